@@ -0,0 +1,62 @@
+import hashlib
+import hmac
+import os
+import re
+import urllib.request
+
+UPSTREAM = 'https://www.gravatar.com/avatar/{digest}?s={size}&d=identicon&r=g'
+EXTENSIONS = {'image/png': 'png', 'image/jpeg': 'jpg', 'image/gif': 'gif'}
+DIGEST = re.compile(r'^[0-9a-f]{32}$')
+
+
+def signature(secret, digest, size):
+    # only avatars the site itself linked to are proxied; any other digest would still get an identicon
+    return hmac.new(secret.encode('utf-8'), f'{digest}/{size}'.encode('ascii'), hashlib.sha256).hexdigest()[:20]
+
+
+def valid_signature(secret, digest, size, given):
+    return hmac.compare_digest(signature(secret, digest, size), given)
+
+
+def upstream_url(digest, size):
+    return UPSTREAM.format(digest=digest, size=size)
+
+
+def cached_path(cache_folder, digest, size):
+    for extension in EXTENSIONS.values():
+        path = os.path.join(cache_folder, f'{digest}-{size}.{extension}')
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def prune(cache_folder, max_files):
+    # oldest first; an evicted avatar is simply fetched again the next time it is shown
+    entries = sorted(os.scandir(cache_folder), key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[:max(len(entries) - max_files, 0)]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def fetch_avatar(cache_folder, digest, size, timeout=5, max_files=None):
+    # each avatar is downloaded once per cache folder; later requests are served from disk
+    path = cached_path(cache_folder, digest, size)
+    if path is not None:
+        return path
+    with urllib.request.urlopen(upstream_url(digest, size), timeout=timeout) as response:
+        extension = EXTENSIONS.get(response.headers.get_content_type())
+        if extension is None:
+            raise ValueError(f'unexpected avatar type {response.headers.get_content_type()}')
+        data = response.read()
+    os.makedirs(cache_folder, exist_ok=True)
+    path = os.path.join(cache_folder, f'{digest}-{size}.{extension}')
+    # written aside and renamed so a concurrent request never serves a half-written file
+    temporary_path = f'{path}.{os.getpid()}.tmp'
+    with open(temporary_path, 'wb') as f:
+        f.write(data)
+    os.replace(temporary_path, path)
+    if max_files:
+        prune(cache_folder, max_files)
+    return path
@@ -0,0 +1,296 @@
+"""Benchmark the hot routes against a seeded SQLite database.
+
+    python benchmark.py --output baseline.json
+    python benchmark.py --baseline baseline.json      # exits 1 if a route got slower or chattier
+
+Seeds a throwaway database with users, posts, projects and deep comment threads, then
+drives the routes through Flask's test client: first one request at a time, then from
+--concurrency threads at once. Reports p50/p95/p99 latency, throughput and SQL queries
+per request as JSON. Everything runs in this process, so the load phase measures lock
+and pool contention inside one worker rather than what a multi-process server can serve.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--posts', type=int, default=20)
+    parser.add_argument('--projects', type=int, default=10)
+    parser.add_argument('--comments', type=int, default=300, help='comments in each post and project thread')
+    parser.add_argument('--reply-ratio', type=float, default=0.7, help='share of comments that answer another')
+    parser.add_argument('--max-depth', type=int, default=12, help='deepest reply chain in a thread')
+    parser.add_argument('--requests', type=int, default=50, help='sequential requests per route')
+    parser.add_argument('--load-requests', type=int, default=400, help='requests in the concurrent phase')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--no-page-cache', action='store_true', help='render every page instead of serving the cache')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--database', help='SQLite file to use (default: a temporary file)')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--baseline', help='earlier report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed p95 slowdown against the baseline')
+    return parser.parse_args()
+
+
+def configure_environment(args):
+    # main reads its configuration at import, so this has to happen first
+    database = args.database or os.path.join(tempfile.mkdtemp(prefix='benchmark-'), 'benchmark.db')
+    if os.path.exists(database):
+        os.remove(database)
+    os.environ['DATABASE_URL'] = f'sqlite:///{os.path.abspath(database)}'
+    os.environ.pop('DATABASE_REPLICA_URL', None)
+    os.environ.setdefault('SECRET_KEY', 'benchmark')
+    os.environ['MAIL_TRANSPORT'] = 'stub'
+    os.environ['MAIL_SPOOL'] = os.path.join(os.path.dirname(os.path.abspath(database)), 'mail_spool.db')
+    os.environ['UPGRADE_DB_ON_START'] = '1'
+    # the report is the measurement; slow-request logging would only interleave with it
+    os.environ.setdefault('SLOW_REQUEST_MS', str(10 ** 9))
+    if args.no_page_cache:
+        os.environ['PAGE_CACHE'] = '0'
+    return database
+
+
+def seed(main, args, rng):
+    from werkzeug.security import generate_password_hash
+
+    db = main.db
+    # one hash for everyone; hashing a password per user would dominate the seeding time
+    password = generate_password_hash('benchmark-password', method='pbkdf2:sha256')
+    users = [main.User(email=f'user{n}@example.com', password=password, name=f'user_{n}') for n in range(args.users)]
+    db.session.add_all(users)
+    db.session.flush()
+    paragraph = ('<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut '
+                 'labore et dolore magna aliqua. <strong>Ut enim</strong> ad minim veniam.</p>')
+    now = datetime.now()
+    targets = []
+    for n in range(args.posts):
+        created = now - timedelta(days=n)
+        post = main.BlogPost(title=f'Post {n}', subtitle=f'Subtitle {n}', body=paragraph * 30 +
+                             '<img src="/static/images/favicon.ico" alt="icon">', cover_photo='static/images/favicon.ico',
+                             author=users[0], date=created.strftime("%B %d, %Y"),
+                             doy=created.timetuple().tm_yday, created_at=created)
+        targets.append(('post', post))
+    for n in range(args.projects):
+        created = now - timedelta(days=n)
+        project = main.Project(title=f'Project {n}', subtitle=f'Subtitle {n}', body=paragraph * 20,
+                               cover_photo='static/images/favicon.ico', author=users[0],
+                               date=created.strftime("%B %d, %Y"), created_at=created)
+        targets.append(('project', project))
+    db.session.add_all(target for kind, target in targets)
+    db.session.flush()
+
+    comments, likes = [], []
+    comment_id = 0
+    for kind, target in targets:
+        thread = []
+        for n in range(args.comments):
+            comment_id += 1
+            parent = None
+            if thread and rng.random() < args.reply_ratio:
+                # answering something recent builds the long chains real threads grow
+                candidates = [c for c in thread[-20:] if c['depth'] < args.max_depth]
+                parent = rng.choice(candidates) if candidates else None
+            body = f'Comment {comment_id} ' + ' '.join(rng.choice(('good', 'point', 'agree', 'why', 'nice', 'see'))
+                                                      for _ in range(rng.randint(5, 40)))
+            author = rng.choice(users)
+            liked_by = rng.sample(users, rng.randint(0, min(3, len(users))))
+            comment = {'id': comment_id, 'body': body, 'body_html': main.render_comment_body(body),
+                       'author_id': author.id, 'post_id': target.id if kind == 'post' else None,
+                       'project_id': target.id if kind == 'project' else None,
+                       'parent_comment': parent['id'] if parent else None,
+                       'parent_chain': parent['parent_chain'] + f"{parent['id']};" if parent else '',
+                       'likes': len(liked_by), 'created_at': now - timedelta(minutes=args.comments - n)}
+            thread.append(dict(comment, depth=parent['depth'] + 1 if parent else 0))
+            comments.append(comment)
+            likes.extend({'user_id': user.id, 'comment_id': comment_id} for user in liked_by)
+    db.session.bulk_insert_mappings(main.Comment, comments)
+    db.session.bulk_insert_mappings(main.CommentLike, likes)
+    main.User.query.update({main.User.comment_count: None}, synchronize_session=False)
+    db.session.commit()
+    main.backfill_comment_counts()
+    if main.search_index is not None:
+        main.rebuild_search_index()
+        db.session.commit()
+    return {'users': [user.id for user in users], 'posts': [t.id for k, t in targets if k == 'post'],
+            'projects': [t.id for k, t in targets if k == 'project'], 'comments': len(comments), 'likes': len(likes)}
+
+
+class QueryCounter:
+    # SQL statements run by the current thread, read before and after each request
+    def __init__(self):
+        self.local = threading.local()
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.local.count = getattr(self.local, 'count', 0) + 1
+
+    def current(self):
+        return getattr(self.local, 'count', 0)
+
+
+class Driver:
+    """Test clients for one thread: an anonymous visitor and a signed-in member."""
+
+    def __init__(self, main, seeded, counter, rng):
+        self.main = main
+        self.seeded = seeded
+        self.counter = counter
+        self.rng = rng
+        self.anonymous = main.app.test_client()
+        self.member = main.app.test_client()
+        with self.member.session_transaction() as session:
+            session['_user_id'] = str(rng.choice(seeded['users'][1:] or seeded['users']))
+            session['_fresh'] = True
+        page = self.member.get(f"/post/{seeded['posts'][0]}")
+        self.csrf_token = re.search(r'name="csrf_token" type="hidden" value="([^"]+)"',
+                                    page.get_data(as_text=True)).group(1)
+        page.close()
+        self.liked = set()
+
+    def scenarios(self):
+        rng, seeded = self.rng, self.seeded
+        return {
+            'show_post': lambda: self.anonymous.get(f"/post/{rng.choice(seeded['posts'])}"),
+            'show_post_member': lambda: self.member.get(f"/post/{rng.choice(seeded['posts'])}"),
+            'show_project': lambda: self.anonymous.get(f"/project/{rng.choice(seeded['projects'])}"),
+            'blog': lambda: self.anonymous.get('/blog'),
+            'user_page': lambda: self.anonymous.get(f"/user_page/{rng.choice(seeded['users'])}"),
+            'like': self.like,
+        }
+
+    def like(self):
+        comment_id = self.rng.randint(1, self.seeded['comments'])
+        action = 'unlike_comment' if comment_id in self.liked else 'like_comment'
+        self.liked.symmetric_difference_update({comment_id})
+        return self.member.post(f'/{action}/{comment_id}', headers={'X-CSRFToken': self.csrf_token})
+
+    def timed(self, scenario):
+        queries = self.counter.current()
+        started = time.perf_counter()
+        response = scenario()
+        # streamed pages are only done once the whole body has been read
+        response.get_data()
+        response.close()
+        elapsed = time.perf_counter() - started
+        return elapsed, self.counter.current() - queries, response.status_code < 400
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def summarize(samples, wall_time=None):
+    latencies = [elapsed * 1000 for elapsed, queries, ok in samples]
+    summary = {'requests': len(samples), 'errors': sum(not ok for elapsed, queries, ok in samples),
+               'p50_ms': round(percentile(latencies, 0.50), 3), 'p95_ms': round(percentile(latencies, 0.95), 3),
+               'p99_ms': round(percentile(latencies, 0.99), 3), 'mean_ms': round(statistics.mean(latencies), 3),
+               'queries_per_request': round(statistics.mean(queries for elapsed, queries, ok in samples), 2)}
+    if wall_time:
+        summary['throughput_rps'] = round(len(samples) / wall_time, 1)
+    return summary
+
+
+def run_sequential(driver, requests):
+    results = {}
+    for name, scenario in driver.scenarios().items():
+        driver.timed(scenario)  # warm caches and lazily built state once before measuring
+        samples = [driver.timed(scenario) for _ in range(requests)]
+        results[name] = summarize(samples)
+    return results
+
+
+def run_load(main, seeded, counter, args):
+    drivers = [Driver(main, seeded, counter, random.Random(args.seed + n)) for n in range(args.concurrency)]
+    names = list(drivers[0].scenarios())
+    samples = {name: [] for name in names}
+    lock = threading.Lock()
+
+    def work(driver, count):
+        scenarios = driver.scenarios()
+        for _ in range(count):
+            name = driver.rng.choice(names)
+            sample = driver.timed(scenarios[name])
+            with lock:
+                samples[name].append(sample)
+
+    per_thread = [args.load_requests // args.concurrency + (n < args.load_requests % args.concurrency)
+                  for n in range(args.concurrency)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        for future in [pool.submit(work, driver, count) for driver, count in zip(drivers, per_thread)]:
+            future.result()
+    wall_time = time.perf_counter() - started
+    everything = [sample for name in names for sample in samples[name]]
+    return {'concurrency': args.concurrency, 'overall': summarize(everything, wall_time),
+            'routes': {name: summarize(samples[name]) for name in names if samples[name]}}
+
+
+def regressions(report, baseline, tolerance):
+    found = []
+    for name, current in report['sequential'].items():
+        previous = baseline.get('sequential', {}).get(name)
+        if previous is None:
+            continue
+        # a millisecond of slack keeps sub-millisecond routes from failing on noise
+        if current['p95_ms'] > previous['p95_ms'] * (1 + tolerance) + 1:
+            found.append(f"{name}: p95 {previous['p95_ms']} ms -> {current['p95_ms']} ms")
+        if current['queries_per_request'] > previous['queries_per_request'] + 0.5:
+            found.append(f"{name}: {previous['queries_per_request']} -> {current['queries_per_request']} queries")
+    return found
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    database = configure_environment(args)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import main as site
+    from sqlalchemy import event
+
+    with site.app.app_context():
+        started = time.perf_counter()
+        seeded = seed(site, args, rng)
+        seed_time = time.perf_counter() - started
+        counter = QueryCounter()
+        for engine in site.db.engines.values():
+            event.listen(engine, 'after_cursor_execute', counter)
+
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'database': database,
+        'scale': {'users': args.users, 'posts': args.posts, 'projects': args.projects,
+                  'comments_per_thread': args.comments, 'max_depth': args.max_depth,
+                  'comments': seeded['comments'], 'likes': seeded['likes'], 'seed_seconds': round(seed_time, 2)},
+        'page_cache': site.app.config['PAGE_CACHE'],
+        'sequential': run_sequential(Driver(site, seeded, counter, rng), args.requests),
+        'load': run_load(site, seeded, counter, args),
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(report, json.load(f), args.tolerance)
+        for line in found:
+            print(f'Regression: {line}', file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import threading
+import time
+
+from flask import g, has_request_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.pool import QueuePool
+
+
+REPLICA = 'replica'
+
+
+class RoutingSession(Session):
+    """Sends the reads of a request marked with g.read_replica to the replica bind.
+
+    Flushes and requests that are not marked keep using the primary, so a view that does
+    write still reads what it has just written.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and not self._flushing and REPLICA in self._db.engines
+                and has_request_context() and g.get('read_replica')):
+            return self._db.engines[REPLICA]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+class PoolStats:
+    """How long this process waited to check a connection out of the pool.
+
+    A burst that outgrows pool_size + max_overflow shows up here as rising wait times and,
+    past pool_timeout, as timeouts; each wait longer than slow_checkout is also logged.
+    """
+
+    def __init__(self, slow_checkout):
+        self.slow_checkout = slow_checkout
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.slow = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, waited, pool, timed_out=False):
+        with self.lock:
+            self.checkouts += 1
+            self.timeouts += timed_out
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            slow = waited >= self.slow_checkout
+            self.slow += slow
+        if slow:
+            print("Slow database checkout: waited %.0f ms with %s connections checked out\n"
+                  % (waited * 1000, pool.checkedout()))
+
+    def snapshot(self, pool):
+        with self.lock:
+            stats = {'checkouts': self.checkouts, 'timeouts': self.timeouts, 'slow_checkouts': self.slow,
+                     'wait_avg_ms': round(self.wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                     'wait_max_ms': round(self.wait_max * 1000, 3)}
+        if isinstance(pool, QueuePool):
+            stats.update(size=pool.size(), checked_out=pool.checkedout(), overflow=max(pool.overflow(), 0))
+        return stats
+
+
+def timed_pool(stats):
+    # a class per PoolStats rather than an attribute on the pool, because dispose() and
+    # pre-fork resets rebuild the pool from its class
+    class TimedQueuePool(QueuePool):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except PoolTimeout:
+                stats.record(time.perf_counter() - started, self, timed_out=True)
+                raise
+            stats.record(time.perf_counter() - started, self)
+            return connection
+
+    return TimedQueuePool
+
+
+def is_sqlite_file(url):
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+
+
+def engine_options(uri, config, stats):
+    """SQLALCHEMY_ENGINE_OPTIONS for uri, sized from the DB_* settings in config."""
+    url = make_url(uri)
+    options = {'poolclass': timed_pool(stats), 'pool_size': config['DB_POOL_SIZE'],
+               'max_overflow': config['DB_MAX_OVERFLOW'], 'pool_timeout': config['DB_POOL_TIMEOUT'],
+               'pool_recycle': config['DB_POOL_RECYCLE'], 'pool_pre_ping': config['DB_POOL_PRE_PING']}
+    if url.get_backend_name() == 'postgresql':
+        # a runaway query is cancelled by the server instead of holding a worker thread
+        options['connect_args'] = {'options': f"-c statement_timeout={config['DB_STATEMENT_TIMEOUT']}"}
+    elif is_sqlite_file(url):
+        # pooled file connections skip reopening the file and rerunning the pragmas per request;
+        # they never go stale, so pre-ping and recycling are only overhead
+        options.update(pool_pre_ping=False, pool_recycle=-1,
+                       connect_args={'timeout': config['DB_BUSY_TIMEOUT'] / 1000, 'check_same_thread': False})
+    elif url.get_backend_name() == 'sqlite':
+        # in-memory databases keep Flask-SQLAlchemy's single shared connection
+        return {}
+    return options
+
+
+def configure_engine(engine, config):
+    if is_sqlite_file(engine.url):
+        @event.listens_for(engine, 'connect')
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            # WAL lets readers carry on while a write commits; busy_timeout makes a second
+            # writer wait for the lock instead of failing with "database is locked"
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute(f"PRAGMA busy_timeout={int(config['DB_BUSY_TIMEOUT'])}")
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.close()
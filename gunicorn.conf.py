@@ -0,0 +1,72 @@
+# gunicorn -c gunicorn.conf.py main:app
+#
+# gthread workers: one process per core, each serving requests from a thread pool, so a
+# request waiting on the database or a streamed page does not hold a whole process.
+# `kill -HUP <master pid>` starts fresh workers and retires the old ones once their
+# in-flight requests finish; with preload_app the code itself is only reloaded by a restart.
+import multiprocessing
+import os
+import tempfile
+
+
+def env_flag(name, default):
+    return os.environ.get(name, default).lower() in ('1', 'true', 'yes')
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+# open connections per worker, including idle keep-alives
+worker_connections = int(os.environ.get('GUNICORN_CONNECTIONS', 1000))
+backlog = int(os.environ.get('GUNICORN_BACKLOG', 2048))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+# recycling workers now and then bounds the in-process caches and any slow leak
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 2000))
+max_requests_jitter = max_requests // 10
+
+# importing the app once in the master shares its memory between workers and runs the
+# UPGRADE_DB_ON_START upgrade a single time instead of once per worker
+preload_app = env_flag('GUNICORN_PRELOAD', '1')
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-') or None
+errorlog = '-'
+forwarded_allow_ips = os.environ.get('FORWARDED_ALLOW_IPS', '127.0.0.1')
+
+# workers write their metrics here so /metrics can add up the whole server; read by main at import
+if not os.environ.get('METRICS_DIR'):
+    os.environ['METRICS_DIR'] = tempfile.mkdtemp(prefix='gunicorn-metrics-')
+
+
+def on_starting(server):
+    # counts left by an earlier run would otherwise be added to this one's
+    directory = os.environ['METRICS_DIR']
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name.endswith('.json'):
+            os.remove(os.path.join(directory, name))
+
+
+def post_fork(server, worker):
+    from main import app, db, mail_queue, metrics
+    metrics.after_fork()
+    # pooled connections opened in the master, primary and replica alike, must not be shared with the children
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+    # the master never starts the mail threads, so forking cannot copy a lock one of them
+    # holds; each worker starts its own, which also delivers mail spooled before it existed
+    mail_queue.start()
+
+
+def worker_exit(server, worker):
+    from main import metrics
+    # the last second of numbers, before child_exit archives them
+    metrics.dump()
+
+
+def child_exit(server, worker):
+    from metrics import archive_process
+    archive_process(os.environ['METRICS_DIR'], worker.pid)
@@ -0,0 +1,197 @@
+import html
+import re
+from collections import namedtuple
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from markupsafe import escape
+
+from image_pipeline import VARIANT_SIZES, variant_urls
+
+# what CKEditor produces for posts and projects; comments are typed into a textarea and get far less
+POST_TAGS = {'p', 'br', 'hr', 'div', 'span', 'strong', 'b', 'em', 'i', 'u', 's', 'sub', 'sup', 'small',
+             'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'pre', 'code', 'ul', 'ol', 'li',
+             'a', 'img', 'figure', 'figcaption', 'iframe',
+             'table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td', 'caption'}
+COMMENT_TAGS = {'p', 'br', 'strong', 'b', 'em', 'i', 'u', 's', 'code', 'a'}
+ATTRIBUTES = {'a': {'href', 'title'}, 'img': {'src', 'alt', 'title', 'width', 'height'},
+              'iframe': {'src', 'width', 'height', 'title', 'allow', 'allowfullscreen', 'frameborder'},
+              'td': {'colspan', 'rowspan'}, 'th': {'colspan', 'rowspan', 'scope'}, 'ol': {'start'}}
+# CKEditor's alignment and image sizing live in class and style, so posts keep them
+STYLED_ATTRIBUTES = {'class', 'style'}
+VOID_TAGS = {'br', 'hr', 'img'}
+# elements dropped together with everything inside them
+DROPPED_TAGS = {'script', 'style', 'noscript', 'template', 'object', 'applet', 'textarea', 'select', 'title',
+                'head', 'iframe'}
+BLOCK_TAGS = {'p', 'div', 'br', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'pre', 'blockquote', 'tr', 'td', 'th',
+              'figcaption'}
+EMBED_HOSTS = {'www.youtube.com', 'www.youtube-nocookie.com', 'player.vimeo.com'}
+URL_SCHEMES = {'', 'http', 'https', 'mailto'}
+UNSAFE_STYLE = re.compile(r'expression|javascript:|url\s*\(|@import|behavior', re.IGNORECASE)
+WORDS_PER_MINUTE = 200
+SUMMARY_LENGTH = 200
+
+RenderedBody = namedtuple('RenderedBody', 'html summary reading_minutes')
+
+
+def safe_url(url):
+    # browsers ignore whitespace and control characters inside a scheme, so "java\nscript:" is still javascript:
+    return urlsplit(re.sub(r'[\x00-\x20]', '', url)).scheme.lower() in URL_SCHEMES
+
+
+def responsive_attributes(src):
+    # uploads that went through image_pipeline have resized variants to offer as a srcset
+    path = src.lstrip('/')
+    if not path.startswith('static/uploads/'):
+        return []
+    fallback = variant_urls(path, 'cover', 'jpg') or variant_urls(path, 'cover', 'png')
+    if not fallback:
+        return []
+    return [('srcset', ', '.join(f'{url} {width}w' for url, width in fallback)), ('sizes', VARIANT_SIZES['cover'])]
+
+
+class Sanitizer(HTMLParser):
+    """Rewrites HTML keeping only allowed tags and attributes, with every tag balanced.
+
+    Text is escaped again on the way out, so nothing the parser misreads can turn into
+    markup. Images are made lazy-loading and fluid, and links from comments are nofollow.
+    """
+
+    def __init__(self, tags, styled, link_rel):
+        super().__init__(convert_charrefs=True)
+        self.tags = tags
+        self.styled = styled
+        self.link_rel = link_rel
+        self.parts = []
+        self.open_tags = []
+        self.dropping = []
+
+    def handle_starttag(self, tag, attrs):
+        embedded = tag == 'iframe' and tag in self.tags and self.embeddable(attrs)
+        if tag in DROPPED_TAGS and not embedded:
+            self.dropping.append(tag)
+            return
+        if self.dropping or tag not in self.tags:
+            return
+        kept = self.allowed_attributes(tag, attrs)
+        if embedded:
+            kept.append(('loading', 'lazy'))
+        elif tag == 'img':
+            if not any(name == 'src' for name, value in kept):
+                return
+            kept = self.image_attributes(kept)
+        elif tag == 'a':
+            kept.append(('rel', self.link_rel))
+        self.parts.append('<%s%s>' % (tag, ''.join(f' {name}="{escape(value)}"' for name, value in kept)))
+        if tag not in VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if self.dropping:
+            if tag == self.dropping[-1]:
+                self.dropping.pop()
+            return
+        if tag not in self.open_tags:
+            return
+        # close anything left open inside this element first
+        while self.open_tags:
+            open_tag = self.open_tags.pop()
+            self.parts.append(f'</{open_tag}>')
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if not self.dropping:
+            self.parts.append(str(escape(data)))
+
+    def embeddable(self, attrs):
+        src = dict(attrs).get('src') or ''
+        return src.startswith('https://') and urlsplit(src).hostname in EMBED_HOSTS
+
+    def allowed_attributes(self, tag, attrs):
+        allowed = ATTRIBUTES.get(tag, set()) | (STYLED_ATTRIBUTES if self.styled else set())
+        kept = []
+        for name, value in attrs:
+            value = value if value is not None else ''
+            if name not in allowed:
+                continue
+            if name in ('href', 'src') and not safe_url(value):
+                continue
+            if name == 'style' and UNSAFE_STYLE.search(value):
+                continue
+            kept.append((name, value))
+        return kept
+
+    def image_attributes(self, kept):
+        attributes = dict(kept)
+        classes = attributes.get('class', '').split()
+        if 'img-fluid' not in classes:
+            classes.append('img-fluid')
+        attributes['class'] = ' '.join(classes)
+        attributes.update(loading='lazy', decoding='async')
+        attributes.update(responsive_attributes(attributes['src']))
+        return list(attributes.items())
+
+    def result(self):
+        self.close()
+        return ''.join(self.parts) + ''.join(f'</{tag}>' for tag in reversed(self.open_tags))
+
+
+def sanitize(markup, tags=POST_TAGS, styled=True, link_rel='noopener'):
+    sanitizer = Sanitizer(tags, styled, link_rel)
+    sanitizer.feed(markup or '')
+    return sanitizer.result()
+
+
+class TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROPPED_TAGS:
+            self.skipping += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append(' ')
+        elif tag == 'img':
+            # alt text is the only words an image contributes
+            self.parts.append(' %s ' % (dict(attrs).get('alt') or ''))
+
+    def handle_endtag(self, tag):
+        if tag in DROPPED_TAGS:
+            self.skipping = max(self.skipping - 1, 0)
+        elif tag in BLOCK_TAGS:
+            self.parts.append(' ')
+
+    def handle_data(self, data):
+        if not self.skipping:
+            self.parts.append(data)
+
+
+def plain_text(markup):
+    extractor = TextExtractor()
+    extractor.feed(markup or '')
+    extractor.close()
+    return ' '.join(html.unescape(''.join(extractor.parts)).split())
+
+
+def summarize(text, length=SUMMARY_LENGTH):
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(' ', 1)[0].rstrip(' ,.;:') + '…'
+
+
+def render_post_body(markup):
+    """Sanitized HTML, a plain-text summary and the reading time in minutes for a post or project body."""
+    text = plain_text(markup)
+    return RenderedBody(sanitize(markup), summarize(text), max(1, round(len(text.split()) / WORDS_PER_MINUTE)))
+
+
+def render_comment_body(markup):
+    return sanitize(markup, tags=COMMENT_TAGS, styled=False, link_rel='nofollow ugc noopener')
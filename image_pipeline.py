@@ -0,0 +1,176 @@
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from markupsafe import Markup, escape
+from PIL import Image, ImageOps
+
+# widths generated for each kind of upload; avatars are cropped square
+VARIANT_WIDTHS = {'cover': (480, 960, 1600), 'avatar': (100, 200)}
+VARIANT_SIZES = {'cover': '(max-width: 576px) 100vw, 36rem', 'avatar': '100px'}
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+
+# variant files already seen on disk at their stated width; missing ones are re-checked since they
+# are built in the background, while files of the wrong width (left by older builds) are remembered
+known_variants = set()
+wrong_width_variants = set()
+executor = {'pool': None, 'pid': None}
+executor_lock = threading.Lock()
+
+
+def save_upload(file, folder, kind, workers=2):
+    # stored under a hash of its content, so a re-upload of the same image reuses the file and its variants
+    data = file.read()
+    extension = file.filename.rsplit('.', 1)[1].lower()
+    filename = f'{hashlib.sha256(data).hexdigest()[:16]}.{extension}'
+    path = os.path.join(folder, filename)
+    if not os.path.exists(path):
+        with open(path, 'wb') as f:
+            f.write(data)
+    submit(build_variants, path, kind, workers=workers)
+    return filename
+
+
+def submit(function, *args, workers=2):
+    # threads do not survive a fork, so each worker process gets its own pool
+    with executor_lock:
+        if executor['pid'] != os.getpid():
+            executor['pool'] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='image-variants')
+            executor['pid'] = os.getpid()
+    return executor['pool'].submit(function, *args)
+
+
+def build_variants(path, kind):
+    stem = os.path.splitext(path)[0]
+    try:
+        with Image.open(path) as original:
+            image = ImageOps.exif_transpose(original)
+            image.load()
+    except (OSError, ValueError) as e:
+        print("Exception when building image variants for %s: %s\n" % (path, e))
+        return
+    fallback = fallback_format(image)
+    image = image.convert('RGBA' if fallback == 'png' else 'RGB')
+    # avatars are cropped square, so the shorter side is what they can be scaled down from
+    available = min(image.size) if kind == 'avatar' else image.width
+    for width in VARIANT_WIDTHS[kind]:
+        if width > available:
+            # never upscaled: a copy of the original would be advertised at a width it does not have
+            remove_variant(f'{stem}-{width}.webp')
+            remove_variant(f'{stem}-{width}.{fallback}')
+            continue
+        if kind == 'avatar':
+            resized = ImageOps.fit(image, (width, width), Image.LANCZOS)
+        else:
+            resized = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+        write_variant(resized, f'{stem}-{width}.webp', 'WEBP')
+        write_variant(resized, f'{stem}-{width}.{fallback}', 'PNG' if fallback == 'png' else 'JPEG')
+
+
+def variant_stems(filenames, kind):
+    # '<stem>-<width>' is a variant only when the width is one this kind is built at and the
+    # original '<stem>.<ext>' sits beside it; 'photo-2023.jpg' on its own is an upload
+    stems = {os.path.splitext(filename)[0] for filename in filenames}
+    variants = set()
+    for stem in stems:
+        original, _, width = stem.rpartition('-')
+        if width.isdigit() and int(width) in VARIANT_WIDTHS[kind] and original in stems:
+            variants.add(stem)
+    return variants
+
+
+def originals(folder, kind):
+    filenames = os.listdir(folder)
+    variants = variant_stems(filenames, kind)
+    return [filename for filename in filenames if os.path.splitext(filename)[0] not in variants]
+
+
+def fallback_format(image):
+    if image.mode in ('RGBA', 'LA') or 'transparency' in image.info:
+        return 'png'
+    return 'jpg'
+
+
+def write_variant(image, variant_path, image_format):
+    if os.path.exists(variant_path):
+        return
+    if image_format == 'JPEG':
+        options = {'quality': JPEG_QUALITY, 'optimize': True, 'progressive': True}
+    elif image_format == 'WEBP':
+        options = {'quality': WEBP_QUALITY, 'method': 4}
+    else:
+        options = {'optimize': True}
+    # written aside and renamed so a page never links a half-written file
+    temporary_path = f'{variant_path}.tmp'
+    image.save(temporary_path, image_format, **options)
+    os.replace(temporary_path, variant_path)
+
+
+def remove_variant(variant_path):
+    # earlier builds wrote unscaled copies for widths wider than the original
+    try:
+        os.remove(variant_path)
+    except FileNotFoundError:
+        pass
+    known_variants.discard(variant_path)
+
+
+def is_local(path):
+    return bool(path) and path.startswith('static/')
+
+
+def variant_exists(variant_path, width):
+    if variant_path in known_variants:
+        return True
+    if variant_path in wrong_width_variants or not os.path.exists(variant_path):
+        return False
+    # only the header is read; a srcset descriptor has to match the file's real width
+    try:
+        with Image.open(variant_path) as variant:
+            actual_width = variant.width
+    except (OSError, ValueError):
+        return False
+    if actual_width != width:
+        wrong_width_variants.add(variant_path)
+        return False
+    known_variants.add(variant_path)
+    return True
+
+
+def variant_urls(path, kind, extension):
+    stem = os.path.splitext(path)[0]
+    return [(f'/{stem}-{width}.{extension}', width) for width in VARIANT_WIDTHS[kind]
+            if variant_exists(f'{stem}-{width}.{extension}', width)]
+
+
+def image_url(path):
+    if is_local(path):
+        return f'/{path}'
+    return path
+
+
+def largest_variant_url(path, kind):
+    if not is_local(path):
+        return path
+    for extension in ('jpg', 'png'):
+        urls = variant_urls(path, kind, extension)
+        if urls:
+            return urls[-1][0]
+    return image_url(path)
+
+
+def responsive_image(path, kind, **attributes):
+    # <picture> with a WebP srcset and a JPEG/PNG fallback once the variants exist, otherwise the plain upload
+    extra = Markup(' ').join(Markup(f'{name.rstrip("_")}="{escape(value)}"') for name, value in attributes.items())
+    webp = variant_urls(path, kind, 'webp') if is_local(path) else []
+    if not webp:
+        return Markup(f'<img src="{escape(image_url(path))}" {extra}>')
+    fallback = variant_urls(path, kind, 'jpg') or variant_urls(path, kind, 'png')
+    sizes = VARIANT_SIZES[kind]
+    webp_srcset = ', '.join(f'{url} {width}w' for url, width in webp)
+    fallback_srcset = ', '.join(f'{url} {width}w' for url, width in fallback)
+    src = fallback[-1][0] if fallback else image_url(path)
+    return Markup(f'<picture><source type="image/webp" srcset="{webp_srcset}" sizes="{sizes}">'
+                  f'<img src="{src}" srcset="{fallback_srcset}" sizes="{sizes}" {extra}></picture>')
@@ -1 +0,0 @@
-image = 'iVBORw0KGgoAAAANSUhEUgAAA5gAAAOGCAYAAACJFD9WAAAAAXNSR0IArs4c6QAAIABJREFUeF7snQe0FEXWx++8QEYQBRRBFCOuopJEzOKaUNFdRTAsCLIqSQURJGPWFQRBhA9BEAniKgbWDCKKGFBBMSIYyCA5vjT1nX8N91mOhHnvTeie/vc578xMv+7qql9VV9Wte+vekPAgARIgARIgARIgARIgARIgARIggTgQCMUhDSZBAiRAAiRAAiRAAiRAAiRAAiRAAkIBk42ABEiABEiABEiABEiABEiABEggLgQoYMYFIxMhARIgARIgARIgARIgARIgARKggMk2QAIkQAIkQAIkQAIkQAIkQAIkEBcCFDDjgpGJkAAJkAAJkAAJkAAJkAAJkAAJUMBkGyABEiABEiABEiABEiABEiABEogLAQqYccHIREiABEiABEiABEiABEiABEiABChgsg2QAAmQAAmQAAmQAAmQAAmQAAnEhQAFzLhgZCIkQAIkQAIkQAIkQAIkQAIkQAIUMNkGSIAESIAESIAESIAESIAESIAE4kKAAmZcMDIREiABEiABEiABEiABEiABEiABCphsAyRAAiRAAiRAAiRAAiRAAiRAAnEhQAEzLhiZCAmQAAmQAAmQAAmQAAmQAAmQAAVMtgESIAESIAESIAESIAESIAESIIG4EKCAGReMTIQESIAESIAESIAESIAESIAESIACJtsACZAACZAACZAACZAACZAACZBAXAhQwIwLRiZCAiRAAiRAAiRAAiRAAiRAAiRAAZNtgARIgARIgARIgARIgARIgARIIC4EKGDGBSMTIQESIAESIAESIAESIAESIAESoIDJNkACJEACJEACJEACJEACJEACJBAXAhQw44KRiZAACZAACZAACZAACZAACZAACVDAZBsgARIgARIgARIgARIgARIgARKICwEKmHHByERIgARIgARIgARIgARIgARIgAQoYLINkAAJkAAJkAAJkAAJkAAJkAAJxIUABcy4YGQiJEACJEACJEACJEACJEACJEACFDDZBkiABEiABEiABEiABEiABEiABOJCgAJmXDAyERIgARIgARIgARIgARIgARIgAQqYbAMkQAIkQAIkQAIkQAIkQAIkQAJxIUABMy4YmQgJkAAJkAAJkAAJkAAJkAAJkAAFTLYBEiABEiABEiABEiABEiABEiCBuBCggBkXjEyEBEiABEiABEiABEiABEiABEiAAibbAAmQAAmQAAmQAAmQAAmQAAmQQFwIUMCMC0YmQgIkQAIkQAIkQAIkQAIkQAIkQAGTbYAESIAESIAESIAESIAESIAESCAuBChgxgUjEyEBEiABEiABEiABEiABEiABEqCAyTZAAiRAAiRAAiRAAiRAAiRAAiQQFwIUMOOCkYmQAAmQAAmQAAmQAAmQAAmQAAlQwGQbIAESIAESIAESIAESIAESIAESiAsBCphxwchESIAESIAESIAESIAESIAESIAEKGCyDZAACZAACZAACZAACZAACZAACcSFAAXMuGBkIiRAAiRAAiRAAiRAAiRAAiRAAhQw2QZIgARIgARIwKMEnn/+ebN161bZvHmz4DM/P9/mdMeOHbJhwwZ7Ht9xfvv27fZ3QUGBlCtXTg488EDJysqSgw46yP7GX9myZe3/cf6QQw6R3Nxc+5eRkWHP4bNUqVJSoUIF+5zs7Gz7iWuMMfY3PvH71ltvtXOIqVOn2jwi3VAoJOFw2OanS5cunGN4tF0xWyRAAiSQSALs/BNJl2mTAAmQAAmQwH4IjB071ixfvlyWLl0qa9askS1btti/Xbt2WaENgiOESPyGcAdBMC8vzwqDEOZwTg98x/nMzEwr5LlCIYQ//E/vLVOmjE0f16mAiWtwL/6Xk5NTKGDiHhx4NtLE7ypVqthrcR3yiLwgHfwf6ULAxf/Lly9vhVwIrdWqVbO/8b9KlSrJXXfdxXkI3xASIAESSDMC7NjTrEJZHBIgARIggeQQgHYRguC6deus5hBCF/7wfdOmTYXCmAqBELYgwEFQVA3ktm3bZOfOnfY3tIC4FkIcBDQcKjziXnxXARPX4RpNU58BAQ8H/qfCnpuOnlPh1BVSkTe9Vr9req4Q616j96tw6aaP7yrkIp9goxpRaFMhxB588MG2vLVq1ZKKFStK7dq15aijjpIOHTpwfpKcZsynkAAJkEDcCbADjztSJkgCJEACJOA3AtOmTTO//fab/Prrr1aL+PvvvwuEPxX2oKGDWSgEKXxCSFQhD79VC6gCF4Qp1RiCBa7FgXMQ1vQ3PiF8qTCG/+NPhUcVHJEPfZ6moUKg3uMKkvos91P/r8KiCquqcdT8av70ObjPFTRVS+qm4+bbfSau0f/pfSgHzHBVQwpWpUuXtgxxHt/BBFpO/EH4PProo63gecstt3De4reXi/klARIIHAF21IGrchaYBEiABIJFYOLEieaXX36xJqgQIteuXWtNOtXUE9pDaCJVSFRtof52BTcV6lRAxLV6PYRCPa+aPFe4UoEM/8MfrletpNaIK5Tq/6IFOt0HqYKgCnGuIKuC7p40kbpP0k0X31UbakxYQqE/m9+qgBldPmWj+dYyaVq631P3Z7rCtctGTW+1DHgOyqlMlRnugaYT5rmHH3643Ud6yimn2O+tWrXinCZYrzZLSwIk4FEC7Iw9WjHMFgmQAAmQwL4JjBgxwqxfv15WrlwpP/zwg6xatcoKj66QAyFRTVdd4cg1H1VtYbQwtC/zUdcUVQU8PecKXa7mUjWCKmiqUOaat6pQqdeq8KpaTdUmqsDmmrVGaxrdPLokkabm0X2e+wxcg3xp+tE14Womo81zVVjFeRUUUQduWfR+1eCq8yJ9nu4hRRncPKjpsCt8wtwW6desWdPu9TzxxBOlatWqVug84IADpE2bNpzrsDMhARIggSQSYKebRNh8FAmQAAmQQPEJPProo+b777+Xn376yQqTECzVSY0KHnsTiIr/VN7pVwJwKgRBFNrRGjVqWE3ncccdJ7169eLcx6+VynyTAAn4ggA7WV9UEzNJAiRAAsEkMHz4cPPFF1/Id999ZwVLdaajzmJ0/yDo7G0vYjDJsdS611PNbLG/E46FoOk85phj5NRTT5UBAwZwHsSmQgIkQAJxJsCONc5AmRwJkAAJkEDxCAwZMsSoN1XslcS+ycWLF1uPrKqhVNNJFSj1Sa5wiXPRXk+LlyPe5WcC7n5ZNbVVU1y0I8QExR5OmNKec845FDb9XNnMOwmQgKcIUMD0VHUwMyRAAiSQngTgpRXmrcuWLZPVq1dbT6zw2ApPrfiOP4TrUGcu+K6CIoQB3XMILRSEBN3b6AqY+t3dV5ieNFmqWAi4bUQ99WqbcsOqoO3h/9BsHnnkkVbYHDRoEOdHsUDmNSRAAiSwBwLsQNksSIAESIAEEkKgTZs25ueff7bmrfDSqnEQMaGHEIhwFG7oDfWsqpN/FQai4zmqExlXoMT3aIc3CSkUE/UNAddRkTocQuaxJxNtBQsV6u0W5922COdA9evXt+FR6tWrJ126dOF8yTc1z4ySAAmkmgA7zFTXAJ9PAiRAAmlEoGPHjlaonD9/vmzYsMFO2tVjqIbFwOQeE3vVHOk10E5q6BAVAtzQHypERntfVXxuXEgVTtMILYtSRAKqyVatuLsg4YZNcRcn3JikKnSiXR122GHSsGFDadSokd2/2bJlS86filgfvJwESCA4BNhBBqeuWVISIAESiDuByZMnmy+//FLgiGf58uWyZMkSa+YK4VFjG2rcRQ2D4Ybz0HAT0Ca5gqMKiDrhV2c+7l4612MsvcfGvWrTIkFtU9p+dJEDbRMHtOrRMTy1jWnYGlf7CSdBiMGJvzp16liBs1+/fpxLpUVrYSFIgATiRYCdYrxIMh0SIAESCBCBe++918ycOVOgrVy3bp3dPwlhEYKimrCqBkkd82BSr+avuE7jTOqEXuMu4reaL6pzH9yr8S31e7TGUoVSN85kgKqERY0ioO1L92JqHE5tgyps4lPPafxRNym9zjXh1liilStXlkMPPVSOOOIIqV27ttV09u7dm3MrtkYSIIFAE2AnGOjqZ+FJgARIIHYCU6dONQsWLJC33nrLenhFyBAeJBBUArqQAcETiysQTvGJmJsQOJs2bWr3cF533XWcawW1kbDcJBBQAuz0AlrxLDYJkAAJ7I/A6NGjDRz0zJ0715q/rlmzRrBPEuavPEgg6ARUM68aTnUqBC54T6DVP/DAA6VixYo2/uZJJ50kl19+ubRt25Zzr6A3HpafBNKcADu5NK9gFo8ESIAEYiUwatQo89NPPwm0lN98840VKNVsVfesqbmhno81bV5HAulGQAVL1wQXZdRYmxAqd+3aZYut5roQPKHVPPnkk6VZs2Zy8803cx6Wbg2D5SEBEhB2bGwEJEACJBBAApMmTTIQIL/66itr7qrxKTE5xh/2O+qeStXMuHsqgUxNBAOIj0UmAbv4gncE74EKleqxFu8MHAjhf7r32BVIcR3On3nmmXLBBRdIr169OB9jmyIBEkgbAuzQ0qYqWRASIAES2DuB5557zvz444/WKc/ixYutQLl9+3bZtGmT3Tum5n6u4xzXBFAdpLiOU1xvsCVlj8HIlDQR3k8CSSagHpJdLaWG5dFFGHUIpM6E9Fp918qXLy+HH364nHDCCdaMll5pk1yJfBwJkEDcCVDAjDtSJkgCJEAC3iAwfPhw8/333wvCiECw3LZtm9W0QLOiGhfktHTp0oVaGBUaNTQDfqsWBvfp/1XQ9EZJmQsSSC0BXaTBewPtf7RnZD3nekNGjtW8Ft+hDS1btqz1RAuPtNBu9u3bl/O01FYtn04CJFAMAuy4igGNt5AACZCAVwnA0+v06dOthhIaSzgagVMeNW/VsB+qkcSEF8KmO9F1tZUaGkTNZPVTwzp4lQPzRQKJJuDGbdX3R83GVWupgiXyov/DJ4RJLNhgT6YboxNparoQNhEGpW7dutYj7YABAzhnS3SlMn0SIIG4EGBnFReMTIQESIAEUkvgyiuvNB9//LFs2bJFduzYYSewKky6eyXVLE9zq3vFcN71EKumf6qZ0Ukw7nNN/lJbaj6dBFJHAEKluz8Z31Wz775zOK/vosbS1Fy7Jrb6XrkOtPBdtZ7wRgsHQS1atKCwmbpq55NJgARiIEABMwZIvIQESIAEvETg+eeft6avCB8CRz0IIbJx40arhdzTJNVLeWdeSIAEikZAtZp4vyG4YiEIHmrPOeccueyyy+Tf//4353JFQ8qrSYAEEkyAnVKCATN5EiABEigpgbFjx5qVK1fK0qVLBWFE8InfrvYEz3D3faWVCSs9AJW0CfF+HxKAYKmaUP2unmg1bFC1atWkQYMG0rx5c+nQoQPndD6sZ2aZBNKRADujdKxVlokESMD3BCZMmGBmz54t3333nfz666/W4yv2U2LfFg7dO4nvavaqk1EVNBlGxPfNgAXwCoEULHJEe6gFCtViqsCpYVEqVaokHTt2lPvuu4/zOq+0GeaDBAJMgB1RgCufRScBEvAegc6dO1vBEh5foaWEgx4VKDXMQSgjJCYcia+nznu0JPpbNR3eKyFzRAIkEAuBaAHT1WK6joLgBRr9BMxmzzrrLLn66qupzYwFMK8hARJIGAEKmAlDy4RJgARIYP8E7r33XrNixQpZv369zJ8/X3755Rdr+orJJByD6Hd4elWh0Y1FqU9QraVOQl1HIfvPBa8gARLwIgE3pma0yax6qNW913Dshe8HHXSQXHfddTJ48GDO8bxYqcwTCQSAADufAFQyi0gCJOAdAk888YR55513ZN68ebJ582abMY056XqhhECp4QpcLaXGpcS56ADuroms67nSO6VnTkiABPZKYD9muNoPuOFR8J7DkiEnJ6cwXq06AmrSpIm0bdtW2rRpw7kemx0JkEBSCbDTSSpuPowESCCoBNq1a2cFS8SnxAFPkCpcQpjEgYmiCpvuPkrVRqpJrMbc0/O4Fke0uWx0SJKgsme5ScDPBFzTWC0HzqE/gGmsvv9q2YBPXaCqXr26XH/99dRm+rkBMO8k4EMCFDB9WGnMMgmQgD8IjB8/3u6nnDNnjvz88892IqiaR3XWs684k+oJ1tVcqCDpeox1PU1GO/wpEqkUODIpUv54MQl4gkByXpRo81gUPXofpgqV+t67oYrwP/QzlStXlvPPP19atWolLVu25LzPE22ImSCB9CbAjia965elIwESSAGBjh07GpjAwkkPnPXA+ysODbKuQia9vKagcvhIEggIAd2zDaET+zPr1KljBc2RI0dy7heQNsBikkCqCLCTSRV5PpcESCDtCNxxxx3mrbfekuXLl8vWrVutV0eYsKkmUrUNOvGLCJjJ0YakHWwWiARIYJ8E1NOsOgNSr7T16tWTK664QgYOHMg5INsQCZBAQgiwc0kIViZKAiQQJAL333+/GTFihGzYsMGawMIsDXssXTNY14QNbLg/MkgthGVNHAEu0OyNrQqUaimhe7xxHv3TVVddJZMnT+Y8MHGNkymTQGAJsGMJbNWz4CRAAvEg0KFDB/Piiy/Kxo0bC01gXWcb6oBDA6S7z6SQGY8aYBokQAJ7I+B6m9awR+iTYFkBD7SNGzeWFi1aSK9evTgfZDMiARKIGwF2KHFDyYRIgASCRGDSpElm2LBhsnDhQhsiAHucMIHDoQ541JMjzqnnV9c7bJB4sawkQALJJaCeZtE/4dA4mein9Dv6pUqVKsnRRx8NB0By9913c16Y3Gri00ggLQmwI0nLamWhSIAEEkngoYceMmPGjLEhR9QcFpM2/MEMTcOOqIbS1VSqF0jdl5nIfDJtEiCB4BJAH4P+CJpK9FPR2kyYyUL4VE/W5cuXlzPOOEMuueQS6dKlC+eHwW06LDkJlJgAO5ASI2QCJEACQSEwbtw4M336dJk/f76sXr26UGupmks3jiUc/OgeTPCJDi+g54LCjuUkARJILgH0QTt27LAP1YUv3X+pgqW7IIbrIIxWrVpVzjvvPO7PTG518WkkkFYEKGCmVXWyMCRAAoki8I9//MN8/PHHsm7dukJzV/XOCLNX3deECVzZsmXtxE7jXkYLmDiPiZwKponKM9MlARIILgGNiamLW+r0R60n3P/D6kIdk6lG87DDDpN//vOfMnjwYM4Vg9uMWHISKBYBdhrFwsabSIAEgkLgiiuuMDNnzrROMXBAK6kCpe6rDAoLlpMESCA4BHQPZ61ateT000+XiRMncs4YnOpnSUmgRATYWZQIH28mARJIRwLTpk0zEyc+K7NmvSfbt2+35q0wJXOFS6z4q4fYdGTAMpEACQSbAPo9tdIoXbq0dQR0+eWXy4MPPsi5Y7CbBktPAvslwE5iv4h4AQmQQFAIDB482Hz66acyZ84cu8dSPb5iogWBEk4y1LxVhc2gsGE5SYAEgkUAFhoQLF0v2TD/r1u3ro2h2adPH84hg9UkWFoSiJkAO4eYUfFCEiCBdCVw8803m/fff1/Wrl1rJ1O7du2ygqSawELA1D89hz2UNJH1aYvAyGd8mndmmwSSRMBdTIuO2QtB86yzzpKrr75a2rdvz7lkkuqEjyEBvxBgp+CXmmI+SYAE4k7g1ltvNW+//basWLHCCpQ7d+60z8B39a6o8S01pqUbegQaTR4kQAIkkI4E0A+i38NiGr6rV2xoNXWLwBFHHGG1mY8++ijnk+nYCFgmEigmAXYIxQTH20iABPxLQAVLjWOpJVEX/pg8RXt4xf8gbOLQmHLcg+nfNsCckwAJ7JuAayKLK+FlFsImFuJcjWaVKlWkcePG0qZNG2nVqhXnlWxYJEACwo6AjYAESCAQBPr27WvNYBctWmRDiOi+IjVzdVfoMZFS7ST+j+/q8EJhIcacepYNBEAWkgRIIFAE0O+pJQcESyy86aEhTXAN/qeLczCbfeuttzi3DFRLYWFJ4K8E2AmwVZAACaQ1gf79+5upU6fKTz/9ZPdMQgsJDaTuodSJ0572G2n8ONVUqpMffKp3xbSGx8KRAAkEloAKj+g38QdhU81mNZam/gYk7VsPPPBAOfXUU6Vly5Zy6623cp4Z2BbEggeZAF/8INc+y04CaUygX79+5qWXXpKff/7ZaiwxOcKkCEKjaitp4prGDYBFIwESKB6BODnBqly5stSrV0/OP/986d+/P+ebxasN3kUCviTAF96X1cZMkwAJ7InAI488YsOMIMTIwoULrUkXPMJCS4nVdXzHgd900MM2RAIkQAKJI4AFPPSz5cuXl+OOO04uu+wyGTBgAOediUPOlEnAMwT4onumKpgREiCB4hJ46KGHzGuvvSZLliyR9evX/2mvkAqU+FTHPRQwi0ua95EACZBAbAR03zq8zqLvLVeunNVmvvzyy5x7xoaQV5GAbwnwJfdt1THjJBBsAlOmTDEzZ86Uzz//XH788Uc7gYHjHqyYwwGPhhUBJXxXRz0qXKq5bLApsvQkQAIkkDgC2s9iiwIETjhGa9CggfTo0YMeZxOHnSmTQMoJUMBMeRUwAyRAAkUh8Nxzz5lRo0bJZ599ZgVK9eaKiQw8G+LT9XboaivVZEsdVNBMtijkeS0JkAAJxE5AHai5HmjVQzdCm9x6660yaNAgzkNjR8orScA3BPhi+6aqmFESCDaBp59+2jrtmTNnjnXag0NjsanpKwRIDTuCiQxWy1WoVOc+GnZEvcjGg2qcfGLEIytMgwRIgAQ8QUD7YnWwhk8s6sGLN/pnLA5ecsklcsUVV8j111/P+agnao2ZIIH4EOALHR+OTIUESCBBBMaNG2deeeUV+fDDD2Xz5s3WQQ80l3pAgFT3+BoYHP/DNZjEQPh0Y1m6IUcSlGUmSwIkQAKBJ4B+Gf2wLu7pQqAu/gEQhM4aNWpIo0aN5Nprr0VoE85LA99yCCAdCPBFTodaZBlIIA0JPPPMM2b69OnyxRdfyPLlyws9v2osS0xWMDmBlhIHBEd1KoHfKnRqfEvcp7ErcR33YKZho2GRSCDpBGi/sDfkum0BGkvtk7F9AeexUIj+GwKo9tX169e3ezNbt27NuWnS2zEfSALxJcCXOL48mRoJkEAcCHTp0sW8+OKLNtwIDxIgARIggfQjAHNZ/EHAxOIfPmvWrCmXXnqpDB8+nPPT9KtylihABPgCB6iyWVQS8DqB//u//zNPP/20fPXVV39x1uP1vAclf9TXBKWmWU4SSCwBtUDRffL4hKCJvZmIm3nnnXdK27ZtOU9NbDUwdRJICAG+uAnBykRJgASKQmD8+PFmzJgx8vHHH1vTKZhUYWVb90sWJS1eSwIkQAIk4H0C6N/dcFLQYGL7gprNQti88MIL5c033+Rc1fvVyRySwJ8I8KVlgyABEkgJgcmTJ5vXXntNFi1aJEuWLLGeYXUvDjKE4Ny6dyclGeRDSYAESIAEEk4gei+9ep+FJnPXrl1Sq1YtueCCC+SZZ57hnDXhtcEHkEB8CPBljQ9HpkICJBAjgSlTptj9ldBWrlmzpvAuCJMQMHFoQG5qMGOEystIgARIwGcE3DAmyDp+Q9jEAe2lxinG+fLly0u9evXkhhtukE6dOnHu6rO6ZnaDR4AvafDqnCUmgZQQmDp1qnn11Vflo48+klWrVtkJhE4ioK1Ud/aYYEDYxOq1eohNSYb5UJ8R4O5Qn1UYsxtwAtgOARNZCJJYVFSBUuMZ4/8a2kQFzypVqkjz5s2pzQx422HxvU+AAqb364g5JAHfE7jmmmsMNJYrV64sDBWikwpoLSFI4tN1Ya8hRXxfeBaABEiABNKcQHGWdzRUlMbJVM0lPvUcxgQsNmIBUgVP/L7ooovk5Zdf5hw2zdsVi+dfAnw5/Vt3zDkJeJrAmDFjzEsvvSRffvmlDTeC1WgVKjX+GT4xgcChkwfVZiIYt/7P0wVl5kiABEiABIpMQB25qaCpY4AKmBrGROMW4zzGDB1H4Gm2S5cucuutt3IuW2T6vIEEEkuAL2Vi+TJ1EggcgVtuucW8/vrrsnz5crsKzYMESIAESIAE4k0Ai5bYm3nzzTfLY489xsEm3oCZHgmUgABfyBLA460kQAJ/EOjQoYN57733ZOnSpdZZA/dQpr51FMdsLfW5Zg5IgARIIDYCGGsqVaok119/vYwcOZJz2tiw8SoSSDgBvowJR8wHkED6Ehg1apT59ttvZfbs2YJPmLRiLyX2T2LgpxfY9K17lowESIAEUklAvdDCUqZChQpy1llnyeuvv855bSorhc8mgd0E+CKyKZAACRSZQI8ePcycOXPk119/lW3btsn27dutOazuqcTAzziWRcaa/jdQpZr+dVyCErJ5lABeAG/FXkxYyuzcudOOPfiOmJkwme3evTvntwFsEyyydwjwBfROXTAnJOB5Av369TPTpk2TX375xWoo9+SEx3U17/kCMYMkQAIkQALxIZDkFQJ3rIHVDKxnMC5Vr15dWrZsKUOHDuUcNz41y1RIoMgE+PIVGRlvIIHgEbjnnnvMCy+8IEuWLLHeYPGHWJXqxMcd6DWemZovBY8WS0wCJEACJJBoAjoO4TnwOo5xCOMSDpjMXnnllfLcc89xnpvoimD6JLAHAnzx2CxIgAT2SgCC5axZs2TBggU2ViX2VGrga41Tht/4rkGxVdhEotyDycZFAiRAAiSQCAJYxIRpLITLHTt22EdgawYsa3TsufbaaylkJgI+0ySB/RCggMkmQgIk8BcC9913n9VYLl682AqWrhCpMclwTgdxPQfhEgM+zjOGJRsWCZAACZBAoghg3MEfxhoscOp39QWg584++2yZNWsW57uJqgimSwLUYLINkAAJ7IvAlClTzCuvvCIzZsywjhNcbSTJ+Y1AkjdE+Q0P80sCJJD2BDCGQatZr1496dixo7Rt25aCZtrXOgvoBQJ80bxQC8wDCXiAwGOPPWYmT54sX331ldVCYi8LBUwPVAyzQAIkQAIkUGQCsKScCYvHAAAgAElEQVSBGa1u5zjxxBPlpptukq5du3LuW2SavIEEikaAL1nRePFqEkg7AmPHjjX//e9/Zd68ebJ169bC8rkmsGlXaBaIBEiABEggrQlAuFTfAGo2izAmXbt2lR49enD+m9a1z8KlmgBfsFTXAJ9PAikkcP/995thw4bJunXrrNZShUpoLjE400lPCiuHjyYBEiABEig2AfUyi/iYOTk51iIHY9rBBx9shcy+fftyDlxsuryRBPZNgC8XWwgJBJRAt27dzPPPPy8rVqywAap37dplSeiKLzzz0VFPQBsHi00CQSPALctpWeOuAzoUUDWZlStXhhZT+vTpw3lwWtY8C5VqAnyxUl0DfD4JpIBAp06dzBtvvGE1l3DmA0ESAzECVWscMQiajGWZgsrhI0mABEiABOJCAGMYxjUcGNtUwMQCKmJl/vOf/5QxY8ZwLhwX2kyEBP4gwJeKrYEEAkagffv2Zu7cubJkyRI74EKQhOmQmhOpoKlxLwOGh8UlARIgARJIAwIY18qWLVsYIxNCJca16O0gCGMye/ZszofToM5ZBO8Q4AvlnbpgTkgg4QRuuOEGM3PmTFm7dm2hUIkVXvW0h08dhLHqiz2ZPEiABEiABEjAbwQgYOJPLXNUsNQFVXdhFR5mu3XrJu3ateO82G8Vzfx6kgBfJE9WCzNFAvEncM0115jZs2fL5s2bC01faQIbf85MkQRIgARIwB8E4PQHC6mw3Klevbr8+9//lkGDBnFu7I/qYy49TIAvkYcrh1kjgXgQmDp1qnnppZdgAmQ1l7q3Uj3qxeMZTIMEfEmAjl18WW3MNAnEg4Ba7kC4xB8ETXiY/de//iVDhgzh/DgekJlGYAnwBQps1bPgQSAwbdo088orr8i7775bKFxixRZ7LylgBqEFsIwkQAIkQAJ7IwDBEoduD0E4k4MOOkiuvfZaGTlyJOfIbDokUEwCfHmKCY63kYDXCUBzOX36dPn000/lt99+syu0ODT0CEKTwOGBrw5qnHxVXZ7NLNuRZ6uGGSOBZBLAgivGRnV4Bx8E8KxeqVIlOffcc+WVV17hPDmZFcJnpQ0BvjhpU5UsCAn8QWDs2LFmxowZVrhcs2aNFSo1viWuwoDKMCRsMSRAAiRAAkElAOESY6MKmerUDmMjxshy5crJySefLB07dpTWrVtzvhzUhsJyF4sAX5hiYeNNJOBdAsOHDzevvvqqzJ8/X7Zs2WL3lcCLHkxiYQaknvRwHgMrDxIgARIgARIIGgENzYVyw6IH46MbKxNjJs5DmwkPsz179uScOWiNhOUtNgG+LMVGxxtJwHsEhg4dal588UVZuHChbNu2rTCDulKLExhU9cAAyoMESIAESIAE0pbAXkziIVBqOC71qI6xUgVP/R/OVaxYUdq0aSNDhw7lvDltGwoLFk8CfFHiSZNpkUAKCTzwwAPWW+zXX39duM8S2VFnPq5THzULSmF2+WgSIAGvEOCeVK/UBPORRAK68Bq9ZUT9FWj4EgiaGDNhMnvZZZfJ1KlTOXdOYj3xUf4kwJfEn/XGXJPAnwi0adPGzJo1S5YvX27NXrECCwc+ezWB5YSSLYgEPE8AE10NFr+nzOpE2PMFYQZJwIcEXEFTx1W8j0ceeaQ0bdpUJkyYwDm0D+uVWU4OAb4cyeHMp5BAQgjcfPPN5pNPPpHvvvvOTkRVsMTD1LwnIQ9moiRAAgkngHd6b0KkCp8JzwQfQAIBJaBjqmoy4b9AQ3xVqFBBTjzxRBvO5M477+RcOqBthMXeOwG+FGwdJOBDAp07dzYffvihfPvtt4WhRjD4qbYj2iueD4vILJNA4AlgX5i+y4DhajOpvQx88yCABBNwBUz9rma1+F26dGkpX768NGvWTF544QXOpxNcH0zeXwT4QvirvpjbgBMYOXKkGTx4sKxevVp27dplPcRiognhEgMffuskVCenAUfG4pNA2hCIdspFITNtqpYF8SABfd90q4laFLgxpfEdguahhx4ql19+uTzxxBOcV3uwLpml5BPgi5B85nwiCRSLQL9+/czIkSNtEGj8YbCDGSxMdnDooOea1XECWizUvIkEPEEAE1sNL6TvuPueeyKTzAQJpCkBbDmBcx+8c+4CrhYX4696osWCL6457rjj5LbbbpOuXbtyfp2m7YLFio0AX4DYOPEqEkgpgUceecQMGjTIDnbqvEdNdTDI6d4QHQx14FPX6ynNPB9OAiRQbAJqkYBJrv5pYgwzVGysvJEE9ktAF3hwIcZSNZOF4AlrIfzpUapUKXsNxmBoNGE227x5c+nUqRPn2fslzQvSkQAbfjrWKsuUdgSqVq1qtm7das1iMZC5HmJViISQqQNh2gFggUgggATUzN010dP3ndYJAWwQLHJSCeBdgzCJP3zXd89d9NHFXWSsTJkydoxWy6IDDjhA6tSpI3Xr1pWTTz5ZevXqxTl3UmuQD0slATb2VNLns0kgBgLNmzc377zzTqFQqeY6GOzw3dVSaqxLnNf9mTE8gpeQAAl4kIDur1YHXtCO4A8Hvch6sMKYpbQioJpKHWNV0EQh8U5ijIUwmZOTU2hdoOMy/o93FffgqFixotSuXdua0DZs2FB69OjB+XdatRYWJpoAGzjbBAl4mEC7du3Myy+/LBs2bLADmQ5Y+IQmUyebHi4CsxZgAqoBcBdC9Luam+miCDCpkypo7FzNvJp+72lPlAphuFc1fppmtAmp/nbPq+Zfzd1UW6i/dYKo+VGvrro3UvOE9xPnkFdoMpAuJpWVK1e2vxHWoEqVKtZ8Dudr1qxpy7t27Vq7jxrpYqKK9HA90sH/Tz/9dHv9li1b5IcffhBYMixbtsyWFWlt3LjR9g+IgYtz2J+NZ8PKQRejwFb3Zmu+9+a4xGUT7cXWFWxdbU60+a6r4Qlw82fRA05A3yV9P7Q/PPDAA+Wggw6So48+2gqbAwcO5Fw84G0lHYvPRp2Otcoy+Z7A3V07mRkz/icr1m+UzZs3F8a0xIClZjjuxNz3BWYB0pKAruK7wpkbTsfdw6QAIGBhQqaLKa5AinT0fnzHIgvScAVQFaY0bVf4cc1KXWHTdYylQpTe5wqersMd5BMCnu6BPvjgg60gWLVqVRuEvW/fvkkfX6dNm2a++eYbWbJkifz222+yYsUK+f3332Xbtm1WgHVDLGjdKHcVCrX80aGOlJ2rzXG1qHsS5mnGm5avNQsVIwF3YS3aYRf6DZzDeA5h8/i6x8s5Z58jPXv2THq/EWNxeBkJFIkAG3KRcPFiEkgcgXem/p+ZP3++zPrgI/l80Q+yLTcsuXkFhSFIVCOhGhN80slH4uqDKZecgLuHUCdbrlCpJmh4kmoSVSuvEzJt42XLlrUaPgh1qgXENUgDGkCkj//v2LHDTtxcDammgWsxsVOhEM/CPSrMqgYSn8gPrsdzITwiDAGER3w/7LDD7O9WrVr5Zgx97LHHDOLmLl261GpAV65caYVzd2+ZCtUqSOtvFfpxrbJ2zQVdIVWFSprwlvz9YQr+JuAujmlfpQs57mKVLubg/YKVQ4MGDaxm88EHH/RN/+LvmmLuE0GAjTcRVJkmCRSBwJMD7jRffb1AFi/5WX5duVbWbdkp2/KzJGxEsjKMTcn1DgtBUyfk9BKLLizCiIf3COwtzIarDYMgp94XXUFTzWWhFYQwA5NSCHfqMOPWW2/9y/g1efJkA1NRHLgfwhDuhaazXLlyUqlSJbnhhhsK78P1cMqh7xcmfbhHTdk6duyYtmPkvffeaz799FPZtGmTjasLU93t27cXmhmrgKjeM8FUTW5dL5quZ9tok0AugHnvnWSOkkdA+zlXmHQtKtw9nmphoO8b7oGgec0111Crmbwq45PiSCBtB884MmJSHiYwbdp48/3338vnn38ueXkFERO1g6tLvXr15N+3dPZs+54x7kGzYP5n8snHC2Tlug2yPTcs2/JDsnr9FoELj6zs0pJfkC8SLrDaGJ3w6uDjmhl6uHqYtYATcM24XTNZYHH38Knwgk/cA60hVvKhMTzzzDOlRo0a0rt3b8++z+lQzYMGDTILFy60+zyh4cSeT9VS6iIAPtWhiVu37kRa69Ct03TgwzKQQFEJuBYc7kKN+45Em6Ljf9HCJqwl6tevLzNmzGAfWNRK4PUpI8DGmjL0fHBJCdx1Zzvz3+kzZMOGTbJ1626tXiY655DVdMC5xnHHHGMnp9WqVbNONqDBaP/v1MSlevY/95gfvv1O1qxcIZs2bLCmaqvys2X7rjzZFc6QsJSSfBOWLCmQLJMvpkDE7N5jppM1NR+Eid+e9q+VlCnvJ4F4EohewXdX79VUDG1Zz2M/EiZT2MN4xhlnSLt27ThGxbNCYkxr4MCB5qeffrJmtOinoOHUEEmqFUZSqmXW/il6jyv3YMYInJelJQFXg6/af7dP1AUb1yRfzdABRPdJ637NVq1ayYQJE9gnpmVrSb9CsaGmX50GpkRH1DzQLFu1yU5OdYIT2U/kmEwakXLlylgTuVDI2L1X5cuXE3hxQ4wq9fIITQk0Jn36DorbOzHj2ZHmyw9ek5Vr1sryletk9e+b5fdNOyU3nCH5Jku2bc+R7eECCWVk2PybcBh6HUEGcKZUlkgOBE97PjLYRO9jU0+Qgal0FtRXBNSpjLZfFUrwCe3YUUcdZYXJE088UcqXL28XgFq3bh23d9BXsDyc2Yceesia0/78888CwROeajVEA/on1xFStDbTw8Vi1kggoQSiw5y4D1MT9Oi957gH/aa711kXcqpWPUhuv/126du3P/vIhNYcE48HATbSeFBkGikhcPJxx5hFi3+TApiRhiLOPiQUmexg0gNhEoc6sYAchz/72xj7PTuEVXgIodn2PITOatUOkaPqHC3Nm18uN3X4d5HekReeftLMnfWGbN+wVjb+vkZW7iwty1eskg1btkpOWCScIRLKypZ8yMAFRkKZGRIqyJeMUFgyjdh9lwWhLAlnlBIJhyRkdhSWw9176TolSQl8PpQEYiSgK/f6XtaqVUv+/ve/y3nnnSc33nhjkd6vGB/JyxJMoGfPnmbWrFlW2MREGH2T67VXzQGpwUxwRTB5TxNQ79SuEx+NT63m53qNOu2L9oitYz3+j/esRo1DZOXK1ew3PV3zzBwIsJGyHfiWQPfuPczQoY+JMRDEIJyFJTsrW/IK8iMeJLMzrJnpvo5oT5X2pQiF7AoiPv92Yj256MIL5OGHH/7DMcjTw83mDRvsHqXw9k2yds0aGxJg/YYNsiM3V3IKRLbtzJftOTmydvNO3/Jlxv1PwI1jqCaprlMWXYBxQ4OoWZc7KVITLnxigqR78vR+DTqO3zpRwnXqhh/nYCVw8cUXy8iRIznu+L9pFZZg4sSJNjQKtJtr1qyxYRdQ1/CIDU0nwqSgLeAPE2Tsr4W5rWpw9uUkyHVi5nq4Vacpuj8d/3Mn7HsLsZJG2FmUABDQsExhE7JzmoyQkXBBgZzdtLG8/9Gn7EcD0Ab8XEQ2UD/XHvMulatUMps2bLYmsHm5uVaTaWyrDgsMSzOssenejz2Zc7kTnoKwSNWDq8ihh1STCmXLyK6dO2Tz+rV2gpSdlSGZGs5AQrIjZ5ds2bpDtueKddQjmSHBwMCDBFJFQNu3u1/XXVTRCbourGhoDkxmIAxoqA8NBeKaZKuJJFbYcR0sBqDNwqGhPU444QQb4+2kk06Se+65hy9DqhpCCp/74IMPmsWLF8u6devsfk4IndjTiQPtxV34wLm9edx0wzuoABl9rwqkKrxGbyFQbVEKcfDRJBAzAQiURjKkoCCy7QdWV9hKU7lCGbm8+SXy7PPT2afGTJMXJpsAG2eyifN5cSVw3oXnm/fenSXZ2aUkPzcyWbGmsgJTWZjB7lvA3J/wiYmK1dhkhiKmqgX5dgUR2z6zMuDttbwUhPMkPz+vcBAoCIXESBZUoWLCVtTkQQIpJ+Bq5t19c+4eIDfMhE72IxObyF5gN+6kOqBA+A+8I3CihT3NxxxzjJxyyily7LHHSocOHTjGpLzmvZWBqVOnGniq3bp1q/z666/WEgTC58aNG20MU3ipheCJNqWLF64H4r3t8dS2q+0ZCySRsSAitEY7XPEWFeaGBPZAwET8L0goQ0IZWRKCjwbMK/LypEKFsnJj25tk+AhahLDteJMAB39v1gtzFSOBAQ8MMg888IDk5+Rbe2+Yyv6xSh3RYRb30AmJuuOPOOGJrCJGNDoFYkKZeKAVaO04EApJKJRpVx13rz0W9/G8jwTiQsA1LYyOaahtVtu6msrqdWp26MazVMc91atXF+ynbNy4seA74lS2b9+eY0pcai2YiTz//PMGwiZicm7evNkKoPBk+8svv8j69esLwzW53mt1AcQVIl3BUgXM6P2g1GYGs435qdRZWCi3nfQfjn/wE9ZTOGCKfu2118rjQ59gv+unig1IXtkoA1LR6VrMoU8NNb169pZdW3dYb6yZIZiTQMMIQS+ybyGWY0+r4rrvTN3yY9KCFXXdF4F7IGRCUwkNpz4vMtHRV2v3CmQsmQjsNWAVWz0FFlExC+62SXeirXHWdFLuvjOqLVKTV9VeQjOE76eeeqrVUI4ePZrjRzHrhbcVnUCfPn3M+++/L4sWLZJt27btXuTLK+yPVaOuTlJc8+8/Fv8iTTbatLboueEdJJB4AjCRxZG/2xpL263uc8e8A44Jhw8fLq2vu4H9ceKrhE8oAgE2yCLA4qXeI9DulpvMs88+JwW5eRIyf2grMbnQSfO+cr2nVe0/XW/gcTZyRs1tMQGHuQp+YyURExo7qbEazEgcToRKgWyrIUi8R445CgqBaKc96qhHy6/72Wx7zs627TriTbmaHH300TakD/ZR1q1bV9q0acMxIygNx8PlHDp0qI3TOXPmTKvthHmtWppotm0/7SwyRjsTogbTwxXMrFkCaMMqTOo+d53XWCsT6y0/0zpPe/W1/7FvZrvxFAE2SE9VBzNTVALHHn+U+fGHJZKZEbJhPaA5hPIwKyvDepPN2I+j5FhitkV7xdR9ma52FM/DYTWXYRPxRJsZWXnkQQKpIuAuoLjOU9CmofHBvkkIlXDKc/jhh0v9+vXtH8OHpKrG+NziEOjRo4f57LPPZMmSJVbY1H2caNsapgrpRnuijV5gLM6zeQ8JJJoA+mrsKXa9JqM/L5WdaRfSET94w8bNnM8nuiKYfpEIsEEWCRcv9hKBvv16mkcf/Y/k5obhsFXEajAzpMBg1Q/b4Y3dk7mvY19mtIUOfrKyCicp0auJ+fm5u5NXAfOPB3Ly4qXWEsy8qJYGbVFNXyFUHnLIIXb/TtOmTeWII46Qzp07cywIZhNJu1LfddddZsGCBTZ0FP40RIpqNIu6fSLtALFAviEAS6mC/Hy7YK5O1vTTmsuGI3HYypXOlt69e0vv/oPYj/umdtM/o2yM6V/HaVvC+g3qmS+/+NquSutRlH2XaQuGBUsbArrfFwVSjbk64HE9ukJTg4m0Xg+TbTXpVnNxOOFB2BCYvT755JPs+9OmlbAgeyPQu3dvo/E58akhUkqXLm3fJ9dZkPvuqOYT6Wo4HjVNVE/l2JvvxorFtepcCO8fjpJ4MWetJohAGm35tw7XCvLtQvpZDU6SOZ9/zX49Qc2GyRadABtj0ZnxDo8QqFnrELNyxVqP5IbZIIH4E3ADzUc75lGnU/rp7jGDySsmxNg/edxxx8mJJ54oI0aMYH8f/ypiij4jMGzYMKOLLroos2LFCus8aNWqVbJs2TIrGG7atOlPJoka5keFR8RehtkihFEInXpePTFHh0bxGSZm1w8E4CAiIyRZ2SIHlMqW2zvcLP2GcPHQD1UXhDxywhGEWk7DMnbqdJuZMGGC7NixKw1LxyKRQIQAJrWYsKqZn2pJdD+l7snRPZXQqiAO5VVXXWWFyhtuoGdBtiUSKCqB8ePHm7lz5wr+li9fbmN2QpB0PdSqBlPTVusZNWFUr7ZFfTavJ4FYCWSEjYThVNCE5YAKZaRS6Wzp0qmz3D3oIc7tY4XI6xJGgI0wYWiZcCIJNG3axDp1KKATnURiZtopJuBqMFWIxDnVlkDQrFixopQrV04OPfRQadWqlfTq1Yv9eorrjY9PHwLPPvusmTRpksyfP1+2bNlitZpwIqSaSldzqQs+WBDCQRPZ9GkHXixJmaxs2ZGbI/BlGMoQKZ0hUqFcWTm8dh3pcFtXue22WzgWeLHiApInNr6AVHQ6FfP227uYKVOmyNq1vxfueUH5Yo15mU4sWJb0JgCtCDQhaoKnAifOQajEfspmzZrJf/7zH/bl6d0UWDoPEOjcubOBKe2vv/5qzWkhaKqVAd5NCJYQKvF+ut5rPZB1ZiENCSBMSZmyZWUXhEwJS3ZWSPJy4MVepPbhdeT2O7vKHXfcwbEhDeveD0Viw/NDLTGPfyLQqFED89VXX0leXsGfHPxQwGRDSTcC6p4e5YJjEjW/O+mkk+TMM8+UoUOHsg9Pt0pneTxP4LnnnrNj0Jtvvmn3bCI0irtH2nXE5fnCxJLBNHKME0tx/XINvOXn54dteLTM7IzdHmdF8vNEsjNLSe0jD5effvqJY4RfKjTN8smGl2YVmu7FueOOrmbixImydev2wrALKlhSwEz32g9e+TBRVSciEDbhsOfCCy+kxjJ4TYEl9iiBrl27mnfffVd++eUX2bFjh130xLuKQ01lPZp1ZsvnBMIShuJSypQqLwiZlh/Ok1JlsiUvJ19CoUyr1UT4kvvvv59zfZ/XtR+zz0bnx1oLcJ7r1z/FLFy40Hae2PuiAzk99gW4UQSg6HXq1JHLL79cHn/8cfbZAahvFtF/BCBovvHGG4WxN91QQf4rDXPsBwLhTCOSZ6RUqLR19JORJZJbkCehjAyRMBY6MqR69epwVMVxww8VmmZ5ZKNLswpN5+L06nW3GT58uOTm5kvEgx9WicPpXGSWLcUENMbq3hYwcB7hCtSjJH7b2GS7Fz90TxaKoRp2/F+9wOITGkrcjwOOQ9S8DucRbuSmm26SYcOGsa9OcVvg40kgFgJDhw41o0aNEsTdxPsfLWiiT8F53acZbXmjsTU17mYsz+Q1JLAnAhq6qnHjxvLRRx9xDGEzSSoBNrik4ubDSkLggAMqGJggYc9BxAyplBQURCbmPEggEQQg7Gn8uz2lrwKkXodr3PAEEBI11p57vw786rTHdRQCIbNu3brSpEkTGT16NPvoRFQs0ySBBBOYNGmSmTx5ssDbObzP4l1H3EwNZ6KCJARMN4atu/hEL7QJrqQ0T17HpUqVKsltt90mDz3E8CVpXuWeKh4nL56qDmZmbwTatLnRPPvsRMnMzJBwOBIfECFKYAnCgwQSRWBPkz/VOOikULWcmAzqBDI6KDuERtVcalgD1WDgf9BgQhN6/PHHywUXXCBDhgxh35yoSmW6JJBEAhMmTLB+A+bNm2f3aOK9R1+Ad95dmIrWZKI/0L4iidmN8VH0+hMjqJRe5lrEYJtFz549pUOHDhxbUlorwXk4G1pw6tq3JZ02baq5+eabrUt4mMfqQIzOk459fFutvsi4CoVqIusKnBAi1ZwVhdHBXLUOrhkc/q+CqAqmGs4A3mFr1qwp55xzjgwfPpx9si9aBjNJAkUjcN1115n//ve/dhFK42XiE/0GDvUQrRYPrlazaE/i1SQQIaDbNbBYgXZ37rnnyuzZsznGsIEkhQAbWlIw8yElIdC8+SXmnXfescIlBmMMwDooU8AsCVneuz8Cas62J60lzml71FiVGMRV2MQn2irMZCtWrCiHHXaY9QJbu3Ztu7cS2gl8VqtWDeZL7Iv3Vxn8Pwn4nECvXr3MtGnTZO3atbJr1y7bP+hClQoE7h5tXZTyRLGptPRENRQlE7owqgsacPhz1113SY8ePTjeFAUkry0WATayYmHjTckiMGnSRAOzjtWr1xYOxNGT/mTlhc8hAbftqUMfNXNTjYM67sHviy++WP72t7/JAw88wL6WzYcESMASaNmypXn77bdl69athQumEAJUe+nuzyQyEigJAfUJoG2qQYMG8vHHH3M8KglU3hsTATaymDDxolQRuKLFpeaN19+y+y4jMcVgUhTxwleqVJZ1+MODBBJFwDWJdT3J6h5Ldw8VvkMbCQc9iFXZu3dv9q+JqhimSwI+JzBixAgzevRoGz8TgqYuXjGOps8r1kPZ1/FJt2/gd7ly5bDgKXfeeSfHJw/VVTpmhQ0sHWs1TcrUvHlz8867b0hIMiUnJ+IEJS+vwDr2UScJ9LKXJpXt0WLovihXc4nBGvsm8Ve1alWBhz6Yvp522mnSuXNn9qkerUtmiwS8SKBPnz7mxRdftPEzd+7cWei1mnE0vVhb/sqTasUxZqE9aUitI444AmF0OFb5qzp9l1s2MN9VWTAyfOklfzcffzxPNm3eEYwCs5QJIaAaSDVn1Rh0rnkrBEXsndSYlviuDqR0nyUGZ1yH38cee6yceuqp9q9bt27sQxNSc0yUBIJFoHXr1ubdd9+VTZs22YKrgKl9GM5FrHgiDsX0t/ZVWAzDdxUm3MUxd4Es+nuwKAevtNouNPyNOpa699575Z577uH4FbwmkbQSs3ElDTUfFAuB55+fYsY+/bR8+OEcO8DmF7CJxsKN1+yZgA6u0Y40dLDVyZjGoUQqKoTqRAxp1KxVS0495RSBk4Snn36ajZINjgRIIO4ERo0aZd544w3skZM1a9ZYSx0crnk+nIbhQJgT7K/T/7serdF3qedQdRQUHXLJNe+Pe0GYoKcIuH4C0GawiNq0aVP56KOPOJZ5qqbSKzNsXOlVn74uzRNPDLWBqb/84ovdzg6MSIiBLn1dqSnOvHrPwwCrh8ahwwIGzutEzPUIi0kZJnAHH3ywnHXWWXL55ZdLu3bt2F+muD75eBIIAgHsz/zoo4/kgw8+kN9//916nAKl/AQAACAASURBVEU/hf4K/RIOCJrqFAi/0X+pN2tco1YaroCqe8dxjgJmEFpSpF2ot2INnaUezPv27St9+vThuBaMppD0UrJhJR05H7gnAh073mpXbtesWWc1lwV5+Xb1tsDQiQ9bTPEJqDZSzYLcCRlSVc96uA7tTk3PMHlr1qyZtGnTBh4f2U8Wvwp4JwmQQAkIPP744zZM14IFC6ywqYtl+ok+S+Mduia0aoGhj44O6eWa3pYge7zVBwTUwznGOHzH+Ib6P+GEE2ThwoUc33xQh37MIhuWH2stjfI8ceIEM2bMGDt4woEPnBxEVmOzd6+wGu+VlvHAvFcn+8iRu/9Szciw0q8ru1jtx3cMuohLefLJJ0v79u3lxhtvZP/oq5pmZkkgvQk88cQTdp/ml19+aWNpQqCE0BAZMzOt0KDCBM6p5so1k3Vj+qY3LZYOBHQvri6o6hiINgG/AlhInTFjBsc6Npe4E2CjijtSJhgrgR49upsXXnhBVqxYIfn5BWJMRKOEgRLCJkyC8vMjget5kEBxCagWUwdYHXQ1vYMOOkhq1KghhxxyiFx//fXStm1b9ovFhc37SIAEkkIAZrTvvfee/Pjjj7Js2TJrRovFMhUqXQ2lG6M3OvRSUjLLh6SEgC4mYEEVbQPzK9V2W+sdCUuZMmUEDn+633U3x72U1FL6PpQNKn3r1rMlg9Zy+vTp8r///c+GH9G4X+gAdVUNm9DdlTfPFoYZ8zQB14MeMqpOfRAL7NBDD5XatWvLFVdcIbfffjv7Qk/XJDNHAiSwNwKDBw82CxculK+++soKmzt27LCOXCBY6F5zV8gkyWAQgICpjqAwFmLxQbeF2C1I+XlSunQp+ec//ynPTZrCMTAYzSJppWSDShpqPmjq1MlWsITzApj3QLjUAVD3BWBQxAFzRdcrHuntgQBNdWNqFhpkWldzy5cvL+eddx72VsoNN9zAPjAmiryIBEjADwSGDh1qYEL7zTffWO1mTk6O1V7taauAms76oVzMY/EIqAdi16uwLrRmZUaGv0svvVRefe1/HAuLh5h37YUAGxSbRlII3HffIDN+/HhZtWqVXVnNz4f3Tqyu7tuJjzXngdlsRoZdiVUNJ/ZqQjjFipx2lupVT01AdI+dGzMM1+ieu2inB0kBwYfElQAWIWDioxpvXa11nV2oJhz1XaVKFWsGO3ToUPZ9ca0JJkYCJOA1AqNHjzbz58+XuXPnytKlS62wqaFP1EmQK3i6YyKdAHmtNuOfn3C4ohxywA5pdOyh0rVzT/l7204cF+OPObApsjEFtuqTU/Bnnx1vJk2aJJ999pndI7Jjxy774AoVylkzHpF9hyHBYIiBDgKDCoe4H4KExnPSa1TjqSYguE7dcu8pRhjyo4NtcmjwKfEm4MaH03aAc6q11OfhHPZa3nfffdKxY0f2e/GuCKZHAiTgaQITJkywntrnzJljLYhUmMQYiUU6jIc4NJSJmlN6ulDMXIkIZIRKS7lyIg2OrSWNj68rj0x6hWNjiYjyZpcAGxPbQ8IIXHDBBebzzz+TTZs2Wwc+0FhC0FOtZSiEwWz/AqaGj9D9dBAssRKLARJ76XDA+6fGLsRAqfHCXO2lmgPpXhTGAUtY1SctYd1jgrrU9qELC/jU1flKlSrJxo0b2d8lrWb4IBIgAa8SuPjii80nn3wimzdvts70VLjUkCc6Nrrxg71aFuar+AQyMB8LZUm1A8vLabWry9lnny09hj3NcbL4SHmnQ4ANic1B7u7ZzSxevFhaXtNKWre+vsRt4qGHHjL//e9/rSt1XRFVTZMKfK7maV9VoB5A4U4bZpCqnYKQefTRR8vpp58uNWvWlOOOO85qrVavXm33nqjDAwiiqv10veth4EQaHED3/QLszaW9V1zdqzm064Zf25yGIsHiw4033ihPPPFEids2uwsSIAESSBcCVatWNevXry8cB2ElhAVdd+EuXcrKcvyVQGZGWPKktJTJzJY6lUtLo5OOlwnvzuU4ycYSFwJsSHHB6N9Eut7e0UybNk1Wr/5dDqtxqFx77bUyZEjx9qc9/PDD5s0337Se7DZt2mShqAAHARHCAFZKXRPG/TkZwP26OR1pQGCsXr26XHbZZTJ27Nh9tt+77rrLmgR9++23u0OeRAZOV+j1b80lJ+f72oeTyj066t9I2xc02VhAQPvQVXj8rly5srRp00Yef/xx9nXJaTJ8CgmQgE8ItG/f3vpGcAVL3VaiC7I+KQqzWQwCYYyKBWEpnVHKhiw54fBDpF/P2+Wq23pwvCwGT97yZwJsRAFuEUOGDzajnxwpPy1earV58OqKCXnDhg3loosukh499t/JjBo1yvz222/y8ccfy9dffw0zxMLAz7qvw907qXEu1QnL/vBDiNH78f2oo46Sdu3aSZ8+fWJqu4gV9tRTT1mtpuvcQNPkHsx914ArREZrCVMpYGqusfig5tI45y5G1KtXT1q1aiXdu3ePqa3sry3y/yRAAiSQbgRatGhhXnnllUKneejXMXajX93fAnC6sQhaecKlsiVrV471hJGXXUZKmxy55ZrLZdiUVzlmBq0xJKC8bEQJgOqXJM84t6n56vOvZevWrVb40r0YEDYrVKggdevWtcLmkUceafc4GlNgBxwIh+vWrZNFixbJ/PlfyIYNGwReXXUfHO5Hem4cLmiVVKjTldFoRyx74qYmtXgu8nDbbbfJww8/XKR2+8gjj5ghQ4bYPGv+3f2YfqmvVOYzeqLhFQ+86iFWPQaDETTdzZo1kxkzZhSpnaSSL59NAiRAAqkicPjhhxt4eIeHdddZGhdgU1UjyXlu2ISlbEa2hKVAcgysxTLl+MNqSocOt0iXXr05fianGtL2KWxAaVu1+y5Y4zMamQULFkju9kiYDwgQ+fm5heaFGsoDQie0mpE4lZnWxNSGhDD5VluZlxvx2OmGhVAhrjDWUlZWoSdYDFj4i3Xvo3q0w3Ox3/KDDz4oVpu95JJLzMyZM+0A6sbeDGj1F7nYXhUw3T26WHGHhrtTp07SrVu3YrWTIoPhDSRAAiTgcwLYTjJu3Dg7pqtVCMZvrywk+hyvZ7OfEQqLKciSjMwMKcjOlXCuSHZGWTmn6Wny7pzZHEM9W3P+yBgbkD/qKa65PPmUv5nvvv3BenPdm7OWaHPIuGagCIkhH+XLl7cCbP/+/aVnz57FarPPP/+8ueWWW6zXPBy6D5QDaBEqIwGXujFLNZRMdPxSPFZd5qM9qNZSHTVhQnTCCSdI69atKVgmoI6YJAmQQPoT6N+/v5kwYYKsWLHCFlb7Y1geYVEZfW/0ojHHT3+3C13Ax8K7xhFHvUOp0K1bN8y5ijXf8jcV5j5eBNh44kXSJ+l0v+t2M3r0aNm5A2E+Qr4QMCFc1KpVS5YtW1ai9nrUUUcZBJuGBhMDY6xaVJ9UrW+zqaFEIGyqIKmTGxUodXKDa/UaDIIQLFu0aBHTfmHfAmLGSYAESCAJBCZPnmxGjhwpc+fOLfRZoNZJuvUFXmZ1kS8JWeIjEkjA9aaviwdqFg2LsQ8//LBEc64EZp1J+4AAG48PKileWRw1eoTp27evbFi/ScJh+VMw+mgTSK9oMLGqBtNHhCH54YcfStRemzRpYuCMCIeayXKPSbxaV/HScbWRukfXNc1Sd/mq6cRkBxpt7A0+//zzZcCAASVqE8XLNe8iARIggfQl0K5dO/P+++/L8uXL7fiLfe3QcqG/hi8EHPAITydA/m4DurirpXA9CKOe7+15p9w14AGOsf6u5pTlng0nZeiT/+BjjjnKLFmyxAqXfokBqfs1jz/+eIQbKVF7bdasmR00sQKrbtk5QCa/HbpPVK2lDnT4xGQGkxe3jeI6OJ0666yz5KSTToKzpxK1hdSWmk8nARIgAW8TGDNmjHnhhRfk008/tWHHsBUBYycOajC9XXex5k7HX1yv3yP+NrKtpdAZJxwlc77+kWNtrEB53Z8IsOEEpEE0adLYfP7555KXV1DojjwWL66pxqMarBo1asivv/5aovbaqFEj88UXX9jBUfce0Ew2tTUM/hjMIEzCEzEOjXeK8wceeKA0adJE6tevLwMHDixR/ae2pHw6CZAACfiPQNeuXc2kSZOs/wIIHRqeShdp/Vci5jiagPqkwLxIHTzimmOrHiCXX3WlPPrUMxx72WyKTICNpsjI/HfD2WefbT766CM7OKidvcYL9LqJqGowK1WqBA93JWqvtWrVMsuWLfuTF1uvl99/ra1oOYYwqYIlYq+hjWKAq1mzppx77rny3HPPlajOi5YbXk0CJEACJBBN4LrrrjOvvvqqbN++3S4IwukPvcymup1gaDQlyoQu8KpmWhcNdBHhgMywZJTKlganNZF3ZhXPg3+JMsibfU2AkzdfV9/+M3/zze3MM888Yx36YED4w1uY2b0SWbIOav85KPkV6OwqVqwo3bt3L/aeu6eeesr06tVLtm3bVrhvRONxljyHTKG4BFRDjZXTAw44wJrBwgR25MiR7JuKC5X3kQAJkEACCJx//vnmm2++seMohE0u0CYAcpKTjN6mor/tFpW8PCldKlNy8guk8Wmny7x58zguJ7l+/Pw4NhY/195+8t6jRw8zduwY2bFjh+TmRjy/lSlTrnBzfsRENrKnwquHG04EgseCBQuK1WbPOussM2/evMJ4nNDgQtjmHszU1jzaIDwEn3jiiXL11VfLv/71r2LVb2pLwaeTAAmQQDAIYG/mmDFjZPHixYVhv4JR8vQspWorVQGhVmN2H6YJSxiWbxmRbSwXXHCB/O9/r3GMTs+mEPdSsaHEHak3EuzSpZMZP/5Zu8ro50NXSKFthIYLsQ5HjRpVpHbbs2dPq8Vdu3at1eLqoXsx/cwn1XlXZw86KKnbc+QLZjfqrVcdRECgx4CGPwiWZ5xxhlx44YVy0003FalOU11uPp8ESIAEgkzgrrvuMpMnT5Z169bZxVqMAa42DAKKhpVSSxUND+YH/w9Brlstuwqf+I26rVq1qjz44IMcr9k4YiLASV1MmPx10ZAhj5n+/fvL9u07fa+hUyc82IO5detWayp72223ycMPPxxT24Vw+fLLLyPESaEXPHffATWYJWvbyk9jU2o4EaSqznpU+MS1+EP8SqyEXnXVVVgwiKkeS5ZL3k0CJEACJBBvAtBmDhs2TBYtWlTo2wCLijg0fib6f11UVOd6bjzjeOeJ6cWfgI7rWChG3OkXXniB43b8MaddimwkaValI0eOMPfff7+sXLla4DQFm/H9fGAgQqeGT6yS4nuFChWkadOm8tpr+zbVuOaaa8zs2bNlw4YNfxnsVNhBujyKT8B1V6+hRsAW5/EHIRNtEOfQHlFv7dq1k+uuu459T/Gx804SIAES8AyBK664wrz99tuF207UaQz6fQicGBv0nFol6cKjZwqRFhkpueMfF4MbukS1mdBiDh48WG644QaO4WnRZhJXCDaQxLFNespTpkwyAwYMkKVLl0pGRpad2Pt9E76rEVOgMK/BoFW+fHm7d++0006zWrEjjjhC5s6dKytWrJAPPvjA7j1FPEUIOVhNxQCH9DDoqcYt6ZWUZg9EPahHQdSLLmhgIQAHfiNgMzTPN910kzzyyCPsc9KsDbA4JEACJNC9e3czceJEuxUFh3qqVzIYe9U0FuOvX2JxB7lmXZNn1J3W3xVXXCEvvfQSx/IgN44Yys4GEgMkP1wybtzT5oEHHpBffvnNClAQpjRYrh/yv688uqug0IppLC5dAcVAhmtycnJsmaHp1EP3AOJada+umjZ3f4HfGaUq/6qtxPN1MUP32eAc4lheeeWV8swzjKOVqjric0mABEggGQRGjBhhRo0aJUuWLLHjsVqw4NnR2ygY5iQZNVKyZ+hcSetPt8RgXB8yZIi0bduWMkTJEKf13WwcaVK9DRvWN/PnfyHlypWzmjs1AU2H4un+DRVidOVTHcqo1kyFS5QdQif+r8JmtAMC1WTSRLZkLUTrwN1vg+9oh9Aod+jQQe688072MyXDzLtJgARIwBcEJk+ebEaOHAmP7zacCQ43vqIKlvjUccMXBQtwJtVSSffQot7+/ve/yzvvvMOxPcDtYn9FZ+PYHyEf/L/Flc3N6/97UwoKjBWqXPNEv5vIqlDp7u9TgdIVGnEdBizd5+EOXjDRxHkNS6JmHurR1AdV7Nksqgmzms+A8cEHHyyXXnqpTJgwgf2LZ2uOGSMBEiCBxBHo2rWree2112T58uV2DyYOXZDUhV862Usc/3ikrOO7Lt7jEwfqD/MqaKvbtGnDcT4esNMwDTYMH1fqY489Zqa/PE3mz/9c8vNgOmoKNZi6sd7vGjrX+5yaY6LTgxCN/ZU40NHt3BnxmKv7PCCEggHOqWCJ39Hf00EAT2UTjh6AsBe2ffv2cALAviWVFcNnkwAJkECKCcDL7JQpU+Szzz6zXuBxqLDCsTfFlRPD46PHd/UIrAsD55xzjrz33nsc62NgGcRL2DB8XOu1ah1mli9fWRh/CkVx97/5uGjMukcI6D5VXXnW/b3InmqQIbRDgwkvsdBc0oW5RyqP2SABEiABDxBo1aqV1WZiIRhjiZrJYnxRayPXosg954HsMwt7IYAFZe7FZPPYGwEKmD5sGwMG9jGjR42RjRs3Sl5eQaHmDkVB5+13raUPqyRts6yCpS5cqMCpZtja3nC+Tp06snjxYvYpadsaWDASIAESKB6BXr16mSeeeMI6/9GFSjdUCcYUbGVRL++6iFm8p6X2rvgGC0lQWeKQSYz/zZo1k5kzZ3LcT1A1+TlZNgqf1V7zyy4yb7/1ru2Ec3P/CLuhq3+uSanPisbsepiA276wuqyTAAww+F6pUiVBiBw69PFwJTJrJEACJJBCAoiXOXPmTNm+fbsdN9T5j5pewnkMzum4gk8e3iWA+qlWrZr07dtXunbtSnnCu1WVkpyxQaQEe/EeCk+xX375pYTDRrBnPjsbXtiM7ahxuN5WuXm+eIx5158JuE583NVm1ZKjnUHgvOqqq+T5559nf8IGRAIkQAIksFcCDRs2NF9//bX9P7SZOq7oJ0KbQJOpQiZRepeA+vo4++yzqcX0bjWlLGecEKYMfewPnjJlkrnvvvvk22+/t/vccnN37dYgmcLYg5qaO/GP/Qm8kgT2TgBtSlea3UFf44qeccYZMnfuXPYlbEQkQAIkQAL7JXD88ceb77//3i5OQkjRGNZqOquaSzoC2i/KlF6glkzwHD9w4EDp3Lkz5wEprRFvPZyNwVv18ZfcPPnkcLtv4aefltr/wYREN8CXLp1t92DyIIFEElDvvOqBVwVLPLNWrVoyaNAgadeuHfuSRFYC0yYBEiCBNCEwbtw4M2zYMIEmM9oyBguaGus6TYqbtsXQusK89Pzzz5d3332X84C0re2iF4yNoejMknZHv/73mHHjxsnaNb+LMZGqgklsVlaGNSHR2JBJyxAfFDgCGhpGPyFcRvb/5kqVKlWkU6dOct9997EfCVzLYIFJgARIoPgEIGQOHjxYvvnmGytk6hYfjamMMYYazOLzTcadqsHEvABOmi666CJ56aWXOB9IBnwfPIMNwaOVdGnzC83s2bMlJydXxISsYCmSUbgBvqAg7y+rfO6+S3qS9WjF+ixbOoCoW3n9Xa5cOWnYsKHMmTOHfYjP6pTZJQESIAEvEHjmmWdM//79ZcWKFX9aMFcTWfqSiFMtxcFj7J5yovWjlnUVK1aUoUOHStu2bTkviFPV+TkZNgIP1t7llzc3b7zxxp8c+Hgwm8xSAAhgoHfdx6sm84QTTpBFixax/whAG2ARSYAESCBRBC677DLz1ltvCbZgwDQWh4a/ooCZKOrxSVe1zpgjQMjE3wV/v0jefectzg3ig9jXqbAReKz6zjr7dPPBnHmFuaKJiMcqKGDZUS9xGPz1gDazefPm8uqrr7L/CFh7YHFJgARIIJ4Epk6darDVYv369X/ajwmzSwgsPLxLQBcAsCCAuSrqq3LlyrJp0ybODbxbbUnLGRtB0lDv+0Fw5vPUU0/Jt99+K1lZpay5SCiUKfn5uR7JIbMRRAIYOCBQ4lNXlzHwd+zYUR577DH2H0FsFCwzCZAACcSRwJVXXmlefvnl3V7yc+14o9sy4vgYJpUAAu4+zIyQsfHZBw7sLwMG3sv5QQJ4+ylJNgAP1Fa37l3Ny9NfldWrV0tOTt7uVbsMm7OMyAcPvxNI0B6IomEpeiZUsFSTJTyvRo0aAucMrVq1Yv9RtArg1SRAAiRAAnsgUKFCBbN9+/ZCwRLasERacBV9NGS1RRNwNZiZGZFY7FkhEYQumzWHocuC3mI4QUxxC7iixaVm3rx5sm7tRpuTSOD6bLuCF3HfnZ+cHLK3TQ5nHz9FY2Bi8Pjwww/Zd/i4Lpl1EiABEvASAdViQnMJK5ldu3YlVMD0Utn9mhc3koEJF4gxItkZItnZWXLppZfKC9O5jcavdRuPfHOSGA+KxUhjypRJ5tH/PCwINrxzR2R/W8QkJGSFTBUsucm9GHB5S9wIuK7jI4sfmXLTTTfJqFGj2HfEjTITIgESIAESOPTQQ82qVatoHuuTpuBuoUGWS5fKslZ4mZkhObRaVRn82GPS8vp/ca7gk/qMdzZZ8fEmGkN699zT0zw36VlZuXKVFORjtUc3s2dY4RIhSCICZ6gw/mUMyfISEog7Aey71JiraJtlypSRESNGSLt27dh3xJ02EyQBEiCB4BK45ZZbzPTp02Xt2rV/CcMWXCreLbkbpgTf1dEP5rT4/s8rLpXJL0znXMG7VZjQnLHiE4r3z4lPnTrZjBs3Tj7+5CNr/pGXFxYTjmguEedSnajAsU92dqbk5SV2D0ISi57QR9G6N3F4I86moFGPOF2oUqWKrFu3jv1G4pAzZRIgARIILIEWLVqYN998U3Jzc+3Yw8O7BHTbDIRJ1BUWo0uXKSc5u3Zhv5ccXrWy3H3PPdL5zrtYkd6txoTljJWeMLR/Thhay8mTJ8uqVWsK4wXRS1oM8D0gPUb2wobtnzvgaf2pMwL1poZS6f8goGE1D4MlDqSlq3x+GDzVRFY1mYcddhiCYrPfiKHp8hISIAESIIGiERgzZozp16+frFmzpnC8/cMnRWShE2MoQmcl0glQ0XLNq/dEIJQRljMaNZY58z7lnCGATYSVnoRKb9HicjN79mzZuXOn1Uri0OD1mMDz8C4BDGYaA7JChQqybds2KzDi0MDQWLXDdXqooIl4UFu3brWDJOoZdY42gEMFNq8Lma4wjLw2aNBAPv2Ug4V3WyxzRgIkQAL+JnDdddeZl156yY6xWMAtXbq05OTk2C0a+I3zjJPphzoOS4UyZWVAn97SvU8/yht+qLI45pEVHkeYblKTJk00r7/+unzwwQfQ+FgTWHSO0GSpuWGi3XAnqGiBShZ1BcEQnxAkcbiaZ61LnEd9Qght2LChnHnmmXL//ffb96tbt25We40VWQiWKrD6QYOt5rHW/XhWlrRo0UJefPFF9huBegtYWBIgARJIPoGjjz7aYP6EeRPGILUiwpgMgZMazOTXSVGeiDB7Jj8sTRo1krmffcZ5Q1HgpcG1rPA4V2L//n3Na6+9Jt9++63k5sKEI9MKJGoiiVU3dJQQVlSLGecsMLk4ElCTVq2/cuXKWQFRzXNQl1hdhXB51FFHydVXX10oWLrZ6N+/v3n00Uft3lu0B92v4PUBUt2Q68B+2223yZNPPsl+I45tjEmRAAmQAAnsmUC/fv3MK6+8IitXrpTff/+dzn981FDsFqGsDCmVmSUPPfSQdLmzG+cOPqq/kmaVlV1SgiLy8MMPmk8++UQWLFhgtZV5efmSlRUxmYRJrO4ZwG8VLqM1YXHIBpNIEAHXjFkFrohjpgIrKGKhoFGjRjJnzpy9vk9PPvmk6datm12B1fuQhmpFE5T1EiermkvkG9/vv/9+6d27N/uNEpNlAiRAAiRAArESOO+888znn38uO3bssOOmHyyAYi1bul5nwuHCoh1//LHy3fc/cu6QrpW9h3KxsotY2WPHjjE///yzfPPNN/Ldd9/Jli1b7D677du3i75L6vgM2yszMyP79SBUiEReNncPn9c1WEXEk3aXQ7BCfUFjWbZs2UINpGqgjzzySLnqqqvk4Ycf3u+7VL16dbN+/frCwdEPJtKuBhMDOrwg/+tfjGuVdg2dBSIBEiABjxNo3LixFTLp5MfjFbU7exkSkvxwgYQyM8QUhKXlP66SaS8xbIk/aq/kudzvpLjkj/B/CoMGDTALFy6U3377TRAEGGYaubl/OHZRLRT2WGJCrnvsIo5cIp5HcT6iyZTC/QTptUndA+5eE9DUtN60jtWj7N/+9je57LLL5JFHHon5HTr11FMNtNyapu5vTEC245akq73dvX805vLGLRNMiARIgARIgARE5MQTTzSLFi2iqawPWkPIZEhmdobkFuRLqcwMObDiAbJm/QbOIXxQd/HIIit6HxT/8Y9/mHkff2BNMnbtzLWap3AYcQH/CDWhGh43lIUbiiIjI6twY3ok5EPEZFb3ZVKDGY9mnLg0UD+od+y9xHH22WdL/fr15cEHHyzyu3PGGWeYjz76qDBsCQRMr3uR1cURfELAzMnJKXK5E1c7TJkESIAESCBIBIYMGWJ69+5dGO4tSGX3W1kzwiEJZ4YkDOu9cFjKlyolTRqfLjM/eJ/zCL9VZjHyy0reC7SLLrzAzH7vQ8kriMQv5OFfAiokYq8knPVEO9nB/zXeoy4O4FpopCFYQaBs1qyZ3H333SV6Xzp16mSefPJJ+/zomJqpoqvaVJjr6nfNi8Yew298hzOjXbt2lYhBqsrJ55IACZAACaQHgc6dO5vnnnvObk/C4YYywW8dxzFupe/hfasxtYBSfxOYV6GuYAGGRYJWrVpxPpG+DVRYuXuo3CdHDjUPP/QfWblyXCwc4gAAIABJREFUrdU48vAvAY1jqcIlSqICpgp55cuXtxrKAw44QGrVqiV169aV4447Trp06RLX9+P+++83//nPf2wsTQ1vkuoBUIVI1abit+ZJtZc6YO9mGVcm/m1ZzDkJkAAJkECqCNx5551m/Pjx1v+FenlXAUaFzkRYiHlfrEtVjfz1uboNSJ0iYluYLvLXq1dPvvzyS84nvFNdcc8JK3cPSLvf1dWMfHK07NqVL6GQiTt0Jpg8Aq6GDp2ddnDIAYTJxo0bW2HypJNOSvhq2tNPP20GDBggq1evtqt4iRj8ikoWZq86OLvmsOCkwjnSVKdGubm57DOKCpnXkwAJkAAJxJ3A3XffbZ599lnrFwPjF/xfwPII4cDSy8dF3NElJUHMcXSuE3F0GXFyqd+7dOkiw4YN45wiKbWR/IewYvfA/I47O5mxT4+Xbdt2UcBMfpuM6xOhjVPtJTo2fD/55JPhKEBOP/10uemmm5L2DkyYMMH06tVL1q5da7WEun83rgUuYmIYlNHZq1ZXQ6ggGfxP9wrj++7BImm8ilgUXk4CJEACJBAwAt26dTOTJk2SdevW2TFLBRrXAidgSDxTXN16hIVsXQDAJ7bbYDHgsMMOg/NMzik8U2PxzQgrdg8827S9zjw/9b+Smwv7/XS24Y9vY/JiajrgoIODcNm6dWsZO3ZsStr98OHDTd++fa2JrA5+rpfWVPBTM2F0+NBSanwx5GW3U5/CFcdDDjkEwa5Twi4VbPhMEiABEiAB7xPo0aOHGTNmjHXICMFF/Rx4P+fpnUN1YqhbglxfDzr3aN++vYwZM4bzijRsCqzUPVTq+c3OMu/P/lBCoWwJh/PTsNqDUyQIcOjkKleuLNj/2L59+5S1+a5du5pRo0YVDoCohVTvwVQTFt2Er1pLCJrq/Aj5rFatGmJ9JlXjG5xWypKSAAmQAAmUhEDPnj3N0KFD4encJoMFZQ0vVpJ0eW/JCLhbbTCniPaeX6FCBdm0aVPK5mUlKx3v3hcBVuoe6Jzwt2PM4h+XijHw9kkB08+vEDo3eCxbsGBBytt6kyZNzCeffFLorTXV2kutV3X0o+bEGsu1YsWKUqlSJWnUqJFMn87gyH5+D5h3EiABEkh3Ai1btjSvvfaaFSyhyfSCn4N0Z76v8uncIlqjrHswcW/ZsmWlZcuWMmHChJTP0YJcV4koOys0iuozE542vfvcI6tXrRMTzpQMOvlJRLtLWprHHHOMDBw4EKaxKW3r2H+JDe0wj8WhoVO8MgC6oVzQ4R988MHSoEEDmTZtWkq5Ja2h8EEkQAIkQAK+J3DJJZeY9957zzr68cr46nuoxSyAOhGEgImFazWVVf8Tul+2Ro0asmzZMs41isnZq7exQqNq5q4ed1hb/u3bdkIMKIxXqC+HmhDiNg3pgE5MXyB1kuJuNvdq5SNfbgewJ3NNNZNUe3n8Vgc1uLcgP19KZZeyq4UqOGnnkV+QL/DBC+c6+n9wgekKzFhwfywmoq6mT80r9JzuZUQ6+hx84jz2DMJrayrNYrXuW7dubaZOnWo7WXWYE49YmDqA6opgdExP1+GB5gXnwF7zgtVeMIO2smnTptKkSRM5+uijsarI/sHLLy/zRgIkQAIk8BcCp556qlm0aJGdX+h4p/4FMEbqPk2vWBEFtQpRP/D6i+P6669PmX+MoPJPdLk5gYwifNHFzcysWbMkbD0q/+Fi2RW03E4JE3XXzl+FBzUJiEWAKm4lq4BQ3PtVSFa7ePUYCmFD9+Cph1Fc6wbNxXcVTPCJ37gPPNB5u/9TdmqLr0KqCuX7yv++PMFp+cEYz3WF/oMOOsgG8u3evbsn2vhBBx1k1q9fX+hCPV77Q9w4llpHrgMh5eIuACjvmjVr2r2piAMKr7oI2dKhQwdP8CpJm+a9JEACJEACwSUwcuRIM3LkSPn+++/t3EQX/iHM7Ny5s9AJkDqhCS6p1JZc58eYpyD++Ndff835R2qrJK5PZ2U6OJ+bNN7cfffdsnLFWilVChqeCB50TvoiqMZIhTL9v2rW1EuWJpsoEw1Xg1eSFgGh0N0Uj5iIKhBq56tBclWYcV1Pux2EftcOXcuu5zVcCPIbq/bSLdveNJlq3qnCPkw8O3XqJI899pgn2jc83MH5gLYNNxZnSduHlt0uh2RkWFzaNnX1FudUc4w81K5dW6699lp58MEHPcGnJO2X95IACZAACZBANIFHHnnEPP744zZGplpd6RxCx0hqMFPbbrQeNH7p2WefLW+//TbnJamtlrg9nRXpoLytYwczfvx42bkDm8Nh2hkJ3RAt2Ki5rFsLeFFUM6cT+niYQO6tpuMlYLomCtizoJpXtyyqlUReIByp4KKCp8ZQBCsIMio8upo0VzhVAVOv31drdk0+VbBVYd7VhKKDUhNZxLecN2+eZ9o2zHUWLFigcSQtYwh6GguqJG+zCphgogGM3Q30SBurtjiHz3bt2jGwcUmA814SIAESIAFfEOjVq5f13L5161Y7BuocoTgL3L4osM8yiTmderDXrU3dunWDx3rPzN98htRT2WUlOtVx5JG1zYoVK6wAlZ8fMbt07fZVA6VmsCrkqeCjJpuuWWJJNVSJbi3InxubSMsCbaOankJ407K6Jpmu+aya1KrZq2u+6poLq8CIcmla+xMw9f+aN/zem4CN9Lt27SpDhgzxRNuG6/TBgwfbdqTtAt/BN1rbXZy6juagixp4FlhAIw1vsBdffDEd9hQHMO8hARIgARLwLYHrr7/evPDCCzb/GA9h4QQzWRxen5/5FnqMGXd9lejCOxwz/vDDD56Yv8VYDF62FwKsxN1g7rtvkOnff4AYAy1dpt1/6W4EV+Em2jQWt6vWTvcl6jn89noHllUq2+69w14F7BFUbWRebq7Ub9BAzj37HIFHNmyYV4HILZeav2L1SU1jUf5y5cpJ1apVBQI7OFqHQAUFlpWyjGUPpqbvai1dgR7Pch0s4ffw4cOlS5cuKW/b11xzjZkxY4YdzDCoQUOsg5o6GohH+3BNmJWTCu9HHXWUNG/eXIYOHZpyHuyFSYAESIAESCDZBC644AIzd+7cwjFYfUZEW/skO19Bf547/9HFctQJlARPPPEE5yw+byCswN0VeMop9azXMdVcQsMEwUA1fK4QqZ0ShCocEKDUu6xrPqqq/0S0Ed0fWdI9BOUqlJdtW7aGBt13rxk9erSsXLmyMLt33HGHDB3yeGjEiBEGQtsPP/xQaNYJ5zD169eXVatW2fM4VAAFOwg2LVq0gNZMli5dWiho78kpzb74qCmLMneD9KqgqXsawRtC7erVq1ParhGS5IEHHrDlxoEyu3t41XNvPMx0kC7KrYKrtscqVarIscceK23btpVbb701pTwS0f6ZJgmQAAmQAAnESuCiiy4yM2fOtJer5izWe3ldYgjofFAtr9Ty7YQTTpBvvvmG85bEYE9aqqzA3agrVixvtm3bLpmZkdAZah6q+y1dJz4QDA4//HCpU6eOrF27FvF7ZOPGjTYlFRritUcyWoBUwTJeAmZGVqbk5+bZdvD0uLHWGQ0EbaQPzeYn8z62/+vcubMZN26cXQHE/8455xyZNWtWaPDjQ+w9y377TUK7ncyAwWmnnSYfzvkgdOmll5q33377LyExVBDanwavevXq9pkQ9mHeoh2R6/1NOyXsaYQp6PTp01Parpudf76ZOWtWoYm1am+1rLoXJJY9qLH0BK5GWPda/uMf/5DJkyenlEMseec1JEACJEACJJAMAvXr1zcLFy60i+H7m3skIz9Bf4b6kNDIBbpYjrlRx44dZeTIkZzD+LiRsPJE5OYObcz4ZyZKKJQpeXkRM87MzJAUII6j+UNo1JehYcOGMn/+/EJ27dq1M9DUbdu2zTYFNx5jSU0wXAFTHQmp4yFoCgvNRQvCEjZhycqMxDfMD0c6UF0h0u+q8VItGmTCgoLd7nJFpEfPu622cteOnVKnzhGydOkvheU85phjDLRyISNy4YUXyutvvvEn4RP5wl84LHLRxRfLW2++Hpo4ZZq58YbrRML5kpmBYLsRvgUFxu5DzM3PlVBIJCsUiSUaNkb+n73zAI+i6vr42d0UOgjSFBAQpElTeD9FERULogKKAorwSu+999AjHaQTOgjYKSoiRURUlCpIEUReBBEFpYdks3u/59xwliEC2WRmS3b/8zx5NmXmzr2/e2dyzj3N6UoichGVua8k9erXl5o1a2HLl+9O9ddfZ67tPkr9ziR9TdGiRalOnTo0ceLEgK/nJ598Un3zzTf6Hxhbts3+ExPlWXZd5dPosm3MkMdKdvXq1Wn9+vUBZ5GB34voOgiAAAiAQIgR4IzuXL7k8mU2JrA8kpxkRjzPjDKWNyE8IYbH78NhWVCMBsZ5YNmQw6zOnTsHOcbvs2LdDTF5RPRYjYfVV5u/1cqAw5Hs9upyOW9QzlhxypYtm7akuVyuf3G777771K+//qoVLM7WKZY+K6ZKHkJuSxQWiYM0Joxx2OzkTHJS5DXFU5RLqYHID7DE60k8JJGiqVPfpg4dkmMW2SI5fPhwunj+HLH18Pffr7ubvvpqfbVm9Wo9xr59+9LwEdfLXNSoUUNt2bJFD5eVV1ZA16xZo9t86eVX1GefrqGEhKtaYZdxsEJsd9goKiKScufISe07daQzZ8/SrDmziVxuevrJmrTq02Ql9vHHH1Pff/+9thpz+1JEuXjxEnTkyJGgWMdVqlTR2WIlMZSxHInZdWCMXTUqm7LpwUx4fdasWZM++OCDoOBhdsy4HgRAAARAAASsJPDggw+qXbt2aVnKWMNcspiybAQLpxniLH5cE/RSaUZC0EQmFI9BllN5PjjEZ+bMmZBnzExHAK8N+4mbN3+W6tu3H/15+m+PgpkcS+jS02J0ReVELVeuXNG/Tjln5cuXVwcOHPC8sIyxgmbn12h9lB02iXfkXR7uk2RnlU9jhlZ+WPn3Uu9S2hNLa79+fWj06Lc8Y6patarauXM7VXnwQdr2/XVLbc8e3dTs2bOpdOnS9P0PO/7FoGzZsurI4eR4zKZNm1Lc3Pmec+66q4A6ffq0tlyyAp7nznw63tNGSWRzEzVu1IgWLV+uz5/89iT19VdbqNErr1L9ho307xo0eEWxEvXOO8nnVK36oGJlv3nzltS9e/eAr2O27h4+fFgr8DIHklnX7PzLOjRm0TWuL14LrFw+99xz9N577wWchRXjRRsgAAIgAAIgYDWBwYMHq8mTJ9P58+e1EmP0EhOFU0p+WX1vtHcjAePGucg0RjmncOHCdPz4ccg0GXThhP3E1X+lrvr445UUFRlNCQlcjiM5y6nNdt11IqUJf/DgwRQTE+Nht3TpUjVw4ED63//+51EuxFJoNgmPWCqNMZ3yAOoHUhE5IpMztPKXuM3y9xF2h3aV5UNcY/kaKZmRrAi56I03mtL8+deVQc5++sH771GNGo/Rpi+/umGNtGvbWj366KPU+I2m/1o7b8WOUkOHDiW3M5Heeust6tKjt+ecF55/TnE22oTERHrllQZUtNi9NH7SRKKrV3Q/WzZrTm/Hzclw67F9+/Zq1apVdOLECcqaNatW9nl+pMyLJPex4v1g3OyQlzHPZY4cOXS8LNxiraCMNkAABEAABEKZQMuWLdWSJUs8nmYpM/6z/GZFiEsoM7zd2Ly3YSa3IvKtVGkQSybLVK+99hrNmZPxZMNwnXvjuDOcQG/lpK1YsUz169+Hfj16nBwOdpe4npHTmExGFrsk8ClRogS98cYb2l2TFYuVK1dyTKYnm6zEzaV8aaW378aHj9vQymNEhC59Ua9OXSK7jT7//HP688xf/KRq7wTtz85lQez2G2IxZYdO3Hi5Hc72anSr5LpRH7z/Lo0ePZK6db+uJHrT/6dqPqEunT9H323fdcPaatjgFfXuu+9T4cJ30/HfTuq/1XzqGbVl4xfErr0jhw2n7gP6Z5j12KZNG7V582b65Zdf9LzLwYqfuMZasQua0j06pass37dSpUq0c+fODMPOm3WEc0AABEAABEDAVwSKFSumWH4zZv6X2uci//nq3mj3umKZMmFlytIlpUqVogMHDkC+yYCLJqwnrWOnNmr+vEV6F4tdN3lhG18w/L0ol2yREhdTnmcu0yExmVw/kg9OsCIJeKSsiVH5uNn6EIXhVn+TdNqirMrPfC+2XP311196DmOGDVUzZ86kP06dIkdEhFbakhKd5CblKSzM4+EvLuXx5JNP6k9WgjgldJMmTTxroUvnjmrt2rV06GfrYhv79O6p4uLi6Omnn6blK667cZa49x71z5mzNH3qDGpo6EOwPUvTp0/XLtBcS+vChQu6vie76EpgurhPS8ZYSR5g1oJ9s/hbSerDf+N12LZtWxo9enRYP8vBtl7QHxAAARAAgeAlwJnxp06dqsOgWL5jWc0YWiShRME7gtDomSiYRrnGWLWB5ezmzZujLmYGnO6wFkqrVC2vdu3c7ymhIfMnmV8jIqIoKSlR/5oVCFYo+EXEi1/cJ0SRkFqYfK4ELntjwbxVuZGUZTiM2UT5QWTFkN0HjFm23njzv+q9994jZ0KCdp1lC2ama/1mRYiV0kaNGtG8efP8Pu9xcbPVoIEDafDggdSufWfP/UeOGqpiR42mieMmUsu27fzer1s9s1OmTFEHDx7UNT65FA0rlFwmhTMFi2XSmGJbNhIk3Ta3a/w+ve+GlAqmbHjwvbl9Lhezbt26oOGW3nHiOhAAARAAARDwJ4G77rpLcS4I3hjmgw0E8v/dqGz6s0/hfK+UVRNE/ilXrhzt3bsXck4GWxxhO2GTp4xRAwb2o6tXkmMSdcmMxGRlMvllk5xhjMt4SEmPlAqDWB/Fb1xiG2UnRpK93G5NpKZgSjYzo8J5XQGOoHFjxlLX7t0881j14YfUjh9+IHeSi6IjoyjBmagVS94FGjBgQFAkxEnJo/7LddQHH64KyFqcPHmyYjfXjRs36qB/jqFkSzUr5BJPmXJnTeIqeU5kl5NfjLxOZOPBqhgOY+ytvGwlxpPdnC9cuBAQbhnsPYfuggAIgAAIgMANBAYOHKg9q/744w+PFZP/d0smeLMeSMCdOoGU8ZdG+Urq0XMrnTp1ogkTJkDeSR1p0JwRtpP1xmv11Hvvf0xuirwhmNvo2uiPVNXiCiDKg9xTrKDye3HdFTdesZj+t0lTmr9wgWceBwwYoDO9/vXXX9rSqsjGIZpU+5matGbtF2E135yAh0vH8A7l338nZwlmvufOndPKozANmqfxFh25XrPU7jmDlct27drR+PHjw2pOg32u0D8QAAEQAIGMQ2DEiBHaVZaz3Bs3/L0xEGScUWbMntodkZTkTKCoSAfdlT8fHTtxCvJOBprKsJ2sOs8/qdZ+tpHc9mTXCLE4ye4Jv1yMVk1fzamxFpNYxFK6CRjdIiULLPeNd9kerPwA/bDjeikR7meZMmW0VY6vcyqiSBvRU49Xp8++2Bjy8923b19dj5PHz66tshtp3CUzWgV9Na9WtSvJBoyWUnbX5ljWVasCY/W1amxoBwRAAARAAAQCTaBXr15q/vz5no1olq1k8z/QfQvn+4usFhmRnKyyfZvWNGHKtJCXY0NlzsN2omIG9VbTpk6hv/65qudSlDvJFOuvFNVG11fph9EFlvvBLq6SYEjcdCW+M2f2HDRixAjq0KmjZy65zMjHH3+sFVCbPYKUy0n1671I73+8OmTnu1u3bmr9+vWcbcyTZdeYHc5YNkZcmsX1NZgf5pTWS+77/fffT7t37w7ZuQzm+UDfQAAEQAAEQo/Aiy++qL744gstP4hiY2WZsdAj5vsRieGHFUyu8nDnnbnprzN/Q/bxPXpL7hDWE9WpbXP18SdfaEuXKJT8cknptmoJ6Vs0Ij7m/EIz3luS+oiFUzLaSq1LjhdlKybHWfbv35/6GUp8xMXFqVatWuk7souBOymRhgzoSzEjY0Nyvh977DH1ww8/6CRMWbJk0e6vModGy58xW5lMhzElti/nOb1tS6IBWQ+c+bdv377Urdv1uNv0to3rQAAEQAAEQAAEiLieeZcuXeiff/7xVA8Idvkg1OfthtwWNk62mYkqV65MX2/9NiRl2VCbz7CfpIULF6pp06bR999/78kexpPMlkKxgPl60o3JW3jHRpQiUT5Z+WXFiRUoiRFl5fJqfDxlzZJV1+ScOXvWDXNZtmxZ9fPPP+vyK5miHTRlwnhq1b5TyM13/fr11QcffOCZIrHwimss/ywZXo1s+QI5x9fza7Z9sa7zGujTpw9vKITcPJplhOtBAARAAARAwAyB5557TnFNcRzBQYBlYAlVE1kuX948VKtWLVq0eCnkoOCYplv2AhN0DQ0rmlOmTCFWyti1VGoc+jqLmCiTrOxI+RNjeRPJVMsPWrFixahw4cK0fft2baXTQehuN1WtUpW+3/7DDXM5Z84cxUlg2K0gc6SdYoYMpD4DY0JuvjNlyqS4jikrX6xI8pe4w7JrMVt6jbEU4vJijMkM5mdUEg20adOGpk+fHnLzF8zs0TcQAAEQAIHwIpAjRw518eJFnQRQwpXCi0DwjJblNFEslbJRZKRDy3jZs2Xhigg0dNgIyETBM13/6gkmJwWSCRMm6FqSu3bt8pQt8eX8icIjsZ/8MytG/PPly5e1EskKUs6cOWnGjBnUsGFDW5s2bdSCBQv077kcScGCBWns2LHUoFHDG+bz/vvvVxyTaHe7qH+/3jR01JiQmu9atWqpdevWebLBCkvZ8UqpvBvTX/OcSgIdX86v2bZ5HTRu3Jjmz58fUnNnlguuBwEQAAEQAAGrCdSrV0+tXr1aK5dwkbWabtraYxlXz4Mj0pOIM1N0JLmSEum5556jVas/gVyUNqR+PRuTcwvcHPC9du1an+9giRIkDxJnCC1SpIju1eHDhz1ps/Ply0enTl1P0VyxYkW1Z88ectjslCdPHho2bBi1bd/uhvl86aWX1Cer15AryUnjRo+gbv0GhtR8FylSRBdJTq5XmqyI8yfvcInCbswiy3/nn41WaV9bqM0+zffddx8dPHgwpObNLBNcDwIgAAIgAAK+IpA3b17F5cxgwfQVYe/alZAw9sSzsceeUkTKRVkyR1P58uVp2/c3VlDwrlWc5S8CEFxvQzr7HblU/OXLlOR06rOiIqO08sKLnK2MEtt3u8mSJD38KcoOKz+SVEhcYO1kI5dbUY6cOWnCxIl07LdjNHz4MIqy2cjpdNEDD1SiHTuvZw5t2bKlWrZsmXaVzZMnL40aNYpat26Zwk12lurcqRNdTXASB69PmjQppOab/wmcPXv2ts+KxLcaS8CIUimJc/z1sN3sPhLELpnrJBGRuMYOGDCANw9Cat4CyRv3BgEQAAEQAIHbEeByZ3PmzNE1syXbvITesMumMSkjSPqOgMeCeU1+lrwo7KWWNWtW6tmpBQ0YNg7yke+mwFTLmJjb4MtfsIA6feoPrRjKIQoBx/bxkZoLBT8QklxGFFJ+QfHBbWXNnk1b3s79/Q9FRUTS/RUq0s6dybsyxUvfp349+DNFRNipbdu29PbUG2PwChcurP744w/9oPXq1YcGDOj3r/ksXepe9ccff9K58xdDaq4nTpyoBg8erN2IvT2MNU4lLjPQachlA0Lceo3xo1yOZMeOHSE1b97OFc4DARAAARAAgUARqFu3rlqzZo2W08RDijeCU4Y1Bap/4XBfMRCIrC014VlOYjn6/pKFafvew5CRgnQxYGJuMTFt27ZVixYtoqSrCeS+pgy6lZvsDse1HS2iqKhI7Z7p7SEWM1FSCxUqRH0HD6avvtxMK5YtJUpy02OPPUYbv9yk56VUmdLq2C9HtJsGx1y+0eS/N8wXZ1D98MMPKEeO7NSzZ28aNGjQv+azSaNX1Lvvv0/TZsyglq1udKH1tt/BeN7MmTMVZ1TlYPzbHfzPQBR6o7uLWDFT1iENxFiNbtLSn/z589PJkyfxfAZiQnBPEAABEACBsCYwe/ZsvYnNm/jiUSQbweK6GewhNhl9Ao0KphgFmLlwz5srC71Ytx7NXYCMssE41xBgbzEr7du2U1u3bqWE+HidUZZdUc9duKBfNAnOROJYSf69WDCNLxqj0mIsQcKKDv/M1k/egXn11Vdp+fLltlHjxqnhQwaTMz6Bnn/+eVq5epWel4avNVLvr1hOd9xxB505+89N5ypnrqzqyuWrxBljp0yZ+q9zpowdqfoPHEx9+/WngTHDQ2a++eXP9SDZhSW1g1mzoilJfeQFlTIeM7V2fPF3cQExllPJkSMH9ezZkwYPHhwy8+ULdmgTBEAABEAABHxF4OWXX9ZWTDYkSNk4vpdY0oJhg9pXYw+mdo1Z/42VFSLtiiIjIihfwbvov02bUcywoZCZgmjiMBleTsb0KW+rvT/9RJyVdd/+n+jMmTOUKVOmGzLN3swqJhY0tp7JgyHJZsaPH0+dOnWyDRo1Uo2MiaFom4OGDhlEvfsP0PPSv/9AtWD+HOJEL19u3nLTuerStYNatHAJNWjQgGbNmvOvc5YvnKOWv/s+ffzJ5yE11+3atdOZdBMSElKdwZSusaJgBkMacskazJsOvFnBfapUqRJt27YtpOYr1UnCCSAAAiAAAiAQRAQWL16srZi//fbbDXGXYtEMoq6GZFeMeTJuVlrOreVq0l85c9xBo2JHczgZZKcgWQ2YiHRMxLhx49SkSZPoxIkTnvjMWyWOkQdEdr8kmQtnfj179qzm373/QDVhzGiKUG5aNH8Bvd70uivs3LjZit0ymjR985Zz9VbsaNWn77/jL9MxtAxzCWf5/fTTT2/ICHuzzouFkK2VEt9otGQGegdS3GNFCeYMwmyZbd++PZ7NDLMa0VEQAAEQAIFQJPDKK6+olStXerLV8xhTljwLxXEHy5hERpNkS9wv8RyUHBb8u2xZslK1atVo3fpkVLO+AAAgAElEQVQvIDsFyeRhItI5Ef369VNcl/LSpUu6BaNfuLFJ4wPAiiIrmPzFVqrdu5Ozwrbo0EktmD2DMkVG0OUrVzEnXszJs88+qzZs2OB50d/qElHw2aWZD3FrZmWTrZ+pJWnyoiumTpEkUOJKPXz4cBowINmCjQMEQAAEQAAEQCBwBBYtWqQ4mztbMdnDSBTMYMhCHzgq/rmzeP3J3UTO9iRpVG6K4NAzRbraQ4H8Bahbj+7Uu3dvyFD+maLb3gWTYGISmjdvrhYvXuxRLm8W8C3B4GJJkwQ/HGv58ccfa/4vvdZYrf7gXVKJTpozcyY1h4k/1VmpUKGC2rdvX6rnMfeqVatS3bp1qV+/frbly5erQ4cO0bfffkvffPONZ4Mg1YZ8dIK8MLNly0ZNmjShGTNm4Jn0EWs0CwIgAAIgAAJpJfDUU0+pL7/8UhsHjDJdoLPQp3UcGe38lFlkUyb9cSsbKbeb7HbSNeF5PkqWQu3wYJlnCLMmZ6Ji5Upq754fKYJs5HS7yBERQcpG5HImJS945abKVR6khx9/nBYvWkoX/vyTIuw2Gjl8KPUZMFDzL31/efXz/p90mRJWWF9t2ADzcpt5mTZtmhoxYoQnuxu/dDgInxPl6CRMCQl6p5FfNpUrV75lqQ8udcKuzqdOnfIUVOZ/IJJwxyrrptGKbWxTNiS4pmrt2rXpww8/xLybfB5xOQiAAAiAAAhYTSA6OlqxbMGeaGmpHmB1P9DedQIprchi8axTp47HgANegSMAgdYk+959+6gJ48ZrZZJfOi621StFUZFRyUpmhI0GDx1GA/sPsD31Qh21ecN6osREGjViGPXq11/zz1cgv+I6mM7ERIqbNZNatEGQ8u2mJSYmRiuGFy5c0ImTJIESX8MvHLYGsusy15Hct29fqmv88ccf17uTEqcpGeNY0TSWNjGzVCSxE/fP2F/+Z/XAAw/Q1q1bU+2nmfvjWhAAARAAARAAgfQReO2119Rnn32m5Q7xPLJqEzp9PcJVxioNkmOD5TbOccJGiJYtW0KuCuAyAXyT8CdOnqRGjxxFf/35p24pU9YsdDUxkZQzSVskueTEmb+Tk/k88dzzatPaz8lht9GgAf09KZWrVq2qftyzi7Jmykx/X7iIOUllTqpXr6527NihS8dIAWRjshz+Pm/evDRw4EDq2LFjqjzZ/WXz5s1a8ZOYSG7D6XRaFqMpVkzpJ1st+eC6p198gaB0k48hLgcBEAABEAABnxJ45pln1MaNG7Uxgf+Hs4yAI3AEjAYGVjBlXtjSzFbMVauSS/7hCAwBwLeAe9nSZdSBgwdIETuC27UF0+GwkduZREWLFaNff/3VE2u58oP3iZJcNGHcWOravZv+fezokSouLo4i7TY6cPgo5uQ2c/L666+rjz76SCfrkaLH/GLhgxVE+d2TTz5JGzdu9Irl3XffrU6ePOnJMssvLXGTNZtlVuI1pA4nu+5ym/yP6emnn4ZyacHzhyZAAARAAARAwNcE4uLiVJ8+fejy5ct09epVyzagfd3vUG6fZSyxJLMMKPXN2Yo5YcIEzm3hlRwYyowCNTaAN0l+2bKlqk+vvnT69GlyutwUnTUL2VjJdLoo/vJFuqdocTp2LFlpbNOpk5o9bQbZyE1jYt+inr17gX8a+Ddp0kS9++67Wjnjl4h8itWRd69YecuePTt17dqVhg0blirfGTNmqC5duuh6pqycclvcDr+wxOUiDV285ancL7Fe8mf+/Pm5zE2q/bPi3mgDBEAABEAABEDAPIGXXnpJu8qylczsBrT53qAFltNYbmPlUmQsrlHPGwA1atSgzZs3Q84K0DIBeJPghwwZpCZNmECXLiWQSxFlyp5N+3//fvx/2iJZsmRJ+unAfs155FuxKmbgIJ1OecyYWOrVuy/4e8m/Vq1aOk6SXxqSKlx2q1ghZOWQd7JY6bwWg+kV244dO+pyM9ymxF56UmC73ab/gYhrLFtEuX98D77XqFGjkErby7nHaSAAAiAAAiAQDARmzZqlrZgXL15MtQ53MPQ3lPvAiqV4m/E4jaUAJXxq2bJl1KABEmcGYh14JYQHomMZ5Z4jR8Sot94aSxcvxlO2HLmoUNF7dIKZk/87RuRy09M1n6DPN6zXnKfPnKb69OxFSQmJFO9MAnsvJ/mFF15Q69at08qZWC75UuOLRV4m/HuuMbpjxw6v+Hbo0EHNmjXLkxWO2zcGjpvdoRQFUxTYnDlz0jPPPEPvvfeeV/3zEhFOAwEQAAEQAAEQ8AOBOnXqqPXr1+sNbxyBI8AKpshWLKuJ8YENDaJsPvLII/TVV19B3grANAG6Sehdu3RQ06fPJKdTUeUHq9LOHdts/3nscbVj23dkc7qocsXy9MOunR7OT9WsoUoUK04z4+aDfSrsOVvs22+/TefPn/+X26oomkZrJjfHP48bN466dOniFV+uZbpkyRLtYmHM8Cp+/DerbZqWJSMxmJKNtlq1asgYmxaAOBcEQAAEQAAEgozAf/7zH7V9+/Yg61V4dUcMAFKuROQsTsDELswsx2XJkoXeeustat++vVcyYXgR9O1oAdwk3zbtWquFCxfS1fgE6tWrL40dE2tr0vRNtWTpIq2w1Hm+Nq1a/Qk4p4HzggUL1Icffsi+8x43FHmBiL+9BHbzzxw/yQdbC8uXL0979uz5F+8ePXqoChUq0H//+98b/talSxc1efJkbQ2VLLKspPKXFUH8RheOu+++m2JiYqhVq1ZYD2lYDzgVBEAABEAABIKJwNSpUxVnqj937twN3lQsO7AswnIJypgEdsaYP39Vr16dNmzYALnLz9MB4CaBxwwbomJjY8npdHHdS81z6LARauSo4ZQrVy4aNGAgderUCZy94Lxw4UKdIfabb76hM2fOeNxhJfOqKIASI8lNGsuKZM2aVStwXbt2vYG37DQWKlSIHn/8cVq0aJHn7/3799c1NbnkiVhDJVmQWfdYGTL3kXfRXn31VVq4cCHWghdrAaeAAAiAAAiAQDATeO6559SGDRs8m9zGsB2UMQn8zIkLLedFGTRokFdl6wLf69DpAYRdk3M5duxbigu6ZsmSjU6dOuXh2bhxY/Xoo49Su3btwDgVxvPmzVNr1qyhbdu20Z9//qktiUblUdxU+WXBB1steVeKz2OlUCyYNWvWvOkuVbly5dShQ4e0my0roeymyuf27dvXJsmD2J1CMpDxPaxSLqWvbL08ehQlaEw+brgcBEAABEAABIKGQKZMmRTLKCxDsDzCcgn/zN+LzBI0nQ2zjjB/lutY8WeZ79NPP4U87sc1ANgmYffs0U1Nnz6dHqlWnb64lszHZJNhc3n9+vXVnj17tIsJx1lyYLYxWU9Kv3rJxCo1JQUU/56T54wePfqm7qeyy8hKoyQK4lImfB3fl11hxfVWdrzk3LQomsZ4TbmO2+Ng8zfeeIPmzZuH5y1sVjcGCgIgAAIgEOoEKlWqpHbv3u3ZoDbmhUiL/BDqnAIxPik1x3PCxoVmzZpxbUzIYX6aDIA2Cbpvn15q5cqVFDNkGDV8rRF4esGTFUsuOfLPP/+QYqukzaYVPFHqRFHj34klU9xijX8TKyaf16ZNG5oyZcot+ZcvX1799NNPN6QV5zZFiRXFUu4nv/diOJ5TpG/Gfyrct7Jly940LjQtbeNcEAABEAABEACB4CIQFxenOnbs6KnFKHJAemSI4BpZ6PRG5Ds2REyYMOFfuThCZ6TBNRIoRCbno2uXTmrr1q30w/brmWJNNhmylzdt2lR9/vnnOr5SDinjkVJx5J/lBW1UPI1Zw7gNtkQ++eSTtHLlytuu5UmTJqnBgwfrEjJyL3FhMVo2jf1Ja4C+8R+K9JN3zUaOHIk43JBd1RgYCIAACIBAOBNgL6m1a9fqjXLxkmJX2bTKEL5jyOKR8l3zQdqyuMiybMaeZBxO9cILL9Dq1auh+/hhzgDZD5DD/Ras3C1atIh+/PFHT1IeqVMkmdbkRSyKpTF2QRRBPodf4BzrwApc7ty5qWLFirRx40av1jHHYrIVU140YsEUt1z5hyAZarkP6XFxMSYh4hpMmzdv9qp/4b5OMH4QAAEQAAEQyGgE5syZoziJzB9//KGVSskNETwKZkYjak1/xUWWWxMrJidcZCtmy5YtIZdZg/mWrQCwjwGHe/Pjxo1T06ZNo19//dWTyvtWrq9SM1KyxkpdSv6UXUFJmlOuXDkdtD1mzJibruHFixerdevW0RNPPEHNmzfX5xQtWlT99ttvHsso/47/AbCyKy8iicXk36e3BqYomPzpdDrxjIX7Q4DxgwAIgAAIhDSBl156SYdLiReU1NIO6UEH+eCkyoDRS43luho1atCmTZsgm/l4/gDYx4DDuXlWLrnGJCt1kl2NeYhVkD/ZaliiRAkdp8hfRYsWpUyZMmkrJb8I4hOuUOJVJx05coSyZs2uz73jjjuocePXbrt2x46JVcNjhlDBwkWpcOHCdPLkSc7iqpVJUQD53umxUBrnlF9gUtSXLaPcPh/cd7Zebt26Fc9YOD8EGDsIgAAIgEDIE+Ba2yzviFIj2fBDfuBBPECHnciZ5E5O4qhsZLcp4t9lzxxNZy9cgWzm47kDYB8DDufmixUrpi2GYn0UxY5fwPzyzZv3TmrRoiXFxsb6ZB3WeuoJtXb9Jq3ciqVSEgOJomuFgml0seV7STmU+fPnU4MGDXwytnBeVxg7CIAACIAACAQTgaVLl6qBAwfS8ePHtXwDC2YQzI5yk90RoTf8XS6OQXVTZISdyOWm/v1609BRN/eAC4Keh0QXIPyGxDQG1yCmT5+uRo0axXVBPa6nrMiJklesWDF6+eWXady4cT5ff//3f/+nvv/+e4+7q8RESH/M7jJKzKgorFJKpVatWggkD65lid6AAAiAAAiAgM8IvPnmm2r58uW69BnLAmblC591NEwa5ioFkdc8yxTZyXZNwXQ5XVS8aCE6fOyEz2XQMEF902ECbjjPvg/GvmLFChUTE0MHDhzQrqOcxIeVMA6svueee3TG12nTpvlt3XXu3FnNnj1b94OVS0ncw5+SzMcMBmOpE26H/6Hky5ePJk6cSI0bN/bbOM2MAdeCAAiAAAiAAAiYI7B8+XLVo0cPOn36tJYFzHpImesNribFZfCS5T6pT6rlPnaVJUVNX61Ls5d9DDnNR0sFYH0ENhybnTt3rpo0aZJWLlmZY6WOD46BfPHFF2n69OmWrrfx40arKFLUqWf/W7Y7evRoNXz4cLpy5coNO4pieTSb5U1cbvnlJZlxOQ32hx9+aOlYw3E9YcwgAAIgAAIgkJEINGrUSH300Uda/oGCGdiZM4ZEcU88tdPtyd+Xu6cA7f7ld8hqPpomgPUR2HBsNn/+/OrChQsUHx+vh585c2YqUqQItWvXjrp27Wr5WnvwgQrq4L4f6b7SZeg/Dz1M2bLloAcefJAaN27iuRcXQR46dKgn0ZCUP+EXvyiFZuZKal9Ku2y95HTlnTp1sny8ZvqJa0EABEAABEAABHxLgGMx27Ztqze105uJ3rc9DJ/WWc6TpEvG+qRMgGNkc0S6qU279hQ70X9edeFDnwhCcDjNtg/HWrNmTbVx40a9YyclPqpUqULbtm3z6Rp7+snqasvWb3hvihKdTipevAQVLVqESpcuTVOnTrc1b95cpw4/e/bsDZlsGYUVLrL88uLsseIOw+VT9uzZ49Mx+3Aa0TQIgAAIgAAIgIAJAkWKFFGc7Mesh5SJLuDSa7UvWSZlZVIUTAGjZbdIB1WrVo02ffkVZDYfrBhA9QHUcGuyQYMG6uOPP9YPMB/8UuVyI0eOHPHL+qpX93n16WefU1KSm9ykKCrCoUud5MyZk86du0AXL17ULxi2WHL5E7FeWhGAz+2yayy3zTGnzZo1o6lTp/pl3OG2zjBeEAABEAABEAh2AtWqVdPJBcWzKdj7m+7+saTDyVmD9BALsij6Mh/aey3JzVYGypkrF/Xt04v69esHuc3ieQRQi4GGY3M1atRQW7Zs0Yolf91///20c+dOv66tXt06qznzF9C58xfIERFBpOzaqsjB3L48xFrLSmv+/Pm53qZfx+3LsaFtEAABEAABEACBtBF4/fXX1YoVK7SXlITRGBMCwnU2bTx9dbbMAyef3LBhA2Q3i0EDqMVAw7E53q377rvvtNWwUqVK9M033wRkXTVq9Lpas2YVXb58We9MOewObdG06rjZZh3/02BFlt1kS5QoQfv37w/I2K0aI9oBARAAARAAARBIP4GJEyeqvn37au8m2YQ25n8QZTP9d8CVVhCQeeBcIceOHYPsZgVUQxsAajHQcGxu/PjxaunSpVq5nDdvXkDXVOnSZdXhQwfJzqqlInLb7T6dEv6nwcmMuO7VgAEDaMSIEQEdv08Hi8ZBAARAAARAAARSJZAjRw6lN7uvxQKKhxcrnXygTmaqCP1yAs8Lu8yOHj2aunXrBvnNQuqAaSFMNBV4Al27d1Pz4ubqTLYuZxKR3bdLXJL8FChQgI4fP+7bmwUeL3oAAiAAAiAAAiCQCoFHHnlEbd26VVswxVImORuQ/Cc4lo8xRrN+/fr07rvvQoazcGoA00KYaMp3BCpXrqjuL1+WFi9aluqabdWurYqLm0eKYzAtdJG92ej4HwUnN+rXrx/vgKXaN98RQssgAAIgAAIgAALBQODtt9/WbrJcrsRYEo0tl6xostcTFM3AzpTIb7wBUKhQIS5nBxnOwikBTAthhkJTzz77rGKFKdgCnnPnSXY3yZsnD9WsWZMWpqJo5sybV50/8w/ZbW6fTgtbMEuVKkWHDh3Cs+RT0mgcBEAABEAABDIOAS7ftnnzZr0JbbRk8vchn2E2A0yT5NBghZ/nQykFOc7CeQNMC2Fm9KZeeuklXTOSd9hq1KhB69atC5r10apVC7V61So6c+YMuVyKskRH6Jd2lmg7Zc6anTJlyUr3lS5DufPkpb17f6KjR49SYmISuVzJ8Q6+OvjF1KNHD4qNjQ0aVr4aK9oFARAAARAAARDwjsD06dPV0KFD6fTp0zoRILtkSgwm/yyl3bxrDWdZTYDng2U4VjR5XiZNmkRdu3aFLGcRaIC0CGRGb2b06NFqwoQJ9M8//+iXXpUqVWj79u1BtT56du+ls8SePnWKLly8QHYbl0UhSnS5KSoqQiuUNhtRlCOSnElOspONXD6OweR6n0ePHg0qThl9LaL/IAACIAACIBAKBCpXrqwOHDhAiYmJ2krG7rJ8iFUzFMaYUccgGX51STu7XSf66dOnD+Q5iyYUIC0CmZGbWbFiheIMqEeOHNEvP7cribp370bjxk8MyvXRtOkb6v3339cv7CSXzRPHEOGw6Zc2v8TtDocuVWL2kDpWvNvI95NgfXF3ady4MS1atCgoOZkdO64HARAAARAAARBIP4GmTZuqxYsXa0sZKzLsIQbLZfp5WnmluMjynLAFc8yYMdS7d2/IcxZBBkiLQGbUZhYvXqwmT57M1krPzporKYlatGhGcXPnB+36qF+/vlq/fj2dP39e95tf3FLQWCvJbrf+4heI2YPb4C/+p8D/JCQwP2vWrFyWhDp27Gj+JmY7ietBAARAAARAAASCisDChQu1myyH7bBsIsolyxKSxTSoOhxGnREDQnR0tDYgLFmyhBo3bgx5zqI1AJAWgcyIzQwcOFDvrJ08eVIrTfyA8YPmdjmpXLlytHvP3qBfH3fmyq7OnruoXWT5ZWF3ROrsbHxwfcqEhARTU2NULuV7bSG126latWr09ddfBz0jUwBwMQiAAAiAAAiAQLoJ1KtXT61du1bLI6xkSsyfFRvg6e4ULkz2drNzqFVyKRmn0wl5zsJ1AZgWwsxoTT366KO6ThMfsrPGSlpkhJ0KFixIx387GfTro0uHttpd9vTpM+QiIge7ybqSA7fFr97MvGil1W7XbfELiNvlHUh2qejQoQMHhQc9IzPjx7UgAAIgAAIgAALpJxAXF6dGjhxJv/76q25EspZCwUw/UyuulCQ/LNNlypSJjROQ56wAe60NwLQQZkZqqnbt2urzzz/XiqVY+djiFx8fT7woHn/8Mdr05VdBtT4mThytLl+Kp6zZs1P27NkpR44cNGX8RNqzZ48ex1VnUnIgvbJpSyx/b/bgHS7+Z8AHK5mSCS5v3rzaPbZ58+ZBxcjseHE9CIAACIAACICAtQTKly+vDh06pK1mEm4DF1lrGae1NVHwRbZLTEyEPJdWiLc5HzAthJlRmurTu6eaPSuO4uMT6GpivLbG8cEvO12bSbmpd+9eFPvW2ICtjwceqKQ46ZAr8TJFZs5EHBd66aKTHJFEkZERZLdfs1C6FMUnuig6OpISEpzEaWSNL22zhYylEC8rsNyuWEWfffZZ+uyzzwLGJ6OsNfQTBEAABEAABMKdQPPmzdW8efO0pcyKze9w52nF+CXJj5SMcbvdkOmsAHutDcC0EGZGaKp/v14qLm4e/fXXWbKRg6IzR2mrJR9S/Ddnjmx0/sKlgK6N9u3bqw0bNtBvv/1Px1Sy3svur8nJdtxaoeRdQK6JKbtQrADyi4KVQP6SZD9m5oWtl5xdTPz0+Z758uUjDtpv165dQBmZGReuBQEQAAEQAAEQ8B+BO++8U3Etb5FZ4CLrP/a3uhMbVVhuZDlv8ODBLNtBrrNoWgDSIpAZoZlZM6eqgQMH0pkz5yhTdCa6mpBIity66/KA8fcl7i1Gh48EvrbjuHHj1DvL3qP9+/dry6orKdGTKZb7qeMirwVoJ1teb8wkK4qhmblJ6SLLSuujjz5KX375JZ4dM2BxLQiAAAiAAAiEEYFGjRqp5cuXS7yfJyN9GCEIqqEac2ywEeGll16iDz74ALKdRbMEkBaBzAjN/N9/HlA7d+4kuz2CEhOTyGF3kLIlu8YaH7T69esH1UPWtWt39cUXX9CJEyfowqXzpLhYMdeScjqJ1PUERca4S1aYObbUrIussU6SWEWHDx+OYrwZYcGjjyAAAiAAAiAQRARy586t/v77by2bGJPMSCZT/uTNcQ5dYpkDh+8IGEOg2JhQoEAB+v3336EXWYQcIC0CGezNtGndXL3zzjt06VJyCQ8+IiOiSdncnpcZv+w4cU7Pnj2pf//+Pl8bY8aMUbly5aDWrdt6fa/hw4erlStX0r59+4jrUIoiee7cOe0Sy7ENkhHXShdZKcR7LRGS1/0N9nWB/oEACIAACIAACPiHQMuWLdXChQs9tbpFTpEcGFbILf4ZSWjdhfnnypWL/vnnH8h3Fk0tQFoEMpibWbJ4voqJiaFffvkfG/yuZVhNurZ7ZvNkR2XlLHfu3BQbG0utW7f2+dp45pln1FdbNlLx4sWpfdu21LFTd6/vOWrUKJUnTx5q06aNrXfv3mrmzJl05coVTxIetjxqt1mTh9RJkkyynNxnzZo1XvfT5O1xOQiAAAiAAAiAQAgRKF68uDp27JinDiMPzWhNk7rkZj2wQgiZT4ZijL9kBZO94MaPH08dO3aEjGcBcUC0AGKwN/HSi7XVhi830+XLl3UJD71DppKzrbpd110x+GFjpW306NF+UTAnTZqkJk4aS8ePn6TsWTNTrlw56f6ypalChQpU9cEqVL9RU6/W55QpUxQrxefPn9dusZyIh8fIhxVKplhGmc3Zs2e96lOwrwn0DwRAAARAAARAwP8EWrVqpRYvXqy9x4yWS2O4EssxUDB9OzfiosxyooSJ9e7dm2VgyHkWoAdECyAGcxPtW7dQaz5bS7/9dpLsNjtFRkfR1auJ15PjuJxaGeMXHVvpKlWqRDt27PDbupgxY4aaP38+7dj+PSlFlD1LJoqPv0pFCt9NxYoVo/wFCxC7pebPV0C7L2TPdQe1adve07/Y2Fj13nvv0d69e7V7LLvM8njYmim7gmbnRzLJsvXy888/9xsbs/3G9SAAAiAAAiAAAsFHoHTp0roUGx8caykKjnhNSVb/4Ot5qPSIqxIksxe3ZGbeqVMnmjhxIuQ8C6YZEC2AGKxNTBwbq2LHjrtm2XOS3eEgm43rRzqJ7DadLIeVTnmh8UPWqFEjWrRokd/XxdAhMWrWrFl06o9TFGln91ZF9mufERHJ5Umy5siplc2CBQtqS+uxX4/ThUsX6eTJk54suFIDk18UrBiaDZIXC2jevHlpyJAhcJ0I1sWOfoEACIAACIBABiHQpk0bXReTN/clb4RYLEXZNNb0ziDDylDdFLdkzrEhcjArmBMmTPC7DJyhwHnZWUD0ElRGPK1ksSLq+O+ntWXP4UjOSJZcK5LdR93XgsyT3Uj5BccWwj59+lCvXr0Cti6aNWumPlm9hgOtk5VDm6LIyGtZbx02nVkt2QKbnD3W6XRp5VPKicgLw6ossmK9fOKJJ2jTpk0B45IR1x/6DAIgAAIgAAIgcHMCZcuWVVyGTTLIyllGl02w8x0BkR35U7L6dunSBQqmRcghMFsEMtiaqfHIQ+rbb7+jREXksCcrl6yc8eF0JpDDYSMXWwltdv1g8d/LlCnDNSeDYk28/HI9XVLl9xOndJ+T40aTKCHBSY4Iu1YqWbnkvvO4WInmgxVCVqJ5PBywzbuDZg5ui7PVsl/+4MGDg4KNmfHgWhAAARAAARAAgcAT4FjMZcuW0aVLlzxWTJZt5AsWTN/PkRgRxIrctWtXmjRpEmQ9C9ADogUQg62JTp06qNmzZ2slK7VEqmLxY1/0kiXupZ8P/xI0a2LuvFnqrQkT6X+/HKWkhESKtEdq5THR7SI7W2TdSWQ3CT+l5TPli53/XrVqVfrhhx+ChovJIeNyEAABEAABEACBABOYO3eu4s3rs2fP6p5IOTTJWg8F0z8TxHKe1B3t3LkzFEyLsENotghksDSzdOliNXz4cDp8+DC5XBzHeHsVTB6sJKeT8ufPSyNHjqQWLa0tUdKsyevKHhlBpUqVod59+l68sI8AACAASURBVKVpzcUtWqSV5b07dxP3ka2vPCbebRKXXzPsxXrLL3LjzqFw48969erRihUr0tRvM33CtSAAAiAAAiAAAqFP4IknnlCbN2/W8od4mnEGWYnDDH0CgRshMxcLJn/yz6+++iq98847kPcsmBZAtABiMDVRs+YTasOGTTo7Fn+RFzY+rawlJVKJEiXo0M9HLF0Ti+fPU126d6MLFy5Qzpw5KWeu3FS+fHkqVaoUjRkzxut7vdakqXr//feJ3EnkciaR3aZIuRSpVBTo1OaGXyryMpcdLAn25s8iRYrQoEGDqFWrVl73NbV74u8gAAIgAAIgAAIgsGLFCtWjRw86ffq0J5s/KzpSsgSEfEdA8o+wDMgHy4NVqlShbdu2Qd6zADsgWgAxWJpYtmyZ4iQ9f/zxh056480LyuOCoRQ99kg12rz1G8vXxOCBg9TEiRPp0uVL5IiIoIiIKB0fWbx4capZuRiVKVuacue6g15q2eO29y5dtpQ6ePAQEdko0uYgh82m3WXNHMbU4OKDb7RkPv/887Ry5UrLmZjpM64FARAAARAAARAIDQIcizlnzpx/ZZMNjdEFZhQstCkvbi3JfaRcCRsVjh49CpnPC3apnQKIqRHKQH+vXr26+vbbb7VFjpUlbxRMt3JThCOCSLno6Sdr0mdfrPfJmpg7J04tXfYOZ2Iluz3ZvVWXEYnMRpmiIygi6RLldCRRgdzZqNhdBShnjmyU547cdNWenWxREZT3rkK08N0VdOz4SeLNpkhHFDkTk8hmd5uaIeMOFiuWfHAGWu4fW1zZZbht27Y+YWKq47gYBEAABEAABEAgJAjcdddd6syZM9o4wDKcbHSHxOCCeBApS8Lkz5+fxo0bR40bN4bcZ3LeANAkwGC5fOrUqYrrNMbHx9PVq1d1nCK/pFKLwVQ2ogi7g6LsNnq1/iu0wMe+51z7afXq1XTu3Dm6cuUKkSMT2UmRw+4mh0oiZah/GR2VibLRVV2/89xVF8W7iKKyRFJ8vJMiHFGUlOQmu0kFk18u4ibLcym8+CVfoUIF+vHHH/GMBMsiRz9AAARAAARAIAQJdO/eXU2ePNmz+S4lNEJwqEEzJKMRhmU/lvu4xjp7Avbu3Ruyn8mZAkCTAIPl8meffVZt3LhR+/CnJc21m50I3IpyZs1CXTt3oaGjR/t8TYwZM0YtWbKEDhw4QMrtSK5hGck1LRNZw6NIRwQlJSUSdySSYy6JKDo6ghKSXJTk4rqYkZ5YBSuyrEm8A8+lBNpny5aNOF31iBEjfM4jWNYQ+gECIAACIAACIBAYAhUrVlT79u3zKJlm5BtvXUQDM9LguKt4rYknG3uu5ciRgzp16kTDhw+H7GdymgDQJMBguHzJkiWqW7duOtW1vJC0+6nLpRWm2x02h53cSS7Knyc3DRowkDp06+aXNfHuu8vV/Pnz6YfNX1G8M4lcNjtdTUzQiiYrvORyUYSdKMGRlSjJmexO60qiCK7f6XLqcfL3bjbBmjwkg6yxmYoVK9KuXbvMN26yb7gcBEAABEAABEAg9AkMGzZMLViwgGMAPTW9Q3/UgRuh0YNNaqhziFTHjh3ZTRbyn8mpAUCTAIPh8i5dumjXCom7NGZBTU3BVI4IcjgT6YFyZej7nw74fT306ddXcVzm3r17Kf7KFYqKjCKlbNpCyeMhcmslmcfEX2Jt5E9JymNmDoypwfme8pLh2Mt+/dJWUsVMP3AtCIAACIAACIBAeBPgMKK5c+fqTXSjLMdU2HsrMTEx1dCn8CaYttFLOBlfxTIlf9WuXZs+/PBDv8vDaet58J8NgME/R6n2sGrVqmrHjh0eRUxcZL1xr3Db7JTJpuip6o/Smk2bLVkPb7xeR3256SsqWqQY3V+pCs2cNSfVdrt166ZWrFhBv//+OyeJpSxZs9KVy5d1GjBjsDu/DEThZAttajGmqcHT7rnX6h9xzGqmTJnojjvuoFOnTqXa59Taxt9BAARAAARAAARAIC0ESpQooX755RePfMMyj5TS4O9F7vFGxkvLfcPxXKmFzmMXWfPpp5+mtWvXQgY0uSAA0CTAYLg8MjJSiXVPMsh64x7LfWdrYc7M0dTk1Vfo7YWLLFkP7do1UwsXLCanM4lIRVDu3LmJH9gl7yy9bfuTJ09Uy5cvp0tX4nWpFd6pS7ya4Nmx44eff8cHvxQkFtOKORCllcunxMTEUN++fS1hYUXf0AYIgAAIgAAIgEB4EGAr5sKFC7W8Y4wP5NGL3JOad9oNpBCQedOFI+FRkkk2WSZWVL16ddq82RqDS3is2JuPEkJ0Bp/9Hj16qAkTJuhRsGlfXEtZ0RR3z9sO0W2j3FkzU6e2rWnI+AmWrYd27dqoNWs+pbN//a3dXBMSEvTu0FNPP0ktWrSgVxs0SvVeC5YuVB+u+ID27NlDv/32m1YqxaVVsn+ZtWCKsioK+SOPPEJbtmxJtW8ZfNmg+yAAAiAAAiAAAkFKoGTJktqKKUoPyzoi0xnDeYK0+xmiW0YFU9jy7x544AHavn075ECTswiAJgEG+vIHHnhA7d+/XytwkmZZTP7eKJj8MOWMiqZuXTrSkDHWBjXPX7BEbflyE33++Wf0559/UpKLazsR5cmTm0qVKkX3338/Vby/HN2Zv8BNFc55C+aqQwd+5p0k2r17ty6/YsyQK1Zbs3MgcQ7sGtuzZ0/EXpoFiutBAARAAARAAATSTaB9+/Zq5syZWq7jDXA+jCXV2JIpv0/3TcL8QmMWWZGfWSYuUaIEHTlyBPqRyfUBgCYBBvryfPny6eK8/OLhXS2jRc9YfuNW/eQkrFnsDurcvh2NnjzFJ+thypQp6tNPP6Vt27bR5cuXye1O0m4ILpeibFkzU/bs2alQoUJ07vx5unjxIuXPX1C7hpz+60/tIsv1MnXW2IgI/UIVhdAK9sYkPw899BCsl1ZARRsgAAIgAAIgAAKmCLB899dff3nakFAelves2mA31cEMfvHNFEweUv78+WnQoEHUoUMHn8jEGRyb190HPK9RBeeJ2bNnV6yUpbc2pNtuo2i7onbNW9KkmbN9uh5iY2NVXFwc7wzpZDrabZYURUVFUmJCEnFNTv49K5GiLEsSHlack5XS5J08K4Pc+SXD1ssOHTrQ0KFDfcogOFcRegUCIAACIAACIBBMBFq2bKkWLVqkE/wYDQaS+dSKEKFgGm8g+iJKu8iY/Jk5c2bq3r075EGTEwJh2iTAQF4+YMAA9dZbb2nFK2UtR28zrLrtRFEOohZN/ksz4ub7fD0MGRqj3T7YZVa5beSwc8lLlye2QHEpEnJorNrF1+a+QbHk3/Fh1e6dWDArVKhAP/74o8/HH8j1gnuDAAiAAAiAAAhkHAIFChTwWDElV4S4c6Yp0U/GGbJfeyoKplGB5+/Z4PD2229DJjQxG4BnAl6gL33xxRfVJ598YqobNpuDoqPsFDNoIPXuP8gv66FO3drq88/WktvpJjclWybl4P6Q3Wb4nfuW4/PGBVgUSC6ey/cRy6i8oCVOtW7duvTBBx/4ZfymJgwXgwAIgAAIgAAIhAWBXr16qbFjxxJnuGdLpiiZxsynYQHCB4MU+dBY/k7KwEAmNA8cArV5hgFr4f7779cJfswcDkck2SiJOrZrSxOmTPPLeqhdu5b6estmcl5NoKRruuXN6jnp37HCee1IT80no/uDuNvyp1h9uemiRYvSsWPH/DJ2M3OFa0EABEAABEAABMKLQIUKFdTevXv1oKVut8gx4UXCd6M1KpssH1arVo22bt0KudAEcsAzAS/Ql959993q1KlTprrBFkO7zUUtm71JM+bM8/l6mDRpguI6k5cvXSK2KjpdiWS7pmTa7ckFhB02m4434PIml68m/1GUy7QqmXy+BMTzC5l3ATmBkFg/OXa1c+fONG6ctRl0TU0KLgYBEAABEAABEAABIurSpYuaM2cOxcfHa9lFNsvTKg8B5o0EpMaohFyxdZiTSbKluEiRIsSW44YNG/pcLg7VeQG4DDqz8sLh0h1mDqVslCnaQd27dKaRb/lHySpbtqz6+eAh3W0xUNptNnI4bBTpsGsl006sZCo6d9mZbuWS2+cXByuR/CLml4YkQ2Llll8mnFTo8uXLeA7MLCJcCwIgAAIgAAIg4DMClStXVlwTXCxtrAixfIMj/QREURfFUioU8M9Zs2al0aNHU6dOnSAfphMxwKUTXKAvk5eN2X6wgpklcyT1692LBsYM98t6WLp0qWrTpg1dunSJ2EVXK5rKrV+cDptKrnVJyS/Oq8lJY296eBODKRdK/SjZ/RNF85FHHoEbhNlFhOtBAARAAARAAAR8RqBz5846Cz/nkUhZks5nNw2Tho2WTB6ylMVr1aoVTZ8+3S9ycSiiBrgMOKszZ85UgwcPpnPnzmmrnJlDXGTbtmpJb8+wrkzJpEmT1PTp08kRoSg6KjO5kpKoZMmSVL58eSpQ8G4aPnw4/XnmL3I7uVBJshaZ7Cp7fUeO/6LsdlMKpjGdtzFbGL9QsmTJQtOmTaNmzZrhOTCziHAtCIAACIAACICATwmUL19eHTx4UCuYsGCaR83yIVsrJWGSMTcHGyUeeOAB+uGHHyAfphM1wKUTXCAve/7559W6dess2cViBVO5nVTvxefpw1WfWLYeKlWqpH766Sdi/TAxgV+GdkpKclNUVAS5tbuqi1iftNtuVCBvlXY7vbEGolRqBZY7cy1jLbdXsWJF2r17t2VjDuSawL1BAARAAARAAARCl8Crr76qVq1apWuIcz4JVjRxpJ+AKJhSVUDLiYYY13z58tGpU6cgI6YTMcClE1ygLps9e7bq27cvnT9//obyHuntDyuYDrubaj5egz77YqNl66FBgwbqiy++oPPn/yHlJoqMdOidIh0yYCOtXEZGRZDLmcICa0/uArvu8uG4poCmN8mPMXOsFNIV94f69evT8uXLLRtzeucA14EACIAACIAACIDA7Qg0btxYrVixQuep4GSF/InDHAGWETknh/BkyyUr7vzJfCdOnEgdO3aEnJgOzICWDmiBvKRmzZpqy5Ytpl1jZQz2CAeRW9GDD1Sibd9vt3Q99OzZW3344Yf0v//9TyuUbp2hy67dZbn4SESEg5yKtOIpqbeVYiVUUXR0FF29av4FanSB4HvIvfilwu6x7du3t3TMgVwbuDcIgAAIgAAIgEBoEhgwYICaOnWqNjBIDe/QHGlwjIrlx2bNmtGcOXMgJ6ZjSgAtHdACdUn//v3VlClTdKpqPiS1spn+uJVbu6neW7woHT5y1PL1MGvWLO3SsXXrVrqamEBX4+PJYXdQhN1Bic5EioyK0pZY8YNPfmm69M6R05n8aeYQy6exHf7+rrvuYsXX8vGa6SuuBQEQAAEQAAEQAIFbEciTJ4/6+++/dQwmy004fEuA84bs2bMHsmI6MANaOqAF6pJChQqpM2fOkJQmYbO+2SQ/blLaDTVP7lzUs1t36t1/gE/WxNChQ9XHq1bSL7/8orPHckIf9nXn/kvcpSiB8tJka6fZLNxGBVNSUPNn9erV6auvvvLJWAO1PnBfEAABEAABEACB0CXAXmwbNmzQAzS7AZ+xKbH4dq2Iuo8GwvJj3rx56c8//4SsmA7GgJYOaIG4pESJEopdTdk3nEtsiPXSdB0ku43cSS7KmiUTtWregiZNnebTNVGr9rNq8+YtdDU+kZT2fU8uassPspQdYStm8rj4y5wFU1xkJXBbgrmbNGlCixcv9ulYA7FOcE8QAAEQAAEQAIHQJLBo0SLVvn17rt/t2ZwPzZEGflQsh3I9zD59+tDgwYMhL6ZxSgAsjcD8ffqECRPU5MmT6eTJk57dKg5Gtmr3imMwkxKdFBXpoFdfrk9LV7yb7jXx0kt1Fe/2FC5yN5UoUYJea9Tkpm29PW2q2rRxM3399dd09swf5HIpHU/AhxS85e9Z8TS7Q2fMEiZzx+VJBgwYQH379k33WP29DnA/EAABEAABEAABEPi///s/tWPHjmsb8eDhSwJsnChevDgdPnwY8mIaQQNYGoH58/SRI0eqmTNn0unTp3WGKz4ksJv97826x3J7NoedlIvjMBVVr/YIbdrydbrWxLJly1SvXr3oxIkTOpEPHzlyZqNqVR+mRo0a0BtvtvhXu0Nihqnvt22lH3/8kTimID4+QY9PXGTNKpfcB3GRFW7cdpkyZejAgQPpGqc/5x/3AgEQAAEQAAEQAAEjgY4dO+pkP1bISCB7awIij95xxx109uxZyIxpXCwAlkZg/jq9W7duavny5VyDx6N0cd0jrn8kyqUVWcQ4yY9N1w1RVLJ4Mfr56K/pXhOtWrVSCxYs8BQBZmUuUwSneiaq8uADVK1aNRo9btK/2p8wYZxav349bdq0WSuX8mXFy1Ncb7UybbPprzp16tCHH36Y7nH6aw3gPiAAAiAAAiAAAiCQkkDhwoUVe7bh8C0BdpPNnj079evXj/r37w+5MQ24ASsNsPx1at26ddXmzZvpwoUL+pZSl4cVLlYu2ZpphXLJbXO5Sc7oqtxJdHeBgjR27Fhq8HrjdK+LWrVqqS+//EonItJury4nZc4UTVevJlDOHFm0krl67fqbtl+pUgW1f/9BS8cnCYRYaeXY1cyZM3NpEoqNjU33GP21DnAfEAABEAABEAABEEhJoGHDhuq9994DGB8TkDArrpv+/vvvQ25MA2/ASgMsf5z60EMPqe3bt2srHi9scfH01b25ff5iZbBGjRq0ceNG02vi+eefV2vXrtVddisbKZVEkRGR5HI5yW6zUdHCheiNxo0pZuR1JY8LCK9bt47++eefG1Jvi4KY3vHz7pMUzOUESQULFqRhw4ZRq1atTI8zvX3CdSAAAiAAAiAAAiCQXgKLFy9WnTt31oYISfpolBf9IT+mt+8Z5TrmytUa+PORRx6hzZs3Q25Mw+QBVhpg+frUFi1aqBUrVmjrHy9oKavhy/vyPdgqmi1bNurevbtlmbLq1aun1qxZQ1wGhdzJGWLdWmkminJE6Oyxd955Jz1c/XE6evSojsPU5UtsrJAmK7yS+dXM+MUtluNVM2XKRPfddx/fC+veDFRcCwIgAAIgAAIgEFACpUqVUj///LOW4ViWY9lJ6mOKkSKgHczgN2flUsoCli5dmg4ePAjZMQ1zClhpgOXLU2fNmqWGDh3K9XY8yXusqHOZWp9ZAeMX0r333kv79++3dD1wHOnixQvpzJm/tWIZqd17ue4l12+y6eyxUdHR2iVWlEpjUh62OJqNwzTWvmT32Jo1a9KaNWssHWdqjPF3EAABEAABEAABELCSwOuvv65zdUj5NbFkSlZ+02XsrOysD9piQc6XlTCFH4dXsUFk5MiR1Lx5c8iPXs4lQHkJyten/ec//1FsxWNLG39JIh+zClZq/WaFjhXZVq1a0dSpUy1fD+PHjVEfffQRsdsvj8vFpS2vxZXyJ/+OX4ZS+1J+5vGzgmn2EBdbeeEOGjSIBg0aZPk4zfYT14MACIAACIAACICAtwSGDh2qRo0apWUliRXka0Vu9HWIlbf9zKjniZsxy5E5cuRg2ZG6desG+dHLCQUoL0H58rROnTqphQsXal96cemUZD6+VjBZ8eJCsufOnfPpWmjapLH6fN16T4wlWy95jMROtEp54i4leRHvHPGukZQsSS9/Y1IkzgTm63Gmt5+4DgRAAARAAARAAATSQqBKlSpq3759usKAKJcsU/kjxCot/cyI57IMylxZLmcPuJYtW9KUKVN8KitnRE636jNABXg258yZo3hX5MyZM56EPmKWF196X3exYsWKtGvXLp+vhUmTJukY0127dlFSkvuaK3ByEh7+YuulKNTG782OX3hykPbWrVt9Pk6z/cX1IAACIAACIAACIJAagQ4dOqi5c+fqWEFjfXQrNuhTu3eo/12UdFYwmWfjxo1p7ty5kCG9nHiA8hKUr06rVKmS2r17N3EpyghHhMdllO/njyBtfoD69u3r17IdDRo0UJ999hnFx8frnSFxi+VPPvhBluy2Vrh4SJwpJzEaPXo01ryvFjPaBQEQAAEQAAEQ8BuBGTNmqP79+9PFixf1Rr3ktPBHDg+/DTKAN+L686y8s1zasGFDWrx4MWRIL+cDoLwE5YvTqlatqn744QcdA8nKFStTxphBcXPwxb2lTfYrD5TbaLcuXdWOXTs5uRCdP3/e4yprdJM1W6ZEstIy4+nTpyNA25eLCW2DAAiAAAiAAAj4lcCDDz6oc3hwLCZbMVnusSJJol8HEYQ3E0MHe9Yx07Jly9LevXuhN3k5VwDlJSirT+vZs6eaOHGiz+tcGhU0tojyy0ceGh7Tiy++SCtXrgzoOlj6zkLFtSmPHD56jUfyw2yF9ZKVVX7RcnmSn3/+OaDjtHoNoT0QAAEQAAEQAIHwJvDss8+qjRs3almHLW1isLA8h4ev07YG2TSK/ChJItma2bx5c58kxAyyoVvSHQjclmBMWyPs0sBxl2fPnvVYLNPWgvdnG5VJfjgkEJxbKFmyJMXExLBfecDXQfPmb6ply5Zp9w5OAMSHFS4e4kP/8ssv0/vvvx/wcXo/czgTBEAABEAABEAABG5PoFWrVjpRJB+sZEpWfnCzhgDLoiw7szz96KOP0tdffw1Z0gu0gOQFJKtPYXeGHTt2mK7x6E2/WMHKlCmTfumwBZO/5weFa/q0aNHCr7GXt+tvbOwoNWbMGLpw4ZIn+5kViX7YEsqKdWxsLHXu3Bnr3ZtFg3NAAARAAARAAAQyBIFx48apIUOG6LwWktRQKhJkiAEEaSdZoRQrsNQYLVSoEB0/fhyypBdzBkheQLLylHr16qlPPvlEpzzmsiSWuzCk6KzURpIHRT45WPmdd94JmvlfunSx6tmzJ/3xx5+aCe8Y8cvSCj6sVF+5ciVoxmrlekJbIAACIAACIAAC4U0gf/78SqoRSGiUFWFG4UxVQrVEaWe5lA0WM2fODArPv2CfGwjdfpyh/v37qxkzZnBSHU9CH7NJbFLrvrjISskTVrYeeugh2rRpU1DN/bx5capnz970999/e4bEfZYHO7Vx3urvPP5s2bJxhrWgGm96x4PrQAAEQAAEQAAEQMBIgCsScD1M9vxCiRJr1wYbOkSWZpmd5fjWrVtDpkwFMwBZuw5v21qhQoX0DhPHGbLi5I+XAN9HApRZYeOkPsEYi9iiRQsdgylusZwW2ooYTH4x5MmTh06fPo217se1jluBAAiAAAiAAAj4h0DXrl3V22+/rWVLo2unf+4emncRC7CxsgHL7Rxy1b17d8iUUDCDY+G/8MILau3atVqBYkWPD46J9IcFkx8OvmfNmjXpk08+CcqH4qmnnlJbtmzxJCES1wSzLrLcTv78+en3338PynEHx+pEL0AABEAABEAABDIygbvvvltx8kip28gyJo70EzCGmEkrLE937NiRJk+eDJkSCmb6F5dVVw4cOFCNGjVKNycLVgKwfe0jL+1Xq1aNtm7dGrQPBJdt+fjjj4ktvFwTU1x6zc4B8y5QoACdOHEiaMdudoy4HgRAAARAAARAILwJPPbYY+qrr77ylCrxtQEj1GmnzF0itelfe+21oMphEqzzAKHbDzNTokQJdezYMW295EPM7WKlS/kSEKWQP9P6gjCeL9ezqynX3Gzbtm3Qz3fHjh3V+vXrWSGkS5cu6fHzl6Td5h05/p4/xS/eqKwbFXb5fZkyZWjfvn1BP3Y/LEXcAgRAAARAAARAIAQJDB06VBszOAwrrbJjCOIwPSRjPXYJa+OKDO3bt6fp06dDpoQF0/QaM9VA5cqV1a5du/TDzgqRxESKsilKktzEmFraCusm36927dr06aefZqiHYd68eeq7777j5DxUpEgR+vbbb2n//v3awslZvPghv9lhVMrl5VC3bl366KOPMtT4TS06XAwCIAACIAACIBB2BBwOh5KSGmE3eIsHLPIk85TQNr5Ft27daOzYsZApoWBavOLS0FzTpk3VihUrdFwhBwbzwYoRKz68WCWhjQRli3JpNsW0UTHNnTs3DRs2jDp06BASD0O1atXUN99840lcZLT2Ml9hJ59sve3Xrx8NHjw4JMafhuWHU0EABEAABEAABMKIQNWqVbVRI911xFlSUmEE7DZDZfmSPeYkdwp/8s+dO3dmr0DIlFAwA/OgjBgxQo0ZM0YHW4tSyYqkWDElxtBowTSjWBpN+TJi/l3Vqg/Sd999H1IPAqfj/umnnzRXSQIkimZKtxAuyzJp0iSklA7MY4C7ggAIgAAIgAAI+IlAv3791Pjx4z1yp59uG7K3EQXTmD+lUaNGtGzZspCSq30xgQDkC6pE1KVLFxUXF6cVTK7DmCVLFu3qmSNHDjp+/DgdOnRIl+EQV09evCmLuqZ0n71dV1MqmGINfaPxa7Rg4eKQmudXXnlFJwSSgOubxRpIzaISJUrQkSNHQmr8PlqyaBYEQAAEQAAEQCADE5g7d67q3bu3TpZoto54BsZgSdeNSX7EXZYVzqpVq9I333wDuRIWTEvWWboaqVOnjmIF8oUXXtDKZKtWrTwLsmLFimrv3r03FG8Va5y8FCSxze1uLoveaP0U5ZLb6929C42IDS1f8dq1a+tEQOyucLPxG12EOf40WEuzpGtR4SIQAAEQAAEQAAEQuAWBhx9+WH3//fdaPsJhngDL1JI/hb8vWLAgG4qgYELBNL+4fNVCsWLF1MmTJ7WiJO6zYok07px4c/+U7rViEe3Wrg2NmTI1pB6Ehx56SCcAEgX8Zllkefz89eabb9KcOXNCavzerAecAwIgAAIgAAIgEH4EWrZsqRYsWAALpgVTL8qlhLdxk+yJeP78eciVUDAtWGE+aiI2NlanlGY3WkkrndKK6U2qaaNyKTtWomC++nxtWrZyVcg8CHPmzFEDBw7U2WTFDdYYhynZ0zjGlb8GDBhAUBymsgAAIABJREFUAwcODJnx+2gpolkQAAEQAAEQAIEQINC7d281depULVv64wjVvEBi6OGyeOyFyHK6KJjTp0+nN954A7LlbRYY4Pjj6bvNPfr27atjNc+ePevJgCrBxN7EYLIVTye7iXAk71a5FWWJiqTICDtVqViJNny7LaTmePHixSomJoZ++eUXnZmXlWt+6MViaczIe+edd9KQIUNCJoNugJcqbg8CIAACIAACIJABCJQsWVIdPXrUY8U0WuKklngGGEZAu8gKJhsqJFGnGDP4d2zoGDRoUEjJ11bDBhyriaajvc6dO6tp06ZpZUnSIRsVpds1KfV5lI3IlZRE0VHRlJSQQPnuvINaN2tOQ8eOD6k5XrBggbZg/vHHH5oVHzlz5tQB7fzSlIO/L1OmDO3Zsyekxp+O5YVLQAAEQAAEQAAEwohAixYt1NKlS4mtbxKCJR5uLDsZa66HEZY0DVVC1sRLkFnKUb9+ffrggw8gX96GKOCkabn57uRSpUqpX3/91WON4xcCW+iMC/pmdxe/cFYwldt9g4LZrmUrGhw7JuTm+LHHHlPffvutVjAlhbSwER78QqhTpw6tXLky5Mbvu1WIlkEABEAABEAABEKBQPHixdWxY8dusGKKhxy7fMomfSiM1RdjYFZi9OH2pbYoK+rFixdnTzrIl1AwfbH0rG3zqaee0plRxQrHiqU3O0yScTYqU7RWTiPsDoqy26hC+XL03Y7dIbn4ucbo5MmTdRymHPyyZGbywmT32O7du1P//v1DkoG1qw+tgQAIgAAIgAAIhBKBZs2aqcWLF2tZUowV8j3Lmsgye/vZFgXTmOeDuTFDNgBduXIF8iUUzOB/ZXDdzLlz5+qgbHGP9SYGkxe6ttqR0i6ypIgiiOih/6tCX2/bHrKLn7OksfsH+8bzi9NYroR58O7Szz//HLLjD/4VjR6CAAiAAAiAAAgEigAnRWzXrp1HPpJ+sLzEcpMoToHqX7DfV4w8ImMaKxcwQ87xERMTAznzFhMJMEG0wsuWLasOHjzo2VXiQOLUXGS5+9qKaU9WNB02O+XKlpWer12LFixdHtLzW6VKFbVz505PfSKJM9D1P3v3ppEjR4b0+INo6aIrIAACIAACIAACQUagaNGi2k2WD2OSGkmOGGTdDaruSI4TkcNZJhcvOWbJddZXr14NORMKZlCt25t2hpP9zJ8/n+Lj4z1WOW92mHSmq6hIrWi5nEmUNTqKevboRkNHvRXSC3/y5Mmqb9++mhVbMsWKycl99u/fH9JjD/7VjB6CAAiAAAiAAAgEkgC7ybK3FyuUkj0W7rHezYgxOZIxiST/nn++55576MiRI5A1oWB6t6ACfVbp0qXVoUOHtH+3NwHYnjTKSU6y2e0UHRlFSVev0rChg6n/kGEhv/C7deum5s2bR5cvX9bFb/Ply6djL1u3bh3yYw/0WsX9QQAEQAAEQAAEgpfAqFGjFLty8iZ8dHS0/hTLnOTwCN7eB7ZnopCznC0JJY1usiyn9+jRg0aNGgV58yZTBSiBXb//uvuYMWNUv379tDVOirxKILbUMRJLnV7w7mQ/eneSSz8AdrKRza6Ii8C2bNUmLOZ38ODB6sSJE1SwYEG4xQbZekZ3QAAEQAAEQAAEAkegQIECipMiskJpjCuU8hv+7hkLpsrfN/XB/VjBrFu3Lr377rthIWunFSGgpJWYH84vVqyYLllitGIaM8qK8sldsTns5Ha5yGFPzmzFiX4iIuzkTHJjbv0wV7gFCIAACIAACIAACAQrgVq1aqm1a9dqGVHKlHhTpSBYxxNM/Spfvjzqrd9iQqCEBNNKvdYXtsiNHTtW+8ynTCMtO078e+3eYOP8PnaP+Z7LlJDNDQUzCOcVXQIBEAABEAABEAABfxIYN26cxzOOFUx2k/U2iaQ/+5nR7sUyeNmyZZHzAwpmxlq6zzzzjNq4caMncY1HoWSrpS15X4B/x1ZO/uQXBh+cRZZ1TFgwM9Z8o7cgAAIgAAIgAAIg4AsCuXLlUufPn9fyoySv8cV9wqlNVtI598fgwYOpc+fOMNilmHwACdKnYe7cuTpDKvvNiyvDDa6x15RMCdLm4G2xeObKmZ3Onb+IuQ3SuUW3QAAEQAAEQAAEQMBfBO677z51+PBhbZCQchveVCnwV/8y6n1YBuc4zJUrV0LmhoKZcZbxww8/rL799lvdYfGd5+9F0ZTf8QKXxD/895w5s9M//5zHYs84U42eggAIgAAIgAAIgIBPCFSvXl3LkywvsucbGyQCleTHJwMMQKPMko07FSpUoB9++AEyNxTMAKzCdN6yQ4cOugQHvwi41iPvNumMsW63x8WBXxCSPpl/HxUVRZGRDrp8OR6LPZ3ccRkIgAAIgAAIgAAIhAqBJ598Um3atMljsMiwbrJBlIJWEiblypWLmjRpQlOmTIHcbXhgACOI3x4zZsxQ7Nt96dIlio+P91gxxWKpi+W63MkjsCdnB+O/3X13Qfrtt5OY2yCeW3QNBEAABEAABEAABPxBQBRMqe0o9Rz9ce9QvYdYgzkHSp48eWj48OHUvn17yN7XJhwggnzls5vstm3btPKYlJSkrZVyiFVTFrkryUl2u40qla9A23fvwdwG+dyieyAAAiAAAiAAAiDgawKsYH7zzTd09epVfSttoFChUI3S1+Ru3b5RwWS346eeeoo+++wzyN5QMAO3KNNy53r16qmVK1f+K/MXu8bKyyEiIpKczkQOziS7nahq1ar03Tb4g6eFM84FARAAARAAARAAgVAkUKZMGXXgwAFtrDBWIgjFsfprTKykSwUHZlqqVCk6ePAgFEwomP5agubuM3LkSDVmzBi968S7JWy1FMXSWCiXf8+xl26Xi0qWLEkHDx3GIjeHHleDAAiAAAiAAAiAQIYncO+996pjx4556l+yRxyyyJqbVkmuydZLUTTdbjdkbyiY5haWP68uUKCAOn36tN51kgXNn+IuKy8KicksXeY+2vfTASxyf04S7gUCIAACIAACIAACQUigZMmS6pdffvFUIYCLrPlJYjlcEv2IVfjtt9+mjh07Qv7m6hfmEaMFXxOoXLmy2rVrl8etQYK0ZfeJLZtc14h3UPhvLZo1p9lxczC3vp4YtA8CIAACIAACIAACQU6gSpUqaufOnR4Fk2VGqaMe5F0P2u5JqUCRvfnnDh060OTJkyF/Q8EM2nV7Q8caNmyoPv74Y/0yEPdYtlrywQuaXxTiOss/x8XFUfPmzbHAM8b0opcgAAIgAAIgAAIg4DMCL7zwgvrkk090DUyWFyVJpM9uGCYNi5LJn1xS8JlnnqF169ZB/oaCmTGegM6dO6sZM2boF4IolVLDyO3m+pgO/TeugckWzPh41MDMGDOLXoIACIAACIAACICAbwm0bdtWzZw5U7t0SqiVb+8Y+q1LdQceKX/P8ne5cuVo9+7dUDChYGaMB2DYsGEqNjZW744YrZjJPt9cBzM5Kxh/3XHHHfTXX39hcWeMqUUvQQAEQAAEQAAEQMCnBKZMmaL69+9PCQkJOpwKLrLmcUsMJsve7FXIn9myZaOLFy9CBoeCaX6B+auFbNmyqfj4+BvqFknSH17k8rK455576OjRo1jc/poY3AcEQAAEQAAEQAAEgpjA8uXLVe/evenEiRPaUIEMstZMFrNkyyV/skzOLsic6Kd169ZhL4eHPQBrlphvW+nRo4eaMmWKVi55l4QXsGSO5d9dd5d104MPPkg7duzAvPp2StA6CIAACIAACIAACGQYAlxXneMwxdqWYToexB0VN1lWLjlMjS3ETZo0ocWLF4e9HB72AIJ43Xq69vDDD6tt27bpXRJ+MUgWWT5Bdk4kcPu5556j1atXY14zwsSijyAAAiAAAiAAAiDgBwLdu3dXU6dO1R5vrAhJ0kg/3DokbyFehDw4ycjLMnn16tXpyy+/DHs5POwBZIRVX7x4cV0gV+rsSPYvo+VSMsm+8MILUDAzwqSijyAAAiAAAiAAAiDgRwKFCxdW7CYr8YN+vHXI3Uq7xRJRZFSUVjDZAMSyeKFChejYsWNhr1+FPYBgX/G9evVSc+bMoXPnznmyfxktl1LklX/HLwzeOdmyZQvmNdgnFv0DARAAARAAARAAAT8SaN68uVqyZImntJ0fbx1ytzLWweTBsSchH7ly5UKyTST5Cf71/uyzz6rPP/9cK5fi6y3usNJ7WeSsYFatWpW+/fZbKJjBP7XoIQiAAAiAAAiAAAj4jcC8efNUnz59tNFCSt/57eYhdiNJ8GN0lWWm0dHR1KlTJxo3blxYy+JhPfhgX+uzZ8/W5UmOHj2qd0Z4MfMXm+A5zTQrnOImKxnBHnroIfr6668xr8E+uegfCIAACIAACIAACPiZQPny5dXevXuRSdYC7iKTc1OSfPPOO++kOnXqUFxcXFjL4mE9eAvWlk+baNiwoXrvvfc8iXx4Z4QVTVYuecdEEvyIoulWbqrxWA3avHkz5tWnM4PGQQAEQAAEQAAEQCDjEejQoYOKi4vTsiSO9BMQy2VKJZPl9Ndee40WLVoU1rJ4WA8+/cvKP1eWK1dOHThw4LY3Y7dYXuSywKtUqULfffcd5tU/U4S7gAAIgAAIgAAIgECGIpA5c2aVmJioc3dINlmWJY311SWxZIYamB87y3J3yrKBUpe+Vq1aYZ9wE4qIHxdjWm41adIkNWjQILp8+XKql7Elkw9+GXAdTMRgpooMJ4AACIAACIAACIBAWBKIjo5WsGCam3pWJqVsIHsSisGHW0WpEtIZdnEEIYH//Oc/aufOnZ7aOrfqonH3ic955JFHaOvWrZjXIJxTdAkEQAAEQAAEQAAEAk2gTJky6tChQ4HuRkjcX0q+yCeHs5UrV4727dsX1rJ4WA8+WFf2kiVL1H//+1+tXHrrosCJf9hUX7NmTVq1ahXmNVgnF/0CARAAARAAARAAgQAS6Natm5o8ebKnB0bXWP6lWOQC2MWgv7WEp4lrsWSVZQXzrrvuoiFDhlDr1q3DVh4P24EH88rlOkXz58/3qhCumOfFkslZZBGDGcyzi76BAAiAAAiAAAiAQOAIzJo1S7Vv3/6G+EujRxwUzNTnRhRMqeLAiuX/s3ceYFJUWRu+uioMOa0EQRBM8BMkgwFlVcCAiIEsSBIJkobkDEEYGMKQMwwZCcKKARZEMCGCCgg6K4gEVxRRCSKS3fX+z3f19BazMt0z1dVd1fUVzzzdzFS49z2nqs6599xzJPkmamHGx8ergQMH+tbP8m3Hg6tO9Pa44YYb9FdffWXKkWBEJKNN/o59oew1atRgiGz0RMcrkwAJkAAJkAAJkIDrCVxzzTUaTpGUu0ODxaakgxm6+KzZZMXZjIuLUz179lQjRozwrZ/l246HrjqR3RNhCxMmTAjJuUTLoMyovSPfb7vtNvXJJ59QrpEVG69GAiRAAiRAAiRAAp4hgEyySPQDJ9OaQRYdEKfJM52JUkOtocXilGMmGEvWnnzySbVkyRLf2uO+7XiUdDHoZUuXLq0PHToUdObSeiLrAuMbb7xRffnll5RrUNLcgQRIgARIgARIgAT8SSBnzpymVAmcTDhHVqeSDmZwnZAcKbDBpWQJPiVUtly5ciotLc239rhvOx5cdSK/R48ePXRqaqpRzgsXLphYbqlPlFFrZBbzmmuuUQUKFFDff/895Rp58fGKJEACJEACJEACJOAJAgiRFedI1l+K00QH074Ir732WoVyg127dvWlTe7LTttXG2fOgNIk27ZtCziVoTiYkmlWZjFLlSqlDh48SLk6IyKelQRIgARIgARIgAQ8TWDx4sW6bdu2pg/iXMqERqjVCzwNIAKNh33euXNnNWPGDF/a5L7sdAT0KtOXSE5O1snJyer8+fOB8iSSoSrY7KX8HQ+HSpUqcQ1mpunzABIgARIgARIgARLwB4HnnntOT5s2LdDZ9NFydDLDowf16tVTb7zxhi99LV92OjxqE96z1K1bV2/atMmcFCGyWCAscfEZXcmaJhnHValShQ5meEXDs5EACZAACZAACZBAzBCoXLmy3rVrl+lPemeSM5mZFzOcKZ3uMHAtU6aMb/Oi0MHMvB6F/YjZs2frxMRE9dNPPwUywkp9S0l5fLmLSmgD9sN0fNWqVdWOHTso17BLiSckARIgARIgARIgAe8TyJEjhz537tyfOpje7507egCbPG/evCopKUl1797dd3a57zrsDrW7tBWNGjXSb7zxhpmxxCbOZSiLrCUtMvbF97vvvltt2LCBcnWjoNkmEiABEiABEiABEogigf79++uUlJQotsAfl4ZdjmjE9u3bq2nTpvnOLvddh92m1tOmTdODBw9WJ06cMAutJbGPtdhtKG3GsVdddZV66qmn1Lx58yjXUKBxHxIgARIgARIgARLwEYHbb79df/TRRyFVKXAblj8LRXVbG6U9koSzTp066r333vOdXe67DrtNEZ955hk9Z86cS5xLqaGDtoZSpgT7QZFRpqRfv35q+PDhlKvbBM32kAAJkAAJkAAJkECUCRQpUkT/+OOPl9S9tNqaTPATHgGBo6zD3Lt3r+/sct91ODxqE76z3Hrrrfrrr79WiIWXxD44O77/+9///p/F1+mvDOWFQ4rPuLg4NXLkSNWjRw/KNXwi4plIgARIgARIgARIwPME4uPj9YwZM0yt9VAnMDzf6Sh1ABM/iEosWbKkL8sH0hGJkuLhso0bN9br169XZ8+eNa3ADCScSgmVFccxWBOxPxzMPHnyqHHjxiHem3INBo1/JwESIAESIAESIAEfEXjooYf0m2++aaLe6GA6K3jJkYL69AcOHPCdXe67DjurTpk7e548efSpU6fMQRjlwCZOJf4v6zAzOiseEKLEBQsWVEePHqVMMycG7k0CJEACJEACJEACMU/ghhtuMFFzMjER8x2OYgclwvDGG29U+/fv951t7rsOR1HXLrl08+bN9fLly41jKbUsxbmU0iShji5hfxxbpEgRdeTIEcrULUJmO0iABEiABEiABEjABQSGDBmix44da5ZkYQIjWBk8FzTZ001A4s2LFy+q6tWrq23btvnONvddh92irYUKFdKSOVZqWKJtUEjc+OJsBltsLeG0OOa6665T33zzDWXqFiGzHSRAAiRAAiRAAiTgAgINGzY0JfGwFAtbMPvSBU32dBMkCrFhw4Zq9erVvrPNfddhN2jrE088oV999VXTFNzo1lEkmVK3OpsZtRkKDKcUW4kSJdRXX31FmbpByGwDCZAACZAACZAACbiEQKlSpQLhsTKZ4ZKmxWwzsmXLhsSbatSoUb6zzX3XYTdoMW7yQ4cOmRh4OJdwKvEdP9b6l9aZzcu1W8IccA7MYB46dIgydYOQ2QYSIAESIAESIAEScAGB5ORkPWzYMJM9Fpvk7nBB02K2CbDP8+fPr1JSUlSHDh18Z5v7rsPR1uROnTrplStXKoTHpp+5lDWXWJeJ7+lnN/+s7VbntHDhwur777+nTKMtZF6fBEiABEiABEiABFxCoHv37nrq1KmBSY1ff/2VazAdlg1s/GuvvVZ99913vrTLfdlph3Uqw9NXqFBBp6WlBW5scTLhTKL2pTiZWIMZygiT1NnBRXPmzKlSU1NV06ZNKddoCpnXJgESIAESIAESIAGXEFi+fLnu1q2bmdxgBtnwCEWWtKHEIJL5SPUH/F4mfx555BH16quv+tIm92Wnw6NamT9LYmKinjhxoglRkMyxEhabI0cOdf78eYV6OQcPHjTrKkOpg2mtmRkXF6cwQtWuXTvKNfPi4REkQAIkQAIkQAIkEJMEEhIS9OzZs9WxY8c4exkGCYuDCXtdnHZMFknyJNj1ffv2VS+88IIvbXJfdjoMepXpU7z44ot64MCByPJqbmxreAJitOvVq6eWLVtm5FGxYkX9+eefh1wEV1IhYzFxcnKyio+Pp1wzLSEeQAIkQAIkQAIkQAKxS+DBBx/UGzZsMPk+Qi2FF7s07PVMHEzY9NZoRJnJLFOmjC/rXwpVOiL29CvkoxH/PnnyZDOFLjc1QlqLFy+umjRpooYOHRqQRePGjfUrr7xyyb6XuxDOBQcTDitCbOPj432ZrSpkQXBHEiABEiABEiABEvAhgfnz5+vExET1ww8/0MG0KX8Jg7Um25TKDohArFOnjnr33Xd962f5tuM29SrThzdt2tQ4jYjTRrx23rx51QMPPKAWLVr0PzIYOnSoHjVqlAmZDVanSNZgQpnhaLZs2VItXLiQcs20hHgACZAACZAACZAACcQ2gfvuu0+/9dZbQe3L2KYQnt5h5hL2NzZZeynfH3/8cfXSSy/51h73bcfDo1qhn6Vw4cIace9wLhEO+8QTT6innnrqT/kvW7ZMN2/e3MxIiuJmNIMp5UwwO3rPPfeojRs3Uq6hi4Z7kgAJkAAJkAAJkIAvCAwZMkSPGDEiUBbPF512oJMyWyllBmVCCHY7JpG6d++ukpKSfGuP+7bjDujaZU/5+OOP6zVr1pjkPhUqVFBpaWlBuV999dU6lBj59DOcN998s9qzZ0/Q80ey/7wWCZAACZAACZAACZCAOwjExcVpqYnpjhZ5rxUSGiuTPNaQ2XLlyqndu3f72hb3decjpc7XX3+9RnIfOJefffZZSMyvvPJKLUobrJ0YPZFp+r/+9a/q6NGjIV0j2Hn5dxIgARIgARIgARIggdgiQAfTvjylGoTVwcRZ8XtEE7711lu+tsV93Xn76hX8DMOHDzfZY5HhtX///mrYsGEhMc+WLZuZwQwWIiuOpST6QamSuXPnqhYtWoR0neA94B4kQAIkQAIkQAIkQAKxQiB37tz6zJkzmesOrEqduUNieW8pE4hPqV0viTz9vv7SONqxLHw39K1u3bp67969ZjRj6dKlIfMuVKiQPn78eEiLsOFkovYO1ndC0Tt16oR6mCFfyw2c2AYSIAESIAESIAESIAHnCVx77bUmLwi3rBOwlnmBY4kNtnju3LnVoEGDVL9+/Xxth/u681lXq9CPnD17tsbsZZs2bUJmvWTJEt2hQwezZjPYJouMZb0mlLx69epq69atIV8v2DX4dxIgARIgARIgARIggdggEKkQ2Vie9JQZTMxeSj4U2OJcqvb7PUInxIXPiqSkJI3RD4S9QlmDbaLkGDnBbGbRokXV4cOHKdtg4Ph3EiABEiABEiABEvAZgWuuuUbDZuSWdQJShx4cJRcKHM2SJUuqgwcP+t4G9z2ArKuWc0cmJibq5OTkkMJjrVmrsmfPbmY9/1iXSdk6JyKemQRIgARIgARIgAQ8R2DUqFH6hRdeMHXZudkjIJNAKCsIe/zXX39Vt9xyi/riiy98b4P7HoA91XLm6B49eujp06cHTfCDq0O5odhQajiWmPXEQ+P5559XI0eOpHydERHPSgIkQAIkQAIkQAKeIwAbc9q0aSFFyHmuc1FqsLUGZqFChVRiYqLq1auXr21wX3c+SnoY9LItW7bUS5YsCSlEFg4m1l3CuYSTCWcTv7vjjjvUpk2bKN+gtLkDCZAACZAACZAACfiDQJ8+ffTUqVM5gxkGccP2lplLiSjEZ82aNdWHH37oaxvc150Pg245coqmTZvqFStWGKfRmqXqzy4mGWQxc4mf8+fPm+PgYL7//vuUryMS4klJgARIgARIgARIwHsEMImxdOnSkJZhea93kW2xTPIg0Q8meLAeE5M+WId54MABX9vgvu58ZNUw9KtVqlRJ79mzx8xIyrT75Y6Wv8MRte7LRcah8+aeJEACJEACJEACJOAHAjVr1tTbt28POoHhBxZ2+ihL1OBUWmcvYY/nyZNHPffcc2r48OG+9bN823E7SuX0scWKFdPfffedmYkMtllnOK0OZt68edXYsWNV+/btKeNgEPl3EiABEiABEiABEvABgfLly+t//vOfIdmYPsCR5S5K5ljMXmLWEja4lAzEbGblypXVRx995Fsb3Lcdz7JGReDAHDly6LNnz4a0BhPNST97KTHhHTt2VNOnT6eMIyAzXoIESIAESIAESIAE3E6gdOnS+tChQ0zyY1NQ1sQ++C4OJmxwOJqYxRw2bJjq2bOnL+1wX3bapk45frgUwJUp94wuKIpsLfKKtZhwOh944AG1evVqythxifECJEACJEACJEACJOBuAjNmzNADBw5UJ06cCLoEy909iX7rrEvU4FDK/zGbif/nyJFD9e3bVw0ZMsSXdrgvOx19tcy4BXAwUWrEqrAZHYH9ZNYSU/X4DgWvXbs2M8m6XdhsHwmQAAmQAAmQAAlEgMCgQYP0pEmT1JkzZ7gG0yZvCZHFacQOl+85c+Y0kzwrV670rZ/l247b1CvHDp83b55+5plnTA3MULLIQsHxYy1VgsZhFrN8+fJq165dlLFj0uKJSYAESIAESIAESMAbBFq3bq2XLVtmkkj+BZUKvNFsT7QSNjtsd9jk5cqVU7t37/a1/e3rzrtRY/v376+RnAdKCicRoyLBNhlFwfQ8jpNY8BIlSqikpCT11FNPUc7BIPLvJEACJEACJEACJBDDBOrXr6/feeedgCMUw111vGvpqzjA/saWK1cu9eyzzyLRpq9tb1933nHty8IF2rZtq5csWWIK4GJWMpQ6mJK1CpezLjQuUKCAGjBgAGLAKecsyIKHkAAJkAAJkAAJkECsEKhSpYreuXNnSBFysdJnp/ohCTZhd2P2ErPCmBi68cYb1RdffOF7u9v3AJxSvKyet0GDBnrjxo2mWGsoZUqCXadVq1Zq0aJFlHMwUPw7CZAACZAACZAACcQwgZtvvlnv27fPMwl+YLy6NYw3ffQgSpNgcgiRg4MGDfK93e17AG57jlSoUEGnpaWZZoUaIptRHx566CFmknWbkNkeEiABEiABEiABEogggdTUVA3n59tvv/2f8nZha4abPcKwdfK/J4JTeeHCBfMLRB1i9nLv3r3x0IL/AAAgAElEQVT0rRBR6QBvntIGgaJFi+ojR44EssIGC5ENdqkqVaqo7du3U87BQPHvJEACJEACJEACJBCjBJ5//nk9depUdfr0aYbIhkHGkjkWdvo111xjHM3Bgwej9iVtbjqYYdCwMJ8iX758+uzZsya5jyTssXMJJPr5+uuvqex2IPJYEiABEiABEiABEvAwgZYtW+qlS5eaHoRSpcDDXY1I06UOPRxMzGSi7uXJkydpb/9BnyAiooahXWT27Nm6R48eZv0lfiRDVWhH//le+fPnV6NHj1YdOnSgrO2A5LEkQAIkQAIkQAIk4FECDz74oF63bp1pfTjsS49iCFuzJammlCa577771MaNG2lr08EMm46F7UQjRozQw4cPN5mo4GCGkkU22MXj4uJUYmKiSkhIoNIHg8W/kwAJkAAJkAAJkEAMEqhevbresWOH6ZnMvsVgNyPWJSkjCJZwNrt166YmTZpEW5sOZsR0MOQLde7cWS9YsMA4l5LuOJQ6mBldAE4q6vFMmTKFSh+yJLgjCZAACZAACZAACcQGgRUrVujevXurw4cPmw4hiaTUbYyNHka+F2AIWx0hspjMeeGFF1T//v1pa9PBjLwyBruihC9gNAQ3fjiyyMJBbdmypVqyZAmVPpgA+HcSIAESIAESIAESiDECyCDbr18/derUqUB+D4bJ2hMy7Gsk90FpkqJFi6ojR47QzrYgJQx7+hXWo1GfaP/+/WaqHYqLT6mzA4cTjqeMOuHv8rdgM5glS5ZU+/fvp6zDKi2ejARIgARIgARIgATcTwAZZFNSUozdCHsyHEuw3N9r51sodnrp0qVpZ6fDTafDef0L6Qovvvii7tOnj/r+++/NiAjCZKVEidWplEXFMvIUrIwJ/l6gQAF1/PhxyjokSXAnEiABEiABEiABEogdAl27dtXTpk0zExfyE8x+jJ3eO9MTWceKCZ/bbrtN7dq1i3Y2ZzCdUTY7Z01ISNCTJk0ydXQkI5VMvcvDAOeXNZn4Xagx9LgJMHLVq1cvKr8dIfFYEiABEiABEiABEvAYgSZNmugVK1aYVodj+ZXHuu9oczEb3LBhQ7Vq1Sra2HQwHdW1LJ38ySef1K+++qqZtZQMstYwBglnsIbMSpHXjC4I5xLna9OmjVq4cCGVP0vS4UEkQAIkQAIkQAIk4E0CderU0Zs3bzaNF7sQn9zsEcBkDzg+/fTTKjU1lTY2HUx7CuXE0fXq1dNvvfWWmb1EwVaMMJ0/fz6wHhMOpmT8wndJiwznMaMNDilugAoVKqhPP/2Uyu+E8HhOEiABEiABEiABEnApgZtuukkfPHgw0DrJ8+HS5nqiWbL+EtGGvXr1UiNHjqSNTQfTfboro0ty08PB/Nvf/mYczbS0NLM2E86krL0UZzPYCBTOB4c1Z86c6uTJk1R+94meLSIBEiABEiABEiABRwggg2x8fLz65ZdfLkkeyTWY9nGDYcGCBdWwYcNUly5daGPTwbSvVOE+Q8WKFfXnn39uMnuhrs6tt96q9uzZY5R1xowZet26dWrr1q3q6NGjZh9s+Aw2gwkHE04qHNNff/2Vyh9uwfF8JEACJEACJEACJOBSAs8++6xOTU0NJI4Uu9BunXWXdjdizZIJH2SQ3bdvH+3rdOQJJGKqmPGFSpQooTFLCecyb968qnXr1mrKlCmXyKdDhw566dKl6uzZs8a5lNIlGZ1ZamriRhg/frzq2bMnZe4SmbMZJEACJEACJEACJOAkgXvvvdcswUI0G5zKzNRZh8GonWych88NltmyZVPVq1dXmzdvpm1NB9N92jx79myN6fUjR44Yx7Fp06Zq8eLFf6qsZcuW1Xv37jWzkhcv/ltd8ZffF2z/59d/m0+Z1bxCq99DIa7470znww8/rFavXs2bwH0qwBaRAAmQAAmQAAmQQNgJFCtWTP/www9mBlMSRiL6LdgSq7A3JMZOKDOYjz76qHr55ZdpW9PBdJ+Gz5s3Tw8ePNiEv9auXVu9++67l1VUFMsdO3ZsYD0mHEg8JPR/fjMdg8KbdZx/OJj/0b8FZjuLFi0KJ5Y3gftUgC0iARIgARIgARIggbATyJ07t0bSSAmJzcwMZtgbE0MnBM/s2bOrVq1aqTlz5tC2poPpPu1esGCBHjp0qAl9nTx5MmYwM1TUatWqaST+wUPCmgkMo1OyaNtaO1MyyaLnCQkJKikpiTeC+9SALSIBEiABEiABEiCBsBFAhNwzzzzz+0SE1r9HvP3nPwqZT4Pl8AhbI2L0RLC/c+fOrbp3765GjBhBu5oOpvs0fdGiRfrDDz9U06dPD0lBBw0apKdMnqh+/vkXdcUfDw2EPUDZrbUxZfoev8ODBfH3DRo0YJis+1SALSIBEiABEiABEiCBsBKYPn267tGjxyVl7sSxFBsxrBf00cmwVC1fvnxwLlXHjh1Dst99hEcRiEelXaVyJf3lnt3qwn+USQwERYcTiZEpibFH1+BcYqQK++DvZcqUUQcOHKDcPSp3NpsESIAESIAESIAEQiEwfvx43b9/f2MDwjaU6Db8n2swQyF4+X3AkhlkM+BjDy+PjhaBsaNG6HVr/6E+3plmahtJ6RJJP22tmSl/wwMF9XqSk5NVp06d6GRGS3i8LgmQAAmQAAmQAAk4TCAhIUHD5sOGiQjYhjIhwTqY9uHff//9av369bSn/wQlodjXr6idIaFvLz1/0TKF7GDqyisCCX7w8Pj137+a8Fkk+5GwWYy2xMXFqXbt2mGtJ2UfNcnxwiRAAiRAAiRAAiTgLIEuXbro2bNnG/sQGyYa5DtDZO2xR4Kfrl27qpSUFNrTdDDtKZPbjh4/cqieMnO++vbbbxWyxWLDiJQ4mFciHEL//jtJTw1nExmvFi1axBvCbQJle0iABEiABEiABEggTAQee+wxvWrVqkA1AdiHcCyxnIqbPQJwMJGgs2/fvrSn6WDaUyY3Hl27RmW9fdtOpa+8Qil9pfpN/e5M4t9frrpSqd9+f5DggYIkPxcvXlSY0t+wYQNvCDcKlG0iARIgARIgARIggTAQaNiwoV69erWZeJBEkPI9DKeP6VPIxIw441izKqVe0PHChQur77//nrb0ZbSAYDx+e7Rr00IvXrJU/YYJzD8cTJOGWv/2+wLu33QgdFbSU1etWlXt2LGDsve47Nl8EiABEiABEiABErgcgcqVK+udO3cae1DqpCMvB9ZiMslPxnojZV1krap8SskXrr/MmB+dDI8/l2bPmqZ79uypzp//Vakr/lvnCDcCZjMRIouHiYzA4AFTvHhxM63ftm1byt/j8mfzSYAESIAESIAESODPCBQqVEgfP348sExK6qLDJqSDGdzBhM0sDqUwk5nM9u3bq9TUVNrRnMGM3YdPoYL59YmfflJXXPEX8xDBDWEcTP2bugL//ljcLaMxefLkUUhbPWDAAN4YsasW7BkJkAAJkAAJkIBPCSxfvly3bdvWLI1CaKfVFmSCn9CUQiozSBlA60xw79691bhx42hH08EMTZm8uNfNN9+ov/xyv7rqKsSH/57UR5xMCYu1xtwjk2y3bt3U6NGjeWN4UeBsMwmQAAmQAAmQAAlkQKBbt256ztw56uKFiwGbUJI+ch1mcNWB/SxlXeBoyiSN1JufPHkyssjSjqaDGVyZvLpH/fr19fr169Vf/nKF+u03JPlRf8Tbo6iuNjeI1MLEjZEtWzbVsmVLNW/ePN4YXhU6200CJEACJEACJEAClyFw22236d27d5sZTLEBTXTbb7+Z/7MOZsaqIw4mWMkMsGTgzZUrlzp9+jRt6AwQEk4MPJp6xffWkydOUlr/nnZa69/DYhEyq7ASEx6nUpck+6lfv75au3Yt5R8D8mcXSIAESIAESIAESEAIJCYm6kmTJqmzZ88GnCNZS/i7nfh7pBu3yxNInxRJnHKwK1asmDp8+DAB0sGM7Vto8pRpum+/eHXhwnn1F7P+UnQeIbP/NuVJUFxXRrAwElOrVi21detW3hyxrRrsHQmQAAmQAAmQgM8I3Hvvvfqdd94JTC5IghopvcEsssEVQpxw2M6woSWsGI56mTJl1N69e2lD08EMrkhe36NIkSL6xx9/vCT0wZpS2Tq9j5ukVKlSvDm8LnS2nwRIgARIgARIgATSEbjpppv0wYMHzW+tobCSn4PAMkfAOpsJnpUqVVKffPIJHUw6mJlTJC/uXbFiRRNrj1Eq6wMEIy/4P0arZMPoC0qVfP3117w5vChstpkESIAESIAESIAELkOgVq1aetu2bXQwbWiIJPWRU4h9DZu6QYMGXGYWhC0dDBvK56ZDGzRooN98881Ak6w3hixKtsbbFyxYEFlkVbt27agDbhIk20ICJEACJEACJEACNgg0btxYv/7663QwbTC0JkOSigxSO7RTp05q+vTptJ8z4Es4NpTPTYe2a9dOz58/P1A4V0JirQu55cbAKEyOHDnUoEGDWAvTTUJkW0iABEiABEiABEjAJoGWLVvq5cuX08G0wTFQU/6338z6S9lgXyclJanExET6UHQwbWiYRw4dOHCgHjVqVCBb2H+n8q9EBL7pRfqbJT4+nrUwPSJfNpMESIAESIAESIAEQiHw5JNP6lWrVtHBDAXWZfbBpAycSZnJxCc2lPqbOXOmevrpp+lg0sG0oWEeOXTixIk6ISHBpKSWVNQyYymFdcXBxCdGY7p3767Gjh3LG8QjMmYzSYAESIAESIAESCAYATqYwQiF9neJArQuNStRooQ6dOgQbecgCAkoNB1z/V7z58/X/fv3V8gkK7V6ZPTFWgcTHcHvsU/nzp3VxIkTqQOuly4bSAIkQAIkQAIkQAKhEWCIbGicMtpLJmcwIYPviAxE2b+KFSuqHTt20Hamg2lfybxyhjJlyuh//etfprlS88jadkmzjN9prVSHDu3VnDlzeJN4RcBsJwmQAAmQAAmQAAkEIdCqVSu9bNkysxfLlGRNXWTWUiZtECILB7Nq1arqww8/pO1MBzNriuXFo+rWras3bdr0Pw8TuSkuXrxoQmNRsgQ3yX333afWrVvHm8SLwmabSYAESIAESIAESOBPCDRr1kyvWLGCbGwQsE7KyJIznO6BBx5Qa9asoe1MB9OGdnnsUJQq2bBhg5m9xGatgSmOJT5x0/z666+qaNGi6siRI7xJPCZnNpcESIAESIAESIAELkegXr16euPGjQRkg4C1prysxcRn8+bN1dKlS2k708G0oV0eO7Rp06YmaxhmKHETWOPG8R2Op/xesmFNmTJFde3alTeKx2TN5pIACZAACZAACZDAnxG477779Ntvv004YSJgdTD79u2rxowZQ7uZDmaYtMsDp+nSpYuphYnZSTiZEjcuNwam+PF7bDKT+eijj6qVK1fyRvGAfNlEEiABEiABEiABEghGoH79+iaijVvWCVgTZEp1BtjOEyZMUF26dKHdTAcz68rltSMHDx6sofjnzp0zdXtksy5Uxs2BtZhy45QtW1bt2bOHN4rXhM32kgAJkAAJkAAJkMCfEKhTp47evHkz2dgkAFtaKi8gCrBAgQLq2LFjtJlD4EpIIUDyyi6zZs3SgwYNUkePHg3UwsTNgaKw4lQiuQ9+hxsFjid+UlNTVfv27akLXhE020kCJEACJEACJEAClyFQo0YNvX379tD4wPrToe3qp72sazAl4U/58uVVWloa7eUQFIGQQoDkpV3KlSund+/ebUJg4Uji55prrjGfEh4r2bBkn44dO6oZM2ZQF7wkaLaVBEiABEiABEiABP6EAGzBL774gmxsEpDQWJnJfOSRR9Qrr7xCezkEroQUAiQv7XLXXXeZsAisv5QbQtZjWlMuy9/Qt1KlSqmDBw9SF7wkaLaVBEiABEiABEiABNIRmDNnjn7++efV8ePHycYGAdjJ1mSZiAZ85pln1JQpU2gvh8CVkEKA5KVdnn32Wb1gwQJ1/vz5QJKfjNqPGyhfvnzq5MmT1AUvCZptJQESIAESIAESIIF0BHr27Kmx9An5OLhlnYBMxEiobPbs2dXgwYPVgAEDaC+HgJWQQoDkpV2Sk5P1qFGj1OnTp0NqNmY6c+XKpcaOHct1mCER404kQAIkQAIkQAIk4E4CrVu31osXLzY5NrhlnYC18gKWmhUuXFgNHz5ctWnThmBDwEpIIUDy2i7FihXTP/zwQyBTbEbtxwgNRmVQOHb+/PnUB68Jm+0lARIgARIgARIggT8IIMHPxx9/bJI9css6AUzAoOwfNoTKFitWTI0ePRr2Mm3lELASUgiQvLZLhQoV9Oeffx5yszHKVbJkSZWUlKRatmxJnQiZHHckARIgARIgARIgAXcQWLx4se7Ro4c6derUJeXq3NE6b7YCjjoqL8DBHDNmDO3kEMVIZyJEUF7a7ZFHHtGvv/56SKNXGKGRJEDMJuslKbOtJEACJEACJEACJPBfAiNHjtQDBw4MKYKN3DImgAg/TMBI0sxbbrmFdeMzoTR0MDMByyu7Dho0SCNOXNIrZ9Ru3EDYMP1ft25dtWHDBuqEVwTNdpIACZAACZAACZDAHwTatm2r58+fH6hzTjD2CWj9e5HQWrVqqa1bt9JGDhEpQYUIymu7XXPNNVrqXmbUdmsh2euuu04NGzZMtW3blnrhNYGzvSRAAiRAAiRAAr4m8H//93+mFnooEwy+BhVC52Ef4wfhsZjFrFevnlq7di3t4xDYYReCChGU13bLmTOnPnv2bNAsYhiZweylhMl27tyZNX68Jmy2lwRIgARIgARIwNcEFixYoNu1a2dsOiSnYRbZ8KgDIv1QbeHJJ59kMsxMIKWDmQlYXto1f/78+ueffw6pyTKLiU+M0Kxbt456ERI57kQCJEACJEACJEAC0SfQsmVLvXz5cjPjBidTlkBFv2XebIGExmL28uqrr1bdunVTKSkptI9DFCdBhQjKa7thBvPChQshPWBkFhMjXkWLFlWTJk1STZo0oW54TehsLwmQAAmQAAmQgC8JFClSRB89etSEx8KeY5kSe2ogky9wMHPmzKl69+6tBg8eTNs4RKwEFSIor+0W6gymFJLFJ26iHDlyqL59+6qBAwdSN7wmdLaXBEiABEiABEjAdwRWrFihmzRpYvrN2cvwiR8TMLCPCxUqpBISElSPHj1oG4eIl6BCBOW13eBgnjx5MmgMvixiRigFbiT8VK5cWe3cuZO64TWhs70kQAIkQAIkQAK+I/DQQw/pjRs3KkSuWUtr+A5EGDssNjFOiRqYycnJ6umnn6ZtHCJjggoRlNd2u+qqq7T15rhc++FYYuYSMfvYsmfPbh5OSUlJqk+fPtQPrwme7SUBEiABEiABEvAVgcKFC5vwWEnsIzUcfQUhzJ2V2UvYx6VKlVL/+te/aBNngjFhZQKWl3bFGsxz586F1GRM/0vMvixqRqjFihUrqB8hEeROJEACJEACJEACJBB5Ah07dtQvvviigs0n6y5hyzGLrH1ZgCcczFtvvVXt2bOHNnEmkBJWJmB5adfixYvrw4cPB33AyBpM9E0eTMiWVaBAAdWoUSM1c+ZM6oiXBM+2kgAJkAAJkAAJ+IZA9erV9c6dO01SR4lc4zrM8IhfEv1Uq1ZNffzxx7SHM4GVsDIBy0u7lihRQh85ciRoFllxMOFU4sGEepjibMbFxamKFSuqFi1aqOeee4664iUFYFtJgARIgARIgARimsDChQt1YmKigr2HmbZrrrkmkEFWItJiGoCDnbOW8LvrrrvUu+++Szs4E7wJKxOwvLRr7dq19UcffWS7yVifeffdd6uNGzdSV2zT5AlIgARIgARIgARIIDwEOnXqpOfNmxeYvcRZZe0gHUx7jGUCBtUV7r//fvXaa6/RDs4EUsLKBCwv7Tp06FA9ZMgQ23WQ8ID629/+pt566y3qipcUgG0lARIgARIgARKIaQJ169bVmzZtMg4m11yGV9TCEzPD/fr1U2PGjKEdnAnEhJUJWF7atX379nru3Lm2HUw8tG6//Xa1ZcsW6oqXFIBtJQESIAESIAESiFkCY8aM0SkpKerEiRMmPFbyaEhiGjqc9kQvZfywnrVnz55q1KhRtIMzgZSwMgHLS7s+99xzevbs2SYW3+520003qb1791JX7ILk8SRAAiRAAiRAAiQQBgINGzbUq1evVnCAxMGU8Fjk0xCHMwyX8uUpJGFSrly51LBhw1Tv3r1pB2dCEwgrE7C8tGtqaqru2LGj7QcMRnDy5cunBg8erHr06EF98ZISsK0kQAIkQAIkQAIxSeD666/Xhw4dMrXMZUPUGRxLhsyGT+Q5c+ZUkyZNUu3ataMNnAmshJUJWF7b9aqrrtJ4yNjZMIKDrGQdOnRQ06ZNo77YgcljSYAESIAESIAESMAmgaSkJD106FBzFrHzMCEgDiYT/NgEbCndhxni8+fP0/7NJFICyyQwL+2ePXt2ffHiRVtNlnCLO++8U7333nvUF1s0eTAJkAAJkAAJkAAJ2CNw//336w0bNpjZSwnlxMwlvkt5DXtX4NHivBcqVEgdO3aM9m8mVYLAMgnMS7sju9h7771nq8nyoLruuuvUN998Q32xRZMHkwAJkAAJkAAJkIA9AgUKFNCnTp0ytcvhZGINpjibMpPJJD/2GONoOO316tVTa9eupf2bSZwElklgXtq9S5cueubMmabJ1tAJ/F8K8uLhlNEmdYDw4Bo1apTq27cvdcZLSsC2kgAJkAAJkAAJxAyBhIQEnZycbDvHRswAyWJHJIxYHHGrQ46/IdwYtm/nzp3V1KlTaftmkjOBZRKYl3ZfsGCBRmpljHLJjWJdAC7hr8H6JKNjjRs3Vi+//DJ1Jhgw/p0ESIAESIAESIAEHCBQs2ZNvX37dhMOyy18BKw84WzC9sXnokWLVLNmzWj7ZhI1gWUSmNd2L1GihD5y5Mj/hE+gH5jFDBZCIY4p9i1WrJj67rvvqDNeUwK2lwRIgARIgARIICYI5MyZU587dy4m+uKmTljXskoNzBIlSqivvvqKdm8WBEVoWYDmpUOqV6+uP/nkE9NkqZMkGcckXj+j/lgdUOw/YcIE1bVrV+qNl5SAbSUBEiABEiABEogJAtmyZdMXLlxgiGyYpSk5R8S5hK3cunVrtWDBAtq8WWBNaFmA5qVD+vXrZ9ZhnjlzJpC+2houG6wv6esp1apVS33wwQfUm2Dg+HcSIAESIAESIAESCCOBnj176ilTppgzMkTWHljJTYKzwNYVB1O45s6dW82aNYvhsVnETEchi+C8dFjlypX1rl27TDy5rMFEbcuzZ8+GNAImM56oBYQb7z//+Q/1xksKwLaSAAmQAAmQAAl4nkCFChV0WlpaSLab5zvrcAfgVCKyTxxMfFprit52223qk08+ob2bRTkQXBbBeekwzGLOmDFD/fLLL/9zI+EGy2iTvyPbbLZs2RTqaiYmJqrhw4dTd7ykBGwrCZAACZAACZCApwkUKVJEHzt2zJQnCWa/ebqjEWi8tV6ofJcIP0yotGvXTs2YMYO2bhZlQXBZBOe1w/7v//5Pf/nll4FkP7/++qtxGPGZ0YYZS5n5lLCBatWqqW3btlF3vKYEbC8JkAAJkAAJkIAnCcybN0/37t3bVAawOkee7IxLGm2tpiCzl4jwy549uxo7dqzq2LEjbd0syorgsgjOa4fFx8frqVOnGgcTI18YnZGbKaO+4CFmTQ509dVXq2uvvVYdPnyYuuM1JWB7SYAESIAESIAEPEkAtc3nz59vIslgvwWrAuDJTkag0TBeUeAl/QQK/g8bFzZv+fLl1WeffUY714Y8CM8GPK8dWqZMGf3111+bZsPJlExZoTiYmMXEhhsPoztDhgxBqCz1x2tKwPaSAAmQAAmQAAl4jkDdunX1e++9Z6LKEH3GENnwiBC2sCS0lDWZ9913n9q4cSNtXBuICc8GPK8dmpCQoEePHh1wFEOdxZQQAtyAshbzkUceUStWrKD+eE0J2F4SIAESIAESIAFPEVi4cKFOSEhA9JgZ5McsJh1MeyKUZV/WyRY4mJjFbN++vZo5cyZtXBuICc8GPC8emjdvXo1kPxgBk5GaYP2QNZjYHzci1m6WLFlS7d27l/oTDB7/TgIkQAIkQAIkQAI2CPTo0UPPmTPHZP8X+40hsjaA/pExVpx0CTnG/wsXLqyGDh3K9Zf28Co6CDYBeu3wO+64Q2/fvt3MRMrayoz6ILOX+LTWz8QIT5s2bVRqaip1yGtKwPaSAAmQAAmQAAl4hsA999yjt2zZYkJj6ViGT2zCUiZQMDuM9Zc7duygbWsTMwHaBOi1w4cMGaJTUlICo2ChFOrFPrIYWsJkMYJWo0YNtWXLFuqQ15SA7SUBEiABEiABEvAMgeuvv14jPNaanJGOpn3xiQ0sazDBtGrVqqyUYB8tZzDDwNBzp0CY7M8//xxSmRKs08Rsp8xkSlgtHMwiRYqoUaNGqaeeeopOpue0gA0mARIgARIgARJwO4Hnn39eT5o0SZ0/fz7QVNhkdDDtSU6cS3xKThI48MWLF1d9+vRRPXv2pG1rAzHh2YDn1UOLFSumf/jhh5BCZHGzYWRHsmwhPAMhBPjEDdmiRQu1cOFC6pFXlYHtJgESIAESIAEScC2B+vXr6/Xr1xtbDD8SVebaBnukYbBvsdwL9qy1UgIY169fX61bt462rQ1ZEp4NeF49tHnz5nrZsmVhyUCGxdATJkxQzZo1oy55VSHYbhIgARIgARIgAVcSyJ8/v4k6k6VKkj8jlCVOruyQSxqFiRM4mcIVzRLnHRF6R44coV1rQ1aEZwOeVw8dN26cHjx4sDpz5oxtJxMjPY899hhLlnhVGdhuEiABEiABEiABVxJo3bq1XrlypYk4Q2kSRI7RwQyvqKzJLMXJrFChgvrss8/oI9lATXg24Hn50Jw5c+oLFy5csmA8K/3B6E/BggXV8ePHqUtZAchjSGXz9P4AACAASURBVIAESIAESIAESOBPCBQtWlR///33xrGUpUlwiEKpAkCgwQlYk/tIqRIc9fDDD6vXX3+ddm1whJfdg/BswPPyobly5TIOZqi1MC/XV7k527Vrp+bMmUN98rJSsO0kQAIkQAIkQAKuIDB+/Hj9/PPPK9hqkgfDmnCRSX7siUlCYyUzryROgl3buXNnNWXKFNq0NhATng14Xj60evXqetu2bbZDZOWGzJEjhzp9+jT1yctKwbaTAAmQAAmQAAm4gkC5cuX03r17A22xZj1FUhpryRJXNNhjjRBn3TpziS7ExcWphIQElZiYSJvWhkwJzwY8Lx86ePBgjeQ8WIdpZ5MsswjfaNCgAUMK7MDksSRAAiRAAiRAAr4nMHr0aD1gwADDATNq2BBxhiz+WIsJB5NJfsKjJulLvhQqVEgNHToUs5j0kWwgJjwb8Lx+aKVKlXRaWpqtblizcP31r39V48aNU61bt6Ze2aLKg0mABEiABEiABPxKoGLFinrPnj2BrKaS7RRlNay1yf3KJxz9hv0Kp93qrINzmTJl1AsvvMAa7zYh0xGwCdDLh9erV09v3LjRdhckzACzmA899JBatWoV9co2VZ6ABEiABEiABEjAbwR69eqlU1NTsewoUJ8Rjo8k+oGTKQ6n39iEs7/iYIIr7FhhWr58eYVKC02aNKEtawM44dmA5/VDk5OT9fjx49WxY8fMgwujYtmyZTM3GkIw8BALlgRInEvcqPjBLObIkSNVmzZtqFteVxC2nwRIgARIgARIIGIElixZoocMGaIOHjwYsWv69UJwKCXkGDYwtuuuu0516tQJazBpw9pUDAK0CdDLh7/00ku6b9++6vDhw6Yb1hExcRiD9U8WR0uoLJzSxo0bsy5mMHD8OwmQAAmQAAmQAAlYCDRr1ky//PLLZsCfWWKdVQ2sbQVn2K0oAZMnTx4zQdK1a1f6RmFAT4hhgOjlU9x8881637595kEms5iYlZRivsH6Zq0hJAulr732WoWZ0ebNm1O/ggHk30mABEiABEiABHxPYPbs2Saxz8mTJ01obLAIMt8DCwMATJKANWzgli1bqoULF9JuDQNXnIIgwwTSq6dp1KiRXr16tWm+NZOWdWYyWN8kkxluUjiceCg2bNhQvfrqq9SvYPD4dxIgARIgARIgAd8TqF27tt6+fbuZTWOWWOfVQezV7NmzqyJFiqivvvqKNmsYsRNmGGF69VSFCxfWWIcpNZXwYEPYQCgPOClTIoulhUH+/PnNLGbbtm2pY15VDLabBEiABEiABEjAcQLt27fXCxcuNIP0LEPiOG5zAZm9xKRI+/bt1dy5c2mvhhE9YYYRpldPhVGzrVu3BuLQEY+OWUn5yahfskYAzigeivi/OKbIKPv6669Tx7yqGGw3CZAACZAACZCAowRQ83L48OHq7NmzJgJMbDAZ9Hf04j4+uUym5MuXT40ZM0Z17NiR9moY9YEwwwjTq6fq27evTklJMc6hZIWVB5sU+M2ob9ZRIMnEhd/lzp1bTZgwQbVr14565lXlYLtJgARIgARIgAQcI3DjjTfqAwcOBOwvGdwPxf5yrFE+OLHYuah+cPToUdqpYZY5gYYZqFdPV6BAAf3TTz+Z5D54uCFEFt+DjaBJaCxSPeMYycqFT/zceeed6t1336WeeVUx2G4SIAESIAESIAFHCDzwwAN63bp1gXqXuIgsPZL8Fo5cmCc1NipYFyxYkA6mA/pAw98BqF48ZevWrfWiRYtMTSAsMNdKqyvw7wp7KhIXF6fmzZunmjZtau9EXoTKNpMACZAACZAACZDAnxBo166dKUny888/B2wvKfkmg/YE5xwBqZiAaLsTJ07QRg0zagINM1Avn65UqVL60KFDZgYTW7Zs2cy6SrvbPffco95++23qml2QPJ4ESIAESIAESMDzBHr27GmS+kjkGNZewvaC3YVBfpnF9HxHXdwBmUCpU6eOeuedd2ijhllWBBpmoF4+XZcuXfT8+fPVuXPnAjUx7a4BwPEYHRo6dKjq3r079c3LCsK2kwAJkAAJkAAJ2CIwYcIEjaQyR44cMaGxkiQRJ5Ua5LCdGCJrC3PQg+HE33bbbWrXrl20TYPSyvwOhJp5ZjF9BGYx//Wvf10SrmGnwxghQqjHXXfdpd58803qmx2YPJYESIAESIAESMCzBObPn2+SKn755ZdmllLyWIijiVwWfp69hJH4ewyd8xuY33fffWrdunW0TR3ATagOQPXyKatWrap37dplHnAykmanPzICV6xYMTVw4EDVuXNn6pwdoDyWBEiABEiABEjAkwRKly6tv/vuO3X+/HnTfjiYkhQRziU2lCnB8iS7EWSeBHSZRjvheMLB7NChg5oxYwbtUgeUhVAdgOrlU/7tb3/Tb7/9tgnZwJoAuw84OJh4WOLB2bBhQ/Xaa69R57ysIGw7CZAACZAACZBApgmUL19ef/7554HkiWIbiaMpDqasw8z0BXhApghce+21qk+fPvihXZopcqHtTKihcfLNXgkJCXry5MlmkTl+7G6YCcVDFOfKmzevmjhxomrbti31zi5YHk8CJEACJEACJOAJAnfccYf+4IMPFDLrX7hwIVDzEgP52GAnYUAeNhPrYEZGpEWKFDG12lnlwBneNPSd4erps9asWVN/9NFHZpTNbpkSzIDiAYpwW4zO1a1blxllPa0dbDwJkAAJkAAJkECoBOrXr683bdpkwl7FoZToMAmRldlLsZkQRcYkP6ESztp+tWrVUlu2bKEflDV8QY8i2KCI/LdD27Zt9YIFC0yYLEbT7Gx4QIqTis/s2bOr8ePHq06dOlH37IDlsSRAAiRAAiRAAq4m8NBDD+l33nknMGsJuwoRXRh0t2tfubrjLmicsMYnHHdwx0yxJFd65JFH1KpVq2iLOiQrgnUIrJdPa02hbXcNJjjgHBidw02OrXr16urDDz+k7nlZSdh2EiABEiABEiCByxJ4+umn9dq1a9WPP/4YGLCHHQR7KBy2FdGHRiB9JB4cTIQqd+vWTY0ZM4a2aGgYM70XwWYamT8OuPXWW/X+/fttj7DhRkaZEsmIhocrRu7Gjh2runbtSv3zhzqxlyRAAiRAAiTgGwI9e/Y0kWAnT540fZZlQpIxlrOXzquC5ABBWLLYopjFhMOZP39+NWnSJNWqVSvaoQ6JgmAdAuv105YtW1ajTpPdNQByg+NT1mLiAXvjjTeq3bt3U/+8rihsPwmQAAmQAAmQQIDAggULdK9evdSpU6fM72DzwJbCzCWcG3E27ea4IPKMCYC5sMZ3THbAwcRER+HChdXhw4dpgzqoRITrIFwvn7ply5Z6+fLlth1MPEClaLDEvUuNTST82bBhA3XQy4rCtpMACZAACZAACQQIVK9eXW/bts04lrCBMLguS4TEHgpHGTgiz5iA1YEXGYA/ZFGyZEl14MAB2p8OKhHhOgjX66cuUKCAlvCOrPYFo0Z4yMpMpoTKos4TYuCTk5PVs88+Sz3MKmAeRwIkQAIkQAIk4AoCiYmJOiUlxdg8kjEWdhCcGnE2OXMZOVEJe5nggEzA/4477lCbN2+m7emgKAjXQbheP/Utt9yi9+3bZ6sbkoJbHrQye4lQEYQu3HvvvWr9+vXUQ1uUeTAJkAAJkAAJkEC0CSB/xaFDh9TZs2cvyVgqtS2lfTLwHu32xvL1rVUM0E8pAYPvnTt3VtOnT6ft6aACEK6DcL1+ahQG3rp1q61uwInErKXEwaNMyfnz5wMpuvPkyaMee+wxNW/ePOqiLdI8mARIgARIgARIIFoEevTooefPn2/WXlpnKa3rAKU8iYTKRqutfriurMHEuktsKFEikxvjxo1T3bt3p93poCIQroNwvX7qmjVrmnUEUksI/cHD0Voo2G4SIDyES5curfbt20dd9LrCsP0kQAIkQAIk4EMCL730kh48eLBC9n2ZrWQobHQVQUrkwbG01h79w6alzemweAjYYcBePv3o0aN1//79A04lMnBduHDBOJz4kfWUdvqIBzHSRQ8bNgw1iaiPdmDyWBIgARIgARIggYgT6NWrl542bZqxi7DBXsJsGbfoEZAkk+mTTRYvXlx9++23tDcdFg0BOwzY66evUqWK3rlzpxmRk1Eg3KxwMMNRxwnnwYzoo48+qlatWkV99LrCsP0kQAIkQAIk4DMCJUqU0N98842xk6QkCWbQuEWPgCT4gaMvssBngwYN1Jo1a2hvOiwaAnYYsNdPn5KSogcNGmTCC6xpnsXhlHDZrPZTHgAlSpRQX331FfUxqyB5HAmQAAmQAAmQQMQJdOzYUc+ZMydQ7zJ9cpmIN4gXNAQkqSQ+paIBBgAQypyQkEB702E9IWCHAcfC6cuUKaO//fbbS8I9wpVuGzc+Spbgpocj279/f+pkLCgN+0ACJEACJEACPiBQsGBBU9INA+45cuQwGWRhI3ENZnSFL6GxkmQJrcmZM6c6ffo07cwIiIaQIwDZ65do1KiRfu211wIZuCREFrOadkNArEWIy5Ytq/75z39SJ72uMGw/CZAACZAACfiAQHx8vEZGUgyUI0cFNiz9gVMj2Ut9gMGVXZQElZAFZjAxAHDLLbeovXv30s6MgMQIOQKQvX6JyZMn66FDh6qff/7ZzGLadSqtPMTBxAMA38eMGaN69epFvfS60rD9JEACJEACJBDjBCpXrqzT0tKMbQQnU7KVhiMJYoyjc7x71iQ/8r19+/Zqzpw5tDEdp68UIUcAcixcokGDBnrjxo3mIYrsaHh4YnQoHGVKhA9GlypUqKDS0tKol7GgNOwDCZAACZAACcQwgauuukrL7Bi6iQF4LP0Jh30Uw9gi0jXIQexVyAUTGTNmzFDt27enjRkBCRByBCDHwiXatGmjV65caUJAxKkMR6Fg6xoFOJj58uVTzz33nEpKSqJuxoLisA8kQAIkQAIkEIME7rjjDlMr3DrgDicG/8dnODLtxyC2iHcJcsDa2Jtuukl9+umntC0jJAGCjhBor18GNZ6mT58eeHBai9ba6ZtkW5NyJfh/rVq11NatW6mbdsDyWBIgARIgARIgAccIFC9e3CRAxOwYfhDhJbYM62A6hj3kE1uT/MBm7dSpk5o1axZty5AJ2tuRoO3x883RK1asMOVK9u7da9ZK4mFqNzwW8OQc1gd09uzZTUZZppH2jXqxoyRAAiRAAiTgGQLNmzfXL7/8shl0t9a+lKiscNUK9wwQFzbUWi6mVKlSatiwYapVq1b0eyIkK4KOEOhYuMxTTz1lwmTxQLUunrbbNxn5kxh5PBSqVavGWUy7YHk8CZAACZAACZBAWAlgwL1Pnz4Ks5fiSKavfYmwTJYpCSv2TJ9M6qzjwEaNGqmXX36ZPk+mKWb9AMLOOjvfHTlhwgSdlJSEGkJhS/IDiJJKGt/xQMbaBYSXYBZzwIAB1FHfaRo7TAIkQAIkQALuJNC0aVO9atWqQMZYhMZik3IYMgDvztb7q1WwL7H+cvDgwSo+Pp72ZATFT9gRhB0LlypTpow+cOBAIETW7ggdjreG2lpDZmvUqMFZzFhQGvaBBEiABEiABGKAwNy5c/XAgQPVkSNHTG9kBtO6zAd2TXrbJga67rkuyORF/fr11fr16+nvRFiCBB5h4F6/XLdu3fTs2bONU4hF03ZrYgYWxl/5F3XlX35f14nQEqmL2a9fP2aU9brSsP0kQAIkQAIkEAMEULLtrbfeuiRDrOSkgO0ig+R2B99jAFXUuwA7slChQuq7776jrxMFaRB6FKB7/ZIlSpTQ33zzjW3nEhxklE8+Zd2CZGKrWLEi00p7XWHYfhIgARIgARLwOIEnnnhCv/baa2ZwHTYKNpRXk9qX+L+EyYYjCaLHcUW9+bAn27Ztq+bPn09fJwrSIPQoQPf6Jbt3766nTJkSCJOVosLysMWDVx64dh+yeFhjFnP48OHUVa8rDttPAiRAAiRAAh4kMHbsWI0spKdOnTKth51j177xIAbXNdmaXEm+yxrYYsWKqcOHD9N2jJLUCD5K4L1+2RtuuEF//fXXASdTbmzrAxeOp90QWpzv5ptvRnkU6qrXlYbtJwESIAESIAEPEihVqpQ+dOiQypYtmzp//rzpAcNg3SFI6wwybEYkibxw4QLrXkZZPDTaoywAr14+Pj5eT5w40YzgyTpK9AUzjnAssaVP252VvuIBjhCUF154AT/U16xA5DEkQAIkQAIkQAJZItCsWTP90ksvXZK4J1y1wLPUIB4UICBOvjVUGbIpXbq02r9/P23GKOoK4UcRvtcvXbZsWf3FF19cEioLB1NudHEy7fRTMrShSO6BAweor3Zg8lgSIAESIAESIIGQCUycOFGPHDlSHTt2zAyai01itXNCPhl3dIRA+twd+fLlU88995waNmwYbUZHiId2UsIPjRP3+hMCAwYM0NOmTVNnzpwxD13UgpLkPOEa3ZPZ0bx586p27dqpCRMmUGepjSRAAiRAAiRAAo4TqFq1qt69e7c6d+6cuRbCL2HrhCNCy/HGx/gFJIIOzr7k/sCMJsqSrF69mrZilOVPAURZAF6/fJUqVfSuXbtMN8Kx5jI9DwmRxUP9+uuvV88//7xq37499dbrisP2kwAJkAAJkICLCTRu3Fhv2LBBnT59OuBYyhIgcTRd3HxfNU3yfxQtWhQzl6pDhw60E6OsARRAlAXg9ctjFjM1NVX99NNPxsGEQygLrsOxAB7nwnmQFjwuLk5Vq1ZNvf/++9RbrysO208CJEACJEACLiXQqlUr/eqrrxrnErYHZjCvvvpqswRIBr7tJjF0adc91yyJdEMCpkceeUStXLmSNqILpEghuEAIXm9C+fLl9f79+9XFixdNV+ThG4403jIqJcmD8KAfPHgwSpdQd72uOGw/CZAACZAACbiMQNu2bfXrr7+uTp48aRxKqXmJZuL/cGSQpZQOpjsEJ3IoWLCgSQjZuXNn2ocuEA2F4AIheL0JPXr00HPnzjUjfPLwhbMpi+Ht9g/nwQwmnExsmMX88MMPqbt2wfJ4EiABEiABEiCBAAEk9cFSHNgwrHPpfsVAqDLKxsA+vOuuu9Q777xD29AlYqMgXCIIrzcDGWW/+uorc6NjNElCFuyO8MlsqDiXWFyfK1cu1bJlSzVr1izqr9cVh+0nARIgARIgARcQSE1N1X369DGzk2LLuKBZbMJlCMh6WNiHsAuRdLJly5a0C12iMRSESwTh9WYkJibqESNGmFlLya4G51AeAFntH86FH4SkYBZTzpcnTx41ZMgQFR8fTx3OKlweRwIkQAIkQAIkYAhcd911+sSJE5estyQa9xIQexMTDw8++KBau3Yt7UEXiYvCcJEwvN6UkiVL6m+++SawBlPWTdrtlyQNgqOJc8JxRfjKbbfdpnbt2kUdtguYx5MACZAACZCAjwncf//9etOmTWYQW5bk2B0g9zHOsHfdGq4sCSQlUq5AgQLqxIkTtAXDTt3eCSkQe/x4tIUAZjFTUlJMjahwZVnDefCDc+JhInU28TtkdBs0aJBKTEykHlMTSYAESIAESIAEMk3giSee0G+88YbJGAsbAz8YxLa7xCfTDeEBlyUgDqa1OoE4mE8//bRasGAB7UCX6Q8F4jKBeL055cqVM0WJsfAaCX/sLpLHCKKEQeBc+C7OJlgVL15cJSQkqGeffZa67HXlYftJgARIgARIIIIEmjdvrtesWRNwLmFfYMuePXsgM34Em8NLXYaALL3Cn8XJhI150003qX379tH+c6HmUCguFIqXmzRw4EA9depUk947HKN/cDAlLBYPfnzHQwUb/oZZzLvvvltt3LiRuuxlxWHbSYAESIAESCCCBJo1a6ZXr15tkvpgk8HrcCUpjGBXfHMpiWpDh/Pnz4/JBZWUlET7z4UaQKG4UCheb1K1atX0zp07TTfszmDK+kvrTKY4lnA08T1HjhyqUaNGatmyZdRnrysP208CJEACJEACDhNAWOwrr7xiBsKx5lIGxOHApP+dw03h6TNBQBxMfDZp0kQtWbKEdl8m+EVyVwomkrR9cq3k5GSTUVYKEWMtA2Ya8RCXh3c4MswCp9TILFGihBowYIDq2rUrddonesZukgAJkAAJkEBmCSQkJOhx48YZm4SbewnIBIUsjcKn5OSoVKmS+vTTT2nvuVd8isJxsXC83LTatWvr7du3mxlGzDQitFUeFpKZzbpYO6t9xbmw3hNObLVq1dT27dup01mFyeNIgARIgARIIIYJjBgxwizj+fHHH21HWMUwJld0TSYQrI4lJisQtdatWzc1YsQI2nuukNSfN4LCcbFwvNy0IUOG6PHjx5uF87I4G2EnVidTkvfY6aes0YQTC0ezYcOG6u9//zv12g5UHksCJEACJEACMUZg8eLFetSoUerzzz83PQtHnogYQ+Sq7lgnEKTsHX535513qs2bN9POc5W0/rcxFJDLBeTl5lWpUkWnpaVdkk1WalniIWHNCpbVfko5FDx8sEA/X758qnv37mrYsGHU7axC5XEkQAIkQAIkEGMEkB/in//8Z2C5DutculvAkm8DtiLsO8xc4vukSZPUM888QxvP3eJjiKzL5ePp5iUlJZm6mKdOnTJrMOUhge8SOhuOEUScS2ZHcY1ChQqpY8eO8eHjae1h40mABEiABEggPAQaNWqkX3/99UCps3BEUIWnZTzL5QhI3XP5O2w91rz0jr7QCPeOrDzZ0sqVK5uMsnAAJfU3HhrY8LCwuw5TnEucU2ZFMZtZs2ZN9f7771O/Pak1bDQJkAAJkAAJhIdAz5499cSJE41ziS1cSQbD0zqe5XIEJOJNsvzecMMN6sCBA7TrPKIyFJRHBOXVZo4cOdJklMVaTJmttK7JtBuighcFXhpI8oNNEv7gWh06dFCzZ8+mjntVedhuEiABEiABErBBYNasWbpPnz7q7NmzJopKbA5EUklNbRun56EOEpBJCEwa5M6dWw0ePFj17NmTNp2DzMN5agoqnDR5rj8lUK5cOb1nzx7zNzzUxRkMV4iKPIRwbsTpSykUFOHt16+f6tOnD/WcukkCJEACJEACPiNQtmxZ/eWXXwYSDEpt7XDkgPAZyoh3VyLTYNM98MADavXq1bTlIi6FrF+Qwso6Ox4ZIoHx48drOHpwBPEjcfXhcjAzakb58uVVQkKCatasGXU9RHlxNxIgARIgARLwOoE6deroTz75xERQib0Bx9KabNDrffRy++E4yjIpTA7A+beWJsHMJeqpV69eXW3bto02nMeETYF5TGBebW7NmjX1Rx99ZB4eeGhgFtPu+stQWOAatWvXZkrrUGBxHxIgARIgARKIAQI1atTQKEdy5swZY3fIUhrJByEZ6GOgq57tgkSfZcuWTZ0/f970Q5Y5Safy5MljKgMMHz6c/orHJE2BeUxgXm1uSkqKqT91/Phx41jCyZSF2072ScqX1KpVS23ZsoX67iRsnpsESIAESIAEokygUqVK+tNPPw20Ak4L1lvix5pxPhxZ7KPcVc9fXiYcMAAAOZ07d870KXv27KYsScuWLdWUKVNou3lQ0hSaB4Xm1SbXq1dPv/XWW+YhL0Vzne6LhGAg/KJjx44qNTWVOu80dJ6fBEiABEiABKJA4K677tLvv/++wqyYLMuRZD4yeykzZwiV5RY9AlJZQKLZIA84mrJOtn379kzUGD3x2L4yjW3bCHmCUAmMGjVKT5kyRf3www8mGU8ksrhJxjg8sJCFbPTo0erZZ5+l3ocqNO5HAiRAAiRAAh4gcPfdd+utW7eaJTjWXA9SzswaFotBbmaRjb5QIZu4uDgzcwmZYIPs7rnnHrV+/XraatEXUZZbQOFlGR0PzAoBLLrfsmVLIFV4Vs6RmWMkFBcjY3Ay77zzTrVp0ybqfWYgcl8SIAESIAEScDGBxx57TL/22muBRIIYxMYm4bEyW2mdvWSIbHQFCplIZQE4lTIA8OCDD6p//OMftNOiKx7bV6cAbSPkCTJDIDk5WY8bN0798ssvZpTR6Qc8XiZ4weBBhjWfOXPmVHh4rVy5krqfGcFxXxIgARIgARJwIYG+ffvqmTNnmoQ+kqkezgqcTJnJRLMlRFYylbqwK75qkrUOOhxNbPfff79au3Yt7bMY0AQKMQaE6LUuVK1aVe/cudOMVjm9BkJi/GV0DC+cIkWKqA4dOjArmdcUh+0lARIgARIgAQuBuXPn6qFDh6pDhw4Zm0J+xNHErnjvWxP9WOsrEmb0CIijj4Q+KEdSt25d9fbbb9MviZ5IwnplCjKsOHmyUAhMnDhRDxkyxNSmEgdTQljxUpCF3jiXXQcUDzAJlZHzweksUaKEwkvp6aef5j0QitC4DwmQAAmQAAm4jEC1atVMrUsJr8SyGKl16bKm+q45YsthravMJON31lIkmLmEzBBZ9vLLL9MeiyEtoTBjSJhe6srtt9+ud+zYcUk9TJltlLBZWZhvp184hywcF2dVQmduvvlm9eWXX/IesAOYx5IACZAACZBAFAjAudy1a5dJ1gOnRUJisfwGm9NLcJzrMswS72e4lfWu1rJ0UiZGEizBwWzQoIFavXo1bTHnFCoqZ6ZAo4KdFwUB1Kr67LPPAjUx8aCB8yezmHZnL+UFg/NI/Sv8zlq65OGHH1Zr1qzhfUCVJAESIAESIAGPEHj88cf1K6+8YlprXVNpzR4bDhvCIzhc2UyZNJCMvWLfQUYitxo1aqjNmzfTBnOlBO01ikK1x49H2yAwfPhwPWzYMHMGGXGU0AkZ5ZL6SFm9jLXOkqy7kLTYSPqD3z355JPqxRdf5L2QVcg8jgRIgARIgAQiRKBfv3562rRpprSFZCGVjKT4xEymDCRHqEm8zJ8QkBnk9Gtg4XDid7Vq1VIffvghba8Y1R4KNkYF65VuVa9e3YTKWsuJ4MUgzqDdfsgIJhxXLCK3jm5iVhMvJ9RgDlDLdQAAIABJREFU6tSpk0pJSeH9YBc4jycBEiABEiABBwkULlxYHz161EQ7wYmRpTD4joFjSSBod4DawS744tSQCxL4nD9/3theMnEA57JkyZIqOTlZtWzZknZXjGoDBRujgvVKt1JSUvTAgQON8wdnT0a68H84ndY01lnpk4RkiAOLT/mdvIzw4MuXL5/q27evGjBgAO+JrIDmMSRAAiRAAiTgMAFkocfSGjiS8j6XpD7WdX3y3eHm8PRBCEgUGXaTAX7YW927d1fDhg2jvRXDGkThxrBwvdK1++67T7/99tuB5qZP9mOnH/LiwYNNMtVKVllZByCjneXLl1effvop7wk7wHksCZAACZAACThA4O6779bvvfeeObNEOcl7XaKV5F1vzbvgQFN4yhAISBZ/60xy7ty51WOPPabmz59PWysEhl7ehQL2svRipO0LFy4M1LGC8wcHU2Yv7c5gpn/5yEtIZjRlRA3/x/fSpUurjh07qt69e/PeiBH9YjdIgARIgAS8TaBRo0Z648aN6syZM4FoJwmPlUFiWfMH5zIcEVDeJhb91ksIs8gFn7fddpv6+OOPaV9FXzyOt4BCdhwxLxAKgQEDBujp06ers2fPmrBYKZLsdBY4yT6HB5+MsiF8o1+/fqp///68P0IRHvchARIgARIgAYcING7cWK9fv94spZHcCQiR9W4ZEodAReG0Un/UWl5OQpchKxnkx9/LlSvHKLEoyChal6QBHS3yvO7/EMDaip07dxrnMlu2bJfUyHQKl9RpklAOyWJbsGBBNXnyZC5Adwo8z0sCJEACJEACQQg88cQTes2aNYHMsIhygtPCGcroq45MBEAWqAQg5Ugk8kzsKXwWKVJEHTp0iD5H9MUWsRZQ2BFDzQsFI7BixQrdrVs3deLECfMyicQLRBxLyW4mJUyQ/rxSpUocbQsmNP6dBEiABEiABBwg8Oijj+q33npLnT592pwdjiUGnzGTydlLB4Bn8pTWupaw2ZCoEZuEKMPphHOZK1cuNWTIENWjRw/6HJlk7OXdKWwvSy8G2/7cc8/pGTNm2M4eGyoaGYHDA1GS/uA7Umvj4XjXXXep9957j/dJqEC5HwmQAAmQAAnYJFCjRg0T0STLZKS2JRxLCZNlplibkG0eLuGx1lwW1hqkkk/jmWeeQUQY7SibvL12OAXuNYn5oL033XSTPnjwYKCciNNdlgLNcCgxAid1tOTh+Mgjj6iVK1fyXnFaEDw/CZAACZCArwlMnTpVp6SkqK+//jqQzEfe0RgQltkxfLLOpTtUBXKQ2UypfQl7CrPN99xzj1q3bh3tJ3eIKqKtoNAjipsXC4XAmDFj9KRJk9R3333n+AsEDqXU3MRLDC8tPBThXCJMFn+Pi4szmWXHjRvH+yUUAXIfEiABEiABEsgkgeHDh+vU1FR15MgRs0xGspBKjWxxLuHMMMlPJuE6sLs4lpL9X7L5SjRY7dq11aZNm2g3OcDeC6ek4L0gJR+2sXfv3nratGnmJeLkhhcY1nrKmk95ceGastYDvytVqpTq0KGDSkxM5D3jpEB4bhIgARIgAd8RiI+P1wsXLlTHjx+3ZB5F/erfZy2x4V0s72upg+k7UC7qMAblZeYScsEmsqpRo4b66KOPaC+5SF6RbgqFH2nivF7IBCpVqqTT0tJC3j8rO1pDbCSjrKwrwKiprM2Eo1u0aFE1cOBA1bVrV943WYHNY0iABEiABEggHYEWLVrov//97wEHRd7F8ok/IFkMBoJlFhPOjdNlzLIsKFgIOstHe+ZAsZ+s4bFw/DEgf+DAAdpJnpGkMw2lAjjDlWcNA4F58+bpESNGqK+++sqMkuHFImmvpW6l0y8YqZMpo6fXXXedGjNmjGrRogXvnTDImKcgARIgARLwL4HHHntMr1u3zkQrSYIYed/6l4o7ei4RXuJAWp16yeJr/Rt+V6BAATV16lTVtGlT2kjuEGPUWkEFiBp6XjgUAq1atdKrVq1SZ8+eVTlz5lRnzpwxh0UqVblkmcX10AZsZcqUgYOpkpKSeP+EIkTuQwIkQAIkQALpCNx99916+/bt5r2OiCGpnygJfJjEJ7oqI+XbJOwVA+4yqC/fZVAA/y9UqJBKTk5W7dq1o20UXdG54upUAleIgY3IiMDtt9+ut23bZkY4pXwIXkQSwuokPSnojGtLEWH8rnTp0qp3796qW7duvIecFADPTQIkQAIkEHMEatasqT/66CPTLylzYf0eifd7zEENc4ckaY8kWxI5yf9l9hID8Pnz5zc2Ud++fWkThVkOXj0dFcGrkvNZu++44w798ccfGydTHnJ4qDmdBMhawgTOLUbrcH1knr3ppptUr169VJcuXXgf+Uwf2V0SIAESIIGsEahSpYr+7LPPTLb29LOW+J28Z51eApO11vvnKIngkh6nD4eVZUsYDOjRowdmL2kL+Uc9gvaUyhAUEXdwC4GyZcvqL774wsxc4sUTiTTl8kCVtZ/ywpORvWrVqqlOnTqhjAnvJbcoCttBAiRAAiTgSgKVK1c2yfvgvMiaPrxPJRwTjbYm3HNlJ3zSKIngkvqjkJOUIMF3DATkyJFD1alTh7UufaITmekmjeLM0OK+USWAAswjR45Uhw8fNu2QGkzONOr3NHB46cn6A7kmfie/h+OJNZmDBg3ionZnBMGzkgAJkAAJeJzA8uXLTX1rRCJZQyzxfpWEMbL2UqKUuAYz+kKXWWbrbKbYRPjbnXfeyVqX0ReTK1tAB9OVYmGjLkcgOTnZZJbFyNr58+cdB4WHqsxeSmIhqcMls5j4faVKlfDi5P3kuER4ARIgARIgAS8RSE1N1cgs+umnn14yMCxOizUySN6rVsfTS32N1bbKgD5mLbEhkqx48eLI8k+7J1aFbrNfVAybAHl45AkMGTJET58+XZ04ccLxOlhSHkWKOsO5lIQ/eClKGm88dFlYOPK6wCuSAAmQAAm4l8DQoUP13Llz1TfffGOcS2teA7QaA7h4p8rvJa8C3rWyPtO9vYvtlom80EuxhfA9V65c6tprr1UHDx6kDxHbKmCrd1QOW/h4cLQIdOvWTS9btizgZMqsoqQ6t67tcLKN1iyzSAJUpUoVtWXLFt5XTkLnuUmABEiABFxPoGfPnnrJkiXq6NGjgTWWMkhrLXnh+o74tIHWsFiZZcbvbrnlFrV3717aOT7Vi1C7TQUJlRT3cx2B1q1b66VLlwaSBWAkFNldsclCdKez0MkIqyQoiIuLMzOZ7777Lu8t12kMG0QCJEACJBAJAqhh/fLLL6tz586ZutV4V2J2EoPAEmYZW2ssf8/bEEubzFpalwche367du1YjiSWBO1QX2gEOwSWp40MAWSW3b9/f6BcCRw8vNAi6WAii9rZs2dNhzE6i4fygw8+qF577TXeX5FRA16FBEiABEjAJQTq1aun3333XXXx4kUzcymlR9A8CYnF99hyMF0CP4zNwAC9DJ7jO9ZcwrkcOnQobZswco7VU1FJYlWyPunX0qVLdefOnc2LTJL+WDO/SnY6p3DAocS1sSFEFt+ljEqXLl3UxIkTeY85BZ/nJQESIAEScA2Bzp076w8//FChnBhmKcU5wXtRSpFIeRKGyLpGbBk2RLLIwr7p0KGDmjx5Mm0ab4gu6q2kokRdBGyAXQLNmzfXa9asUadPnzaJAvBAlJeZtcSI3etc7nhJ9INPqd+FffPnz69eeOEF1b17d95nTsHneUmABEiABKJO4LHHHtPr1q0zg6zp37vp61zKwKzTA8BRh+LxBkguC5Yj8bggo9R8Gr5RAs/LhpcA1mOuXLnSnBQhsjLq5vQLDA4lQmSxtsS6vgQPZrxUy5Ytq3bv3s37LLzi5tlIgARIgARcQKBx48Z6/fr1ZpmIzErK+0/yIsjAr9S/xO8RceT0+9kFeDzfBMi0VKlSat++fbRjPC/NyHaAChNZ3ryagwRuv/12vXXr1oiu67Cm7paF8FI3E6O0CJd94okn1OLFi3mvOSh7npoESIAESCCyBO6//36z1lJKd0lYrNWBlEykeB9KEj60kmVIIiurrF4tX758KikpSXXt2pU2TFYh+vQ4KoxPBR+L3V6wYIEeN24cZgxNiE4k1nhIkgJ5ieIFi+vi95Ipr2DBgqpx48Zqzpw5vN9iUfHYJxIgARLwEYHU1FQ9Z84ctWPHDtNr60CrfJf1l/i75EXAuxHf4ZBiPyb5cbfSwHbBusuRI0fSdnG3qFzZOiqNK8XCRmWVwOzZs/Xo0aPVgQMHTGp0vMAQioPRUrzYsD5EZhgj8YJDaBBeqmhL27Zt1dSpU3nPZVW4PI4ESIAESCBqBGbNmqVfeeUV9dlnn6ljx44FBlGj1iBe2BYBGQyATYRBcgyK43ewl/DTpk0bNXPmTNostij792Aqjn9lH7M9nzlzpkZIx+HDh00fEaaKhydmNeHoSUa7SAHA9XFtJP1p3bq1GjduHO+7SMHndUiABEiABGwRQLb2hQsXmhnLM2fOBBL5cA2lLaxRP1gSIkqIszVJYr169dSaNWtoq0RdSt5tAJXHu7JjyzMgMGLECD1hwgR14sQJM4OIHyljgpE5yXLndIiOZGHDNfE9b968asCAAapfv36896jBJEACJEACriaABHr/+Mc/TBIfJNDDOxODphLm6urGs3EZEpClPdhJvsNOuf3229X7779PG4X6Y4sAFcgWPh7sZgJ9+vTRM2fONI6lhH7IWhAp/oyHqpMbzh8XFxd4MSPjLH43d+5c1aJFC95/TsLnuUmABEiABLJM4MEHH9SbNm0yJcAkM7s1IogzmFlG64oD4UxCnojqwiA8Bt4rVKig0tLSaJu4QkLebgSVyNvyY+uDEGjVqpVZM4LsdVKLC86mzCw6PYMpL2ApLo3rIkwXi+dHjRqFkFneg9RiEiABEiABVxG488479bZt28xMpQzMwhnBOwy/w3sMn9y8S0DqkUpCxJw5cyrksOjSpQvtEu+K1TUtpxK5RhRsiFMEnnrqKeNkYu0IXo7WGUWnHUxriCz6J/+Hw1m+fHnVt29fLKTnfeiU8HleEiABEiCBTBGoXLmyTktLM+8rycgug6R4Z8pavUydlDu7koCExsIuatGihZo9ezbtEVdKynuNoiJ5T2ZscRYI3HvvvaZGJtaQiKOHzGlSSiQLpwzpELyIcR0Z6cXDXGZSMRpcrlw59cknn/A+DIkmdyIBEiABEnCSQI0aNfTHH39sQifxfsQsF95ZeHdJ6RF5nzFE1klJOH9uGXBHiCzqdS9fvpy2iPPYfXMFKpNvRM2O3nHHHfqDDz4IvDAl9MdJMgg9wXXEyZQXtISm4BMzmbt27eK96KQgeG4SIAESIIEMCcTHx+vp06cbZxLLSuR9BUdEon2k9JY4nUTqbQKQ9Z133qk2b95MG8TbonRd66lQrhMJG+QkgerVq+tPP/00sKgdL0mM0sIRlNlFCf9BaJDTI7TigN5yyy1q7969vB+dFD7PTQIkQAIkcFkC5cuX1/v27TPOJQY/nU6CR1E4TwD2DDbYGrB1JAOw2DbVqlVTH3/8MW0P50XhuytQqXwncna4Vq1aGvW88ODFAxezi/gutTLxABbH02lauCYyy+KFfv3116uEhATVsWNH3pdOg+f5SYAESIAEDIFly5bpgQMHqm+++SYw+CoDrkTkXQIy24wewNZBYiaZmYaDWaVKFTqX3hWv61tOQ9b1ImIDnSBwzz336C1btgTWYMoon4zuyYNZfu9EG3BOPOStD/5ixYqpJk2aqIkTJ/LedAo6z0sCJEACJBAgUKFCBf3FF1+Yd5GUrpDSXsTkXQLWqKzs2bNfUgu8VKlSav/+/bQzvCte17ecyuV6EbGBThGoU6eOSWaAOplwLBESiweyPIgldbdT18d5JSMfvqMNGF0sUKCAqlixonE0mS7cSfo8NwmQAAn4m8Bdd91lEuBhk0Q+8t3fZLzfe4Q5w66xRmRJxNbEiRNV165d6QN4X8yu7QGVy7WiYcMiQQAv182bN5sHsGTLQ0Y1cfycLmMiazDF2UQbJClQkSJF1EMPPaRmzJjB+zQSysBrkAAJkICPCNSvX19v3LjRDG5ioFWS+sinj1DEZFdhv4gNgxlpyDVPnjyqUaNGauHChbQrYlLq7ukUFcw9smBLokQAiQ327NkTGOWD0ycjfk4n+cGIMZxKXBOzl5JtVhxNzKY+9dRTKjU1lfdqlPSDlyUBEiCBWCPw0EMP6TfeeMO8ezCoincNZrukdJfTg6uxxtON/bGGyMrMJcqRLFu2jPaEGwUWY22iksWYQNmdrBGoVKmSWYMi2fNwFlkfmbUzhnaUrPGU2piy7gX/x6iyJB8aMmSIGjRoEO/X0LByLxIgARIggcsQgHO5YcOGwLIQGdDE7rJExDr7RZDeJAAbRpxMyPj2229X77zzDu0Ib4rTc62monlOZGywUwRq166t09LSjJMZiRqZ6IfUEpNPvATwUsCIMkaWMaKM3xUuXFj17t1bxcfH8551SgF4XhIgARKIcQKdO3fWS5YsUWfOnDE9hQNiTezD8NjYUQBZ6oNBg0qVKqkePXqoZs2a0YaIHRG7uidUNFeLh42LNAFrwgM4d3jxSj0wvIglfBZ/EwfR6TbiupjNvPXWW00Zk+bNm/O+dRo6z08CJEACMUbgmWee0StWrFCnT58OJH+JsS7GVHdgf1hDleU7fi/RT7BPpJY37BKpd4nfy8DBk08+qRYvXky7Iaa0w/2docK5X0ZsYQQJLFq0SA8bNkwdOnTIzCJK2RI8tLGJY2kNX3W6edZEQFWrVlU7duzgfes0dJ6fBEiABGKIwOOPP67Xrl1rZiylFmIMdS+muyIzkenLpqGuJZIziZMJCFhrKWtqYTt069ZNjR49mjZDTGuIOztHpXOnXNiqKBKYOXOmHjp0qPrhhx/Mg1uyylpLmUhIaySSAEniH7ws8L1+/frqlVde4b0bRR3hpUmABEjACwReeuklExL79ttvm3cZfuCYSFkuL/TBz21MP2sps5qwPWQJjTie8n/wiouLU/369WPuBj8rT5T7TiM1ygLg5d1JYMiQIXr48OGBMKL0GfWsyXmc7AHWTpw9ezYwQomXSo4cObCOQs2ZM4f3r5PweW4SIAES8DCBZcuWaSSIO3LkiPrll19MT2S2y+nBUQ9jc2XTrY4mGmitoW39Drn+9a9/NTkb+vbtSxvBldL0R6OofP6QM3uZBQLJyckaxYhPnjwZSLpjdSwxWuj0S1oKX1uTAGG9BUagn376aTVz5kzew1mQLQ8hARIggVgmcP/995sazwiHlfwBEj4p75X0IZexzMOLfZP3PtoOW8MaKmtNzCR5GnLnzq2qV6+uWrVqhfJmtA28KPQYajMVMIaEya6En8CIESP0Sy+9pD777DPzgJewFOtn+K/63zPiJYJZzHPnzgWuLwWTc+bMqTp16qTGjh3L+9hJIfDcJEACJOARApMnTzYhsdu3bzctxrsKWdElnwB+h1lMDJCy1qW7hSplRmAHyGC2ZP2VMjL4P8JhixYtqhITE1X79u1pD7hbrL5pHRXRN6JmR7NKYMqUKXrevHnq888/NzOZ8tK2vrCzeu5gx+EaGIHGjCU+sQ5T1mDAQMifP7/q2LGjGjNmDO/lYDD5dxIgARKIYQIPP/ywfu+990yWWHlXoLvilGAGEwOU2KxhlTGMxNNd+7MwWJl9hm0AWZYqVUpVqVJFNWrUCDOXtAM8LfHYajyVMbbkyd44RABO5qRJk9TXX39troAR4UgVosbIpcxaSiiMZLOFEZEvXz7VunVrNW7cON7PDsmfpyUBEiABtxIYO3asfvPNN9WGDRvMTJe1jIW8p/DOkIFKGRx1eomHW3l5rV3W2UoJjUVk0wMPPKAaNmxIx9JrAvVJe2mQ+kTQ7KZ9AnPnztUDBw402WVlFNF6VvxORojxXepn2r/y5c8gxgQW9T/++ONq2rRpvKedBM5zkwAJkICLCDRq1Eh/8MEH6tSpU5eU1orE+8dFGDzZFIlQkuU3GEgWZxKfGBSQ7PXooNgVhQoVUk2aNFGTJ0/m+96TkvdHo6mc/pAzexkmApMmTdI9e/YMnE0cPOtaFkn+E6kQJHF2ES7bq1cvNXDgQN7XYZI3T0MCJEACbiQwfPhwvXz5cvXll18Gwl5ldgtLOawhsm5sP9v0u8MoziV4yMyzJF/Cp6yXhTzhbBYoUEAdPnyY73gqkOsJUEldLyI20G0EunbtapIoYMRYNrwI8AKAcykvBWuYkpN9kLTzeFnlypVLtWjRQs2ePZv3tpPQeW4SIAESiAKBUaNG6VmzZpnlGnjmYyDTmg8A7yHMhNHBjIJwMnlJsRWw5AabddY5/aA13u0PP/ywWr58Od/tmeTM3aNDgIoaHe68qscJ1K1bV7///vuBEUhZE4mXgsxqysvfya7K+kysx0ASILyw8CIqW7as2rZtG+9vJ+Hz3CRAAiQQIQJjxozRq1atMhnN8b6RwUx5B8ggp8yERahZvIwNAlI+BrLEgADsB0nCJKeF01mwYEH1xBNPcAmMDdY8NPIEaIBGnjmvGAMEZs6cqZOSksx6TNnkJYH/W9dSONldeUFZ65pJvazrr79etWnTRg0ePJj3uZNC4LlJgARIwCECKJW1du1a9cUXX6jjx4+bq0g9S+sl4YjAyZT3UCQGOB3qsm9OK+VHZDmNLK+BfEV+RYoUMTWvhw4dyve4bzQjNjpKhY0NObIXUSDQr18/vWDBAvXjjz8GwmMlLCl9tlenmifhsdYQXfxO6p5hXWa1atXU2rVrea87JQSelwRIgAQcIFCvXj29bds2debMGfNMlzWWGMCEE4LNuuYfUSxWB5RZYm0IBW9MbeP4EA4Vx1JmoXGILLXB95tv/v/2zjzaquJM+5XkD0VQFEmcB9QWIkmMQzSRFjUuNRpIp01HBLHTINoIghjDkBjRKILCgsagxCFMSjNEO9LGdsUhcQiRDk7ECHEAx6CCCoqKmu/rb3/rKfu5qzwBufeyzz37nP07a911zz13n9q1f1W7dj31vvW+B2qPLc/uZrDkkOIRoOMWr02oUR0RUAS/X/3qV9Et1qlEnKcyfVBU65K8ypkKTe/HSc+///77hz59+oTx48dzz1erMSgXAhCAQA4Exo8fny1atCgsW7YsPlfSYDC2UKaulGkaCz0L9LcEKQIzh8aoYhGO0+BIsXpmu926d+8e/vSnP/G8riJ/iq4uATpvdflSeoMTmDJlSjZu3LiwcePGGCLer1RwVhOBHkiafDicuR5YmnhYcDptiiYc+qxr165h4MCBYcSIEdz71WwYyoYABCDQQgLTp0/Pli5dGrRouW7dumjN0niuPfZ6vtgzxh4q+luv1AKm9xahjkbawmpweBsRcLt5MVjPaD2zv/KVr4QHHniAZ3QbtQOnqQ4BOnB1uFJqiQicc845cVLw/PPPx9VHTQg0GdDDwyvPzmml394/k0aJqxYuu86m4c932GGH8I//+I9h9uzZ3P/VAk+5EIAABJpJ4LLLLstuuummsHLlyvjc8DaHtnhGNLOKHNYKAvZm0lfdlnaL9bNZcwZvrVHbawGYKPCtgM1XCkeACWbhmoQK1SuByZMnZ48//nh48sknwyuvvBLefvvtOFF4//33494ZR4nTA8W5rdpiAuFV7tR1SlHpFGl2yJAhSmvCOFCvnY56QwACdUtAuSwVwOeRRx6JVkeN0faEsXdK3V4cFW8ikIpKf6jP9GzWgrNFpp7Ll156aTj33HN5JtN/6p4Anbjum5ALKCKBSZMmZf/1X/8lN5e4Iq3Jg1OJpIGAqi0w0xyZ4pTuy9SDTS6z3/72t8Pll1/OWFDEjkSdIACBhiNw+eWXx+eDIsNqITIN0qaLdaqraj8fGg5swS/InkROZ+Z2dvyGQw45JDz66KM8iwvejlSveQToyM3jxFEQaBWBYcOGZfPnzw/r16//WPh4PWi8P7JVBbfgSw4AoXPaZVdCUy+tlu++++7hi1/8YujZs2e46KKLGBNawJZDIQABCDSXgIXlqlWr4h5LLTy2a9cubquwZ4sCvmhcdnTY5pbNccUkUOkm632x3jajWmshWO3et2/fMHPmTJ7BxWxKatVCAnTkFgLjcAi0lMA111yTTZgwIbz++utR4GkyYYHXFkEY0gTcmrT45XO7LkpporDoZ599dhgwYABjQ0sbmuMhAAEIbIbA+eefn82dOzcKyzTdiD1cLDQcHbbdttuGD5PAcYCtPwJ2g1XNnZ86jYeg99tss028MC04jx07NowcOZJnb/01NTXeBAE6Mt0CAm1A4MYbb8wmTZoUnnvuuSgy01XMap7eUQi9iurEznbN8b4fTWq0gqoHYseOHcN3v/vdMH36dMaHajYOZUMAAqUg0Lt37+zuu++OY7/dXp2OwpZKC02Nw3o5UFwpADXoRVYKTF2mn/+O7K5+oNdRRx0VHnroIZ65DdoXynhZdOYytjrXXBMCM2bMyKZOnRqefvrp+JBx8J1qVsbC0pMar556RTVNp+L66BhZMwcMGBCmTJnCGFHNBqJsCECgYQnccMMNMY2Vgr7JDfKDDz5o2gfvoG+pR4s9TGTVcvqphoXjC9MTJmvMq3RwH11dGujHkYLV9lrQ1RYVuccOHjyY521jdoVSXhWduZTNzkXXisCsWbOyn/70pzGBdltECbTFMrWYegXVSbgdudAuPN4bst1224XjjjsuPvjOOOMMxopadRrOCwEI1B2BoUOHZv/5n/8ZxaXzVzqYixf27CorYan3ji6u4x0Mru4unAr/DQHHQfCzV+6wCvp32GGHhRNPPDGMGTOG5yv9puEI0Kkbrkm5oKITuP7667PLL788rF69uqmqDuygh45WufUqwgRDK+l77rln6NGjB3kzi96xqB8EIFBzAoMHD84WL14cI8S2hZcXlE0OAAAgAElEQVRKzS+YCmyWgBd4bZnWM13P+KOPPjou3o4ePZo5OP2nYQnQuRu2abmwIhOYOHFiNmbMmFhFpxLxqrY+K4qLlB+QqmO3bt3CP/zDP4TLLruMcaPInYu6QQACbU5g9uzZ2XXXXRdWrFgRNmzYEF0iSTPS5s1QqBNKUGqPpSyWfvXv359IsYVqJSpTLQJMFKtFlnIhsAUCPXv2zJYuXdpksZSIc6AHr3jajbXWMF0vuc1q9fUb3/hGGDFiBONHrRuG80MAAjUncNppp2XKeSxh+f7770crlcbwNGp3zStJBdqcgIM6OZL7l7/8ZfJctnkrcMJaEWCCWCvynBcCISj3ZPbf//3fUVjaNVbvvR+y1hMU78fUb7vxquEUmODQQw8NgwYNYn8mPRkCECgtgcMOOyx79NFHm4K4eB+lvT9KC4YLj89xB3Hq3LlzWLNmDXNu+kVpCNDZS9PUXGgRCUyZMiW78sorw9q1a+OeyzQnmlY/a23BtLC0+NXkSZ85xL6izfbq1SvMmTOHsaSIHYw6QQACVSHwne98J7v33nvDe++9F0WE3CCVWkTjoyyYsmTWevyuyoVTaLMJOICexOXo0aPJcdlschzYCASYFDZCK3INdU1g1KhRMQH3q6+++rF9O478WsuLczRD52qzRdNWVn3erl270KVLl+g2O3nyZMaUWjYY54YABKpK4Morr8ymT58eXnvttSgotTDofMJ6/+GHH8bzy+Oj1h4oVQVB4VskoOdnhw4dwmmnnca+yy3S4oBGI8BksNFalOupSwLjx4/PFixYEJ599tm48l2UCYpWYC10tUovgWkrq0Psy5qpz3feeecYGU8/Q4YMYWypy55IpSEAgU0RUB7jW265JTz22GPhjTfeiMHZNAY6UqzEpMZBiUxbNPWbV3kJqC90795dacl4Hpa3G5T2yun0pW16LryIBC6++OLs1ltvDatWrYpuqLWOQug9JFqN12QpFZWOfivXMNXVeT133333cPDBB4fvfOc7YeDAgYwxRexo1AkCEGg2ge9973vZHXfcEd55552mPXUa8/TaVDopL8LVevxu9gVyYFUIHHDAAcpxyXOwKnQptOgEmPwVvYWoXykJ/PSnP82WLFkSnnvuuSg233zzzSaxqUmLo9N5gqO/7caq986nWe09QGkQIJ3LiaTlNrv99tuHs88+O1xxxRWMM6XsxVw0BOqbwHXXXZctXLgwPPTQQ03urvbkQDzWd9s2p/Z+1jpgU/q32z9ddNUz0PsuO3XqFM4///xwySWX8PxrDmyOaTgCdPyGa1IuqBEJTJo0KZsxY0Z44YUXYrTZNKCErtdurMqfqZV1Cb222AOUit3Kh6/Or4ft17/+9XDHHXcw1jRix+SaINCABMaOHZtdffXVTQF8dIlpvmK9L4KHSQOiL9Ql+bnqnKb6ncZG8Oe2Zuv5qz24e++9dxSXF154Ic+9QrUolWlLAnT+tqTNuSCwlQQGDx6c3XbbbQp33hSh0AF30pV1h0Zvi0BBOkeaVNxWTF+qIs3269cvXHvttYw3W9n+fB0CEKgugd69e2d33XVXk8Uy3XduLxHvs8SKWd22KELpqaUyFZyqm551Tktjt2htERk2bFj44Q9/yPOuCA1IHWpGgBugZug5MQRaR+CHP/xhNnPmzLBu3br4gNOkx/sfndDZeyfbcgKUuhH54et6fPaznw0/+tGPwgUXXMCY07pm51sQgEAVCSjQ2qxZs8Lzzz8f91lWWqskJPRy4J5N7b2sYvUougYEUnHpYE5eTNXzLrVq63OlIznnnHPCZZddxnOuBu3FKYtFgJugWO1BbSDQLAI//vGPs2uvvTa8++67TcF30v2WDp3frMK28iBPxPTATZOL27LpzxRN74knnmDM2UrefB0CEMiPwIIFC7Ibb7xRkT7jXncHLZOLv18Slem+d415Fhf51YSSikqg0lVW9fRzzQu8iqI+aNAgYg4UtRGpV5sTYLLX5sg5IQTyIaBE3//xH/8RV9o1KdLeD/3WAy9dbc3nbJsupdI9NnXJteDUN7U3Ra+jjz463HvvvYw71WwUyoYABJpFQN4g2nLw1FNPxS0Hdn31Hsu0EI+zGte05y5dTGvWyTio7gikzzMv4KZbQOw+LQ+dIUOGhLFjx/Jsq7tWpsLVIsDNUC2ylAuBNiDwla98JXv44YebVtP9wEuth9WsRnOCIOj8djnbbrvtQq9evcLChQsZe6rZMJQNAQh8IoHRo0dnkydPjqJSPxs3bmzaamCBaVGh346Y7cW7tgiiRhPWloAD16kWaZR0vddirvrCbrvtFn784x8rYjrPtNo2F2cvGAFuiII1CNWBQEsJ7LTTTtmGDRua9gzZcuh9mS0tryXH2xXX7mPpviU/nB3x1nuWNHk79dRTw4IFCxh/WgKbYyEAga0mIGF5yy23xIjcDsxia6T3jOskEpCyVFpc2nKl8UtjmxfNtrpCFFBYAu4fqmD6bGvfvn3YYYcdYoT0uXPn8hwrbAtSsVoS4MaoJX3ODYEcCPTv3z+79dZbY/qSNBCF3nu1PYfTtKqIyoTjtgIoT+ahhx4afv/73zMGtYosX4IABFpCYMyYMdntt98eVq5cGcWhxsZq5wluSf04tu0JOApsuqXEi6VeqLWlUltP9PxSjuljjz023HnnnTy72r7JOGMdEeAGqaPGoqoQ2BSB+fPnZ2PHjg0vvvhi+Otf/xoPSVff86CmgSJrRUGVAYD0sPYepo4dO4Z99tknfPGLXwyHHHJI+MEPfsB41ArGfAUCENg8AeW0vOOOO+I+S7nBpgF62jLKdjHbqLUjezGvZou1qrhcPY+8MKtFBy046NmZxjOQsNSrQ4cO4YADDggnnnhimDhxIs+qLcLmgLIT4CYpew/g+huCwBVXXBGjyr722mtxAuVXW+TB/CSAaSCMNIecE1N7RVjuRrvssks46KCDwuGHH47YbIheyUVAoHYEtPA2bdq08PTTT8fosBprJB5koaq1Z0ftqHDmlICtld5OYoumjpHgdKTgLl26hNNPPz1MmDCBOTNdCALNJMDN0kxQHAaBohM45ZRTsl//+tdN1SySC5hWhiU27WaUBiPyZ87hudNOO0Wxue+++4YePXoofybjVNE7H/WDQIEIDB48OI6Ff/nLX6JQsGVKC1seF0kzUqAGq1FV7CKtPiKRqVeaV3rXXXcNffv2DVOmTOEZVKM24rT1S4Cbpn7bjppD4GMEFi5cmI0fPz788Y9/jBHuvApbS0wOmmG3NIlIrxrboqm/lcbEVgUdowe+rQ2f+9znQpcu+4Xu3Q8KRx11VBgwYADjVi0blXNDoIAE5s6dmy1evDgogI+2CrzzzjvRAmUvDgfp8WIXaUYK2IhtXCU/n/T8UZ/xIqeePXKH/f73vx8GDhzI86aN24XTNQYBbpzGaEeuAgKRwLx587J/+7d/C0pdUpQAFo4m6/2Y+q3VYkdotEUhdVeS+PTE0Ps2nYdO7rRHHHFEOOmkk8K55577N2PYSSedlN1///1Bkf6UFqVbt27huOOOCxdddBHjHfcJBBqMwLhx47IFCxaEP//5z3HMkFh4//334/jndE265DSlUpp2pMFwcDktIKBnjuMV6GsKPqd+oufLgw8+yPOiBSw5FAKVBLiB6BMQaDACc+bMya655prw2GOPNU2qanWJeoBLIMoi6ah8qotFo62Y/p9Fph76nhB6v2bq0qb3miRKQCpQ0MEHHxyUquWBBx4I69evj58roIeOsXucgjTI9fbzn/98nECMHDmS8a9WHYPzQmArCPz85z/P5P66aNGi8Oyzz8Z7XWOGFqEcoEXjRrofXe8dxdrCkyA/W9EIDfBVC0w9I2TBVITYPn36hNmzZ/NsaID25RJqS4CbqLb8OTsEqkLgF7/4RTZ9+nStwlal/OYWajc0CUmLQj3IUzc159J04nIHWvC+mMpARZ4UWpSmqVC8Gq3/Of+mPrPA9bkkNiVMlcds2rRpjIPNbVCOg0CNCMyePTtbsWJFePLJJ8Mf/vCHGP1TY4nHCe+13FRqpHSsaMs8wTVCxWmbScALDjp85513juJy+vTpPA+ayY/DIPBJBLiR6B8QaGACJ598ciaRqcmYXVFTV7FKFzKv8jsgT1HcbKvVRNtvv310of3e974XhgwZwnhYLdCUC4FWENBC2X333RdeeumlsGzZsuidICFJHstWwCzpVxxQTn3G2zP0Xi9v29BiZL9+/cKsWbN4BpS0n3DZ+RPgZsqfKSVCoFAEvvGNb2T33ntvjI4nK6JdxyQe7ZKqCle6jVU/xUntc7DZRUqus9rTOWPGDMbEQvVeKlMmArNmzcqUr3L58uXhmWeeiYF6lHpJrovaV6mX9096zCoTH661ZQSc09L79+U+7T4kbxY943TMCSecEG6//XbG/pbh5WgIfCIBbig6CARKQOD444+PERb1gHVEVwfSSV1Ovapb+VmjIvK+TgcikkXzmGOOCf3795e7FONjozY811UTAqNHj87mzJkTDjvssLhnetWqVXH/pC2S8rTQpD+N/qr/Ocq0rVCqvN3da3IhnLQuCHi7hRYltLCqPuP9lvqtfnXyySeHX/7yl4z1ddGiVLKeCHBT1VNrUVcIbAWBY445JlN0WT1onQoktQZUWgTsPrQVpyz8VzUB8URVLGQp0YS3U6dOMfLs0UcfHUaMGME4WfiWpIJFJ9CnT5/oSSE3V7st6v5z3kHdhxaadtVP70/9P4047cWwol839asdAachcV+x146efwoE17t377Bw4ULG99o1EWduYALcWA3cuFwaBCoJ9OvXL7vtttticIw0R2UaTbH6rrHFahcHInKOTnFxGhXl4OzevXsUm2PHjmW8LFbTUZuCE/j3f//37Omnnw6//e1vw9KlS+O44wWd1Hsg3fudCkdHoZbnxWc+/Znw/7KPFoS8h67R94gXvHkLXz33Hy+qymKpvqSAPlo8XLRoEWN64VuRCtYrAW6uem056g2BVhI488wzM4X31/6m1EpZxr1NaT5OTz7sVqXf+lHEWf1Pbn0DBgwIffv2ZdxsZd/ja41N4MILL8zuueeemE9Q3gDaR/nWW2/FIGMKpBKF4mc+8zd7wR1UTHQcYTpNWSRh6rFK309z6TY2Ua5uawh4MUN9SS/93bFjx/Ctb32LVCRbA5bvQqAZBJgoNQMSh0Cg0Qj867/+a3bLLbeEd999N7qo6cdua2WyYNp6qQmIr1uTEL38P1tLFAxir732CsOGDQsXXHABY2ej3RRcT6sJKNrrzTffHH7zm99EF3MJTAXlcR5ajS96OVWRg61YUKb3W7roZZHpscnlWDBgwWxlk9U+vlorK96yrzlwnbc+yCPl7LPPDldccQXjd8tQcjQEWkyAm6zFyPgCBBqDwPnnn5/NmDEj7sm0C1FZE497UptG0rXg9L4dtbomtgcccEA455xzwqhRoxg/G+NW4CpaSWDw4MHZ3XffHUXlm2++2bRH0gtWKlbvnePWQlJC08dU3ntpnkr9z1GvUwtm5V7MVlafr5WAgHNdfuELX9DCYDjrrLMYt0vQ7lxi7Qlwo9W+DagBBGpG4OKLL86uvfba6MKmSaJDt9tN1PsS9dv/s2VPE8SttSAUfSHd+1TTCbLYaCVcSbmnTZvGGFqz3suJa0Fg1KhR2V133RVefvnl6P7KCwLVJpB61aSLoN7ioPN7T69cseVS7b/bt28fvv71r4df/epXjNXVbijKh0BCgBuO7gCBkhMYOXJktmDBgvD666/HPVJOE+CUALYcOBCHceUhMIuO3qvfnqxIaGpSI0EutyulNOnVq5fcZuNYOnXq1Oz++++PDPfcc8/w5S9/WS5ZjLNFb2jqt1kC8+bNi7kpf/3rX4cnnngiWh41NnivJOggUE0ClQGgUrHphVA/o2wV92Ko9s4rxyXBfKrZQpQNgU0TYOJDz4AABGSJy2644Ybw3HPPRZHpfYfOG5ZaMu1Gaje3RsZngSlhKVc9r5Q7KIn2momR3GaVEF5WYOX38yq7AgR169YtRqLVZGjdunVh1113jZ/pu0OHDmUMbuQOVIfXNmfOnOzxxx+PFkoJyrVr14b33nsvjgkO0ON8umV1qa/DZq3LKqdbFnQBdp/We/U9CUjt9dVLlkunudHixz777BOD+Vx99dWMsXXZ+lS63glw49V7C1J/COREYPbs2dlVV10Vnn/++WihS0WVTuH0HVoldn66Rg8IlLpgOSKhJjaazOja5Yqll3KqSVw6iIk+l4VTv73KruM0ARJXiUtxlNg85JBD4mTI0WoV3Vf/Jy1KTh2bYj6RwIQJE7Jly5bFhaWVK1fGPJUSleqrvr/drx0QTAVqcu9FFxBDoBoENNY6oFNavoM+qY/au8S/1S8POuggLd6FQYMGMcetRsNQJgSaQYCbrxmQOAQCZSLQs2fPOOGU0En3HtolVg9yB95odC6a3JiBrTWe8GjyLaGpv23x9Up6mlbBYlT80hV4C1YJUYl3nUdsJVT1HbnYKv/mNddcwzjd6B2tDa9v4sSJ2R//+MfwwgsvhLfffjv85S9/iXspvXdN/dCBrdI+n3o1pDlj27DqnKpkBNwPHdSp0mKu/+tZ5MVQicsjjzwyPPjgg4yZJesrXG7xCHATFq9NqBEEak5g/Pjx2fjx42MaE1srJJq8P9PpAxrdgulE3bbaakJjoa1JjSbd3vejyY0sv3rZoqn3aRRaWSbFzPkAvZdNx5mp06Q4+qaSgnfu3DkcfPDBYe7cuYzZNb876q8CV111Vfbggw+GJUuWxL6nvibXQk/M1ee84OH+XHlvO09ums7HaUPqjwg1rhcCHhfd/5yf2PsutTAikamFur//+78P99xzD2NkvTQu9WxoAtyIDd28XBwEWk/guuuuyyZOnBheeumlKIpSF9E0AFDrz1D8b6YusprQ2JqZTsI1wbHroCY5FpmyRvrlSbktP/o8tX7qWFuGPWnXuXS8WEu8ShhIuPbr1y/8/Oc/Z+wufvepaQ1/8pOfZI8++mh47LHHopXSOSl979ql0Pe2rUN249bf3neZTuod3KcMQb5q2oCcvMnjI83RbGumYwDsuOOOcfGtb9++BFSjz0CgQASYpBSoMagKBIpG4Gc/+1l20003BU1UtUrstCSaXDqoQtHqnHd97Car355Upzn57Prq/UJp6pY0l6bFpSZGzu/nY1NrkT/T+SqFvQXuHnvsEQ4//PAYwXbgwIGM43k3eh2WN3PmzOzhhx+O96r2USvYlCO+qt/Ytdv9Ob2fdbleNLGAtOXIKNRvveDh4F9YMOuwo9RRldMI5qq2+6QW3LSY99WvfjWcdNJJYcSIEYyBddSuVLUcBLgpy9HOXCUEtopAv379st/+9rcxUmplknQLIZ0gdaNzBMCtOjFf/kQCmmjtt99+QUnEv/3tb2sVnzG9RH3msssuyyQmly9fHiNAay+lLZSkESlRR6jTS63MM5wGj0sX3bw1Q4JT2wzkCnvKKaeE8847j/GuTtueajc+AW7Oxm9jrhACuRAYMWJENmfOnBhl0ivLKljv7Q5qi4ateaQxyAX9ZguxC68mXXvttZcmXGH48OGM69XFXrPSx40blz377LNRTMrtdc2aNTFSsUWl9+/apTW1ptes0pwYAp9AwCJTh3hbgC2VdtNu3759+NKXvhTTPclzY/DgwYxx9CoIFJwAN2nBG4jqQaBIBC644ILs+uuvj5NaB6+x26gtmY6I6sA4Rap/o9XFK/5ORq79SGeeeWaYMmUKY3sDNfbo0aOz22+/PXoQKCel7j+JSS/0pN4ClbkCGwgDl9JgBDx+aW+5opbr5f3m9oZRypHTTz89XHTRRYxpDdb+XE5jE+CGbez25eogkDuBoUOHZgsWLGiaEFhspgFxLD7rzYKiATHLnVj1CnQUUOfatOVY+5LuvPNOxvfqoa96yZMmTcoUoOeBBx4Ib775Ztz/6AAnvufSSlhYOiCK7sc0fU7VK6wT1NsN1CZQOMnmCKiv2usljZ6t/ZUdO3YMQ4YMCZdccgnjGF0IAnVIgBu3DhuNKkOgCAR69eqV/elPf4qTX1lVbEVT3dJgQEWoa1XqUIDJtEXF9ttvH9NOOO2JUpucccYZYerUqYzxVWn86hU6bNiwTKJSbrBKE5RGJrbF0gF3LDjTYFEWovpdbws81aNKyUUk4AUxB4zzdgu5w55zzjlh0KBBjF9FbDjqBIFmEODmbQYkDoEABDZNYPbs2dnSpUujlUXBRmRZ8f6vVGjCrzoELOptqXK0UH3eoUOH0LVr1yAXM+1bGjp0KON9dZqh1aXOmzcv3j8Sk8uWLYsusF40cLoQJ5J3lFedTO/lSqj7Ta/KKMTe+9zoeWpbDZ4vFoaAoxurz2qv5Yknnhh++ctfMlYVpoWoCARaR4CbuHXc+BYEIFBBYMyYMZkSuT/55JNh3bp1MY2JJse8qkcg3YOns0hgWnQ4b6naYYcddgh77713zBenH8L6V69NmlPyeeedF4Xl6tWrw6uvvhq/4sUCWR2dVzVN0+D21P/1Pt2Hqe+nE3X/TZCt5rQGx9SKgPqs8wHL66J///5h8uTJzEtr1SCcFwI5EuBGzhEmRUEAAkEThOyWW24JjzzySNOkFy7VIeAgGRIdaV5DuVDqbwsM5z7UZE4/ijgry+bXvva1cP755/McqELzLFiwIHvllVfCxo0bY8RXubs+9dRTce+y/pZLc2qB9nsLRUfUdBAt//ZeZ6cLqnSPTa2XCMwqNGy1iyyA6321L9Hlq68rMNmxxx4bvvvd78qtn7GoreBzHghUmQA3c5UBUzwEykpg1KhR2cyZM+PE+oMPPvibPZreP2aXWgkfTaK9h0wTaVz8qtt75JImsbnvvvuGffbZJ7rSnnXWWTwXNoNdovH000+PfObPnx8FpH5WrlwZrZESj7Is6kcCXz/q03J31Y8jKyP8qtuvKT0fAraaO21IGjhKCxypG7cWOpxyJH3vaMdpflbVTnuLlc9SEWIHDBjAmJNPk1EKBApDgJu6ME1BRSDQmAT69euXPfPMM2HFihXRmqOXgzrYsiYh6X2Emrh4IoPArG6fsBXMkUfFu3PnzuHII4+MP/8bybF0z4mrr746u+mmm+KeyLfffrspz6StxKmFuHLPsd1a06TxTuHj1rS1kv5d3f5N6VtHwMIyzXPsPqvfFqBOLWLhqAVFvfy5jtOP0pHIVf+II44IJ5xwQujTp0/pxpataxG+DYH6IcDNXT9tRU0hULcEZs6cmY0ePTruzZQVx6vf6YRbn9nV026CRMGsbpN7AqmzOJei0wVYFHXq1CkKLP3/s5/9bJwkak9nly5dwoEHHhj+7u/+LvTt27chniVXXXVVdtddd4XFixdHK6TcVG15EZc012ulOLTl3S3mVD22VlZaLdPcldVtZUqHQOsIeLHE44NFpe+FNAeyXbq1CGPvE31fEa4POOCAsPvuu4djjjkmXHjhhQ0xVrSOKN+CQHkIcKOXp625UgjUlMBZZ52VLVq0KLoRemLiSbYjZOq3JioOX2+hWdOKN/jJLeLTIDFpzkVdfro/MBX/Ok6CUxNI7aO6+uqr6+KZsnDhwkz9UNFbN2zYEPdGKjjV2rVrm/YNVwpEdwMLy00tfqSpeioF6KYm67jKNvjNVeeX5/2+9nCotMR7oTBNn6MFGX3v0EMPjYtP3bp1C2PHjq2LcaHOm4vqQ6BQBLjpC9UcVAYCjU3g+uuvz5SO4Q9/+EPct6ZJvqNmehIjAhacTMCr2x80QXTUWZ0p3fcq9o5Wqv/Zmqf20nvvL/QeK7k9aw+nkqN7n2J1a7/50ufMmZMpN+sbb7wR9/8qV+uaNWvi3xKU6ndy116/fv3Hou46d6TFpRdAUlHt955cW0imbq+pWK/sw+nfuMjWqodw3uYQqFxM8f3gxRWNAXKD9RYH7eeWqFQeyylTpjC/bA5kjoFAgxJgAGjQhuWyIFB0AhMmTMjmz58fXnzxxTjZ92RGK+CavGsiLqHJq3oEJITSPa+psPf+2DQwTSqmLEjVXhZk+q3AHf/0T/8Uhg8fXpXny7Rp07LXX3896EdC8a233oo/isr64Ycfxh+JSv2obroOB95Jc0mmYtLBpVI3WF1f5V5JXZ/zVKbWSh1r646FuQOeuPUqXWJTi2buLVyiSKS5s6PAJgLqs96nnUastsu873ulGDnttNPCz372s6rc8zQJBCBQfwQYDOqvzagxBBqOwIknnpg98MADcfKuCY0Ep37jIlvdpk5FUBrox+LK+2X1twWSftvF2cFubMXU57JoyG1WZWuvpvM2qgyJP4k9W0ErFxBSi146uXU+VU1s9V79QmXp/BKSro9Fn8VbKijTvZA+jy20+p/qnQYn8Tk3ZXG0yLTITt2MUzdC1a/ymszSjKvbwpQOgdYTSBeZVErq8aAosLp/JCxnzZrFXLL1mPkmBBqSAINCQzYrFwWB+iRwxBFHZMuXL4/WKIKgtE0bWkBV7q1MAwB5T6xq5BQEqdWvcs+mU9BUfk/frzzPJ12lxZmtjRZnjjLsKJaOUqk6pVbY1OLo76Zuft7zqzrpvV2EXf9UWKfv0/2ZqdjU5xa3qaWzUkziGts2fZuzbB0B9VPfa77v9ZlSGinK9Pz585lDbh1ivg2BhiXA4NCwTcuFQaA+CZx55pnZvHnzYioTWbtsEbI1SBN4WbJkcXLaCF1pmpNNf2ufoL9rgeJJv10h65MQtYYABCCQDwEvwthbwR4KzkvshReNp4oEq2BeM2fOZO6YD35KgUDDEmCQaNim5cIgUL8EvvnNb2b33HPPx9wpNcHZb7/9QteuXWO0z6VLl0Y3SYlITYYkNr3/TVdu8ZkGXLHlydYo0qDUbx+pZc3Z4lhL+pw7TwLeh+08xNHd/dOfCv/3/3y0t1o/eyPmDiIAABwiSURBVO65ZzjuuONwhc0TPGVBoMEJIDAbvIG5PAjUK4GTTz45+81vfhMTc/fs2TMcdNBB4Qc/+EHTmHXxxRdnv/vd74Ki0ipiqN0cdb3ev2kBmQansQulI6HWKx/qDQEIQGBrCHgPtl3M7fHhvZe77LJLFJannHJKzSNDb8118l0IQKDtCSAw2545Z4QABHImMHz48Oy2224Lq1evbsqh6fQnOlWa+Nv7BdOUHDlXh+IgAAEIFJ5AusdSlbWHhzxCtLA3ZsyYMGjQIOaJhW9JKgiB4hFg4Chem1AjCECgFQTmzZuX3XjjjWHJkiVNezc1UXKwGkcFteWyMs1EK07JVyAAAQjUNQFHa3ZALkV+7t27d5gzZw7zw7puWSoPgdoSYACpLX/ODgEI5Ezg0ksvzebMmRPzJCoarVNYOMCPBKYDV5BnM2f4FAcBCNQNAS++tWvXLnTu3Dkcf/zx7LOsm9ajohAoNgEEZrHbh9pBAAKtJDBo0KDswQcfDC+++GIUlHpZbPpvgvy0Ei5fgwAE6p6A9qorZ632WM6bN4/5YN23KBcAgeIQYEApTltQEwhAIGcCc+fOjXszH3744bBmzZoYddYWzDSibM6npTgIQAAChSegwGnf+ta3wvjx45kLFr61qCAE6osAg0p9tRe1hQAEWkHgF7/4RXbrrbeG+++/P6Y4kbj0nqM0sIUEqD53bjhHWXT6E7vZqgp6r895QQACEKgFgXR8cqRsBS/zyx4bWlTz4pr2ordv3z6ceuqp4eabb2YAq0XDcU4IlIAAg0sJGplLhAAEPiJw8803Z4sWLQqPP/54ePnll2OuzG222SZOvvSSy5gmbX/961+bcmvajdb5ND2Bc7oT2EIAAhCoBQGNSRqPJCA1Zmn8Uj5Lf+4osQ5wtu2224Y99tgjBvGZOnUq879aNBrnhEBJCDDAlKShuUwIQODjBAYOHBjzbGqPpi2aDv6jvzUp029N2jRR8yRNpehzTewIEkSvggAEakXAVkunZEo9M/Q/R8yWsOzYsWPcazlr1izmfbVqMM4LgRIRYKApUWNzqRCAwMcJ3HjjjdnEiRPDSy+9FMWiVv71o8AXikDrCVylqNQxBAiiN0EAArUkYBd9/fZYpQUxL4ZpnNpxxx3DPvvsE/r06RN+9KMfMeerZYNxbgiUiACDTYkam0uFAAT+lsD8+fOz3/3ud3F/ptxm5S6riZlczbTyL+Gp93Y382QuFZ9whQAEINDWBLy3UudVzl+5yfqltCPdu3cPPXr0IIhPWzcM54MABAICk04AAQhA4H8JnHvuudlDDz0Unnjiiegaa0uAI886b5zdZr0vE4AQgAAE2pqAxh8F7JG3RWrNlMXytNNOCxMmTGCO19aNwvkgAIFIgMGHjgABCECggsDw4cPj/kxZNDds2BAnb7IQSHDakimrJm6ydB0IQKBWBORhsXHjxrgf3K+vfvWrYdCgQWHAgAHM72rVMJwXAhBAYNIHIAABCGyOgITmfffdF1asWPGx/ZgE+KHPQAACtSbgVEla6Np3333DiBEjwnnnnYewrHXDcH4IQACBSR+AAAQgsCUCl156aRSaS5YsacqfafdZpwZQGc6pmVo2HRDIeTf12/s49dvpTiRaNWG0G24auGNL9eP/ECgiASmdrIgVa6M6pQLQOXT9mV1aff977HDOXXlI6GVXfefm1Tih/ykq7G677Ra++c1vhoMPPjj88z//M8KyjdqV00AAAlsmwIC0ZUYcAQEIQCASmDx5cnSdXb58eXjnnXfij16a8FkgOtWJ92dW7tf0597XmebVTMUlyNuCQNklUFswLu85LAp1X0tYeuHJYlP3vheZnINXQcacbsTpkkRQ44Xc9PVdBe/p2bOnxiPmcOXtXlw5BApNgMGp0M1D5SAAgaISGDduXPbII4+EZ599Njz33HMx+myaKsBCMs2VqQmlLRX+PM1dl05Ai3rd1AsCEGgegco0R76/nQ5JpdhiKY8IiUz9rQUrezxIVCpt0i677BKOOuqo6Ap7ySWXMHdrXhNwFAQgUCMCDFI1As9pIQCBxiEwbNiwTO6zzzzzTHjvvfeiNVMpA2yl3GabbeLFKtqjrRGaUNp6acul93ZiyWycvsGVQMDusLZkpsJSYlLjhMYD/dYxWnySsJQL7LHHHhuOPPLIMGTIEOZrdCUIQKBuCDBg1U1TUVEIQKDoBK655prslVdeiVbNRx99NLz44ouxyunE0m5x/jzNq5mmGoiWzv/5n1LvYSt6e1O/lhIol0uy7vX03hctu8rqf7ZaekFJYrNDhw7hhBNOCF27dg1XXnklc7SWdjGOhwAECkGAwasQzUAlIACBRiQwZ86cbPXq1eHuu+8OcqfVBFKTSlsoZOWUkJRrnD5LA/6QBqURewTXVCYC3l+pa7Z7vO5xu8/bXd7/69GjRxg8eHA4/fTTmZuVqaNwrRBoQAIMYg3YqFwSBCBQXAKTJk3KFi9eHF599dUg8blu3booOjUZ9W8LzuJeBTWDAASaQ8D7ML2n0mLTeyu7dOkSPve5z4U777yT+VhzgHIMBCBQFwQY0OqimagkBCDQqARGjRqVKc/mW2+9FeReu2bNmhgwCAtmo7Y411UWAmlKEr+XC6z2VipoT69evcLIkSOZh5WlQ3CdECgRAQa2EjU2lwoBCBSbwPz587PHH3886Ef7N2XdVCoUCc7KPJmycuolq6fdbPVeE1kHC/LvNFWKraPOz6ky0nQKsrTYde8jWuXaN1fsHkLt8iSgfi6X1UohGHv9pz4VXVkd2VXHOPKzg/LoOL2Xq7vvm8o0RT6HIsF+6UtfCscff3y44oormHvl2ZCUBQEIFI4Ag1zhmoQKQQACEPiIwKxZs6J187HHHoupUNavXx8nsxKSdqdNgwRpMmuxqO/bPS+NSuv9X4psqzL8t453VFt9LxWgtAcEGpFA6r6q+8j3UnqtlfslvYDj+6tyn6XFp4/TfXbggQeGU045JYwbN445VyN2JK4JAhD4GwIMdnQKCEAAAnVEYNq0adkTTzwR/vznP4eVK1dG66ZSo9iKYmuMJ7qynOj/emmym+bYSwWpLTmedDvFSh2hoaoQaBGB1HKZLsj4vayXul/0sgDVPeN7yOJSn+nechoiHb/XXnuFU089NRxyyCHhX/7lX5hrtahlOBgCEKh3Agx69d6C1B8CECg1geuuuy57+umnw6pVq6Kl87XXXmvKw5laW+zeJ1hpwnfD02RZgUf0squt06aUGjAX37AE3L9tsU+FpD7Tj0SmLPsSlbqH7D5uF3XnvNW906lTp5i38qijjgrDhg1jftWwPYcLgwAEtkSAAXBLhPg/BCAAgToioFyc9913X3jzzTfDG2+8EfdyanKsybKEo17eJ5buG7MAtaWmji6ZqkJgqwhUusqqsPQz3y/6TJZ9uc3KM2DHHXeMEWD333//0Lt373DGGWcwp9qqluDLEIBAoxBgMGyUluQ6IAABCGyCwJVXXpkpOu0LL7wQxabc+NauXRs++OCDppycEpUOBFS5bxOoEGgOgXoNBZUKSQvL1HVWFkotzOywww5RVO6+++7h85//fAzYM3r0aOZQzekcHAMBCJSOAINj6ZqcC4YABMpMYMGCBZkCBr3++uvhqaeeCs8880x0q5WVxkF/0kBBZWbFtTc2gTQ3pV1fJS71Xi6vuh+UTkSWymOOOSYcdthhYdCgQcybGrtbcHUQgEAOBBgoc4BIERCAAATqmcDUqVOjlXPp0qVBAYTefvvt6AbIHsx6blXqviUClQLT1kxZKrfffvsY+fXoo48mSM+WQPJ/CEAAAhUEEJh0CQhAAAIQ+BiBESNGZIsXL45RamXFUaTayj2aDozSrl276Hbr/JoOLCSB6j1r3gPqyLT6n/eyWcjacqSK6FwqL02hYrdF/T8NzkLTFZeABZvbzO3mdCBpip1KV1V9J+0/jtjqfibXVVkana5HfUWf+bejv7of2UKp/8s6qf87z6XLkttr9+7dw8yZM5kbFbdbUTMIQKAOCDCI1kEjUUUIQAACtSRw7rnnZkuWLAkvv/xyTIciAZgGDtLk3cGBLCw1aXfUzTS/YKWQsBXJeTdTIZAKEl+/vx+F7Kc/HbJaguHcWySQWsHdN9IvOdDUpgryooIXHCxUJSrdT/TbwtLlp595YcRRXyUu1Yc7d+4c91MefvjhMeorqUS22JQcAAEIQKDZBBCYzUbFgRCAAAQgcMMNN2SybMqlVoJT0WolEvT+3XffjVYnCwK/lwDQMbYqWXymlkh9ppdFqY+xqNicAKFFiktgc3kmvSChtvbChC3iqdXTeVp9nK3ctjxKaKaWbls3LSq9j9LpdyQoDz300Big55JLLmH+U9yuQ80gAIE6J8AAW+cNSPUhAAEIFIHAT37yk2zFihVh3bp1MVqtggi98847UTBWurfaamlxYEFqN0j/lsh0PsLKVBKpVbQI11/9OtRfnNZNucB6waAyHc6mXKDVL+xKbdFYGYzH1kv9X0JS5WyzzTbxRy9Ff/3CF74Q04nMmDGDOU/1OypngAAEIBAYbOkEEIAABCCQO4HJkydnv//972PAIAlORaqVa6L3vkk42NUxFQmqiPdqSkzoZZGZeyUpsKoEUoGZCsrUSum29f/T77jtXUkvOOgYpw9RH1GUV7m8fu1rXwu77rpr6NSpU3Sh3WmnnUKHDh1Cnz59mOtUtaUpHAIQgMDHCTDo0iMgAAEIQKDqBKZMmZLJjVZWzuXLl4f169fHc7733nvxt/Nw2ropgSAxmgqPSqtlKlSqfgGcYKsIpK6wdof1AoIK3tReTS00qA+ob9hyqUUJBZaSRVKismvXrqFHjx5h6NChzGe2qoX4MgQgAIH8CDAg58eSkiAAAQhAoAUEhg0bli1btizu31yzZk2MRmvLporxvsxo5fp/WZDPTeUevRacjkPbmEC6xza1QntvpaMEe1HBbeuorvrb+3bVL7SHslu3buGkk04K3//+95m/tHF7cjoIQAACzSXAAN1cUhwHAQhAAAJVJTBy5Mhs9erVMT2K9nLKuimBIdfa1L3WFq80jUlVK0bhrSLgyMAWmhKO2hupHJOyQmp/pESkrJJaXNCP9lLqOFktd9555ygoZaEcNmwY85VWtQJfggAEIND2BBiw2545Z4QABCAAgRYQmDhxYrZq1arw6quvhjfeeCNGrlUAIQlQCU/l6XT+Q7vROr9m6lYry5ndMytToFSmT0nToVRW1ak1nBYjpkz534BEjnCapszwOR1NN7XcVbr5+m/XdVOYUsvgpupWucfRgly/K4Mlbe66bVXUd+zK6miulYF20vq4Hdq3bx+D7siVVdZH/dbeSInF4cOHM/doQf/nUAhAAAL1RoBBvt5ajPpCAAIQgIAigkbRqdQo2s8pi+dbb70V3yuwkKxhH3zwQbSAOmdnKpb03tYyCyRHvNX/nCalUhRa+Pm7boo0Cqrfb0o8pselwi/dg7g5IZhabC2cK7+Xfjct3/VMj9/SHtZUNKdluR6pYJeIVLCdPfbYI+y///5hr732ir+xPHKzQgACECgfAQRm+dqcK4YABCDQ8ATmzZuXydrpnw0bNjQJ0LVr18Y9nxJKFqESSNtuu22TJdKpU2SJk1tnKgwlXmVBlfXU1kxZUSW4JMr03kGLbPVzjkbtI/3Mpz9Kv2KhlkZSrbQWWjC67Mr9is4p6ePSsvQ+FcQWiZs6ny2+Pr8tsKkl09eg78s6qWtV1NYuXbqEAw88MAbcueCCC5hXNPzdxQVCAAIQ+GQCPAjoIRCAAAQgUDoCCxYsyLT3z9ZO7QmUBa5///6f8v/OPPPMzT4j58+fn8liKiEmoSnRKrGq9xK1joKr9CwbN26MgtMWQbn2yuLq6KgWj6qD0mo4h6OtlDpOQrdjx47xt0Xf3nvvHc9TKQothuVKLOutxLDe65wS2rL6qk4WnBLBEsW29OpvsdF5VBedf7vttosurqqD3F132223cMQRR4RPYlS6TsUFQwACEIDAR88WOEAAAhCAAAQgAAEIQAACEIAABPIggMDMgyJlQAACEIAABCAAAQhAAAIQgAAWTPoABCAAAQhAAAIQgAAEIAABCORDAAtmPhwpBQIQgAAEIAABCEAAAhCAQOkJIDBL3wUAAAEIQAACEIAABCAAAQhAIB8CCMx8OFIKBCAAAQhAAAIQgAAEIACB0hNAYJa+CwAAAhCAAAQgAAEIQAACEIBAPgQQmPlwpBQIQAACEIAABCAAAQhAAAKlJ4DALH0XAAAEIAABCEAAAhCAAAQgAIF8CCAw8+FIKRCAAAQgAAEIQAACEIAABEpPAIFZ+i4AAAhAAAIQgAAEIAABCEAAAvkQQGDmw5FSIAABCEAAAhCAAAQgAAEIlJ4AArP0XQAAEIAABCAAAQhAAAIQgAAE8iGAwMyHI6VAAAIQgAAEIAABCEAAAhAoPQEEZum7AAAgAAEIQAACEIAABCAAAQjkQwCBmQ9HSoEABCAAAQhAAAIQgAAEIFB6AgjM0ncBAEAAAhCAAAQgAAEIQAACEMiHAAIzH46UAgEIQAACEIAABCAAAQhAoPQEEJil7wIAgAAEIAABCEAAAhCAAAQgkA8BBGY+HCkFAhCAAAQgAAEIQAACEIBA6QkgMEvfBQAAAQhAAAIQgAAEIAABCEAgHwIIzHw4UgoEIAABCEAAAhCAAAQgAIHSE0Bglr4LAAACEIAABCAAAQhAAAIQgEA+BBCY+XCkFAhAAAIQgAAEIAABCEAAAqUngMAsfRcAAAQgAAEIQAACEIAABCAAgXwIIDDz4UgpEIAABCAAAQhAAAIQgAAESk8AgVn6LgAACEAAAhCAAAQgAAEIQAAC+RBAYObDkVIgAAEIQAACEIAABCAAAQiUngACs/RdAAAQgAAEIAABCEAAAhCAAATyIYDAzIcjpUAAAhCAAAQgAAEIQAACECg9AQRm6bsAACAAAQhAAAIQgAAEIAABCORDAIGZD0dKgQAEIAABCEAAAhCAAAQgUHoCCMzSdwEAQAACEIAABCAAAQhAAAIQyIcAAjMfjpQCAQhAAAIQgAAEIAABCECg9AQQmKXvAgCAAAQgAAEIQAACEIAABCCQDwEEZj4cKQUCEIAABCAAAQhAAAIQgEDpCSAwS98FAAABCEAAAhCAAAQgAAEIQCAfAgjMfDhSCgQgAAEIQAACEIAABCAAgdITQGCWvgsAAAIQgAAEIAABCEAAAhCAQD4EEJj5cKQUCEAAAhCAAAQgAAEIQAACpSeAwCx9FwAABCAAAQhAAAIQgAAEIACBfAggMPPhSCkQgAAEIAABCEAAAhCAAARKTwCBWfouAAAIQAACEIAABCAAAQhAAAL5EEBg5sORUiAAAQhAAAIQgAAEIAABCJSeAAKz9F0AABCAAAQgAAEIQAACEIAABPIhgMDMhyOlQAACEIAABCAAAQhAAAIQKD0BBGbpuwAAIAABCEAAAhCAAAQgAAEI5EMAgZkPR0qBAAQgAAEIQAACEIAABCBQegIIzNJ3AQBAAAIQgAAEIAABCEAAAhDIhwACMx+OlAIBCEAAAhCAAAQgAAEIQKD0BBCYpe8CAIAABCAAAQhAAAIQgAAEIJAPAQRmPhwpBQIQgAAEIAABCEAAAhCAQOkJIDBL3wUAAAEIQAACEIAABCAAAQhAIB8CCMx8OFIKBCAAAQhAAAIQgAAEIACB0hNAYJa+CwAAAhCAAAQgAAEIQAACEIBAPgQQmPlwpBQIQAACEIAABCAAAQhAAAKlJ4DALH0XAAAEIAABCEAAAhCAAAQgAIF8CCAw8+FIKRCAAAQgAAEIQAACEIAABEpPAIFZ+i4AAAhAAAIQgAAEIAABCEAAAvkQQGDmw5FSIAABCEAAAhCAAAQgAAEIlJ4AArP0XQAAEIAABCAAAQhAAAIQgAAE8iGAwMyHI6VAAAIQgAAEIAABCEAAAhAoPQEEZum7AAAgAAEIQAACEIAABCAAAQjkQwCBmQ9HSoEABCAAAQhAAAIQgAAEIFB6AgjM0ncBAEAAAhCAAAQgAAEIQAACEMiHAAIzH46UAgEIQAACEIAABCAAAQhAoPQEEJil7wIAgAAEIAABCEAAAhCAAAQgkA8BBGY+HCkFAhCAAAQgAAEIQAACEIBA6QkgMEvfBQAAAQhAAAIQgAAEIAABCEAgHwIIzHw4UgoEIAABCEAAAhCAAAQgAIHSE0Bglr4LAAACEIAABCAAAQhAAAIQgEA+BBCY+XCkFAhAAAIQgAAEIAABCEAAAqUngMAsfRcAAAQgAAEIQAACEIAABCAAgXwIIDDz4UgpEIAABCAAAQhAAAIQgAAESk8AgVn6LgAACEAAAhCAAAQgAAEIQAAC+RBAYObDkVIgAAEIQAACEIAABCAAAQiUngACs/RdAAAQgAAEIAABCEAAAhCAAATyIYDAzIcjpUAAAhCAAAQgAAEIQAACECg9AQRm6bsAACAAAQhAAAIQgAAEIAABCORDAIGZD0dKgQAEIAABCEAAAhCAAAQgUHoCCMzSdwEAQAACEIAABCAAAQhAAAIQyIcAAjMfjpQCAQhAAAIQgAAEIAABCECg9AQQmKXvAgCAAAQgAAEIQAACEIAABCCQDwEEZj4cKQUCEIAABCAAAQhAAAIQgEDpCSAwS98FAAABCEAAAhCAAAQgAAEIQCAfAgjMfDhSCgQgAAEIQAACEIAABCAAgdITQGCWvgsAAAIQgAAEIAABCEAAAhCAQD4EEJj5cKQUCEAAAhCAAAQgAAEIQAACpSeAwCx9FwAABCAAAQhAAAIQgAAEIACBfAggMPPhSCkQgAAEIAABCEAAAhCAAARKTwCBWfouAAAIQAACEIAABCAAAQhAAAL5EEBg5sORUiAAAQhAAAIQgAAEIAABCJSeAAKz9F0AABCAAAQgAAEIQAACEIAABPIhgMDMhyOlQAACEIAABCAAAQhAAAIQKD0BBGbpuwAAIAABCEAAAhCAAAQgAAEI5EMAgZkPR0qBAAQgAAEIQAACEIAABCBQegIIzNJ3AQBAAAIQgAAEIAABCEAAAhDIhwACMx+OlAIBCEAAAhCAAAQgAAEIQKD0BBCYpe8CAIAABCAAAQhAAAIQgAAEIJAPAQRmPhwpBQIQgAAEIAABCEAAAhCAQOkJIDBL3wUAAAEIQAACEIAABCAAAQhAIB8CCMx8OFIKBCAAAQhAAAIQgAAEIACB0hNAYJa+CwAAAhCAAAQgAAEIQAACEIBAPgQQmPlwpBQIQAACEIAABCAAAQhAAAKlJ4DALH0XAAAEIAABCEAAAhCAAAQgAIF8CCAw8+FIKRCAAAQgAAEIQAACEIAABEpPAIFZ+i4AAAhAAAIQgAAEIAABCEAAAvkQQGDmw5FSIAABCEAAAhCAAAQgAAEIlJ4AArP0XQAAEIAABCAAAQhAAAIQgAAE8iGAwMyHI6VAAAIQgAAEIAABCEAAAhAoPQEEZum7AAAgAAEIQAACEIAABCAAAQjkQwCBmQ9HSoEABCAAAQhAAAIQgAAEIFB6AgjM0ncBAEAAAhCAAAQgAAEIQAACEMiHAAIzH46UAgEIQAACEIAABCAAAQhAoPQE/j8Rr9OqtMh3MwAAAABJRU5ErkJggg=='
\ No newline at end of file
@@ -0,0 +1,142 @@
+import base64
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+import sib_api_v3_sdk
+
+
+class SendinblueTransport:
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.api_instance = None
+        self.lock = threading.Lock()
+
+    def send(self, message):
+        # one client (and its connection pool) for the life of the process
+        with self.lock:
+            if self.api_instance is None:
+                configuration = sib_api_v3_sdk.Configuration()
+                configuration.api_key['api-key'] = self.api_key
+                self.api_instance = sib_api_v3_sdk.TransactionalEmailsApi(sib_api_v3_sdk.ApiClient(configuration))
+        if message.get('attachment'):
+            message = dict(message, attachment=[resolve_attachment(item) for item in message['attachment']])
+        return self.api_instance.send_transac_email(sib_api_v3_sdk.SendSmtpEmail(**message))
+
+
+@lru_cache(maxsize=16)
+def encoded_file(path):
+    with open(path, 'rb') as f:
+        return base64.b64encode(f.read()).decode('ascii')
+
+
+def resolve_attachment(item):
+    # attachments are spooled as {"path": ..., "name": ...} so the file is not copied into every message
+    if 'path' not in item:
+        return item
+    return {'content': encoded_file(item['path']), 'name': item['name']}
+
+
+class StubTransport:
+    # keeps messages in memory instead of sending them, for offline runs and tests
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+        return {'stub_id': len(self.sent)}
+
+
+class MailQueue:
+    """Spools outgoing mail to SQLite and delivers it from background worker threads.
+
+    Messages are dicts of SendSmtpEmail keyword arguments. A failed send is retried with
+    exponential backoff until max_attempts, after which it stays in the spool marked 'failed'.
+    Several processes may share one spool file; each claims a message with a short lease.
+    """
+
+    def __init__(self, spool_path, transport, workers=2, max_attempts=5, backoff=30, lease=300):
+        self.spool_path = spool_path
+        self.transport = transport
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.lease = lease
+        self.wakeup = threading.Event()
+        self.started_pid = None
+        self.start_lock = threading.Lock()
+        self.execute('CREATE TABLE IF NOT EXISTS outbox (id INTEGER PRIMARY KEY, payload TEXT NOT NULL, '
+                     'attempts INTEGER NOT NULL DEFAULT 0, next_attempt_at REAL NOT NULL, '
+                     'status TEXT NOT NULL DEFAULT \'pending\', last_error TEXT)')
+        self.execute('CREATE INDEX IF NOT EXISTS ix_outbox_due ON outbox (status, next_attempt_at)')
+
+    def connect(self):
+        conn = sqlite3.connect(self.spool_path, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def execute(self, sql, params=()):
+        conn = self.connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def enqueue(self, message):
+        self.execute('INSERT INTO outbox (payload, next_attempt_at) VALUES (?, ?)', (json.dumps(message), time.time()))
+        self.start()
+        self.wakeup.set()
+
+    def start(self):
+        # threads do not survive a fork, so a forked worker process starts its own
+        with self.start_lock:
+            if self.started_pid == os.getpid():
+                return
+            self.started_pid = os.getpid()
+            for n in range(self.workers):
+                threading.Thread(target=self.work_forever, name=f'mail-worker-{n}', daemon=True).start()
+
+    def claim(self):
+        now = time.time()
+        conn = self.connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('SELECT id, payload, attempts FROM outbox WHERE status = \'pending\' '
+                               'AND next_attempt_at <= ? ORDER BY next_attempt_at LIMIT 1', (now,)).fetchone()
+            if row is not None:
+                conn.execute('UPDATE outbox SET next_attempt_at = ? WHERE id = ?', (now + self.lease, row[0]))
+            conn.execute('COMMIT')
+            return row
+        finally:
+            conn.close()
+
+    def deliver_one(self):
+        row = self.claim()
+        if row is None:
+            return False
+        message_id, payload, attempts = row
+        try:
+            self.transport.send(json.loads(payload))
+        except Exception as e:
+            attempts += 1
+            status = 'failed' if attempts >= self.max_attempts else 'pending'
+            print("Exception when sending queued email %s (attempt %s): %s\n" % (message_id, attempts, e))
+            self.execute('UPDATE outbox SET attempts = ?, status = ?, next_attempt_at = ?, last_error = ? WHERE id = ?',
+                         (attempts, status, time.time() + self.backoff * 2 ** (attempts - 1), str(e), message_id))
+        else:
+            self.execute('DELETE FROM outbox WHERE id = ?', (message_id,))
+        return True
+
+    def work_forever(self):
+        while True:
+            try:
+                delivered = self.deliver_one()
+            except sqlite3.Error as e:
+                print("Exception when reading the mail spool: %s\n" % e)
+                delivered = False
+            if not delivered:
+                self.wakeup.wait(1)
+                self.wakeup.clear()
@@ -1,82 +1,227 @@
+import atexit
+import hmac
 import os
-from datetime import date, datetime
-from functools import wraps
+import threading
+import time
+from datetime import date, datetime, timezone
+from functools import lru_cache, wraps
 from dotenv import load_dotenv, find_dotenv
 
-from flask import Flask, render_template, redirect, url_for, flash, abort, request
+from flask import Flask, render_template, stream_template, redirect, url_for, flash, abort, request, g, \
+    make_response, session, send_file, get_template_attribute, jsonify, has_request_context, signals_available, \
+    before_render_template, template_rendered
 from flask_bootstrap import Bootstrap
 from flask_ckeditor import CKEditor, CKEditorField
-from flask_gravatar import Gravatar
 from flask_login import UserMixin, login_user, LoginManager, login_required, current_user, logout_user
 from flask_sqlalchemy import SQLAlchemy
 from flask_wtf import FlaskForm
+from flask_wtf.csrf import validate_csrf
 from libgravatar import Gravatar as G
-from markupsafe import Markup
+from sqlalchemy import and_, event, inspect, or_, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, joinedload, defer, make_transient_to_detached
 from werkzeug.security import generate_password_hash, check_password_hash
-from werkzeug.utils import secure_filename
 from wtforms import StringField, SubmitField, PasswordField, BooleanField, HiddenField
-from wtforms.validators import DataRequired, Length
-import sib_api_v3_sdk
-from sib_api_v3_sdk.rest import ApiException
-
-from image_var import image
+from wtforms.validators import DataRequired, Length, ValidationError
+
+from avatar_proxy import DIGEST, fetch_avatar, signature as avatar_signature, upstream_url, valid_signature
+from db_config import REPLICA, PoolStats, RoutingSession, configure_engine, engine_options
+from html_pipeline import render_comment_body, render_post_body
+from image_pipeline import build_variants, largest_variant_url, originals, responsive_image, save_upload
+from mail_queue import MailQueue, SendinblueTransport, StubTransport
+from metrics import Metrics, TimedTransport
+from page_cache import LRUCache, PageCache, RedisBackend
+from search_index import search_index_for
+from static_assets import StaticAssets
 
 UPLOAD_FOLDER = 'static/uploads'
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
 PP_UPLOAD_FOLDER = 'static/uploads/profile_pictures'
+GRAVATAR_SIZE = 100
+
 
+load_dotenv(find_dotenv())
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY')
 app.config['MAX_CONTENT_LENGTH'] = 32 * 1000 * 1000
 app.config['PP_FOLDER'] = PP_UPLOAD_FOLDER
-
-gravatar = Gravatar(app,
-                    size=100,
-                    rating='g',
-                    default='identicon',
-                    force_default=False,
-                    use_ssl=False,
-                    base_url=None)
+# threads per process resizing uploads into their responsive variants
+app.config['IMAGE_WORKERS'] = int(os.environ.get('IMAGE_WORKERS', 2))
+app.config['COMMENT_CACHE_SIZE'] = int(os.environ.get('COMMENT_CACHE_SIZE', 256))
+# post and project pages are streamed: everything above the thread first, then COMMENT_CHUNK_SIZE comments at a time
+app.config['STREAM_PAGES'] = os.environ.get('STREAM_PAGES', '1').lower() in ('1', 'true', 'yes')
+app.config['COMMENT_CHUNK_SIZE'] = int(os.environ.get('COMMENT_CHUNK_SIZE', 50))
+# top-level comments per page of a thread, and replies shown under each before "Load more replies"
+app.config['COMMENT_PAGE_SIZE'] = int(os.environ.get('COMMENT_PAGE_SIZE', 20))
+app.config['REPLY_PAGE_SIZE'] = int(os.environ.get('REPLY_PAGE_SIZE', 10))
+app.config['STREAM_MIN_WRITE'] = int(os.environ.get('STREAM_MIN_WRITE', 8 * 1024))
+app.config['LISTING_PAGE_SIZE'] = int(os.environ.get('LISTING_PAGE_SIZE', 10))
+app.config['HISTORY_PAGE_SIZE'] = int(os.environ.get('HISTORY_PAGE_SIZE', 20))
+app.config['SEARCH_PAGE_SIZE'] = int(os.environ.get('SEARCH_PAGE_SIZE', 10))
+# signed-in users restored from a per-process cache for USER_CACHE_TTL seconds (0 turns it off)
+app.config['USER_CACHE_SIZE'] = int(os.environ.get('USER_CACHE_SIZE', 1024))
+app.config['USER_CACHE_TTL'] = int(os.environ.get('USER_CACHE_TTL', 60))
+app.config['UPGRADE_DB_ON_START'] = os.environ.get('UPGRADE_DB_ON_START', '1').lower() in ('1', 'true', 'yes')
+# coalesce like counter updates in memory and write them every LIKE_FLUSH_INTERVAL seconds
+app.config['LIKE_WRITE_BEHIND'] = os.environ.get('LIKE_WRITE_BEHIND', '').lower() in ('1', 'true', 'yes')
+app.config['LIKE_FLUSH_INTERVAL'] = float(os.environ.get('LIKE_FLUSH_INTERVAL', 5))
+# outgoing mail is spooled and sent by background workers; MAIL_TRANSPORT=stub keeps it in memory instead
+app.config['MAIL_TRANSPORT'] = os.environ.get('MAIL_TRANSPORT', 'sendinblue')
+app.config['MAIL_SPOOL'] = os.environ.get('MAIL_SPOOL', os.path.join(app.instance_path, 'mail_spool.db'))
+app.config['MAIL_WORKERS'] = int(os.environ.get('MAIL_WORKERS', 2))
+app.config['MAIL_MAX_ATTEMPTS'] = int(os.environ.get('MAIL_MAX_ATTEMPTS', 5))
+# registration mail logo: a hosted copy if MAIL_LOGO_URL is set, otherwise attached from MAIL_LOGO_PATH
+app.config['MAIL_LOGO_URL'] = os.environ.get('MAIL_LOGO_URL')
+app.config['MAIL_LOGO_PATH'] = os.path.join(app.root_path, 'static', 'images', 'email_logo.png')
+# url_for('static') points at content-hashed copies served as immutable; plain names are cached for STATIC_MAX_AGE
+app.config['STATIC_FINGERPRINT'] = os.environ.get('STATIC_FINGERPRINT', '1').lower() in ('1', 'true', 'yes')
+app.config['STATIC_BUILD_FOLDER'] = os.environ.get('STATIC_BUILD_FOLDER', os.path.join(app.instance_path, 'static_build'))
+app.config['STATIC_MAX_AGE'] = int(os.environ.get('STATIC_MAX_AGE', 24 * 60 * 60))
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = app.config['STATIC_MAX_AGE']
+# whole pages for anonymous visitors; PAGE_CACHE_REDIS_URL shares them between worker processes
+app.config['PAGE_CACHE'] = os.environ.get('PAGE_CACHE', '1').lower() in ('1', 'true', 'yes')
+app.config['PAGE_CACHE_SIZE'] = int(os.environ.get('PAGE_CACHE_SIZE', 256))
+app.config['PAGE_CACHE_TTL'] = int(os.environ.get('PAGE_CACHE_TTL', 60 * 60))
+app.config['PAGE_CACHE_MAX_AGE'] = int(os.environ.get('PAGE_CACHE_MAX_AGE', 0))
+app.config['PAGE_CACHE_REDIS_URL'] = os.environ.get('PAGE_CACHE_REDIS_URL')
+# serve gravatars from /avatar, fetched once into AVATAR_CACHE_FOLDER, instead of linking gravatar.com
+app.config['AVATAR_PROXY'] = os.environ.get('AVATAR_PROXY', '').lower() in ('1', 'true', 'yes')
+app.config['AVATAR_CACHE_FOLDER'] = os.environ.get('AVATAR_CACHE_FOLDER', os.path.join(app.instance_path, 'avatar_cache'))
+app.config['AVATAR_MAX_AGE'] = int(os.environ.get('AVATAR_MAX_AGE', 7 * 24 * 60 * 60))
+app.config['AVATAR_CACHE_MAX_FILES'] = int(os.environ.get('AVATAR_CACHE_MAX_FILES', 10000))
+# /metrics is for the admin or a scraper sending "Authorization: Bearer METRICS_TOKEN";
+# requests slower than SLOW_REQUEST_MS are logged with their queries. With METRICS_DIR (which
+# gunicorn.conf.py sets) every worker writes its numbers there and a scrape adds them all up
+app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
+app.config['METRICS_DIR'] = os.environ.get('METRICS_DIR')
+app.config['SLOW_REQUEST_MS'] = int(os.environ.get('SLOW_REQUEST_MS', 500))
+app.config['SLOW_REQUEST_LOGGED_QUERIES'] = int(os.environ.get('SLOW_REQUEST_LOGGED_QUERIES', 50))
+metrics = Metrics(app.config['METRICS_DIR'])
 
 ckeditor = CKEditor(app)
 Bootstrap(app)
+app.jinja_env.globals.update(responsive_image=responsive_image, largest_variant_url=largest_variant_url)
+if app.config['STATIC_FINGERPRINT']:
+    static_assets = StaticAssets(app, app.config['STATIC_BUILD_FOLDER'])
 
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get("DATABASE_URL", "sqlite:///site.db").replace("postgres://",
                                                                                                     "postgresql://", 1)
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-db = SQLAlchemy(app)
+# connection pool per worker process; the statement timeout is for Postgres, the busy timeout for SQLite (both in ms)
+app.config['DB_POOL_SIZE'] = int(os.environ.get('DB_POOL_SIZE', 5))
+app.config['DB_MAX_OVERFLOW'] = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+app.config['DB_POOL_TIMEOUT'] = int(os.environ.get('DB_POOL_TIMEOUT', 10))
+app.config['DB_POOL_RECYCLE'] = int(os.environ.get('DB_POOL_RECYCLE', 30 * 60))
+app.config['DB_POOL_PRE_PING'] = os.environ.get('DB_POOL_PRE_PING', '1').lower() in ('1', 'true', 'yes')
+app.config['DB_STATEMENT_TIMEOUT'] = int(os.environ.get('DB_STATEMENT_TIMEOUT', 15 * 1000))
+app.config['DB_BUSY_TIMEOUT'] = int(os.environ.get('DB_BUSY_TIMEOUT', 5 * 1000))
+app.config['DB_SLOW_CHECKOUT'] = int(os.environ.get('DB_SLOW_CHECKOUT', 100))
+pool_stats = PoolStats(app.config['DB_SLOW_CHECKOUT'] / 1000)
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config['SQLALCHEMY_DATABASE_URI'], app.config, pool_stats)
+# public read-only views query the replica; someone who has just written reads the primary for REPLICA_STICKY_SECONDS
+app.config['DATABASE_REPLICA_URL'] = os.environ.get('DATABASE_REPLICA_URL')
+app.config['REPLICA_STICKY_SECONDS'] = int(os.environ.get('REPLICA_STICKY_SECONDS', 10))
+replica_pool_stats = PoolStats(app.config['DB_SLOW_CHECKOUT'] / 1000)
+if app.config['DATABASE_REPLICA_URL']:
+    replica_url = app.config['DATABASE_REPLICA_URL'].replace("postgres://", "postgresql://", 1)
+    app.config['SQLALCHEMY_BINDS'] = {REPLICA: dict(engine_options(replica_url, app.config, replica_pool_stats),
+                                                    url=replica_url)}
+db = SQLAlchemy(app, session_options={'class_': RoutingSession})
+with app.app_context():
+    for engine in db.engines.values():
+        configure_engine(engine, app.config)
+    # FTS5 on SQLite, a tsvector column on Postgres; None (no /search) for anything else
+    search_index = search_index_for(db.engine.dialect.name)
+
+
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info['query_started'] = time.perf_counter()
+
+
+def record_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info.pop('query_started', time.perf_counter())
+    metrics.queries.observe(elapsed)
+    if has_request_context() and 'queries' in g:
+        g.queries.append((statement, elapsed))
+
+
+with app.app_context():
+    for engine in db.engines.values():
+        event.listen(engine, 'before_cursor_execute', start_query_timer)
+        event.listen(engine, 'after_cursor_execute', record_query)
+
+def pool_gauge(key):
+    def read():
+        # also read when a worker writes its metrics file after a response, outside any request
+        with app.app_context():
+            values = {('primary',): pool_stats.snapshot(db.engine.pool).get(key, 0)}
+            if REPLICA in db.engines:
+                values[('replica',)] = replica_pool_stats.snapshot(db.engines[REPLICA].pool).get(key, 0)
+        return values
+    return read
+
+
+metrics.gauge('db_pool_checked_out', 'Connections checked out of the pool.', pool_gauge('checked_out'), ('pool',))
+metrics.gauge('db_pool_checkout_wait_max_ms', 'Longest wait for a pooled connection.', pool_gauge('wait_max_ms'),
+              ('pool',))
+metrics.gauge('db_pool_checkout_timeouts', 'Checkouts that gave up after DB_POOL_TIMEOUT.', pool_gauge('timeouts'),
+              ('pool',))
 
 login_manager = LoginManager()
 login_manager.init_app(app)
 
+if app.config['MAIL_TRANSPORT'] == 'stub':
+    mail_transport = StubTransport()
+else:
+    mail_transport = SendinblueTransport(os.environ.get("SENDINBLUE_KEY"))
+os.makedirs(os.path.dirname(os.path.abspath(app.config['MAIL_SPOOL'])), exist_ok=True)
+mail_queue = MailQueue(app.config['MAIL_SPOOL'], TimedTransport(mail_transport, metrics), workers=app.config['MAIL_WORKERS'],
+                       max_attempts=app.config['MAIL_MAX_ATTEMPTS'])
+# the delivery threads start on the first enqueue, in gunicorn's post_fork, or below under waitress;
+# never at import, where gunicorn's preload would start them in the master before it forks
+
 
 class BlogPost(db.Model):
     __tablename__ = "posts"
+    __table_args__ = (db.Index('ix_posts_created_at_id', 'created_at', 'id'),)
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(256), unique=False, nullable=False)
     subtitle = db.Column(db.String(256), nullable=False)
     date = db.Column(db.String(256), nullable=False)
     doy = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.now)
     body = db.Column(db.Text, nullable=False)
+    # body run through html_pipeline when it is saved; what the pages show
+    body_html = db.Column(db.Text, nullable=True)
+    summary = db.Column(db.String(300), nullable=True)
+    reading_minutes = db.Column(db.Integer, nullable=True)
     cover_photo = db.Column(db.String, unique=False, nullable=True)
     author_id = db.Column(db.Integer, db.ForeignKey('users.id'))
+    comment_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     author = relationship("User", back_populates="posts")
     comments = relationship("Comment", back_populates="parent_post")
 
 
 class Project(db.Model):
     __tablename__ = "projects"
+    __table_args__ = (db.Index('ix_projects_created_at_id', 'created_at', 'id'),)
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(256), unique=False, nullable=False)
     subtitle = db.Column(db.String(256), nullable=True)
     body = db.Column(db.Text, nullable=False)
+    # body run through html_pipeline when it is saved; what the pages show
+    body_html = db.Column(db.Text, nullable=True)
+    summary = db.Column(db.String(300), nullable=True)
+    reading_minutes = db.Column(db.Integer, nullable=True)
     cover_photo = db.Column(db.String, unique=False, nullable=True)
     date = db.Column(db.String(256), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.now)
     author_id = db.Column(db.Integer, db.ForeignKey('users.id'))
+    comment_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     author = relationship("User", back_populates="projects")
     comments = relationship("Comment", back_populates="parent_project")
 
@@ -85,15 +230,28 @@ class Comment(db.Model):
     __tablename__ = "comments"
     id = db.Column(db.Integer, primary_key=True)
     body = db.Column(db.Text, nullable=False)
-    author_id = db.Column(db.Integer, db.ForeignKey('users.id'))
-    post_id = db.Column(db.Integer, db.ForeignKey("posts.id"))
-    project_id = db.Column(db.Integer, db.ForeignKey("projects.id"))
-    parent_comment = db.Column(db.Integer, nullable=True)
+    body_html = db.Column(db.Text, nullable=True)
+    author_id = db.Column(db.Integer, db.ForeignKey('users.id'), index=True)
+    post_id = db.Column(db.Integer, db.ForeignKey("posts.id"), index=True)
+    project_id = db.Column(db.Integer, db.ForeignKey("projects.id"), index=True)
+    parent_comment = db.Column(db.Integer, nullable=True, index=True)
     parent_chain = db.Column(db.String(256), nullable=True)
     likes = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.now)
     author = relationship("User", back_populates="comments")
     parent_post = relationship("BlogPost", back_populates="comments")
     parent_project = relationship("Project", back_populates="comments")
+    likers = relationship("CommentLike", back_populates="comment", cascade="all, delete-orphan")
+
+
+class CommentLike(db.Model):
+    __tablename__ = "comment_likes"
+    __table_args__ = (db.UniqueConstraint('user_id', 'comment_id', name='uq_comment_likes_user_comment'),)
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    comment_id = db.Column(db.Integer, db.ForeignKey('comments.id'), nullable=False)
+    user = relationship("User", back_populates="likes")
+    comment = relationship("Comment", back_populates="likers")
 
 
 class User(UserMixin, db.Model):
@@ -103,10 +261,33 @@ class User(UserMixin, db.Model):
     password = db.Column(db.String(512))
     name = db.Column(db.String(128))
     profile_picture = db.Column(db.String(256), nullable=True)
+    # superseded by CommentLike; only read by migrate_liked_comments
     liked_comments = db.Column(db.String(256))
+    # kept in step with the user's comments; NULL until backfill_comment_counts has run
+    comment_count = db.Column(db.Integer, nullable=True, default=0)
     posts = relationship("BlogPost", back_populates="author")
     comments = relationship("Comment", back_populates="author", lazy='dynamic', )
     projects = relationship("Project", back_populates="author")
+    likes = relationship("CommentLike", back_populates="user", cascade="all, delete-orphan")
+
+
+@event.listens_for(BlogPost.body, 'set')
+@event.listens_for(Project.body, 'set')
+def render_post_html(target, value, oldvalue, initiator):
+    # rendered once when the body is written, never while a page is served
+    target.body_html, target.summary, target.reading_minutes = render_post_body(value)
+
+
+@event.listens_for(Comment.body, 'set')
+def render_comment_html(target, value, oldvalue, initiator):
+    target.body_html = render_comment_body(value)
+
+
+class CacheVersion(db.Model):
+    __tablename__ = "cache_versions"
+    name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
 
 class ContactForm(FlaskForm):
@@ -174,8 +355,177 @@ class DeleteProfileForm(FlaskForm):
     submit = SubmitField("Delete Account")
 
 
-with app.app_context():
+# rendered comment threads, keyed by (table, id, comment_version, viewer class)
+comment_fragment_cache = LRUCache(app.config['COMMENT_CACHE_SIZE'])
+
+if app.config['PAGE_CACHE_REDIS_URL']:
+    page_cache_backend = RedisBackend(app.config['PAGE_CACHE_REDIS_URL'], app.config['PAGE_CACHE_TTL'])
+else:
+    page_cache_backend = LRUCache(app.config['PAGE_CACHE_SIZE'])
+page_cache = PageCache(page_cache_backend, app.config['PAGE_CACHE_TTL'])
+
+# columns added after tables already existed in deployed databases; create_all() only creates missing tables
+ADDED_COLUMNS = [
+    ('posts', 'comment_version', 'INTEGER NOT NULL DEFAULT 0'),
+    ('projects', 'comment_version', 'INTEGER NOT NULL DEFAULT 0'),
+    ('posts', 'created_at', 'TIMESTAMP'),
+    ('projects', 'created_at', 'TIMESTAMP'),
+    # comments from before this revision keep a NULL created_at; nothing records when they were written
+    ('comments', 'created_at', 'TIMESTAMP'),
+    ('users', 'comment_count', 'INTEGER'),
+    ('posts', 'body_html', 'TEXT'),
+    ('posts', 'summary', 'VARCHAR(300)'),
+    ('posts', 'reading_minutes', 'INTEGER'),
+    ('projects', 'body_html', 'TEXT'),
+    ('projects', 'summary', 'VARCHAR(300)'),
+    ('projects', 'reading_minutes', 'INTEGER'),
+    ('comments', 'body_html', 'TEXT'),
+]
+
+
+def upgrade_schema():
+    inspector = inspect(db.engine)
+    for table, column, ddl in ADDED_COLUMNS:
+        if column not in [existing['name'] for existing in inspector.get_columns(table)]:
+            db.session.execute(text(f'ALTER TABLE {table} ADD COLUMN {column} {ddl}'))
+    db.session.commit()
+    # indexes declared on the models after their tables were created
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
+
+def backfill_created_at():
+    # rows from before created_at existed only have the formatted date string
+    for model in (BlogPost, Project):
+        for row in model.query.options(defer(model.body), defer(model.body_html)).filter(model.created_at.is_(None)):
+            try:
+                row.created_at = datetime.strptime(row.date, "%B %d, %Y")
+            except ValueError:
+                row.created_at = datetime.now()
+    db.session.commit()
+
+
+def backfill_comment_counts():
+    counted = db.session.query(db.func.count(Comment.id)).filter(Comment.author_id == User.id).scalar_subquery()
+    User.query.filter(User.comment_count.is_(None)).update({User.comment_count: counted}, synchronize_session=False)
+    db.session.commit()
+
+
+def migrate_liked_comments():
+    # move the old ';'-joined User.liked_comments strings into comment_likes, then clear them
+    existing_comments = {comment_id for comment_id, in db.session.query(Comment.id)}
+    for user in User.query.filter(User.liked_comments != ''):
+        already_liked = {like.comment_id for like in user.likes}
+        for entry in set(user.liked_comments.split(';')):
+            if entry.isdigit() and int(entry) in existing_comments and int(entry) not in already_liked:
+                db.session.add(CommentLike(user_id=user.id, comment_id=int(entry)))
+        user.liked_comments = ''
+    db.session.commit()
+
+
+# like counter deltas waiting to be written in LIKE_WRITE_BEHIND mode, comment id -> delta
+pending_like_deltas = {}
+like_delta_lock = threading.Lock()
+like_flusher = {'thread': None}
+
+
+def seed_cache_versions():
+    for name in ('pages', 'comments'):
+        if CacheVersion.query.get(name) is None:
+            db.session.add(CacheVersion(name=name))
+    db.session.commit()
+
+
+def backfill_search_index():
+    # a database from before search is indexed in full once; the write routes keep it current after that
+    if search_index is None:
+        return
+    search_index.create(db.session)
+    if not search_index.count(db.session):
+        rebuild_search_index()
+    db.session.commit()
+
+
+def rebuild_search_index():
+    search_index.clear(db.session)
+    for post in BlogPost.query:
+        index_for_search('post', post)
+    for project in Project.query:
+        index_for_search('project', project)
+    for comment in Comment.query.filter(Comment.body.notlike('[Comment Deleted by %]')):
+        index_for_search('comment', comment)
+
+
+def backfill_rendered_bodies(only_missing=True, batch_size=200):
+    # rows written before html_pipeline (or before a change to it) get their HTML here, a batch at a time
+    for model in (BlogPost, Project, Comment):
+        last_id = 0
+        while True:
+            query = model.query.filter(model.id > last_id)
+            if only_missing:
+                query = query.filter(model.body_html.is_(None))
+            rows = query.order_by(model.id).limit(batch_size).all()
+            if not rows:
+                break
+            for row in rows:
+                if model is Comment:
+                    render_comment_html(row, row.body, None, None)
+                else:
+                    render_post_html(row, row.body, None, None)
+            last_id = rows[-1].id
+            db.session.commit()
+    if not only_missing:
+        # cached pages and thread fragments still hold the old HTML
+        bump_page_version()
+        bump_page_version('comments')
+        Project.query.update({Project.comment_version: Project.comment_version + 1}, synchronize_session=False)
+        BlogPost.query.update({BlogPost.comment_version: BlogPost.comment_version + 1}, synchronize_session=False)
+        db.session.commit()
+
+
+def upgrade_database():
     db.create_all()
+    upgrade_schema()
+    migrate_liked_comments()
+    backfill_created_at()
+    backfill_comment_counts()
+    seed_cache_versions()
+    backfill_search_index()
+    backfill_rendered_bodies()
+
+
+@app.cli.command('upgrade-db')
+def upgrade_db_command():
+    """Bring an existing database up to the current models."""
+    upgrade_database()
+
+
+@app.cli.command('rebuild-search-index')
+def rebuild_search_index_command():
+    """Index every post, project and comment again from scratch."""
+    if search_index is None:
+        print(f"Search is not supported on {db.engine.dialect.name}")
+        return
+    search_index.create(db.session)
+    rebuild_search_index()
+    db.session.commit()
+
+
+@app.cli.command('render-bodies')
+def render_bodies_command():
+    """Run every post, project and comment body through html_pipeline again."""
+    backfill_rendered_bodies(only_missing=False)
+
+
+@app.cli.command('build-image-variants')
+def build_image_variants_command():
+    """Generate the resized variants of every upload that predates the image pipeline."""
+    for folder, kind in ((app.config['UPLOAD_FOLDER'], 'cover'), (app.config['PP_FOLDER'], 'avatar')):
+        for filename in originals(folder, kind):
+            if allowed_file(filename):
+                build_variants(os.path.join(folder, filename), kind)
+
 
 def allowed_file(filename):
     return '.' in filename and \
@@ -194,12 +544,205 @@ def admin_only(f):
     return decorated_function
 
 
+def cached_page(f, scope=None):
+    # anonymous GETs are answered from page_cache, with an ETag and Last-Modified for conditional requests
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if (not app.config['PAGE_CACHE'] or request.method not in ('GET', 'HEAD')
+                or current_user.is_authenticated or '_flashes' in session):
+            return f(*args, **kwargs)
+        pages = CacheVersion.query.get('pages')
+        scope_version = scope(**kwargs) if scope else ''
+        if pages is None or scope_version is None:
+            return f(*args, **kwargs)
+        version = f'{pages.version}.{scope_version}' if scope else pages.version
+        entry = page_cache.get(version, request.full_path)
+        if entry is None:
+            response = make_response(f(*args, **kwargs))
+            # forms create a csrf token on every request, but a page showing one belongs to this visitor only
+            csrf_token = g.get('csrf_token')
+            if response.status_code != 200 or (csrf_token and csrf_token in response.get_data(as_text=True)):
+                return response
+            if scope:
+                # scoped versions carry no timestamp; the page is at least as new as this render
+                last_modified = time.time()
+            else:
+                last_modified = pages.updated_at.replace(tzinfo=timezone.utc).timestamp()
+            entry = page_cache.store(version, request.full_path, response, last_modified)
+        response = make_response(entry['body'])
+        response.mimetype = entry['mimetype']
+        response.set_etag(entry['etag'])
+        response.last_modified = datetime.fromtimestamp(entry['last_modified'], timezone.utc)
+        if session.modified:
+            # rendering started a session (a form's csrf token), so this response carries the
+            # visitor's own cookie; shared caches must not store it and replay it to others
+            response.cache_control.private = True
+        else:
+            response.cache_control.public = True
+        response.cache_control.max_age = app.config['PAGE_CACHE_MAX_AGE']
+        # signed-in visitors get a different page at the same URL
+        response.vary.add('Cookie')
+        return response.make_conditional(request)
+
+    return decorated_function
+
+
+def cached_page_scoped(scope):
+    # for pages that change more often than the site as a whole: scope(**view_args) returns the
+    # extra version they are keyed on, or None to skip the cache
+    return lambda f: cached_page(f, scope)
+
+
+def post_thread_version(post_id):
+    return db.session.query(BlogPost.comment_version).filter_by(id=post_id).scalar()
+
+
+def project_thread_version(proj_id):
+    return db.session.query(Project.comment_version).filter_by(id=proj_id).scalar()
+
+
+def reply_thread_version(comment_id):
+    return db.session.query(db.func.coalesce(BlogPost.comment_version, Project.comment_version)).select_from(
+        Comment).outerjoin(BlogPost, Comment.post_id == BlogPost.id).outerjoin(
+        Project, Comment.project_id == Project.id).filter(Comment.id == comment_id).scalar()
+
+
+def comments_version(**view_args):
+    comments = CacheVersion.query.get('comments')
+    return comments.version if comments else None
+
+
+def replica_reads(f):
+    # GETs of public pages read from the replica, unless this visitor wrote something moments ago
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if (app.config['DATABASE_REPLICA_URL'] and request.method in ('GET', 'HEAD')
+                and session.get('primary_until', 0) < time.time()):
+            g.read_replica = True
+        return f(*args, **kwargs)
+
+    return decorated_function
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def note_primary_write(session, flush_context):
+    if has_request_context():
+        g.wrote_to_primary = True
+
+
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def note_statement_write(orm_execute_state):
+    # likes write with insert/update/delete statements, which never flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        note_primary_write(orm_execute_state.session, None)
+
+
+@app.after_request
+def stick_to_primary(response):
+    # the replica may not have the write yet, so the writer's next pages come from the primary
+    if app.config['DATABASE_REPLICA_URL'] and g.get('wrote_to_primary'):
+        session['primary_until'] = time.time() + app.config['REPLICA_STICKY_SECONDS']
+    return response
+
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    g.queries = []
+
+
+@app.after_request
+def time_request(response):
+    # recorded when the response is closed, so a streamed page counts the queries its template ran
+    if 'request_started' in g:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        details = (route, request.method, response.status_code, request.full_path.rstrip('?'), g.request_started, g.queries)
+        response.call_on_close(lambda: record_request(*details))
+    return response
+
+
+def record_request(route, method, status, path, started, queries):
+    elapsed = time.perf_counter() - started
+    query_time = sum(query_elapsed for statement, query_elapsed in queries)
+    metrics.requests.observe(elapsed, route, method, status)
+    metrics.request_queries.observe(len(queries), route)
+    metrics.request_query_time.observe(query_time, route)
+    metrics.maybe_dump()
+    if elapsed * 1000 >= app.config['SLOW_REQUEST_MS']:
+        limit = app.config['SLOW_REQUEST_LOGGED_QUERIES']
+        lines = ['  %7.1f ms  %s' % (query_elapsed * 1000, ' '.join(statement.split())[:300])
+                 for statement, query_elapsed in queries[:limit]]
+        if len(queries) > limit:
+            lines.append(f'  ... and {len(queries) - limit} more')
+        print("Slow request %s %s: %.0f ms, %s queries in %.0f ms\n%s\n"
+              % (method, path, elapsed * 1000, len(queries), query_time * 1000, '\n'.join(lines)))
+
+
+def start_template_timer(sender, template, context, **extra):
+    if has_request_context():
+        g.setdefault('templates_started', {})[template.name] = time.perf_counter()
+
+
+def record_template(sender, template, context, **extra):
+    started = g.get('templates_started', {}).pop(template.name, None) if has_request_context() else None
+    if started is not None:
+        metrics.templates.observe(time.perf_counter() - started, template.name)
+
+
+# Flask only sends template signals when blinker is installed
+if signals_available:
+    before_render_template.connect(start_template_timer, app)
+    template_rendered.connect(record_template, app)
+
+
+def render_page(template_name, **context):
+    if not app.config['STREAM_PAGES']:
+        return render_template(template_name, **context)
+    return app.response_class(coalesce_writes(stream_template(template_name, **context)), mimetype='text/html')
+
+
+def coalesce_writes(pieces):
+    # jinja yields every tag and expression separately; send them in writes of at least STREAM_MIN_WRITE,
+    # or early where the page yields an empty piece
+    buffered, size = [], 0
+    for piece in pieces:
+        buffered.append(piece)
+        size += len(piece)
+        if size >= app.config['STREAM_MIN_WRITE'] or (not piece and size):
+            yield ''.join(buffered)
+            buffered, size = [], 0
+    if buffered:
+        yield ''.join(buffered)
+
+
+user_cache = LRUCache(app.config['USER_CACHE_SIZE'])
+
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    # a detached copy of the row is merged into this request's session without querying;
+    # other workers may keep an old copy for up to USER_CACHE_TTL after forget_user
+    entry = user_cache.get(int(user_id))
+    if entry is not None and entry[0] + app.config['USER_CACHE_TTL'] > time.time():
+        return db.session.merge(entry[1], load=False)
+    user = User.query.get(int(user_id))
+    if user is not None and app.config['USER_CACHE_TTL'] > 0:
+        user_cache.set(user.id, (time.time(), detached_copy(user)))
+    return user
+
+
+def detached_copy(user):
+    copy = User(**{column.key: getattr(user, column.key) for column in inspect(User).column_attrs})
+    make_transient_to_detached(copy)
+    return copy
+
+
+def forget_user(user_id):
+    user_cache.delete(user_id)
 
 
 @app.route('/', methods=['GET', 'POST'])
+@cached_page
 def home():
     form = ContactForm()
     if request.method == 'POST':
@@ -211,10 +754,12 @@ def home():
 
 
 @app.route('/blog')
+@replica_reads
+@cached_page
 def blog():
-    posts = BlogPost.query.all()
-    return render_template("blog.html", logged_in=current_user.is_authenticated, all_posts=posts,
-                           doy=datetime.now().timetuple().tm_yday, year=date.today().year, user=current_user,
+    posts, older = listing_page(BlogPost, request.args.get('before'))
+    return render_template("blog.html", logged_in=current_user.is_authenticated, all_posts=posts, older=older,
+                           now=datetime.now(), year=date.today().year, user=current_user,
                            page="Blog")
 
 @app.route('/contact', methods=['GET', 'POST'])
@@ -229,10 +774,31 @@ def contact():
 
 
 @app.route('/projects')
+@replica_reads
+@cached_page
 def projects():
-    projects_ = Project.query.all()
+    projects_, older = listing_page(Project, request.args.get('before'))
     return render_template("projects.html", logged_in=current_user.is_authenticated, year=date.today().year,
-                           user=current_user, all_projects=projects_, page="Projects")
+                           user=current_user, all_projects=projects_, older=older, page="Projects")
+
+
+def listing_page(model, cursor):
+    # keyset pagination, newest first: each page seeks past the (created_at, id) of the previous page's last row
+    query = model.query.options(defer(model.body), defer(model.body_html)).order_by(model.created_at.desc(), model.id.desc())
+    if cursor:
+        try:
+            created_at, row_id = cursor.rsplit('_', 1)
+            created_at, row_id = datetime.fromisoformat(created_at), int(row_id)
+        except ValueError:
+            return abort(400)
+        query = query.filter(or_(model.created_at < created_at,
+                                 and_(model.created_at == created_at, model.id < row_id)))
+    page_size = app.config['LISTING_PAGE_SIZE']
+    rows = query.limit(page_size + 1).all()
+    if len(rows) > page_size:
+        last = rows[page_size - 1]
+        return rows[:page_size], f'{last.created_at.isoformat()}_{last.id}'
+    return rows, None
 
 
 @app.route('/register', methods=["GET", "POST"])
@@ -247,7 +813,6 @@ def register():
                     password=generate_password_hash(form.password.data, method='pbkdf2:sha256',
                                                     salt_length=8),
                     name=nameFix,
-                    liked_comments='',
                 )
                 db.session.add(new_user)
                 db.session.commit()
@@ -304,11 +869,12 @@ def settings():
         else:
             file = request.files['file']
             if file and allowed_file(file.filename):
-                filename = secure_filename(file.filename)
-                file.save(os.path.join(app.config['PP_FOLDER'], filename))
+                filename = save_upload(file, app.config['PP_FOLDER'], 'avatar', workers=app.config['IMAGE_WORKERS'])
                 path = f'static/uploads/profile_pictures/{filename}'
                 current_user.profile_picture = path
+                bump_user_threads(current_user)
                 db.session.commit()
+                forget_user(current_user.id)
             else:
                 flash("Invalid File")
     if password_form.validate_on_submit():
@@ -317,6 +883,7 @@ def settings():
                 current_user.password = generate_password_hash(password_form.confirm_new_password.data,
                                                                method='pbkdf2:sha256')
                 db.session.commit()
+                forget_user(current_user.id)
                 flash('Password Change Successful.')
                 return redirect(url_for('settings', _anchor='form2'))
             else:
@@ -325,8 +892,11 @@ def settings():
             flash("Incorrect Current Password")
     if delete_form.validate_on_submit():
         if check_password_hash(current_user.password, delete_form.password.data):
+            bump_user_threads(current_user)
+            user_id = current_user.id
             db.session.delete(current_user)
             db.session.commit()
+            forget_user(user_id)
             return redirect(url_for('home'))
         else:
             flash("Incorrect Password")
@@ -335,11 +905,71 @@ def settings():
                            delete_form=delete_form, page="Settings")
 
 @app.route("/user_page/<int:user_id>")
+@replica_reads
+@cached_page_scoped(comments_version)
 def user_page(user_id):
-    shown_user = User.query.get(user_id)
-    comments = shown_user.comments
+    shown_user = User.query.get_or_404(user_id)
+    comments, older = comment_history_page(shown_user, request.args.get('before'))
+    posts = projects_ = []
+    if shown_user.id == 1:
+        posts = BlogPost.query.options(defer(BlogPost.body), defer(BlogPost.body_html)).filter_by(author_id=shown_user.id).order_by(
+            BlogPost.created_at.desc()).all()
+        projects_ = Project.query.options(defer(Project.body), defer(Project.body_html)).filter_by(author_id=shown_user.id).order_by(
+            Project.created_at.desc()).all()
     return render_template('user_page.html', shown_user=shown_user, logged_in=current_user.is_authenticated, year=date.today().year,
-                           user=current_user, page="User Page", comment_list_length=comments.count())
+                           user=current_user, page="User Page", comments=comments, older=older, posts=posts,
+                           projects=projects_, comment_list_length=shown_user.comment_count or len(comments))
+
+def comment_history_page(shown_user, cursor):
+    # newest first, seeking past the id of the previous page's last comment; parent titles come in the same query
+    query = Comment.query.options(joinedload(Comment.parent_post).load_only(BlogPost.id, BlogPost.title),
+                                  joinedload(Comment.parent_project).load_only(Project.id, Project.title)).filter(
+        Comment.author_id == shown_user.id).order_by(Comment.id.desc())
+    if cursor:
+        if not cursor.isdigit():
+            return abort(400)
+        query = query.filter(Comment.id < int(cursor))
+    page_size = app.config['HISTORY_PAGE_SIZE']
+    rows = query.limit(page_size + 1).all()
+    if len(rows) > page_size:
+        return rows[:page_size], rows[page_size - 1].id
+    return rows, None
+
+@app.route("/avatar/<digest>/<int:size>/<signature>")
+def avatar(digest, size, signature):
+    if (not app.config['AVATAR_PROXY'] or not DIGEST.match(digest) or size != GRAVATAR_SIZE
+            or not valid_signature(app.config['SECRET_KEY'], digest, size, signature)):
+        return abort(404)
+    try:
+        path = fetch_avatar(app.config['AVATAR_CACHE_FOLDER'], digest, size,
+                            max_files=app.config['AVATAR_CACHE_MAX_FILES'])
+    except (OSError, ValueError) as e:
+        print("Exception when fetching avatar %s: %s\n" % (digest, e))
+        return redirect(upstream_url(digest, size))
+    return send_file(path, max_age=app.config['AVATAR_MAX_AGE'])
+
+@app.route("/metrics")
+def metrics_page():
+    token = app.config['METRICS_TOKEN']
+    scraper = bool(token) and hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}')
+    if not scraper and not (current_user.is_authenticated and current_user.id == 1):
+        return abort(403)
+    return app.response_class(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route("/healthz")
+def healthz():
+    # for load balancers and container health checks: this worker answers and can reach the database
+    try:
+        for engine in db.engines.values():
+            with engine.connect() as connection:
+                connection.execute(text('SELECT 1'))
+    except Exception as e:
+        print("Exception when checking the database: %s\n" % e)
+        return jsonify(status='unavailable'), 503
+    pools = {'pool': pool_stats.snapshot(db.engine.pool)}
+    if REPLICA in db.engines:
+        pools['replica_pool'] = replica_pool_stats.snapshot(db.engines[REPLICA].pool)
+    return jsonify(status='ok', **pools)
 
 @app.route("/new-post", methods=['GET', 'POST'])
 @admin_only
@@ -350,8 +980,7 @@ def add_new_blog():
             pass
         file = request.files['file']
         if file and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            file.save(os.path.join(app.config["UPLOAD_FOLDER"], filename))
+            filename = save_upload(file, app.config["UPLOAD_FOLDER"], 'cover', workers=app.config['IMAGE_WORKERS'])
         if form.cover_photo.data == '':
             option_result = f'static/uploads/{filename}'
         else:
@@ -366,6 +995,9 @@ def add_new_blog():
             doy=datetime.now().timetuple().tm_yday
         )
         db.session.add(new_post)
+        db.session.flush()
+        index_for_search('post', new_post)
+        bump_page_version()
         db.session.commit()
         new = BlogPost.query.filter(BlogPost.title == new_post.title, BlogPost.subtitle == new_post.subtitle).first()
         return redirect(url_for('show_post', post_id=new.id))
@@ -389,8 +1021,7 @@ def edit_post(post_id):
             pass
         file = request.files['file']
         if file and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            file.save(os.path.join(app.config["UPLOAD_FOLDER"], filename))
+            filename = save_upload(file, app.config["UPLOAD_FOLDER"], 'cover', workers=app.config['IMAGE_WORKERS'])
         if edit_form.cover_photo.data == '':
             option_result = f'static/uploads/{filename}'
         else:
@@ -401,6 +1032,8 @@ def edit_post(post_id):
         post.cover_photo = option_result
         post.author = current_user
         post.body = edit_form.body.data
+        index_for_search('post', post)
+        bump_page_version()
         db.session.commit()
         return redirect(url_for('show_post', post_id=post_id))
     return render_template('new_blog_post.html', form=edit_form, logged_in=current_user.is_authenticated,
@@ -408,18 +1041,12 @@ def edit_post(post_id):
 
 
 @app.route("/post/<int:post_id>", methods=['GET', 'POST'])
+@replica_reads
+@cached_page_scoped(post_thread_version)
 def show_post(post_id):
     form = CommentForm()
     replyform = CommentReplyForm()
     requested_post = BlogPost.query.get(post_id)
-    comment_structure = order_comments(post_id)
-    construct = ''
-    for n in range(0, len(comment_structure)):
-        parent_node = HTML_comment_constructor(comment_structure[n]['comment'])
-        parent_HTML = Markup(f'''</ul><ul class="commentList"><li style="margin-left:10vw;margin-right:10vw;list-style:none;"><hr><div>{parent_node}</div></li>''')
-        rest_of_node = reducer(comment_structure[n],'',1)
-        full_node = parent_HTML+rest_of_node
-        construct+=full_node
     if request.method == 'POST':
         if request.form.get('submit')=='Post':
             new_comment = Comment(
@@ -431,10 +1058,15 @@ def show_post(post_id):
                 parent_chain="",
             )
             db.session.add(new_comment)
-            new = Comment.query.filter(Comment.body == new_comment.body).order_by(Comment.id.desc()).first()
-            like_comment_on_post(new)
+            # flushed for its id, which the author's like and the search document need
+            db.session.flush()
+            like_comment_on_post(new_comment)
+            count_comments(current_user.id, 1)
+            index_for_search('comment', new_comment)
+            bump_thread_version(new_comment.parent_post or new_comment.parent_project)
             db.session.commit()
-            return redirect(url_for('show_post', post_id=post_id, _anchor=f'comment_marker_{new_comment.id}'))
+            return redirect(url_for('show_post', post_id=post_id, after=thread_page_after(new_comment),
+                                    _anchor=f'comment_marker_{new_comment.id}'))
         elif request.form.get('reply_submit')=='Post Reply':
             new_reply = Comment(
                 body=request.form['comment_reply'],
@@ -446,14 +1078,19 @@ def show_post(post_id):
             the_parent_comment = Comment.query.get(new_reply.parent_comment)
             new_reply.parent_chain=the_parent_comment.parent_chain + f"{the_parent_comment.id};"
             db.session.add(new_reply)
-            new = Comment.query.filter(Comment.body == new_reply.body).order_by(Comment.id.desc()).first()
-            like_comment_on_post(new)
+            # flushed for its id, which the author's like and the search document need
+            db.session.flush()
+            like_comment_on_post(new_reply)
+            count_comments(current_user.id, 1)
+            index_for_search('comment', new_reply)
+            bump_thread_version(new_reply.parent_post or new_reply.parent_project)
             db.session.commit()
-            return redirect(url_for('show_post', post_id=post_id, _anchor=f'comment_marker_{new_reply.id}'))
-    return render_template("post.html", post=requested_post, user=current_user,
+            return redirect(url_for('show_post', post_id=post_id, after=thread_page_after(new_reply),
+                                    _anchor=f'comment_marker_{new_reply.id}'))
+    return render_page("post.html", post=requested_post, user=current_user, description=requested_post.summary,
                            logged_in=current_user.is_authenticated, form=form, page="Blog",
                            replyform=replyform, year=date.today().year,
-                           comments=construct)
+                           comments=comment_section(requested_post, request.args.get('after', type=int)))
 
 @app.route("/new-project", methods=['GET', 'POST'])
 @admin_only
@@ -464,8 +1101,7 @@ def add_new_project():
             pass
         file = request.files['file']
         if file and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            file.save(os.path.join(app.config["UPLOAD_FOLDER"], filename))
+            filename = save_upload(file, app.config["UPLOAD_FOLDER"], 'cover', workers=app.config['IMAGE_WORKERS'])
         if form.cover_photo.data == '':
             option_result = f'static/uploads/{filename}'
         else:
@@ -479,6 +1115,9 @@ def add_new_project():
             date=date.today().strftime("%B %d, %Y"),
         )
         db.session.add(new_proj)
+        db.session.flush()
+        index_for_search('project', new_proj)
+        bump_page_version()
         db.session.commit()
         new = Project.query.filter(Project.title == new_proj.title, Project.subtitle == new_proj.subtitle).first()
         return redirect(url_for('show_project', proj_id=new.id))
@@ -502,8 +1141,7 @@ def edit_project(proj_id):
             pass
         file = request.files['file']
         if file and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            file.save(os.path.join(app.config["UPLOAD_FOLDER"], filename))
+            filename = save_upload(file, app.config["UPLOAD_FOLDER"], 'cover', workers=app.config['IMAGE_WORKERS'])
         if edit_form.cover_photo.data == '':
             option_result = f'static/uploads/{filename}'
         else:
@@ -513,6 +1151,8 @@ def edit_project(proj_id):
         project.cover_photo = option_result
         project.author = current_user
         project.body = edit_form.body.data
+        index_for_search('project', project)
+        bump_page_version()
         db.session.commit()
         return redirect(url_for("show_project", proj_id=project.id))
     return render_template('new_project.html', form=edit_form, logged_in=current_user.is_authenticated,
@@ -520,18 +1160,12 @@ def edit_project(proj_id):
 
 
 @app.route("/project/<int:proj_id>", methods=['GET', 'POST'])
+@replica_reads
+@cached_page_scoped(project_thread_version)
 def show_project(proj_id):
     form = CommentForm()
     replyform = CommentReplyForm()
     requested_project = Project.query.get(proj_id)
-    comment_structure = order_comments_project(proj_id)
-    construct = ''
-    for n in range(0, len(comment_structure)):
-        parent_node = HTML_comment_constructor(comment_structure[n]['comment'])
-        parent_HTML = Markup(f'''</ul><ul class="commentList"><li style="margin-left:10vw;margin-right:10vw;list-style:none;"><hr><div>{parent_node}</div></li>''')
-        rest_of_node = reducer(comment_structure[n],'',1)
-        full_node = parent_HTML+rest_of_node
-        construct+=full_node
     if request.method == 'POST':
         if request.form.get('submit')=='Post':
             new_comment = Comment(
@@ -543,10 +1177,15 @@ def show_project(proj_id):
                 parent_chain="",
             )
             db.session.add(new_comment)
-            new = Comment.query.filter(Comment.body == new_comment.body).order_by(Comment.id.desc()).first()
-            like_comment_on_post(new)
+            # flushed for its id, which the author's like and the search document need
+            db.session.flush()
+            like_comment_on_post(new_comment)
+            count_comments(current_user.id, 1)
+            index_for_search('comment', new_comment)
+            bump_thread_version(new_comment.parent_post or new_comment.parent_project)
             db.session.commit()
-            return redirect(url_for('show_project', proj_id=proj_id, _anchor=f'comment_marker_{new_comment.id}'))
+            return redirect(url_for('show_project', proj_id=proj_id, after=thread_page_after(new_comment),
+                                    _anchor=f'comment_marker_{new_comment.id}'))
         elif request.form.get('reply_submit')=='Post Reply':
             new_reply = Comment(
                 body=request.form['comment_reply'],
@@ -558,14 +1197,67 @@ def show_project(proj_id):
             the_parent_comment = Comment.query.get(new_reply.parent_comment)
             new_reply.parent_chain = the_parent_comment.parent_chain + f"{the_parent_comment.id};"
             db.session.add(new_reply)
-            new = Comment.query.filter(Comment.body == new_reply.body).order_by(Comment.id.desc()).first()
-            like_comment_on_post(new)
+            # flushed for its id, which the author's like and the search document need
+            db.session.flush()
+            like_comment_on_post(new_reply)
+            count_comments(current_user.id, 1)
+            index_for_search('comment', new_reply)
+            bump_thread_version(new_reply.parent_post or new_reply.parent_project)
             db.session.commit()
-            return redirect(url_for('show_project', proj_id=proj_id, _anchor=f'comment_marker_{new_reply.id}'))
-    return render_template("project.html", proj=requested_project, user=current_user,
+            return redirect(url_for('show_project', proj_id=proj_id, after=thread_page_after(new_reply),
+                                    _anchor=f'comment_marker_{new_reply.id}'))
+    return render_page("project.html", proj=requested_project, user=current_user, description=requested_project.summary,
                            logged_in=current_user.is_authenticated, form=form, page="Projects",
                            replyform=replyform, year=date.today().year,
-                           comments=construct)
+                           comments=comment_section(requested_project, request.args.get('after', type=int)))
+
+@app.route("/api/post/<int:post_id>/comments")
+@replica_reads
+@cached_page_scoped(post_thread_version)
+def post_comments_api(post_id):
+    return comment_page_json(BlogPost.query.get_or_404(post_id), request.args.get('after', type=int))
+
+@app.route("/api/project/<int:proj_id>/comments")
+@replica_reads
+@cached_page_scoped(project_thread_version)
+def project_comments_api(proj_id):
+    return comment_page_json(Project.query.get_or_404(proj_id), request.args.get('after', type=int))
+
+@app.route("/api/comments/<int:comment_id>/replies")
+@replica_reads
+@cached_page_scoped(reply_thread_version)
+def comment_replies_api(comment_id):
+    comment = Comment.query.get_or_404(comment_id)
+    target = comment.parent_post or comment.parent_project
+    after = request.args.get('after', type=int)
+    fragment, viewer = comment_fragment(target, ('replies', comment_id, after),
+                                        lambda viewer: render_reply_page(target, comment, after, viewer))
+    return comment_json(fragment, viewer, target)
+
+@app.route("/search")
+@replica_reads
+@cached_page_scoped(comments_version)
+def search():
+    if search_index is None:
+        return abort(404)
+    query = request.args.get('q', '').strip()[:200]
+    page = max(request.args.get('page', 1, type=int), 1)
+    page_size = app.config['SEARCH_PAGE_SIZE']
+    hits = search_index.search(db.session, query, page_size + 1, (page - 1) * page_size) if query else []
+    return render_template("search.html", logged_in=current_user.is_authenticated, query=query, page=page,
+                           results=search_results(hits[:page_size]), more=len(hits) > page_size,
+                           year=date.today().year, user=current_user)
+
+@app.route("/comment/<int:comment_id>")
+def comment_link(comment_id):
+    # search results link here so the thread page holding the comment is only worked out when followed
+    comment = Comment.query.get_or_404(comment_id)
+    after = thread_page_after(comment)
+    if comment.post_id is None:
+        return redirect(url_for('show_project', proj_id=comment.project_id, after=after,
+                                _anchor=f'comment_marker_{comment_id}'))
+    return redirect(url_for('show_post', post_id=comment.post_id, after=after,
+                            _anchor=f'comment_marker_{comment_id}'))
 
 @app.route("/_deletepo/<int:post_id>", methods=['GET', 'POST', 'DELETE'])
 @admin_only
@@ -573,8 +1265,13 @@ def delete_post(post_id):
     post_to_delete = BlogPost.query.get(post_id)
     comments_of_post = post_to_delete.comments
     for comment in comments_of_post:
+        if comment.author_id is not None:
+            count_comments(comment.author_id, -1)
         db.session.delete(comment)
+    remove_from_search('comment', [comment.id for comment in comments_of_post])
+    remove_from_search('post', [post_id])
     db.session.delete(post_to_delete)
+    bump_page_version()
     db.session.commit()
     return redirect(url_for('blog', logged_in=current_user.is_authenticated,
                             doy=datetime.now().timetuple().tm_yday, year=date.today().year, user=current_user))
@@ -586,8 +1283,13 @@ def delete_project(proj_id):
     proj_to_delete = Project.query.get(proj_id)
     comments_of_proj = proj_to_delete.comments
     for comment in comments_of_proj:
+        if comment.author_id is not None:
+            count_comments(comment.author_id, -1)
         db.session.delete(comment)
+    remove_from_search('comment', [comment.id for comment in comments_of_proj])
+    remove_from_search('project', [proj_id])
     db.session.delete(proj_to_delete)
+    bump_page_version()
     db.session.commit()
     return redirect(url_for('projects', logged_in=current_user.is_authenticated,
                             doy=datetime.now().timetuple().tm_yday, year=date.today().year, user=current_user))
@@ -601,46 +1303,103 @@ def delete_comment(comment_id):
         comment_to_delete.body = "[Comment Deleted by Admin]"
     else:
         comment_to_delete.body = "[Comment Deleted by Author]"
+    remove_from_search('comment', [comment_id])
+    bump_thread_version(comment_to_delete.parent_post or comment_to_delete.parent_project)
     db.session.commit()
+    after = thread_page_after(comment_to_delete)
     if comment_to_delete.post_id == None:
-        return redirect(url_for('show_project', proj_id=comment_to_delete.project_id, _anchor=f'comment_marker_{comment_id}'))
+        return redirect(url_for('show_project', proj_id=comment_to_delete.project_id, after=after,
+                                _anchor=f'comment_marker_{comment_id}'))
     else:
-        return redirect(url_for('show_post', post_id=comment_to_delete.post_id, _anchor=f'comment_marker_{comment_id}'))
+        return redirect(url_for('show_post', post_id=comment_to_delete.post_id, after=after,
+                                _anchor=f'comment_marker_{comment_id}'))
 
 @app.route("/_deletepp/<int:user_id>/", methods=['GET', 'POST', 'DELETE'])
 @login_required
 def delete_profile_pic(user_id):
     user_to_delete_from = User.query.get(user_id)
     user_to_delete_from.profile_picture = None
+    bump_user_threads(user_to_delete_from)
     db.session.commit()
+    forget_user(user_id)
     return redirect(url_for('settings'))
 
-@app.route("/like_comment/<int:comment_id>", methods=['GET', 'POST'])
+@app.route("/like_comment/<int:comment_id>", methods=['POST'])
 @login_required
 def like_comment(comment_id):
-    comment_to_like = Comment.query.get(comment_id)
-    comment_to_like.likes+=1
-    user_liked_comments = string_to_list(current_user.liked_comments)
-    if user_liked_comments == None:
-        user_liked_comments = [comment_to_like.id]
-    else:
-        user_liked_comments.append(comment_to_like.id)
-    new_string = list_to_string(user_liked_comments)
-    current_user.liked_comments = new_string
+    check_csrf_header()
+    require_comment(comment_id)
+    if insert_like(current_user.id, comment_id):
+        record_like_delta(comment_id, 1)
     db.session.commit()
     return "success"
 
-@app.route("/unlike_comment/<int:comment_id>", methods=['GET', 'POST'])
+@app.route("/unlike_comment/<int:comment_id>", methods=['POST'])
 @login_required
 def unlike_comment(comment_id):
-    comment_to_unlike = Comment.query.get(comment_id)
-    comment_to_unlike.likes-=1
-    user_liked_comments = string_to_list(current_user.liked_comments)
-    user_liked_comments = [comment for comment in user_liked_comments if comment!=str(comment_id)]
-    current_user.liked_comments = list_to_string(user_liked_comments)
+    check_csrf_header()
+    require_comment(comment_id)
+    removed = CommentLike.query.filter_by(user_id=current_user.id, comment_id=comment_id).delete()
+    if removed:
+        record_like_delta(comment_id, -1)
     db.session.commit()
     return "success"
 
+def check_csrf_header():
+    try:
+        validate_csrf(request.headers.get('X-CSRFToken'))
+    except ValidationError:
+        abort(400)
+
+def require_comment(comment_id):
+    # only the id; a like has no use for the body or its rendered HTML
+    if db.session.query(Comment.id).filter_by(id=comment_id).first() is None:
+        abort(404)
+
+def insert_like(user_id, comment_id):
+    # the unique (user_id, comment_id) index decides who wins a double click; the loser inserts nothing
+    if db.engine.dialect.name == 'postgresql':
+        statement = postgresql_insert(CommentLike)
+    else:
+        statement = sqlite_insert(CommentLike)
+    statement = statement.values(user_id=user_id, comment_id=comment_id).on_conflict_do_nothing()
+    return db.session.execute(statement).rowcount == 1
+
+def record_like_delta(comment_id, delta):
+    if not app.config['LIKE_WRITE_BEHIND']:
+        apply_like_deltas({comment_id: delta})
+        return
+    with like_delta_lock:
+        pending_like_deltas[comment_id] = pending_like_deltas.get(comment_id, 0) + delta
+        if like_flusher['thread'] is None:
+            like_flusher['thread'] = threading.Thread(target=flush_like_deltas_forever, daemon=True)
+            like_flusher['thread'].start()
+            atexit.register(flush_like_deltas)
+
+def apply_like_deltas(deltas):
+    for comment_id, delta in deltas.items():
+        if delta:
+            Comment.query.filter_by(id=comment_id).update({Comment.likes: Comment.likes + delta},
+                                                          synchronize_session=False)
+    bump_threads_where(Comment.id.in_(list(deltas)))
+
+def flush_like_deltas():
+    with like_delta_lock:
+        deltas = dict(pending_like_deltas)
+        pending_like_deltas.clear()
+    if deltas:
+        with app.app_context():
+            apply_like_deltas(deltas)
+            db.session.commit()
+
+def flush_like_deltas_forever():
+    while True:
+        time.sleep(app.config['LIKE_FLUSH_INTERVAL'])
+        try:
+            flush_like_deltas()
+        except Exception as e:
+            print("Exception when flushing like counts: %s\n" % e)
+
 def list_to_string(list):
     if list == None:
         return None
@@ -650,199 +1409,356 @@ def list_to_string(list):
             string+=str(id)+";"
         return string
 
-def string_to_list(string):
-    list = string.split(";")
-    for entry in list:
-        if entry == '':
-            list.remove(entry)
-    return list
-
-def hide_reply_insert(comment_id):
-    if Comment.query.get(comment_id).post_id == None:
-        all_comments = Comment.query.filter(Comment.project_id==Comment.query.get(comment_id).project_id)
-    else:
-        all_comments = Comment.query.filter(Comment.post_id==Comment.query.get(comment_id).post_id)
-    comments_to_hide = []
-    for comment in all_comments:
-        this_comment_parent_chain = comment.parent_chain
-        listed = string_to_list(this_comment_parent_chain)
-        for x in listed:
-            if int(x) == comment_id:
-                comments_to_hide.append(comment.id)
-    return list_to_string(comments_to_hide)
-
-
-def order_comments(post_id):
-    comments = Comment.query.filter(Comment.post_id==post_id)
-    comment_tree = []
-    for comment in comments:
-        if comment.parent_comment == None:
-            comment_tree.append(find_children(comment))
-    return comment_tree
-
-def order_comments_project(proj_id):
-    comments = Comment.query.filter(Comment.project_id==proj_id)
-    comment_tree = []
-    for comment in comments:
-        if comment.parent_comment == None:
-            comment_tree.append(find_children(comment))
-    return comment_tree
-
-def find_children(comment):
-    children = Comment.query.filter(Comment.parent_comment == comment.id)
-    if children.count()>0:
-        child_list=[]
-        for child in children:
-            child_list.append(find_children(child))
-        return { 'comment' : comment, 'children': child_list }
-    else:
-        return { 'comment': comment }
-
-def reducer(comments, children_construct,n):
-    try:
-        for children in comments['children']:
-            if len(children)>1:
-                this_top = children['comment']
-                this_top_HTML = HTML_comment_constructor(this_top)
-                styled = Markup(f'''<li style="margin-left:{10+(n*4)}vw;margin-right:10vw;"><div class="vl">{this_top_HTML}</div></li>''')
-                children_construct +=styled
-                try:
-                    if children['children'][0]['comment']:
-                        for x in range(0, len(children['children'])):
-                            this_grand = HTML_comment_constructor(children['children'][x]['comment'])
-                            styled = Markup(f'''<li style="margin-left:{10 + ((n+1) * 4)}vw;margin-right:10vw;"><div class="vl">{this_grand}</div></li>''')
-                            children_construct += styled
-                            children_construct += reducer(children['children'][x], '', n + 2)
-                except:
-                    pass
-            else:
-                #end leaf
-                end_leaf = children['comment']
-                end_leaf_HTML = HTML_comment_constructor(end_leaf)
-                styled = Markup(f'''<li style="margin-left:{10+(n*4)}vw;margin-right:10vw;"><div class="vl">{end_leaf_HTML}</div></li>''')
-                children_construct += styled
-    except:
-        pass
-    return children_construct
-
-def HTML_comment_constructor(comment):
-    html_starter = Markup(f'''<div id="visibility_tag_{comment.id}" class="visible" style="margin-bottom:2em"><div class='anchor' id=comment_marker_{comment.id}></div>{ comment.body }''')
-    like_counter_module = Markup(f'''<div class="row col-5 col-lg-4" ><div class="col-8 col-lg-4" style="color:#F2A900" id="like_counter{comment.id}">+ { comment.likes } likes</div>''')
-    if current_user.is_authenticated:
-        # set like button class based on if user has liked the comment
-        like_check = False
-        user_liked_comments = string_to_list(current_user.liked_comments)
-        for comment_id in user_liked_comments:
-            if comment_id == str(comment.id):
-                like_check = True
-        if like_check == False:
-            like_button_module = Markup(f'''<div class="col-2" style="margin-left:-1em"><div class="hvr-float-shadow"><a class="icon fa-thumbs-up" onclick="changeText({comment.id})" id="button_marker{comment.id}"></a></div></div>''')
-        else:
-            like_button_module = Markup(f'''<div class="col-2" style="margin-left:-1em"><div class="hvr-float-shadow"><a class="icon solid fa-thumbs-up" style="color:#F2A900;" onclick="changeText({comment.id})" id="button_marker{comment.id}"></a></div></div>''')
-        reply_module = Markup(f'''<div class="col-2"><div class="hvr-float-shadow"><a class="icon solid fa-reply" style="color:white;" id=reply_button{comment.id} onclick="showReplyBox( {comment.id} )"></a></div></div></div>''')
+def comment_viewer_class():
+    if not current_user.is_authenticated:
+        return 'anonymous'
+    if current_user.id == 1:
+        return 'admin'
+    return 'member'
+
+def comment_section(target, after=None):
+    # Yields the page of the thread in chunks so a streamed page can send each one as soon as it is rendered.
+    # The empty first chunk lets everything above the thread go out before it is loaded.
+    yield ''
+    if after:
+        yield comment_macro('earlier_comments')(url_for(request.endpoint, **request.view_args))
+    fragment, viewer = comment_fragment(target, ('comments', after),
+                                        lambda viewer: render_comment_page(target, after, viewer))
+    overlay = viewer_overlay(fragment, viewer, thread_criterion(target))
+    for html, comment_ids in fragment['chunks']:
+        yield overlay(html, comment_ids)
+
+def comment_page_json(target, after):
+    fragment, viewer = comment_fragment(target, ('comments', after),
+                                        lambda viewer: render_comment_page(target, after, viewer))
+    return comment_json(fragment, viewer, target)
+
+def comment_json(fragment, viewer, target):
+    overlay = viewer_overlay(fragment, viewer, thread_criterion(target))
+    html = ''.join(overlay(html, comment_ids) for html, comment_ids in fragment['chunks'])
+    liked = []
+    if viewer != 'anonymous':
+        shown = {comment['id'] for comment in fragment['comments']}
+        liked = sorted(shown & liked_comment_ids(current_user.id, thread_criterion(target)))
+    return jsonify(comments=fragment['comments'], liked=liked, next=fragment['next'], html=html)
+
+def comment_fragment(target, page, render):
+    # rendered pages of a thread are shared per viewer class; the viewer's own likes and comments are overlaid after
+    viewer = comment_viewer_class()
+    key = (target.__tablename__, target.id, target.comment_version, viewer) + page
+    fragment = comment_fragment_cache.get(key)
+    if fragment is None:
+        fragment = render(viewer)
+        fragment['chunks'] = cache_when_rendered(fragment, fragment['chunks'], key)
+    return fragment, viewer
+
+def cache_when_rendered(fragment, rendering, key):
+    # only a page rendered to the end is cached
+    chunks = []
+    for chunk in rendering:
+        chunks.append(chunk)
+        yield chunk
+    comment_fragment_cache.set(key, dict(fragment, chunks=chunks))
+
+def render_comment_page(target, after, viewer):
+    # keyset page over top-level comments, oldest first, each with the start of its replies
+    thread = thread_criterion(target)
+    size, reply_size = app.config['COMMENT_PAGE_SIZE'], app.config['REPLY_PAGE_SIZE']
+    root_ids = [comment_id for comment_id, in db.session.query(Comment.id).filter(
+        thread, Comment.parent_comment.is_(None), Comment.id > (after or 0)).order_by(Comment.id).limit(size + 1)]
+    next_url = comments_api_url(target, root_ids[size - 1]) if len(root_ids) > size else None
+    root_ids = root_ids[:size]
+    rows = []
+    if root_ids:
+        replies = [Comment.parent_chain.like(f'{root_id};%') for root_id in root_ids]
+        rows = flatten_comment_tree(load_comment_tree(and_(thread, or_(Comment.id.in_(root_ids), *replies))))
+    groups = []
+    for comment, depth in rows:
+        if depth == 0:
+            groups.append([])
+        groups[-1].append((comment, depth))
+    shown = []
+    for group in groups:
+        more_url = None
+        if len(group) > reply_size + 1:
+            more_url = url_for('comment_replies_api', comment_id=group[0][0].id, after=group[reply_size][0].id)
+            group = group[:reply_size + 1]
+        shown.append((group, more_url))
+    descendants = map_descendants(rows)
+
+    def chunks():
+        for part in chunk_groups(shown, app.config['COMMENT_CHUNK_SIZE']):
+            yield (comment_macro('comment_roots')(part, descendants, viewer),
+                   [comment.id for group, more_url in part for comment, depth in group])
+        if next_url:
+            yield comment_macro('more_comments')(next_url), []
+
+    return comment_page_fragment([row for group, more_url in shown for row in group], descendants, next_url, chunks())
+
+def render_reply_page(target, comment, after, viewer):
+    # the replies beneath one comment in display order, continuing after the reply with id `after`
+    chain = f'{comment.parent_chain or ""}{comment.id};'
+    base_depth = chain.count(';') - 1
+    tree = load_comment_tree(and_(thread_criterion(target),
+                                  or_(Comment.id == comment.id, Comment.parent_chain.like(f'{chain}%'))))
+    rows = [(reply, depth + base_depth) for reply, depth in flatten_comment_tree(tree)]
+    replies = rows[1:]
+    start = 0
+    if after:
+        positions = [reply.id for reply, depth in replies]
+        if after not in positions:
+            abort(400)
+        start = positions.index(after) + 1
+    size = app.config['REPLY_PAGE_SIZE']
+    page = replies[start:start + size]
+    next_url = None
+    if start + size < len(replies):
+        next_url = url_for('comment_replies_api', comment_id=comment.id, after=page[-1][0].id)
+    descendants = map_descendants([(reply, depth - base_depth) for reply, depth in rows])
+
+    def chunks():
+        html = comment_macro('comment_rows')(page, descendants, viewer)
+        if next_url:
+            html += comment_macro('more_replies')(next_url)
+        yield html, [reply.id for reply, depth in page]
+
+    return comment_page_fragment(page, descendants, next_url, chunks())
+
+def comment_page_fragment(rows, descendants, next_url, chunks):
+    return {'chunks': chunks, 'next': next_url, 'descendants': descendants,
+            'authors': {comment.id: comment.author_id for comment, depth in rows},
+            'comments': [comment_data(comment, depth) for comment, depth in rows]}
+
+def comment_data(comment, depth):
+    author = None
+    if comment.author is not None:
+        author = {'id': comment.author.id, 'name': comment.author.name,
+                  'url': url_for('user_page', user_id=comment.author.id)}
+    # the sanitized HTML the page shows, never the markup as it was typed
+    body_html = comment.body_html if comment.body_html is not None else render_comment_body(comment.body)
+    return {'id': comment.id, 'parent_id': comment.parent_comment, 'depth': depth, 'body_html': body_html,
+            'likes': comment.likes, 'created_at': comment.created_at.isoformat() if comment.created_at else None,
+            'author': author}
+
+def chunk_groups(groups, size):
+    # whole top-level comments with their replies, about `size` comments to a chunk
+    chunk, count = [], 0
+    for group in groups:
+        chunk.append(group)
+        count += len(group[0])
+        if count >= size:
+            yield chunk
+            chunk, count = [], 0
+    if chunk:
+        yield chunk
+
+def comments_api_url(target, after):
+    if isinstance(target, BlogPost):
+        return url_for('post_comments_api', post_id=target.id, after=after)
+    return url_for('project_comments_api', proj_id=target.id, after=after)
+
+def thread_page_after(comment):
+    # the `after` cursor of the thread page showing this comment's top-level comment, None for the first page
+    if comment.parent_comment is None:
+        root_id = comment.id
     else:
-        like_button_module = Markup(
-            f'''<div class="col-2" style="margin-left:-1em"><div class="hvr-float-shadow"><a class="icon fa-thumbs-up" tabindex="{comment.id*10}" style="color:gray;" id="button_marker{comment.id}" data-bs-toggle="popover" data-bs-placement="left" data-bs-trigger="focus" data-bs-content="Log in to Like"></a></div></div>''')
-        reply_module = Markup(f'''<div class="col-2"><div class="hvr-float-shadow"><a class="icon solid fa-reply" tabindex="{(comment.id*10)+1}" style="color:gray;" id=reply_button{comment.id}" data-bs-toggle="popover" data-bs-placement="right" data-bs-trigger="focus" data-bs-content="Log in to Reply"></a></div></div></div>''')
-    modules = like_counter_module+like_button_module+reply_module
-    delete_module = Markup(f'''<div class="row col-sm-8 col-lg-4" ><div class="col-2"><div class="hvr-grow"><a href="{url_for('delete_comment', comment_id=comment.id) }" class="icon fa-trash-alt" style="color:gray;padding-left:0.5em;"></a></div></div>''')
-    try:
-        if current_user == comment.author or current_user.id == 1:
-            modules+=delete_module
-    except:
-        pass
-    this_comment_children = hide_reply_insert(comment.id)
-    try:
-        if current_user.id == comment.author.id or current_user.id == 1:
-            hide_replies_button = Markup(f'''<div class="col-4 col-sm-6""><div class="hvr-grow"><a class="icon solid fa-eye" style="color:white" onclick="handleReplyVisibility({comment.id})" id="hide_reply{comment.id}" value="{this_comment_children}"> Hide Replies</a></div></div></div>''')
-    except:
-        hide_replies_button = Markup(f'''<div class="row col-sm-5 col-lg-4"><div class="col-4 col-sm-6""><div class="hvr-grow"><a class="icon solid fa-eye" style="color:white;margin-left:7px" onclick="handleReplyVisibility({comment.id})" id="hide_reply{comment.id}" value="{this_comment_children}"> Hide Replies</a></div></div></div>''')
-    html_starter+=modules+hide_replies_button
-    if comment.author == None:
-        deleted_commenter = Markup('<div>[User Account Deleted]</div>')
-        html_with_commenter = html_starter+deleted_commenter
+        root_id = int((comment.parent_chain or f'{comment.parent_comment};').split(';')[0])
+    thread = Comment.post_id == comment.post_id if comment.post_id else Comment.project_id == comment.project_id
+    earlier = Comment.query.filter(thread, Comment.parent_comment.is_(None), Comment.id < root_id).count()
+    if earlier < app.config['COMMENT_PAGE_SIZE']:
+        return None
+    return root_id - 1
+
+def viewer_overlay(fragment, viewer, thread):
+    if viewer == 'anonymous':
+        return lambda html, comment_ids: html
+    user_liked_comments = liked_comment_ids(current_user.id, thread)
+
+    def overlay(html, comment_ids):
+        for comment_id in comment_ids:
+            if comment_id in user_liked_comments:
+                html = html.replace(comment_macro('unliked_button')(comment_id),
+                                    comment_macro('liked_button')(comment_id))
+            if viewer == 'member' and fragment['authors'][comment_id] == current_user.id:
+                children = fragment['descendants'].get(comment_id, '')
+                html = html.replace(comment_macro('viewer_controls')(comment_id, children),
+                                    comment_macro('owner_controls')(comment_id, children))
+        return html
+
+    return overlay
+
+def comment_macro(name):
+    return get_template_attribute('comments.html', name)
+
+def thread_criterion(target):
+    if isinstance(target, BlogPost):
+        return Comment.post_id == target.id
+    return Comment.project_id == target.id
+
+def liked_comment_ids(user_id, thread):
+    liked = db.session.query(CommentLike.comment_id).join(Comment).filter(CommentLike.user_id == user_id, thread)
+    return {comment_id for comment_id, in liked}
+
+def bump_thread_version(target):
+    # evaluated in SQL so concurrent writers each move the version on
+    target.comment_version = type(target).comment_version + 1
+    # comment history and search results show the comment too
+    bump_page_version('comments')
+
+def bump_user_threads(user):
+    bump_threads_where(Comment.author_id == user.id)
+    bump_page_version('comments')
+
+def bump_threads_where(criterion):
+    commented_posts = db.session.query(Comment.post_id).filter(criterion)
+    commented_projects = db.session.query(Comment.project_id).filter(criterion)
+    BlogPost.query.filter(BlogPost.id.in_(commented_posts)).update(
+        {BlogPost.comment_version: BlogPost.comment_version + 1}, synchronize_session=False)
+    Project.query.filter(Project.id.in_(commented_projects)).update(
+        {Project.comment_version: Project.comment_version + 1}, synchronize_session=False)
+
+def index_for_search(kind, row):
+    # called before the commit of the write it indexes, so the two land together
+    if search_index is None:
+        return
+    if kind == 'comment':
+        search_index.add(db.session, kind, row.id, '', row.body)
     else:
-        intact_commenter_image = Markup('<div class="accountImage me-auto">')
-        if comment.author.profile_picture==None:
-            gravatar = gravatar_gen(comment.author.email)
-            intact_commenter_image+=Markup(f'''<img src="{gravatar}"/><br></div>''')
+        search_index.add(db.session, kind, row.id, row.title, row.body, summary=row.subtitle)
+
+def remove_from_search(kind, ref_ids):
+    if search_index is not None:
+        search_index.remove(db.session, kind, ref_ids)
+
+def search_results(hits):
+    # the index only knows ids; comments also need the post or project they were left on
+    comment_ids = [hit['id'] for hit in hits if hit['kind'] == 'comment']
+    comments = {}
+    if comment_ids:
+        comments = {comment.id: comment for comment in Comment.query.options(
+            joinedload(Comment.parent_post).load_only(BlogPost.id, BlogPost.title),
+            joinedload(Comment.parent_project).load_only(Project.id, Project.title)).filter(Comment.id.in_(comment_ids))}
+    results = []
+    for hit in hits:
+        if hit['kind'] == 'post':
+            results.append(dict(hit, url=url_for('show_post', post_id=hit['id']), label='Blog'))
+        elif hit['kind'] == 'project':
+            results.append(dict(hit, url=url_for('show_project', proj_id=hit['id']), label='Project'))
+        elif hit['id'] in comments:
+            parent = comments[hit['id']].parent_post or comments[hit['id']].parent_project
+            results.append(dict(hit, url=url_for('comment_link', comment_id=hit['id']), label='Comment',
+                                title=f'On {parent.title}' if parent else 'Comment'))
+    return results
+
+def bump_page_version(name='pages'):
+    # 'pages' drops every cached page at once, 'comments' the pages keyed on it; committed together
+    # with the write that caused it. Thread pages are keyed on their own comment_version instead
+    CacheVersion.query.filter_by(name=name).update(
+        {CacheVersion.version: CacheVersion.version + 1, CacheVersion.updated_at: datetime.utcnow()},
+        synchronize_session=False)
+
+def flatten_comment_tree(comment_tree):
+    # (comment, depth) in display order: each comment followed by its replies
+    rows = []
+    stack = [(node, 0) for node in reversed(comment_tree)]
+    while stack:
+        node, depth = stack.pop()
+        rows.append((node['comment'], depth))
+        stack.extend((child, depth + 1) for child in reversed(node.get('children', [])))
+    return rows
+
+def map_descendants(rows):
+    # every comment id -> ';'-joined ids of all replies beneath it, from the flattened thread
+    found = {}
+    ancestors = []
+    for comment, depth in rows:
+        del ancestors[depth:]
+        for ancestor_id in ancestors:
+            found[ancestor_id].append(comment.id)
+        found[comment.id] = []
+        ancestors.append(comment.id)
+    return {comment_id: list_to_string(sorted(ids)) for comment_id, ids in found.items()}
+
+
+def load_comment_tree(criterion):
+    # one query for the whole thread (authors joined in), then link parents to children in memory
+    comments = Comment.query.options(joinedload(Comment.author)).filter(criterion).order_by(Comment.id).all()
+    # a comment whose parent was not loaded (the top of a subtree) is a root
+    nodes = {comment.id: {'comment': comment} for comment in comments}
+    roots = []
+    for comment in comments:
+        if comment.parent_comment in nodes:
+            nodes[comment.parent_comment].setdefault('children', []).append(nodes[comment.id])
         else:
-            intact_commenter_image+=Markup(f'''<img src="../{ comment.author.profile_picture }" class="accountImageCropped"/><br></div>''')
-        html_with_commenter_image = html_starter+intact_commenter_image
-        commenter = Markup(f'''<a href="{ url_for('user_page', user_id=comment.author.id) }" class="user-link">- @{ comment.author.name }</a>''')
-        html_with_commenter = html_with_commenter_image + commenter
-    replyform = CommentReplyForm()
-    comment_reply_box = Markup(f'''</div></div><div class="justify-content-center" style="border-left:none"><form class="needs-validation" style="display:none;" id="{comment.id}" action="" method="post" novalidate>{ replyform.csrf_token() }{ replyform.parent_comment(value=comment.id) }<div class="col-lg-8"><div class="form-group">Reply to @{comment.author.name}<textarea class="form-control" name="comment_reply" rows="3" style="color:white;background-color:rgba(27, 31, 34, 0.85)" required></textarea><div class="invalid-feedback">Please include a message.</div></div><br></div><div class="col-3">{ replyform.reply_submit(class_="btn btn-dark") }</div></form></div>''')
-    comment_with_reply=html_with_commenter+comment_reply_box
-    return comment_with_reply
-
+            roots.append(nodes[comment.id])
+    return roots
 
 def send_contact_email(name, email, message):
-    configuration = sib_api_v3_sdk.Configuration()
-    load_dotenv(find_dotenv())
-    KEY = os.environ["SENDINBLUE_KEY"]
-
-    configuration.api_key['api-key'] = KEY
-    api_instance = sib_api_v3_sdk.TransactionalEmailsApi(sib_api_v3_sdk.ApiClient(configuration))
-
     subject = 'Website Contact Request'
     html_content = f'name: {name}<br>email: {email}<br>message: {message}'
     sender = {"name": "Michael Freno", "email": 'michael@freno.me'}
     to = [{"email": 'michaelt.freno@gmail.com', "name": "Michael Freno"}]
     cc = [{"email": "michael@freno.me", "name": "Michael Freno"}]
     reply_to = {"name": "Michael Freno", "email": 'michael@freno.me',}
-    send_smtp_email = sib_api_v3_sdk.SendSmtpEmail(to=to,  cc=cc, reply_to=reply_to,
-                                                   html_content=html_content, sender=sender, subject=subject)
+    mail_queue.enqueue(dict(to=to, cc=cc, reply_to=reply_to, html_content=html_content, sender=sender,
+                            subject=subject))
 
-    try:
-        api_response = api_instance.send_transac_email(send_smtp_email)
-        print(api_response)
-    except ApiException as e:
-        print("Exception when calling SMTPApi->send_transac_email: %s\n" % e)
+def count_comments(user_id, delta):
+    User.query.filter_by(id=user_id).update({User.comment_count: User.comment_count + delta},
+                                            synchronize_session=False)
+    forget_user(user_id)
 
 def like_comment_on_post(comment):
     comment.likes+=1
-    user_liked_comments = string_to_list(current_user.liked_comments)
-    if user_liked_comments == None:
-        user_liked_comments = [comment.id]
-    else:
-        user_liked_comments.append(comment.id)
-    new_string = list_to_string(user_liked_comments)
-    current_user.liked_comments = new_string
+    db.session.add(CommentLike(user_id=current_user.id, comment_id=comment.id))
 
 
 def send_registration_email(name, email):
-    configuration = sib_api_v3_sdk.Configuration()
-    load_dotenv(find_dotenv())
-    KEY = os.environ["SENDINBLUE_KEY"]
-    configuration.api_key['api-key'] = KEY
-    api_instance = sib_api_v3_sdk.TransactionalEmailsApi(sib_api_v3_sdk.ApiClient(configuration))
     subject = 'Thank you!'
     sender = {"name": "Michael Freno", "email": 'michael@freno.me'}
     reply_to = {"name": "Michael Freno", "email": 'michael@freno.me'}
     templateId = 1
     params = {'FIRSTNAME': name}
     to = [{"email": email, "name": name}]
-    attachment = [{"content":f"{image}",
-                   "name":"logo.jpg"}]
-    send_smtp_email = sib_api_v3_sdk.SendSmtpEmail(to=to, reply_to=reply_to, attachment=attachment,
-                                                   template_id=templateId, params=params, sender=sender, subject=subject)
-    try:
-        api_response = api_instance.send_transac_email(send_smtp_email)
-        print(api_response)
-    except ApiException as e:
-        print("Exception when calling SMTPApi->send_transac_email: %s\n" % e)
+    if app.config['MAIL_LOGO_URL']:
+        attachment = [{"url": app.config['MAIL_LOGO_URL'], "name": "logo.jpg"}]
+    else:
+        # spooled by path; the transport reads and encodes the file once per process
+        attachment = [{"path": app.config['MAIL_LOGO_PATH'], "name": "logo.jpg"}]
+    mail_queue.enqueue(dict(to=to, reply_to=reply_to, attachment=attachment, template_id=templateId, params=params,
+                            sender=sender, subject=subject))
 
+@app.template_filter('gravatar')
+@lru_cache(maxsize=4096)
 def gravatar_gen(email):
-    g = G(email)
-    return g.get_image(size=100,default='identicon')
+    # one md5 per address per process, however many comments and pages show it
+    avatar = G(email)
+    if app.config['AVATAR_PROXY']:
+        return url_for('avatar', digest=avatar.email_hash, size=GRAVATAR_SIZE,
+                       signature=avatar_signature(app.config['SECRET_KEY'], avatar.email_hash, GRAVATAR_SIZE))
+    return avatar.get_image(size=GRAVATAR_SIZE, default='identicon', rating='g', use_ssl=True)
+
 
+# kept at the end of the module so every helper the upgrade steps call is defined.
+# gunicorn's preload_app runs this once in the master; with GUNICORN_PRELOAD=0 or several
+# machines, run `flask --app main upgrade-db` once per deploy and set UPGRADE_DB_ON_START=0
+if app.config['UPGRADE_DB_ON_START']:
+    with app.app_context():
+        upgrade_database()
 
 
 if __name__ == '__main__':
+    # single-process server for local runs and small hosts; in production use
+    # `gunicorn -c gunicorn.conf.py main:app`, which forks one worker per core
     from waitress import serve
     print("Running at")
     this_port = "8080"
     print(f"http://localhost:{this_port}/ http://127.0.0.1:{this_port}")
     server_port = os.environ.get('PORT', this_port)
-    serve(app, host="0.0.0.0", port=server_port)
+    # deliver mail spooled before this process started
+    mail_queue.start()
+    serve(app, host="0.0.0.0", port=server_port,
+          threads=int(os.environ.get('WAITRESS_THREADS', 8)),
+          connection_limit=int(os.environ.get('WAITRESS_CONNECTION_LIMIT', 200)),
+          channel_timeout=int(os.environ.get('WAITRESS_CHANNEL_TIMEOUT', 60)),
+          backlog=int(os.environ.get('WAITRESS_BACKLOG', 1024)))
@@ -0,0 +1,250 @@
+import bisect
+import json
+import os
+import threading
+import time
+
+# seconds; roughly doubling from a fast cached page to a request that has gone badly wrong
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+# finished workers' numbers, added up by the gunicorn master so the totals never go down
+ARCHIVE = 'archive.json'
+
+
+def label_text(names, values):
+    if not names:
+        return ''
+    pairs = ','.join('%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+                     for name, value in zip(names, values))
+    return '{%s}' % pairs
+
+
+class Histogram:
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = buckets
+        self.series = {}
+        self.lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self.lock:
+            counts, total = self.series.get(label_values, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.series[label_values] = (counts, total + value)
+
+    def snapshot(self):
+        with self.lock:
+            return {key: (list(counts), total) for key, (counts, total) in self.series.items()}
+
+    def render(self, series):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        for label_values, (counts, total) in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                labels = label_text(self.labels + ('le',), label_values + (le,))
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = label_text(self.labels, label_values)
+            lines.append(f'{self.name}_sum{labels} {total}')
+            lines.append(f'{self.name}_count{labels} {cumulative}')
+        return lines
+
+
+def merge(into, histograms):
+    for name, series in histograms.items():
+        merged = into.setdefault(name, {})
+        for label_values, (counts, total) in series.items():
+            previous_counts, previous_total = merged.get(label_values, ([0] * len(counts), 0.0))
+            merged[label_values] = ([a + b for a, b in zip(previous_counts, counts)], previous_total + total)
+    return into
+
+
+def encode(histograms):
+    return {name: [[list(label_values), counts, total] for label_values, (counts, total) in series.items()]
+            for name, series in histograms.items()}
+
+
+def decode(histograms):
+    return {name: {tuple(label_values): (counts, total) for label_values, counts, total in series}
+            for name, series in histograms.items()}
+
+
+def read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path, value):
+    # written aside and renamed so a reader never sees half a file
+    temporary_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(temporary_path, 'w') as f:
+        json.dump(value, f)
+    os.replace(temporary_path, path)
+
+
+def process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def archive_process(directory, pid):
+    """Fold the files of a worker that has exited into the archive; called by the gunicorn master."""
+    names = [name for name in os.listdir(directory) if name.startswith(f'{pid}-') and name.endswith('.json')]
+    if not names:
+        return
+    archive = read_json(os.path.join(directory, ARCHIVE)) or {'merged': [], 'histograms': {}}
+    histograms = decode(archive['histograms'])
+    # names merged before and since deleted can no longer be double counted
+    merged = [name for name in archive['merged'] if os.path.exists(os.path.join(directory, name))]
+    for name in names:
+        snapshot = read_json(os.path.join(directory, name))
+        if snapshot is not None:
+            merge(histograms, decode(snapshot['histograms']))
+        merged.append(name)
+    # the archive names the files it has taken in before they are removed, so a scrape
+    # in between skips them instead of counting them twice
+    write_json(os.path.join(directory, ARCHIVE), {'merged': merged, 'histograms': encode(histograms)})
+    for name in names:
+        os.remove(os.path.join(directory, name))
+
+
+class Metrics:
+    """Request, SQL, template and email timings, in Prometheus text format.
+
+    Without a directory the numbers are this process's own. With one, every process
+    writes its numbers there at most once per dump_interval and /metrics adds up all of
+    them, so a scrape describes the whole server whichever worker answers it. Gauges
+    stay per process and carry a pid label.
+    """
+
+    def __init__(self, directory=None, dump_interval=1.0):
+        self.requests = Histogram('http_request_duration_seconds', 'Time to answer a request, streaming included.',
+                                  ('route', 'method', 'status'))
+        self.request_queries = Histogram('http_request_queries', 'SQL statements run per request.', ('route',),
+                                         COUNT_BUCKETS)
+        self.request_query_time = Histogram('http_request_query_seconds', 'Time spent in SQL per request.',
+                                            ('route',))
+        self.queries = Histogram('db_query_duration_seconds', 'Time of each SQL statement.', (), QUERY_BUCKETS)
+        self.templates = Histogram('template_render_seconds', 'Time to render a page template.', ('template',))
+        self.emails = Histogram('email_send_seconds', 'Time to hand one email to the mail API.', ('outcome',))
+        self.histograms = [self.requests, self.request_queries, self.request_query_time, self.queries,
+                           self.templates, self.emails]
+        self.gauges = {}
+        self.directory = directory
+        self.dump_interval = dump_interval
+        self.dump_lock = threading.Lock()
+        self.last_dump = 0.0
+        self.file_name = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def after_fork(self):
+        # what the parent recorded is its own; a fresh file name keeps a reused pid from
+        # overwriting the numbers of an earlier worker
+        for histogram in self.histograms:
+            with histogram.lock:
+                histogram.series = {}
+        self.file_name = None
+
+    def gauge(self, name, documentation, read, labels=()):
+        # read() is called at scrape time and returns {label values: value}, or a plain number without labels
+        self.gauges[name] = (documentation, read, labels)
+
+    def gauge_values(self):
+        values = {}
+        for name, (documentation, read, labels) in self.gauges.items():
+            read_values = read()
+            values[name] = read_values if isinstance(read_values, dict) else {(): read_values}
+        return values
+
+    def dump(self):
+        if self.file_name is None:
+            self.file_name = f'{os.getpid()}-{time.time_ns()}.json'
+        gauges = {name: [[list(label_values), value] for label_values, value in values.items()]
+                  for name, values in self.gauge_values().items()}
+        write_json(os.path.join(self.directory, self.file_name),
+                   {'pid': os.getpid(), 'gauges': gauges,
+                    'histograms': encode({histogram.name: histogram.snapshot() for histogram in self.histograms})})
+        self.last_dump = time.monotonic()
+
+    def maybe_dump(self):
+        # called after every request; another thread already dumping is as good as this one doing it
+        if not self.directory or time.monotonic() - self.last_dump < self.dump_interval:
+            return
+        if self.dump_lock.acquire(blocking=False):
+            try:
+                self.dump()
+            except OSError as e:
+                print("Exception when writing metrics: %s\n" % e)
+            finally:
+                self.dump_lock.release()
+
+    def collect(self):
+        # every process's numbers: archived workers first, then the files of those still running
+        with self.dump_lock:
+            self.dump()
+        snapshots = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json') and name != ARCHIVE:
+                snapshot = read_json(os.path.join(self.directory, name))
+                if snapshot is not None:
+                    snapshots.append((name, snapshot))
+        # read after the worker files: a file removed in the meantime is already in the archive
+        archive = read_json(os.path.join(self.directory, ARCHIVE)) or {'merged': [], 'histograms': {}}
+        histograms = decode(archive['histograms'])
+        gauges = {}
+        for name, snapshot in snapshots:
+            if name in archive['merged']:
+                continue
+            merge(histograms, decode(snapshot['histograms']))
+            if process_alive(snapshot['pid']):
+                for gauge, values in snapshot['gauges'].items():
+                    for label_values, value in values:
+                        gauges.setdefault(gauge, {})[tuple(label_values) + (snapshot['pid'],)] = value
+        return histograms, gauges
+
+    def render(self):
+        if self.directory:
+            histograms, gauges = self.collect()
+            extra_labels = ('pid',)
+        else:
+            histograms = {histogram.name: histogram.snapshot() for histogram in self.histograms}
+            gauges = self.gauge_values()
+            extra_labels = ()
+        lines = []
+        for histogram in self.histograms:
+            lines.extend(histogram.render(histograms.get(histogram.name, {})))
+        for name, (documentation, read, labels) in self.gauges.items():
+            lines.extend([f'# HELP {name} {documentation}', f'# TYPE {name} gauge'])
+            for label_values, value in sorted(gauges.get(name, {}).items()):
+                lines.append(f'{name}{label_text(labels + extra_labels, label_values)} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+class TimedTransport:
+    # wraps a mail transport so every send lands in email_send_seconds
+    def __init__(self, transport, metrics):
+        self.transport = transport
+        self.metrics = metrics
+
+    def send(self, message):
+        started = time.perf_counter()
+        try:
+            result = self.transport.send(message)
+        except Exception:
+            self.metrics.emails.observe(time.perf_counter() - started, 'error')
+            raise
+        self.metrics.emails.observe(time.perf_counter() - started, 'sent')
+        return result
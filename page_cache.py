@@ -0,0 +1,88 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+class LRUCache:
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+
+class RedisBackend:
+    # shares rendered pages between worker processes; entries expire on their own after ttl
+    def __init__(self, url, ttl):
+        if redis is None:
+            raise RuntimeError("PAGE_CACHE_REDIS_URL is set but the redis package is not installed")
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+
+    def get(self, key):
+        value = self.client.get(key)
+        return None if value is None else json.loads(value)
+
+    def set(self, key, value):
+        self.client.set(key, json.dumps(value), ex=self.ttl)
+
+
+class PageCache:
+    """Rendered responses for anonymous GETs, keyed by content version and URL.
+
+    Writers move the version on instead of deleting entries, so every worker stops serving
+    the old pages at once and the stale entries simply age out. An entry older than ttl is
+    rendered again, which keeps relative dates on the listings current.
+    """
+
+    def __init__(self, backend, ttl):
+        self.backend = backend
+        self.ttl = ttl
+
+    def key(self, version, path):
+        return f'page:{version}:{path}'
+
+    def get(self, version, path):
+        try:
+            entry = self.backend.get(self.key(version, path))
+        except Exception as e:
+            print("Exception when reading the page cache: %s\n" % e)
+            return None
+        if entry is None or entry['stored_at'] + self.ttl < time.time():
+            return None
+        return entry
+
+    def store(self, version, path, response, last_modified):
+        body = response.get_data(as_text=True)
+        entry = {'body': body, 'mimetype': response.mimetype, 'stored_at': time.time(),
+                 'etag': hashlib.sha256(body.encode('utf-8')).hexdigest()[:32],
+                 'last_modified': last_modified}
+        try:
+            self.backend.set(self.key(version, path), entry)
+        except Exception as e:
+            print("Exception when writing the page cache: %s\n" % e)
+        return entry
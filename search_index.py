@@ -0,0 +1,111 @@
+import re
+
+from markupsafe import Markup, escape
+from sqlalchemy import text
+
+from html_pipeline import plain_text
+
+# documents share one table; the row id says which kind of row a document was made from
+KINDS = {'post': 1, 'project': 2, 'comment': 3}
+KIND_NAMES = {code: kind for kind, code in KINDS.items()}
+# highlight markers that cannot occur in stripped text, swapped for <mark> after escaping
+START, STOP = '\x02', '\x03'
+
+
+def document_id(kind, ref_id):
+    return ref_id * 4 + KINDS[kind]
+
+
+def highlighted(value):
+    return Markup(str(escape(value)).replace(START, '<mark>').replace(STOP, '</mark>'))
+
+
+def hit(row):
+    return {'kind': KIND_NAMES[row.id % 4], 'id': row.id // 4,
+            'title': highlighted(row.title), 'snippet': highlighted(row.snippet)}
+
+
+class SearchIndex:
+    """Full-text index over posts, projects and comments, kept in the main database.
+
+    Writers call add/remove in the same transaction as the rows they change, so the
+    index never disagrees with what has been committed. Documents are plain text with
+    the markup stripped; the title is weighted above the body when ranking.
+    """
+
+    def add(self, session, kind, ref_id, title, markup, summary=''):
+        body = ' '.join(part for part in (summary, plain_text(markup)) if part)
+        session.execute(self.delete_sql, {'id': document_id(kind, ref_id)})
+        session.execute(self.insert_sql, {'id': document_id(kind, ref_id), 'title': title or '', 'body': body})
+
+    def remove(self, session, kind, ref_ids):
+        for ref_id in ref_ids:
+            session.execute(self.delete_sql, {'id': document_id(kind, ref_id)})
+
+    def count(self, session):
+        return session.execute(text(f'SELECT count(*) FROM {self.table}')).scalar()
+
+    def clear(self, session):
+        session.execute(text(f'DELETE FROM {self.table}'))
+
+
+class SQLiteSearchIndex(SearchIndex):
+    table = 'search_index'
+    delete_sql = text('DELETE FROM search_index WHERE rowid = :id')
+    insert_sql = text('INSERT INTO search_index (rowid, title, body) VALUES (:id, :title, :body)')
+    search_sql = text('SELECT rowid AS id, highlight(search_index, 0, :start, :stop) AS title, '
+                      "snippet(search_index, 1, :start, :stop, '…', 24) AS snippet FROM search_index "
+                      'WHERE search_index MATCH :query ORDER BY bm25(search_index, 4.0, 1.0), rowid DESC '
+                      'LIMIT :limit OFFSET :offset')
+
+    def create(self, session):
+        session.execute(text("CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+                             "title, body, tokenize='porter unicode61 remove_diacritics 2')"))
+
+    def search(self, session, query, limit, offset):
+        words = re.findall(r'\w+', query)
+        if not words:
+            return []
+        # every word must appear; the last may be a prefix so partly typed words still match
+        match = ' '.join('"%s"' % word for word in words) + '*'
+        rows = session.execute(self.search_sql, {'query': match, 'start': START, 'stop': STOP,
+                                                 'limit': limit, 'offset': offset})
+        return [hit(row) for row in rows]
+
+
+class PostgresSearchIndex(SearchIndex):
+    table = 'search_documents'
+    delete_sql = text('DELETE FROM search_documents WHERE id = :id')
+    insert_sql = text('INSERT INTO search_documents (id, title, body) VALUES (:id, :title, :body)')
+    # ts_headline reparses the text, so only the rows of the page asked for get highlighted
+    search_sql = text('SELECT id, ts_headline(\'english\', title, query, :title_options) AS title, '
+                      'ts_headline(\'english\', body, query, :body_options) AS snippet '
+                      'FROM (SELECT id, title, body, query, ts_rank_cd(document, query) AS rank '
+                      'FROM search_documents, websearch_to_tsquery(\'english\', :query) query '
+                      'WHERE document @@ query ORDER BY rank DESC, id DESC LIMIT :limit OFFSET :offset) hits '
+                      'ORDER BY rank DESC, id DESC')
+
+    def create(self, session):
+        session.execute(text("CREATE TABLE IF NOT EXISTS search_documents (id BIGINT PRIMARY KEY, "
+                             "title TEXT NOT NULL, body TEXT NOT NULL, document TSVECTOR GENERATED ALWAYS AS ("
+                             "setweight(to_tsvector('english', title), 'A') || "
+                             "setweight(to_tsvector('english', body), 'B')) STORED)"))
+        session.execute(text('CREATE INDEX IF NOT EXISTS ix_search_documents_document '
+                             'ON search_documents USING GIN (document)'))
+
+    def search(self, session, query, limit, offset):
+        if not query.strip():
+            return []
+        markers = f'StartSel={START}, StopSel={STOP}'
+        rows = session.execute(self.search_sql, {'query': query, 'limit': limit, 'offset': offset,
+                                                 'title_options': f'{markers}, HighlightAll=true',
+                                                 'body_options': f'{markers}, MaxWords=40, MinWords=15, MaxFragments=2'})
+        return [hit(row) for row in rows]
+
+
+def search_index_for(dialect_name):
+    if dialect_name == 'postgresql':
+        return PostgresSearchIndex()
+    if dialect_name == 'sqlite':
+        return SQLiteSearchIndex()
+    return None
@@ -0,0 +1,22 @@
+function loadMoreComments(button){
+    loadCommentPage(button.closest(".load_more_comments"), button.getAttribute("data-url"));
+}
+function loadMoreReplies(button){
+    loadCommentPage(button.closest(".load_more_replies"), button.getAttribute("data-url"));
+}
+function loadCommentPage(placeholder, url){
+    // the page's html ends with its own "load more" control, so it simply takes the old one's place
+    var request = new XMLHttpRequest();
+    request.open("GET", url, true);
+    request.onload = function(){
+        if (request.status != 200){
+            return;
+        }
+        var page = JSON.parse(request.responseText);
+        var container = placeholder.parentElement;
+        placeholder.insertAdjacentHTML("afterend", page.html);
+        placeholder.remove();
+        initPopovers(container);
+    };
+    request.send();
+}
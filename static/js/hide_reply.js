@@ -19,6 +19,10 @@ function handleReplyVisibility(parent_id){
 }
 function setVisibilityOn(comment_id){
     var button = document.getElementById(`hide_reply${comment_id}`)
+    //replies that have not been loaded yet are skipped
+    if (button == null){
+        return;
+    }
     button.style.color = "white";
     button.className = "icon solid fa-eye"
     button.innerHTML = " Hide Replies";
@@ -28,6 +32,9 @@ function setVisibilityOn(comment_id){
 }
 function setVisibilityOff(comment_id){
     var div = document.getElementById(`visibility_tag_${comment_id}`)
+    if (div == null){
+        return;
+    }
     div.className = "hidden";
     setTimeout(setDisplayOff,200);
     function setDisplayOff(){
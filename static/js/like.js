@@ -2,7 +2,8 @@ function changeText(comment_id){
     let specified_button = document.getElementById(`button_marker${comment_id}`);
     if (specified_button.className == "icon fa-thumbs-up"){
         var request = new XMLHttpRequest();
-        request.open("GET","/like_comment/"+comment_id,true);
+        request.open("POST","/like_comment/"+comment_id,true);
+        request.setRequestHeader("X-CSRFToken", csrfToken());
         request.send();
         specified_button.className = "icon solid fa-thumbs-up";
         specified_button.style.color="#F2A900";
@@ -13,7 +14,8 @@ function changeText(comment_id){
         counter.innerHTML = `+ ${like_number} likes`
     }else{
         var request = new XMLHttpRequest();
-        request.open("GET","/unlike_comment/"+comment_id,true);
+        request.open("POST","/unlike_comment/"+comment_id,true);
+        request.setRequestHeader("X-CSRFToken", csrfToken());
         request.send();
         specified_button.className = "icon fa-thumbs-up";
         specified_button.style.color="white"
@@ -24,8 +26,15 @@ function changeText(comment_id){
         counter.innerHTML = `+ ${like_number} likes`
     }
 }
-const popoverTriggerList = document.querySelectorAll('[data-bs-toggle="popover"]')
-const popoverList = [...popoverTriggerList].map(popoverTriggerEl => new bootstrap.Popover(popoverTriggerEl))
+function csrfToken(){
+    return document.querySelector('input[name="csrf_token"]').value;
+}
+function initPopovers(root){
+    // also called for comments loaded after the page
+    const popoverTriggerList = root.querySelectorAll('[data-bs-toggle="popover"]')
+    return [...popoverTriggerList].map(popoverTriggerEl => bootstrap.Popover.getOrCreateInstance(popoverTriggerEl))
+}
+const popoverList = initPopovers(document)
 const popover = new bootstrap.Popover('.popover-dismiss', {
   trigger: 'focus'
 })
\ No newline at end of file
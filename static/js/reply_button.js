@@ -1,14 +1,24 @@
 function showReplyBox(vars){
-    var reply_box = document.getElementById(vars);
-    if ( reply_box.style.display == 'none' ){
-    //If the div is hidden, show it
-    reply_box.style.display = 'block';
-    //change button to gold
-    document.getElementById(`reply_button${vars}`).style.color="#F2A900"
+    // one reply form per page, moved under whichever comment is being answered
+    var reply_form = document.getElementById("reply_form");
+    var shown_under = reply_form.getAttribute("data-parent");
+    if (shown_under){
+      //change the previous button back to white
+      document.getElementById(`reply_button${shown_under}`).style.color="white"
+    }
+    if ( shown_under == String(vars) && reply_form.style.display != 'none' ){
+    //If the form is shown under this comment, hide it
+    reply_form.style.display = 'none';
+    reply_form.setAttribute("data-parent", "");
   } else {
-    //If the div is shown, hide it
-    reply_box.style.display = 'none';
-    //change button to white
-    document.getElementById(`reply_button${vars}`).style.color="white"
+    //Otherwise move it here and show it
+    var reply_button = document.getElementById(`reply_button${vars}`);
+    document.getElementById(`reply_slot${vars}`).appendChild(reply_form);
+    reply_form.elements["parent_comment"].value = vars;
+    document.getElementById("reply_to").textContent = reply_button.getAttribute("data-author");
+    reply_form.setAttribute("data-parent", vars);
+    reply_form.style.display = 'block';
+    //change button to gold
+    reply_button.style.color="#F2A900"
   }
-}
\ No newline at end of file
+}
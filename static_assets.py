@@ -0,0 +1,184 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import posixpath
+import re
+import sys
+
+from flask import request, send_file, abort
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE = {'.css', '.js', '.svg', '.json', '.txt', '.html', '.ttf', '.eot', '.ico', '.map'}
+# ckeditor finds its plugins from the name of ckeditor.js, so its tree keeps plain names;
+# uploads are written at runtime and already carry a content hash
+UNHASHED_PREFIXES = ('ckeditor/',)
+SKIPPED_PREFIXES = ('uploads/',)
+CSS_URL = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def hashed_name(filename, digest):
+    stem, extension = posixpath.splitext(filename)
+    return f'{stem}.{digest}{extension}'
+
+
+def source_files(static_folder):
+    for root, dirs, files in os.walk(static_folder):
+        for name in files:
+            filename = os.path.relpath(os.path.join(root, name), static_folder).replace(os.sep, '/')
+            if not filename.startswith(SKIPPED_PREFIXES) and not name.startswith('.'):
+                yield filename
+
+
+def build(static_folder, build_folder):
+    """Fingerprint and precompress everything under static_folder into build_folder.
+
+    Writes build_folder/manifest.json mapping each plain filename to its hashed name, the
+    rewritten copy of every stylesheet (its url() references point at hashed names too)
+    and a .gz/.br next to each compressible file. Identical files share one hashed URL.
+    """
+    os.makedirs(build_folder, exist_ok=True)
+    urls, files, by_digest = {}, {}, {}
+    filenames = sorted(source_files(static_folder))
+
+    def add(filename, data, origin):
+        digest = content_hash(data)
+        hashed = not filename.startswith(UNHASHED_PREFIXES)
+        if not hashed:
+            served = filename
+        else:
+            # the first file with this content owns the URL; copies point at it
+            served = by_digest.setdefault(digest, hashed_name(filename, digest))
+            urls[filename] = served
+        if served not in files:
+            files[served] = {'origin': origin, 'path': filename if origin == 'static' else served,
+                             'hashed': hashed, 'encodings': compress(data, served, build_folder)}
+            if origin == 'build':
+                write(os.path.join(build_folder, served), data)
+
+    for filename in filenames:
+        if not filename.endswith('.css'):
+            with open(os.path.join(static_folder, filename), 'rb') as f:
+                add(filename, f.read(), 'static')
+
+    def add_stylesheet(filename, stack=()):
+        if filename in urls or filename in stack:
+            return
+        with open(os.path.join(static_folder, filename), 'rb') as f:
+            css = f.read().decode('utf-8')
+
+        def rewrite(match):
+            quote, target = match.groups()
+            path, suffix = re.match(r'([^?#]*)(.*)', target).groups()
+            if re.match(r'^(data:|[a-z]+:|//|/)', target) or not path:
+                return match.group(0)
+            referenced = posixpath.normpath(posixpath.join(posixpath.dirname(filename), path))
+            if referenced.endswith('.css'):
+                add_stylesheet(referenced, stack + (filename,))
+            if referenced not in urls:
+                return match.group(0)
+            return f'url({quote}/static/{urls[referenced]}{suffix}{quote})'
+
+        add(filename, CSS_URL.sub(rewrite, css).encode('utf-8'), 'build')
+
+    for filename in filenames:
+        if filename.endswith('.css'):
+            add_stylesheet(filename)
+
+    write(os.path.join(build_folder, 'manifest.json'), json.dumps({'urls': urls, 'files': files}).encode())
+    return {'urls': urls, 'files': files}
+
+
+def compress(data, served, build_folder):
+    if posixpath.splitext(served)[1] not in COMPRESSIBLE:
+        return []
+    encodings = []
+    gzipped = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gzipped) < len(data):
+        write(os.path.join(build_folder, served + '.gz'), gzipped)
+        encodings.append('gzip')
+    if brotli is not None:
+        compressed = brotli.compress(data, quality=11)
+        if len(compressed) < len(data):
+            write(os.path.join(build_folder, served + '.br'), compressed)
+            encodings.insert(0, 'br')
+    return encodings
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def load_or_build(static_folder, build_folder):
+    manifest_path = os.path.join(build_folder, 'manifest.json')
+    if os.path.exists(manifest_path):
+        built_at = os.path.getmtime(manifest_path)
+        if all(os.path.getmtime(os.path.join(static_folder, filename)) <= built_at
+               for filename in source_files(static_folder)):
+            with open(manifest_path) as f:
+                return json.load(f)
+    return build(static_folder, build_folder)
+
+
+class StaticAssets:
+    """Serves /static from the fingerprinted build.
+
+    url_for('static', ...) resolves to the hashed name, which is served with an immutable
+    Cache-Control; plain names still work and are cached for STATIC_MAX_AGE. Either way a
+    precompressed .br or .gz is sent when the client accepts it.
+    """
+
+    def __init__(self, app, build_folder):
+        self.app = app
+        self.build_folder = build_folder
+        self.manifest = load_or_build(app.static_folder, build_folder)
+        app.url_defaults(self.hashed_url)
+        app.view_functions['static'] = self.serve
+
+    def hashed_url(self, endpoint, values):
+        if endpoint == 'static' and 'filename' in values:
+            values['filename'] = self.manifest['urls'].get(values['filename'], values['filename'])
+
+    def serve(self, filename):
+        asset = self.manifest['files'].get(filename)
+        if asset is None:
+            return self.app.send_static_file(filename)
+        if asset['origin'] == 'static':
+            path = os.path.join(self.app.static_folder, asset['path'])
+        else:
+            path = os.path.join(self.build_folder, asset['path'])
+        encoding = next((e for e in asset['encodings'] if e in request.accept_encodings), None)
+        if encoding is not None:
+            path = os.path.join(self.build_folder, filename + ('.br' if encoding == 'br' else '.gz'))
+        if not os.path.exists(path):
+            abort(404)
+        response = send_file(path, mimetype=mimetypes.guess_type(filename)[0], conditional=True,
+                             max_age=self.app.config['STATIC_MAX_AGE'])
+        if encoding is not None:
+            response.headers['Content-Encoding'] = encoding
+        if asset['encodings']:
+            response.vary.add('Accept-Encoding')
+        if asset['hashed']:
+            # a hashed name never changes content
+            response.headers['Cache-Control'] = IMMUTABLE
+        return response
+
+
+if __name__ == '__main__':
+    # python static_assets.py [static folder] [build folder], e.g. during an image build
+    static_folder = sys.argv[1] if len(sys.argv) > 1 else 'static'
+    build_folder = sys.argv[2] if len(sys.argv) > 2 else os.path.join('instance', 'static_build')
+    manifest = build(static_folder, build_folder)
+    print(f"Fingerprinted {len(manifest['urls'])} files into {build_folder}")